@@ -1,10 +1,11 @@
 import asyncio
 import logging
-from typing import Any, AsyncGenerator, Dict, List
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from llama_index.core.schema import NodeWithScore
 
 from app.core.rag.processors.base import BaseProcessor
+from app.core.rag.rerank_batcher import get_rerank_batcher
 from app.core.rag.types import PipelineContext, PipelineEvent
 from app.core.rag.utils import estimate_tokens
 
@@ -20,6 +21,9 @@ class RerankingProcessor(BaseProcessor):
     """
     Processor responsible for re-ordering retrieved nodes using specialized factories.
     Includes Fail-Open logic and Timeouts.
+
+    Scores are shared across requests through the RerankBatcher: cached (query, document) scores skip
+    the reranker, and local cross-encoder jobs of concurrent requests run as one batch.
     """
 
     def __init__(self):
@@ -102,43 +106,45 @@ class RerankingProcessor(BaseProcessor):
     async def _process_cohere(
         self, ctx: PipelineContext, nodes: List[NodeWithScore], top_n: int, cutoff: float
     ) -> List[NodeWithScore]:
-        from app.factories.rerank_factory import RerankProviderFactory
-        client = await RerankProviderFactory.create_reranker("cohere", ctx.settings_service)
-        if not client:
-            raise Exception("Cohere API Client could not be initialized (Key missing?)")
-
-        documents = [{"text": self._extract_text(n.node)} for n in nodes]
-        logger.info(f"[RERANK] Calling Cohere with {len(documents)} docs")
-
-        try:
-            results = await asyncio.wait_for(
-                client.rerank(
-                    model=COHERE_MODEL,
-                    query=ctx.user_message,
-                    documents=documents,
-                    top_n=top_n,
-                    return_documents=False,
-                ),
-                timeout=TIMEOUT_SECONDS,
-            )
-
-            reranked_nodes = []
+        async def _cohere_scores(query: str, documents: List[str]) -> List[Optional[float]]:
+            from app.factories.rerank_factory import RerankProviderFactory
+
+            client = await RerankProviderFactory.create_reranker("cohere", ctx.settings_service)
+            if not client:
+                raise Exception("Cohere API Client could not be initialized (Key missing?)")
+
+            logger.info(f"[RERANK] Calling Cohere with {len(documents)} docs")
+            try:
+                # Every document is scored (same billing as top_n) so all scores can be cached
+                results = await asyncio.wait_for(
+                    client.rerank(
+                        model=COHERE_MODEL,
+                        query=query,
+                        documents=[{"text": document} for document in documents],
+                        top_n=len(documents),
+                        return_documents=False,
+                    ),
+                    timeout=TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"[RERANK] Cohere timeout after {TIMEOUT_SECONDS}s")
+                raise Exception("Cohere Timeout")
+
+            scores: List[Optional[float]] = [None] * len(documents)
             for result in results.results:
-                idx = result.index
-                if 0 <= idx < len(nodes):
-                    node = nodes[idx]
-                    node.score = result.relevance_score
-                    if node.score >= cutoff:
-                        reranked_nodes.append(node)
-            return reranked_nodes
-        except asyncio.TimeoutError:
-            logger.warning(f"[RERANK] Cohere timeout after {TIMEOUT_SECONDS}s")
-            raise Exception("Cohere Timeout")
+                if 0 <= result.index < len(documents):
+                    scores[result.index] = result.relevance_score
+            return scores
+
+        documents = [self._extract_text(n.node) for n in nodes]
+        scores = await get_rerank_batcher().score(f"cohere:{COHERE_MODEL}", ctx.user_message, documents, _cohere_scores)
+        return self._select(nodes, scores, top_n, cutoff)
 
     async def _process_local(
         self, ctx: PipelineContext, nodes: List[NodeWithScore], top_n: int, cutoff: float
     ) -> List[NodeWithScore]:
         from app.factories.rerank_factory import RerankProviderFactory
+
         reranker = await RerankProviderFactory.create_reranker("local", ctx.settings_service)
         if not reranker:
             raise Exception("Local Reranker could not be initialized")
@@ -146,20 +152,31 @@ class RerankingProcessor(BaseProcessor):
         documents = [self._extract_text(n.node) for n in nodes]
         logger.info(f"[RERANK] Calling Local Reranker with {len(documents)} docs")
 
-        # FastEmbed Rerank is synchronous, run in thread to avoid blocking event loop
-        loop = asyncio.get_event_loop()
-        results = await loop.run_in_executor(
-            None, lambda: list(reranker.rerank(query=ctx.user_message, documents=documents, top_n=top_n))
-        )
+        # FastEmbed is synchronous: pairs of concurrent requests are scored together in a worker thread
+        namespace = f"local:{getattr(reranker, 'model_name', 'default')}"
+        try:
+            scores = await asyncio.wait_for(
+                get_rerank_batcher().score_local(reranker, namespace, ctx.user_message, documents),
+                timeout=TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"[RERANK] Local reranker timeout after {TIMEOUT_SECONDS}s")
+            raise Exception("Local Reranker Timeout")
+        return self._select(nodes, scores, top_n, cutoff)
 
+    @staticmethod
+    def _select(
+        nodes: List[NodeWithScore], scores: List[Optional[float]], top_n: int, cutoff: float
+    ) -> List[NodeWithScore]:
+        """Top n nodes by reranker score, above the cutoff (nodes without a score are dropped)."""
+        ranked = sorted(
+            ((node, score) for node, score in zip(nodes, scores) if score is not None), key=lambda x: x[1], reverse=True
+        )
         reranked_nodes = []
-        for result in results:
-            idx = result["index"]
-            if 0 <= idx < len(nodes):
-                node = nodes[idx]
-                node.score = float(result["score"])
-                if node.score >= cutoff:
-                    reranked_nodes.append(node)
+        for node, score in ranked[:top_n]:
+            node.score = float(score)
+            if node.score >= cutoff:
+                reranked_nodes.append(node)
         return reranked_nodes
 
     def _format_payload(self, nodes: List[NodeWithScore]) -> List[Dict[str, Any]]:
@@ -49,8 +49,9 @@ class RetrievalProcessor(BaseProcessor):
             # Filter low-quality vector matches early to reduce noise before Reranking
             retrieval_cutoff = getattr(ctx.assistant, "retrieval_similarity_cutoff", 0.5)
 
+            # Rank-fused (hybrid) scores are not similarities: lexical-only hits (codes, part numbers) are kept
             original_count = len(nodes)
-            nodes = [n for n in nodes if (n.score or 0) >= retrieval_cutoff]
+            nodes = [n for n, res in zip(nodes, search_results) if res.fused or (n.score or 0) >= retrieval_cutoff]
             filtered_count = original_count - len(nodes)
 
             if filtered_count > 0:
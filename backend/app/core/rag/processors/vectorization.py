@@ -5,6 +5,7 @@ from llama_index.core.schema import QueryBundle
 
 from app.core.rag.processors.base import BaseProcessor
 from app.core.rag.types import PipelineContext, PipelineEvent
+from app.services.chat.embedding_memo import embed_query
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,7 @@ class VectorizationProcessor(BaseProcessor):
         yield PipelineEvent(type="step", step_type="vectorization", status="running")
         try:
             query = ctx.rewritten_query or ctx.user_message
-            query_embedding = await ctx.embed_model.aget_query_embedding(query)
+            query_embedding = await embed_query(ctx.embed_model, query)
             ctx.query_bundle = QueryBundle(query_str=query, embedding=query_embedding)
             yield PipelineEvent(
                 type="step", step_type="vectorization", status="completed", payload={"embedding": query_embedding}
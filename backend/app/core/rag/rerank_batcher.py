@@ -0,0 +1,287 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+ScoreKey = Tuple[str, str]  # (namespace + query digest, document digest)
+ScoreFn = Callable[[str, List[str]], Awaitable[List[Optional[float]]]]
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class RerankScoreCache:
+    """
+    Thread-safe LRU + TTL cache of reranker relevance scores.
+
+    Keyed by (reranker namespace + query digest, document digest): a cross-encoder scores each
+    (query, document) pair independently, so regenerations and repeated questions reuse the scores
+    of the documents they retrieve again, whatever the other candidates are. Documents are keyed by
+    content because retrieval rebuilds its nodes (with fresh ids) on every request.
+    """
+
+    def __init__(self, max_entries: int = 20000, ttl_seconds: int = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        # key -> (score, stored_at)
+        self._entries: "OrderedDict[ScoreKey, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def keys(namespace: str, query: str, documents: Sequence[str]) -> List[ScoreKey]:
+        query_key = f"{namespace}:{_digest(query)}"
+        return [(query_key, _digest(document)) for document in documents]
+
+    def get_many(self, keys: Sequence[ScoreKey]) -> List[Optional[float]]:
+        now = time.time()
+        scores: List[Optional[float]] = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None or now - entry[1] > self.ttl_seconds:
+                    if entry is not None:
+                        del self._entries[key]
+                    self._misses += 1
+                    scores.append(None)
+                    continue
+                self._entries.move_to_end(key)
+                self._hits += 1
+                scores.append(entry[0])
+        return scores
+
+    def put_many(self, items: Dict[ScoreKey, float]) -> None:
+        now = time.time()
+        with self._lock:
+            for key, score in items.items():
+                self._entries[key] = (score, now)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+        return count
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else None,
+            }
+
+
+@dataclass
+class _RerankJob:
+    reranker: Any
+    query: str
+    documents: List[str]
+    future: asyncio.Future = field(repr=False)
+
+
+class RerankBatcher:
+    """
+    Shares reranking work across concurrent chat requests.
+
+    - Score cache: pairs already scored (any request) are never sent to a reranker again.
+    - Local cross-encoder micro-batching: missing pairs are queued; a single worker collects the jobs
+      arriving within `window_ms` (up to `max_pairs` pairs) and scores them in ONE forward pass in a
+      thread, instead of one small ONNX run per request competing for CPU.
+    - Backpressure: the queue is bounded, callers wait for a slot when `max_queue` jobs are pending
+      (the processor's timeout then fails open).
+    """
+
+    def __init__(
+        self,
+        window_ms: int = 5,
+        max_pairs: int = 256,
+        max_queue: int = 64,
+        cache: Optional[RerankScoreCache] = None,
+    ):
+        self.window_seconds = window_ms / 1000
+        self.max_pairs = max_pairs
+        self.max_queue = max_queue
+        self.cache = cache or RerankScoreCache()
+
+        # Bound to the running event loop on first use (recreated if the loop changes)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self._batches = 0
+        self._batched_jobs = 0
+
+    async def score(self, namespace: str, query: str, documents: List[str], score_fn: ScoreFn) -> List[Optional[float]]:
+        """
+        Relevance scores of `documents` for `query`, aligned with `documents`.
+
+        Cached pairs are served from the cache; the others are scored by `score_fn(query, missing_documents)`
+        (None = not scored, e.g. outside a provider's top_n) and cached.
+        """
+        keys = RerankScoreCache.keys(namespace, query, documents)
+        scores = self.cache.get_many(keys)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if not missing:
+            logger.debug(f"[RERANK] Score cache hit for {len(documents)} documents")
+            return scores
+
+        computed = await score_fn(query, [documents[i] for i in missing])
+
+        fresh: Dict[ScoreKey, float] = {}
+        for i, score in zip(missing, computed):
+            if score is not None:
+                scores[i] = score
+                fresh[keys[i]] = score
+        self.cache.put_many(fresh)
+        return scores
+
+    async def score_local(self, reranker: Any, namespace: str, query: str, documents: List[str]) -> List[float]:
+        """score() with the missing pairs scored by the shared micro-batched local cross-encoder."""
+
+        async def _enqueue(q: str, docs: List[str]) -> List[Optional[float]]:
+            self._ensure_worker()
+            future = asyncio.get_running_loop().create_future()
+            await self._queue.put(_RerankJob(reranker=reranker, query=q, documents=docs, future=future))
+            return await future
+
+        return await self.score(namespace, query, documents, _enqueue)
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Worker: collect jobs for one window, score them in one batch, repeat."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            pairs = len(batch[0].documents)
+            deadline = loop.time() + self.window_seconds
+
+            while pairs < self.max_pairs:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    job = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(job)
+                pairs += len(job.documents)
+
+            # Jobs whose caller gave up (timeout) are not scored
+            batch = [job for job in batch if not job.future.done()]
+            by_reranker: Dict[int, List[_RerankJob]] = {}
+            for job in batch:
+                by_reranker.setdefault(id(job.reranker), []).append(job)
+
+            for jobs in by_reranker.values():
+                try:
+                    results = await asyncio.to_thread(_score_jobs, jobs[0].reranker, jobs)
+                except Exception as e:
+                    for job in jobs:
+                        if not job.future.done():
+                            job.future.set_exception(e)
+                    continue
+
+                for job, scores in zip(jobs, results):
+                    if not job.future.done():
+                        job.future.set_result(scores)
+
+                self._batches += 1
+                self._batched_jobs += len(jobs)
+                if len(jobs) > 1:
+                    logger.debug(f"[RERANK] Batched {len(jobs)} requests ({pairs} pairs) in one forward pass")
+
+    def get_stats(self) -> dict:
+        """
+        Get batcher statistics for monitoring.
+
+        Returns:
+            Dictionary with batcher and score cache statistics
+        """
+        return {
+            "batches": self._batches,
+            "jobs": self._batched_jobs,
+            "avg_jobs_per_batch": round(self._batched_jobs / self._batches, 2) if self._batches else None,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "cache": self.cache.stats(),
+        }
+
+
+def _score_jobs(reranker: Any, jobs: List[_RerankJob]) -> List[List[Optional[float]]]:
+    """Scores the jobs of one batch (worker thread), one list of scores per job."""
+    if hasattr(reranker, "rerank_pairs"):
+        # FastEmbed cross-encoder: every (query, document) pair of every job in a single forward pass
+        pairs = [(job.query, document) for job in jobs for document in job.documents]
+        flat = [float(score) for score in reranker.rerank_pairs(pairs, batch_size=len(pairs))]
+        results, offset = [], 0
+        for job in jobs:
+            results.append(flat[offset : offset + len(job.documents)])
+            offset += len(job.documents)
+        return results
+
+    # Rerankers scoring one query at a time: sequential calls, still deduplicated by the cache
+    return [_rerank_one(reranker, job.query, job.documents) for job in jobs]
+
+
+def _rerank_one(reranker: Any, query: str, documents: List[str]) -> List[Optional[float]]:
+    """Scores aligned with documents, from either a score list or [{"index", "score"}] results."""
+    scores: List[Optional[float]] = [None] * len(documents)
+    for position, result in enumerate(reranker.rerank(query=query, documents=documents, top_n=len(documents))):
+        if isinstance(result, dict):
+            index, score = result["index"], result["score"]
+        else:
+            index, score = position, result
+        if 0 <= index < len(documents):
+            scores[index] = float(score)
+    return scores
+
+
+# Global singleton and lock for thread-safe initialization
+_global_batcher: Optional[RerankBatcher] = None
+_init_lock = threading.Lock()
+
+
+def get_rerank_batcher() -> RerankBatcher:
+    """
+    Get or create the global rerank batcher singleton using double-checked locking.
+
+    Returns:
+        Global RerankBatcher instance
+    """
+    global _global_batcher
+    if _global_batcher is None:
+        with _init_lock:
+            if _global_batcher is None:
+                _global_batcher = RerankBatcher(
+                    window_ms=settings.RERANK_BATCH_WINDOW_MS,
+                    max_pairs=settings.RERANK_BATCH_MAX_PAIRS,
+                    max_queue=settings.RERANK_QUEUE_SIZE,
+                    cache=RerankScoreCache(
+                        max_entries=settings.RERANK_SCORE_CACHE_SIZE, ttl_seconds=settings.RERANK_SCORE_CACHE_TTL
+                    ),
+                )
+    return _global_batcher
@@ -3,7 +3,7 @@ import os
 import secrets
 import sys
 import threading
-from typing import Literal, Optional, Type, Tuple
+from typing import Dict, Literal, Optional, Type, Tuple
 
 from pydantic import ValidationError, field_validator, model_validator
 from pydantic_settings import (
@@ -54,6 +54,26 @@ class Settings(BaseSettings):
     REDIS_CACHE_TTL: int = 86400  # 24 hours default
     SEMANTIC_CACHE_SIMILARITY_THRESHOLD: float = 0.90  # Balanced threshold (was 0.95)
 
+    # Semantic Cache L1 (in-process tier in front of Redis/Qdrant, kept coherent through Redis pub/sub)
+    SEMANTIC_CACHE_L1_ENABLED: bool = True
+    SEMANTIC_CACHE_L1_MAX_ENTRIES: int = 5000
+    SEMANTIC_CACHE_L1_TTL: int = 300  # Upper bound, never beyond the Redis entry's own TTL
+
+    # Semantic Cache Index (brute-force in-memory vectors per assistant, Qdrant used above the size limit)
+    SEMANTIC_CACHE_INDEX_ENABLED: bool = False
+    SEMANTIC_CACHE_INDEX_MAX_VECTORS: int = 5000  # Per assistant and provider (~3 KB each at 768 dims)
+    SEMANTIC_CACHE_INDEX_REBUILD_INTERVAL: int = 300  # Picks up entries written by other processes
+
+    # Semantic Cache Maintenance (per-assistant capacity eviction, Qdrant orphan reconciliation)
+    SEMANTIC_CACHE_MAINTENANCE_ENABLED: bool = True
+    SEMANTIC_CACHE_MAINTENANCE_INTERVAL: int = 600  # One process runs it per interval (Redis lock)
+    SEMANTIC_CACHE_MAX_ENTRIES_PER_ASSISTANT: int = 10000
+    SEMANTIC_CACHE_EVICTION_POLICY: Literal["lru", "lfu"] = "lru"  # lfu = fewest hits evicted first
+    SEMANTIC_CACHE_LFU_DECAY: float = 0.5  # lfu: hit counts are multiplied by it every maintenance pass (aging)
+
+    # Semantic Cache document invalidation (entries answered from a document are dropped when it is re-ingested)
+    SEMANTIC_CACHE_DOCUMENT_INVALIDATION_ENABLED: bool = True
+
     # External APIs
     GEMINI_API_KEY: Optional[str] = None
     OPENAI_API_KEY: Optional[str] = None
@@ -91,10 +111,74 @@ class Settings(BaseSettings):
     # Reranker Configuration
     RERANKER_PROVIDER: Literal["cohere", "local"] = "cohere"
     LOCAL_RERANK_MODEL: str = "BAAI/bge-reranker-base"
+    RERANK_BATCH_WINDOW_MS: int = 5  # Local jobs collected into one cross-encoder batch for this long
+    RERANK_BATCH_MAX_PAIRS: int = 256  # ...or until this many (query, document) pairs are pending
+    RERANK_QUEUE_SIZE: int = 64  # Pending local jobs before new requests wait (backpressure)
+    RERANK_SCORE_CACHE_SIZE: int = 20000  # (query, document) scores shared by all requests (LRU)
+    RERANK_SCORE_CACHE_TTL: int = 3600
 
     # Hardware Tuning
     INGESTION_LOCAL_WORKERS: Optional[int] = None  # Override for local worker count
 
+    # Streaming Ingestion (bounded producer/consumer for generic files)
+    INGESTION_STREAMING_ENABLED: bool = True
+    INGESTION_STREAM_HIGH_WATER_MARK: int = 8  # Max extracted files buffered ahead of the embedder
+    INGESTION_STREAM_FLUSH_SEGMENTS: int = 200  # Segments per pipeline.arun call
+
+    # CSV Smart Ingestion (pipelined embedding + upsert)
+    INGESTION_CSV_CONCURRENCY: int = 4  # Batches embedded/upserted in flight
+    INGESTION_CSV_BATCH_SIZE: int = 50  # Initial rows per batch (adapts to rate limits)
+    INGESTION_CSV_MIN_BATCH_SIZE: int = 5
+    INGESTION_CSV_MAX_BATCH_SIZE: int = 200
+
+    # SQL View Ingestion (schema documents of SQL / Vanna SQL connectors)
+    INGESTION_SQL_VIEW_CONCURRENCY: int = 8  # Views introspected in parallel (shared engine)
+    INGESTION_SQL_VIEW_BATCH_SIZE: int = 100  # Views per pipeline.arun call
+
+    # Extraction Process Pool (CPU-bound parsers: pypdf, MarkItDown, email, CSV)
+    INGESTION_EXTRACTION_WORKERS: Optional[int] = None  # None = auto (cpu_count - 1, max 8), 0 = in-process
+    INGESTION_EXTRACTION_TIMEOUT: float = 300.0  # Seconds per file before its worker is recycled
+
+    # Extraction Cache (content-hash dedup of cloud PDF / audio / image extraction results)
+    EXTRACTION_CACHE_ENABLED: bool = True
+    EXTRACTION_CACHE_MAX_MB: int = 512  # Least recently used entries evicted beyond this size
+
+    # Embedding Cache (process-wide LRU in front of every embedding model, optional shared Redis tier)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 20000  # ~6-8 KB per vector (768-1024 dims, float64)
+    EMBEDDING_CACHE_REDIS_ENABLED: bool = False  # Share embeddings across processes and restarts
+    EMBEDDING_CACHE_REDIS_TTL: int = 604800  # 7 days
+
+    # Document Status Index (in-memory INDEXED set used by HybridStrategy instead of a per-search SQL check)
+    DOCUMENT_STATUS_INDEX_ENABLED: bool = True
+    DOCUMENT_STATUS_INDEX_REBUILD_INTERVAL: int = 300  # Full rebuild from PostgreSQL; cold after 3 missed rebuilds
+
+    # Qdrant Payload Indexes (system fields + CSV filter columns, backfilled on existing collections at startup)
+    PAYLOAD_INDEX_MIGRATION_ENABLED: bool = True
+
+    # Qdrant Vector Storage Profiles (applied when a collection is created)
+    # default = float32 vectors in RAM, int8 = scalar quantized + rescoring, int8_on_disk = originals on disk
+    VECTOR_STORAGE_PROFILE: Literal["default", "int8", "int8_on_disk"] = "default"
+    VECTOR_STORAGE_PROFILES: Dict[str, Literal["default", "int8", "int8_on_disk"]] = {}  # Per collection override
+    VECTOR_HNSW_M: int = 16
+    VECTOR_HNSW_EF_CONSTRUCT: int = 100
+    VECTOR_QUANTIZATION_OVERSAMPLING: float = 2.0  # Quantized candidates fetched per result before rescoring
+    VECTOR_PROFILE_MIGRATION_ENABLED: bool = False  # Rebuild collections whose profile changed, then alias swap
+
+    # Hybrid Retrieval (BM25 sparse vectors fused with dense search through reciprocal rank fusion)
+    HYBRID_SEARCH_ENABLED: bool = True  # New collections get the sparse vector; older ones stay dense until rebuilt
+    HYBRID_BM25_AVG_DOC_LENGTH: int = 256  # Average tokens per chunk (BM25 length normalization)
+    HYBRID_PREFETCH_MULTIPLIER: int = 4  # Candidates fetched per branch = top_k * multiplier
+    HYBRID_RRF_K: int = 60
+
+    # Ingestion Status Write-Behind (document status rows + WebSocket progress frames)
+    INGESTION_STATUS_FLUSH_INTERVAL_MS: int = 500  # Buffered status updates flushed as one bulk UPDATE
+    INGESTION_STATUS_FLUSH_MAX_ROWS: int = 200  # ...or as soon as this many documents are pending
+    INGESTION_PROGRESS_INTERVAL_MS: int = 250  # At most one progress frame per document/connector per interval
+
+    # Ingestion Cache (IngestionCache + docstore persistence per connector)
+    INGESTION_CACHE_BACKEND: Literal["json", "sqlite"] = "sqlite"  # json = legacy full-rewrite files
+
     # Initial Bootstrap
     FIRST_SUPERUSER: str = "admin@vectra.ai"
     FIRST_SUPERUSER_PASSWORD: Optional[str] = None
@@ -306,6 +390,16 @@ class Settings(BaseSettings):
             logger.debug(f"Hardware detection failed or no GPU found: {e}. Defaulting to 1 worker.")
             return 1
 
+    @property
+    def computed_extraction_workers(self) -> int:
+        """
+        Number of processes used to parse files (pypdf, MarkItDown...) in parallel.
+        Leaves one core to the event loop; capped to bound worker memory.
+        """
+        if self.INGESTION_EXTRACTION_WORKERS is not None:
+            return max(0, self.INGESTION_EXTRACTION_WORKERS)
+        return max(1, min(8, (os.cpu_count() or 2) - 1))
+
     @property
     def computed_extraction_concurrency(self) -> int:
         """
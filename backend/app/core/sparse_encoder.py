@@ -0,0 +1,95 @@
+"""
+Local BM25 sparse encoder for Qdrant hybrid retrieval.
+
+Dense embeddings blur exact identifiers (part numbers, error codes, product IDs); a lexical
+sparse vector stored next to the dense one catches them. Encoding is local and dependency free:
+- Tokens: lowercased, accent-folded words; compound codes ("AB-1234", "v2.1") are kept whole
+  and also split into their parts, EN/FR stopwords dropped.
+- Dimensions: CRC32 of the token (stable across processes, no vocabulary to persist).
+- Documents: BM25 term-frequency saturation with length normalization.
+- Queries: one weight per unique token. IDF is applied by Qdrant (Modifier.IDF on the sparse
+  vector), so corpus statistics never have to be computed here.
+"""
+
+import re
+import unicodedata
+import zlib
+from collections import Counter
+from typing import List, Tuple
+
+from qdrant_client.http import models as qmodels
+
+from app.core.settings import settings
+
+SPARSE_VECTOR_NAME = "bm25"
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[^\W_]+(?:[-_./][^\W_]+)*")
+_COMPOUND_SPLIT_RE = re.compile(r"[-_./]")
+
+STOPWORDS = frozenset(
+    # English
+    "a an and are as at be but by for from has have how i if in into is it its of on or our that the their "
+    "there these this to was we were what when where which who why will with you your "
+    # French
+    "au aux avec ce ces cette dans de des du elle en est et il ils je la le les leur mais ne nous on ou par "
+    "pas pour qu que qui sa se ses son sont sur un une vous".split()
+)
+
+SparseEncoding = Tuple[List[int], List[float]]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lexical tokens of a text (see module docstring)."""
+    folded = unicodedata.normalize("NFKD", text.lower())
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+
+    tokens: List[str] = []
+    for match in _TOKEN_RE.finditer(folded):
+        token = match.group()
+        if token in STOPWORDS:
+            continue
+        tokens.append(token)
+        if _COMPOUND_SPLIT_RE.search(token):
+            tokens.extend(part for part in _COMPOUND_SPLIT_RE.split(token) if part and part not in STOPWORDS)
+    return tokens
+
+
+def _token_id(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def encode_document(text: str) -> SparseEncoding:
+    """BM25 term weights of a document (indices, values)."""
+    tf = Counter(_token_id(token) for token in tokenize(text))
+    if not tf:
+        return [], []
+
+    doc_len = sum(tf.values())
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_len / settings.HYBRID_BM25_AVG_DOC_LENGTH)
+    return list(tf), [count * (BM25_K1 + 1) / (count + norm) for count in tf.values()]
+
+
+def encode_query(text: str) -> SparseEncoding:
+    """Query weights: every unique token counts once (indices, values)."""
+    indices = list(dict.fromkeys(_token_id(token) for token in tokenize(text)))
+    return indices, [1.0] * len(indices)
+
+
+def encode_documents(texts: List[str]) -> Tuple[List[List[int]], List[List[float]]]:
+    """Batch document encoder (LlamaIndex QdrantVectorStore sparse_doc_fn)."""
+    encoded = [encode_document(text) for text in texts]
+    return [indices for indices, _ in encoded], [values for _, values in encoded]
+
+
+def encode_queries(texts: List[str]) -> Tuple[List[List[int]], List[List[float]]]:
+    """Batch query encoder (LlamaIndex QdrantVectorStore sparse_query_fn)."""
+    encoded = [encode_query(text) for text in texts]
+    return [indices for indices, _ in encoded], [values for _, values in encoded]
+
+
+def to_sparse_vector(encoding: SparseEncoding) -> qmodels.SparseVector:
+    indices, values = encoding
+    return qmodels.SparseVector(indices=indices, values=values)
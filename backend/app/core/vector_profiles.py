@@ -0,0 +1,89 @@
+"""
+Qdrant vector storage profiles.
+
+A profile decides how the vectors of a collection are stored and searched:
+- default: float32 vectors and HNSW graph in RAM (exact scores, highest memory)
+- int8: scalar int8 quantized copy in RAM searched first, top candidates rescored with the originals
+- int8_on_disk: same, original float32 vectors memory-mapped from disk (RAM holds ~1/4 of the vectors)
+
+The profile is selected per collection (VECTOR_STORAGE_PROFILES) with VECTOR_STORAGE_PROFILE as default.
+Changing it only affects new collections; existing ones are rebuilt by the profile migration
+(VectorService.migrate_collection_profile).
+
+With HYBRID_SEARCH_ENABLED collections also declare the BM25 sparse vector (see app.core.sparse_encoder),
+its IDF computed by Qdrant.
+"""
+
+from typing import Any, Dict, Optional
+
+from qdrant_client.http import models as qmodels
+
+from app.core.settings import settings
+from app.core.sparse_encoder import SPARSE_VECTOR_NAME
+
+DEFAULT_PROFILE = "default"
+QUANTIZED_PROFILES = ("int8", "int8_on_disk")
+ON_DISK_PROFILES = ("int8_on_disk",)
+
+
+def get_collection_profile(collection_name: str) -> str:
+    """Storage profile of a (logical) collection name."""
+    return settings.VECTOR_STORAGE_PROFILES.get(collection_name, settings.VECTOR_STORAGE_PROFILE)
+
+
+def collection_create_params(collection_name: str, dimension: int) -> Dict[str, Any]:
+    """Keyword arguments of create_collection for the collection's profile."""
+    profile = get_collection_profile(collection_name)
+
+    params: Dict[str, Any] = {
+        "vectors_config": qmodels.VectorParams(
+            size=dimension, distance=qmodels.Distance.COSINE, on_disk=profile in ON_DISK_PROFILES
+        ),
+        "hnsw_config": qmodels.HnswConfigDiff(m=settings.VECTOR_HNSW_M, ef_construct=settings.VECTOR_HNSW_EF_CONSTRUCT),
+    }
+    if settings.HYBRID_SEARCH_ENABLED:
+        params["sparse_vectors_config"] = {
+            SPARSE_VECTOR_NAME: qmodels.SparseVectorParams(
+                index=qmodels.SparseIndexParams(on_disk=profile in ON_DISK_PROFILES), modifier=qmodels.Modifier.IDF
+            )
+        }
+    if profile in QUANTIZED_PROFILES:
+        params["quantization_config"] = qmodels.ScalarQuantization(
+            scalar=qmodels.ScalarQuantizationConfig(type=qmodels.ScalarType.INT8, quantile=0.99, always_ram=True)
+        )
+    return params
+
+
+def search_params(collection_name: str) -> Optional[qmodels.SearchParams]:
+    """Search parameters of the collection's profile (None = Qdrant defaults)."""
+    if get_collection_profile(collection_name) not in QUANTIZED_PROFILES:
+        return None
+    return qmodels.SearchParams(
+        quantization=qmodels.QuantizationSearchParams(
+            rescore=True, oversampling=settings.VECTOR_QUANTIZATION_OVERSAMPLING
+        )
+    )
+
+
+def profile_matches(collection_name: str, info: Any) -> bool:
+    """
+    Whether an existing collection (get_collection result) is stored under the collection's profile.
+    Only the storage layout is compared: quantization, on-disk vectors, HNSW m / ef_construct and, with
+    hybrid search enabled, the presence of the sparse vector.
+    """
+    profile = get_collection_profile(collection_name)
+    config = info.config
+
+    vectors = config.params.vectors
+    on_disk = bool(getattr(vectors, "on_disk", False))
+    quantized = config.quantization_config is not None
+    hnsw = config.hnsw_config
+    sparse = SPARSE_VECTOR_NAME in (config.params.sparse_vectors or {})
+
+    return (
+        quantized == (profile in QUANTIZED_PROFILES)
+        and on_disk == (profile in ON_DISK_PROFILES)
+        and hnsw.m == settings.VECTOR_HNSW_M
+        and hnsw.ef_construct == settings.VECTOR_HNSW_EF_CONSTRUCT
+        and (sparse or not settings.HYBRID_SEARCH_ENABLED)
+    )
@@ -2,7 +2,7 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any, AsyncGenerator, Dict, List, Optional, Set
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set
 from uuid import UUID, uuid4
 
 from fastapi import WebSocket, WebSocketDisconnect
@@ -31,6 +31,7 @@ class Websocket:
     _worker_last_seen: float = 0.0
     upstream_connection: Any = None
     _last_sse_log_time: float = 0.0
+    _observers: List[Callable[[Dict[str, Any]], None]] = []
 
     def __new__(cls) -> "Websocket":
         if cls._instance is None:
@@ -42,6 +43,7 @@ class Websocket:
             cls._instance._worker_last_seen = 0.0
             cls._instance.upstream_connection = None
             cls._instance._last_sse_log_time = 0.0
+            cls._instance._observers = []
         return cls._instance
 
     # --- Client Connection Management ---
@@ -141,6 +143,17 @@ class Websocket:
         self.unregister_worker()
         await self.emit_worker_status(False)
 
+    # --- In-Process Observers ---
+
+    def add_observer(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Registers a synchronous callback invoked with every broadcast message (e.g. in-memory indexes)."""
+        if callback not in self._observers:
+            self._observers.append(callback)
+
+    def remove_observer(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        if callback in self._observers:
+            self._observers.remove(callback)
+
     # --- Broadcasting ---
 
     async def broadcast(self, message: Dict[str, Any]) -> None:
@@ -153,6 +166,13 @@ class Websocket:
             logger.error(f"Failed to serialize broadcast message: {e}")
             return
 
+        # 0. In-Process Observers (also sees frames rebroadcast from the worker)
+        for callback in self._observers:
+            try:
+                callback(message)
+            except Exception as e:
+                logger.warning(f"Broadcast observer failed: {e}")
+
         # 1. Forward to Upstream (Worker -> API)
         if self.upstream_connection:
             try:
@@ -0,0 +1,353 @@
+"""
+Embedding Cache - Process-wide LRU of embeddings in front of every provider model.
+
+EmbeddingProviderFactory wraps each model it creates in a CachedEmbedding, so query-time callers
+(search strategies, semantic cache, Vanna) and ingestion (pipeline embedding, CSV smart batches with
+repeated semantic text) share one cache. Only texts missing from the cache reach the provider, and
+duplicates inside a batch are embedded once.
+
+KEYS: SHA-256 of (provider class, model, mode, normalised text). Normalisation is NFC + collapsed
+whitespace; case is preserved because embeddings are case-sensitive. The mode separates query from
+document embeddings, which differ for asymmetric models.
+
+TIERS:
+- L1: In-process LRU bounded by entry count (vectors stored as packed float64 arrays)
+- L2 (optional): Shared Redis tier so workers and restarts reuse embeddings. Async paths only;
+  any Redis failure disables the tier for a cooldown and the cache keeps working from L1.
+
+Hit/miss/eviction counters are exposed through EmbeddingCache.stats().
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import redis.asyncio as aioredis
+from llama_index.core.base.embeddings.base import DEFAULT_EMBED_BATCH_SIZE, BaseEmbedding, Embedding
+from pydantic import BaseModel, PrivateAttr
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+MODE_QUERY = "query"
+MODE_TEXT = "text"
+
+REDIS_KEY_PREFIX = "vectra:emb:"
+REDIS_CONNECT_TIMEOUT = 2.0
+REDIS_RETRY_COOLDOWN = 30.0  # Seconds the Redis tier stays disabled after a failure
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Cache-key normalisation: NFC, collapsed whitespace, stripped."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def _pack(vector: Sequence[float]) -> bytes:
+    return array("d", vector).tobytes()
+
+
+def _unpack(payload: bytes) -> array:
+    vector = array("d")
+    vector.frombytes(payload)
+    return vector
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU of embedding vectors with an optional async Redis tier.
+
+    ARCHITECT NOTE:
+    - Blocking L1 API (get_many/put_many) for sync embedding paths (worker threads)
+    - Async API (aget_many/aput_many) adds the Redis tier, failing open
+    """
+
+    def __init__(self, max_entries: int, redis: Optional[aioredis.Redis] = None, redis_ttl: int = 0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of vectors kept in process before LRU eviction
+            redis: Optional async Redis client for the shared tier
+            redis_ttl: Expiry of Redis entries in seconds (0 = no expiry)
+        """
+        self.max_entries = max_entries
+        self.redis = redis
+        self.redis_ttl = redis_ttl
+        self._entries: "OrderedDict[str, array]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis_disabled_until = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.redis_hits = 0
+
+    @staticmethod
+    def make_key(namespace: str, mode: str, text: str) -> str:
+        raw = f"{namespace}\x00{mode}\x00{normalize_text(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # --- L1 (blocking) ---
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Embedding]]:
+        results: List[Optional[Embedding]] = []
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is None:
+                    self.misses += 1
+                    results.append(None)
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    results.append(vector.tolist())
+        return results
+
+    def put_many(self, items: Dict[str, Sequence[float]]) -> None:
+        with self._lock:
+            for key, vector in items.items():
+                self._entries[key] = vector if isinstance(vector, array) else array("d", vector)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    # --- L1 + Redis (async) ---
+
+    async def aget_many(self, keys: Sequence[str]) -> List[Optional[Embedding]]:
+        results = self.get_many(keys)
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        if not missing or not self._redis_available():
+            return results
+
+        try:
+            payloads = await self.redis.mget([REDIS_KEY_PREFIX + keys[i] for i in missing])
+        except Exception as e:
+            self._disable_redis(e)
+            return results
+
+        promoted: Dict[str, array] = {}
+        for i, payload in zip(missing, payloads):
+            if payload:
+                vector = _unpack(payload)
+                promoted[keys[i]] = vector
+                results[i] = vector.tolist()
+
+        if promoted:
+            self.put_many(promoted)
+            with self._lock:
+                # Counted as misses by the L1 lookup above
+                self.misses -= len(promoted)
+                self.hits += len(promoted)
+                self.redis_hits += len(promoted)
+        return results
+
+    async def aput_many(self, items: Dict[str, Sequence[float]]) -> None:
+        self.put_many(items)
+        if not items or not self._redis_available():
+            return
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, vector in items.items():
+                pipe.set(REDIS_KEY_PREFIX + key, _pack(vector), ex=self.redis_ttl or None)
+            await pipe.execute()
+        except Exception as e:
+            self._disable_redis(e)
+
+    def _redis_available(self) -> bool:
+        return self.redis is not None and time.monotonic() >= self._redis_disabled_until
+
+    def _disable_redis(self, error: Exception) -> None:
+        logger.warning(f"⚠️ Embedding cache Redis tier unavailable ({error}), using in-process cache only")
+        self._redis_disabled_until = time.monotonic() + REDIS_RETRY_COOLDOWN
+
+    # --- Introspection ---
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "redis_hits": self.redis_hits,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CachedEmbedding(BaseEmbedding):
+    """
+    BaseEmbedding decorator serving vectors from an EmbeddingCache.
+
+    Batching, callbacks and instrumentation run once in this wrapper; cache misses are delegated to
+    the provider model's private batch methods. Serialization (to_dict) is delegated to the provider
+    model so ingestion cache hashes are unchanged by the wrapper.
+    """
+
+    _inner: BaseEmbedding = PrivateAttr()
+    _cache: EmbeddingCache = PrivateAttr()
+    _namespace: str = PrivateAttr()
+
+    def __init__(self, inner: BaseEmbedding, cache: EmbeddingCache, **kwargs: Any) -> None:
+        model_name = getattr(inner, "model_name", None)
+        batch_size = getattr(inner, "embed_batch_size", None)
+        num_workers = getattr(inner, "num_workers", None)
+        super().__init__(
+            model_name=model_name if isinstance(model_name, str) else type(inner).__name__,
+            embed_batch_size=batch_size if isinstance(batch_size, int) else DEFAULT_EMBED_BATCH_SIZE,
+            num_workers=num_workers if isinstance(num_workers, int) else None,
+            **kwargs,
+        )
+        self._inner = inner
+        self._cache = cache
+        self._namespace = f"{type(inner).__name__}:{self.model_name}"
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    @property
+    def wrapped_model(self) -> BaseEmbedding:
+        return self._inner
+
+    @property
+    def cache(self) -> EmbeddingCache:
+        return self._cache
+
+    @property
+    def namespace(self) -> str:
+        """Provider class and model, used as the cache namespace."""
+        return self._namespace
+
+    def to_dict(self, **kwargs: Any) -> Dict[str, Any]:
+        return self._inner.to_dict(**kwargs)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # EmbeddingCache holds a threading.Lock (IngestionPipeline multiprocessing workers): not pickled,
+        # the unpickled copy uses the cache of its own process
+        state = BaseModel.__getstate__(self)
+        state["__pydantic_private__"] = {k: v for k, v in state["__pydantic_private__"].items() if k != "_cache"}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        BaseModel.__setstate__(self, state)
+        self._cache = get_embedding_cache() or EmbeddingCache(max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES)
+
+    # --- BaseEmbedding hooks ---
+
+    def _get_query_embedding(self, query: str) -> Embedding:
+        return self._embed(MODE_QUERY, [query], lambda texts: [self._inner._get_query_embedding(texts[0])])[0]
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        async def _compute(texts: List[str]) -> List[Embedding]:
+            return [await self._inner._aget_query_embedding(texts[0])]
+
+        return (await self._aembed(MODE_QUERY, [query], _compute))[0]
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self._embed(MODE_TEXT, [text], self._inner._get_text_embeddings)[0]
+
+    async def _aget_text_embedding(self, text: str) -> Embedding:
+        return (await self._aembed(MODE_TEXT, [text], self._inner._aget_text_embeddings))[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        return self._embed(MODE_TEXT, texts, self._inner._get_text_embeddings)
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        return await self._aembed(MODE_TEXT, texts, self._inner._aget_text_embeddings)
+
+    # --- Internals ---
+
+    def _embed(self, mode: str, texts: List[str], compute: Callable[[List[str]], List[Embedding]]) -> List[Embedding]:
+        keys = [EmbeddingCache.make_key(self._namespace, mode, text) for text in texts]
+        results = self._cache.get_many(keys)
+        pending = self._pending(keys, texts, results)
+        if pending:
+            computed = dict(zip(pending, compute(list(pending.values()))))
+            self._cache.put_many(computed)
+            results = self._fill(keys, results, computed)
+        return results
+
+    async def _aembed(
+        self, mode: str, texts: List[str], compute: Callable[[List[str]], Awaitable[List[Embedding]]]
+    ) -> List[Embedding]:
+        keys = [EmbeddingCache.make_key(self._namespace, mode, text) for text in texts]
+        results = await self._cache.aget_many(keys)
+        pending = self._pending(keys, texts, results)
+        if pending:
+            computed = dict(zip(pending, await compute(list(pending.values()))))
+            await self._cache.aput_many(computed)
+            results = self._fill(keys, results, computed)
+        return results
+
+    @staticmethod
+    def _pending(keys: List[str], texts: List[str], results: List[Optional[Embedding]]) -> Dict[str, str]:
+        """Missing keys mapped to the text to embed (duplicates in a batch are embedded once)."""
+        pending: Dict[str, str] = {}
+        for key, text, vector in zip(keys, texts, results):
+            if vector is None and key not in pending:
+                pending[key] = text
+        return pending
+
+    @staticmethod
+    def _fill(keys: List[str], results: List[Optional[Embedding]], computed: Dict[str, Embedding]) -> List[Embedding]:
+        return [vector if vector is not None else list(computed[key]) for key, vector in zip(keys, results)]
+
+
+# Global singleton (one LRU per process, shared by every cached model)
+_global_cache: Optional[EmbeddingCache] = None
+_init_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Get or create the global embedding cache singleton using double-checked locking.
+
+    Returns:
+        Global EmbeddingCache instance, or None if EMBEDDING_CACHE_ENABLED is off
+    """
+    global _global_cache
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    if _global_cache is None:
+        with _init_lock:
+            if _global_cache is None:
+                redis = None
+                if settings.EMBEDDING_CACHE_REDIS_ENABLED:
+                    redis = aioredis.Redis(
+                        host=settings.REDIS_HOST,
+                        port=settings.REDIS_PORT,
+                        password=settings.REDIS_PASSWORD,
+                        db=settings.REDIS_DB,
+                        socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+                        decode_responses=False,
+                    )
+                _global_cache = EmbeddingCache(
+                    max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+                    redis=redis,
+                    redis_ttl=settings.EMBEDDING_CACHE_REDIS_TTL,
+                )
+    return _global_cache
+
+
+def wrap_with_cache(model: BaseEmbedding) -> BaseEmbedding:
+    """Wrap a provider model in a CachedEmbedding (no-op when the cache is disabled or already wrapped)."""
+    cache = get_embedding_cache()
+    if cache is None or isinstance(model, CachedEmbedding):
+        return model
+    return CachedEmbedding(model, cache)
@@ -5,6 +5,7 @@ from typing import Any, Dict, Optional
 from llama_index.core.base.embeddings.base import BaseEmbedding
 
 from app.core.exceptions import ExternalDependencyError
+from app.factories.embedding_cache import wrap_with_cache
 from app.services.settings_service import SettingsService
 
 logger = logging.getLogger(__name__)
@@ -31,23 +32,26 @@ class EmbeddingProviderFactory:
 
         # Route to provider-specific factory method
         if provider == "openai":
-            return await EmbeddingProviderFactory._create_openai_embedding(
+            model = await EmbeddingProviderFactory._create_openai_embedding(
                 settings_service, batch_size=batch_size or 100, **options
             )
         elif provider == "gemini":
-            return await EmbeddingProviderFactory._create_gemini_embedding(
+            model = await EmbeddingProviderFactory._create_gemini_embedding(
                 settings_service, batch_size=batch_size or 10, **options
             )
         elif provider == "ollama":
-            return await EmbeddingProviderFactory._create_ollama_embedding(
+            model = await EmbeddingProviderFactory._create_ollama_embedding(
                 settings_service, batch_size=batch_size or 10, **options
             )
         else:
             logger.warning(f"Unknown provider '{provider}', defaulting to Ollama")
-            return await EmbeddingProviderFactory._create_ollama_embedding(
+            model = await EmbeddingProviderFactory._create_ollama_embedding(
                 settings_service, batch_size=batch_size or 10, **options
             )
 
+        # Shared LRU (+ optional Redis) in front of the provider: repeated texts are never re-embedded
+        return wrap_with_cache(model)
+
     @staticmethod
     async def _create_gemini_embedding(
         settings_service: SettingsService, batch_size: int, **options: Any
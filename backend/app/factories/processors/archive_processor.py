@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import os
 import shutil
 import tempfile
 import zipfile
-from pathlib import Path
-from typing import List
+from pathlib import Path, PurePosixPath
+from typing import List, Optional
 
 from app.core.exceptions import TechnicalError
 from app.factories.processors.base import FileProcessor, ProcessedDocument
@@ -17,13 +17,22 @@ logger = logging.getLogger(__name__)
 class ArchiveProcessor(FileProcessor):
     """
     Processor for Archives (.zip).
-    Extracts contents and delegates to other processors via IngestionFactory.
+    Processes contents member by member and delegates to other processors via IngestionFactory.
+
+    Performance:
+    - Members are never bulk-extracted: SUPPORTS_STREAM processors read straight from the zip,
+      other members are spooled one at a time to a temp file deleted right after processing
+    - Members are processed concurrently (MAX_CONCURRENT_MEMBERS), CPU-bound ones in the
+      extraction process pool
     """
 
     # Safety limits
     MAX_TOTAL_SIZE = 2 * 1024 * 1024 * 1024  # 2GB extracted max (was 500MB)
     MAX_FILE_COUNT = 500  # Max files to process (was 100)
 
+    # Members processed at the same time (also bounds spooled temp files on disk)
+    MAX_CONCURRENT_MEMBERS = 4
+
     def __init__(self) -> None:
         # Zip itself can be larger now (500MB upload limit)
         super().__init__(max_file_size_bytes=500 * 1024 * 1024)
@@ -33,14 +42,11 @@ class ArchiveProcessor(FileProcessor):
 
     async def process(self, file_path: str, ai_provider: Optional[str] = None) -> List[ProcessedDocument]:
         """
-        Extract zip and process contained files.
+        Process the files contained in a zip.
         """
         zip_path = await self._validate_file_path(file_path)
 
-        # Local import to avoid circular dependency
-        from app.factories.ingestion_factory import IngestionFactory
-
-        temp_dir = Path(tempfile.mkdtemp(prefix="vectra_zip_"))
+        spool_dir = Path(tempfile.mkdtemp(prefix="vectra_zip_"))
         processed_docs: List[ProcessedDocument] = []
 
         try:
@@ -52,51 +58,20 @@ class ArchiveProcessor(FileProcessor):
                         f"Zip extraction limit exceeded. Total size {total_size} > {self.MAX_TOTAL_SIZE}"
                     )
 
-                # 2. Extract
-                zip_ref.extractall(temp_dir)
-
-            # 3. Traverse and Delegate
-            file_count = 0
-            for root, _, files in os.walk(temp_dir):
-                for file in files:
-                    if file_count >= self.MAX_FILE_COUNT:
-                        logger.warning(
-                            f"Zip file count limit reached ({self.MAX_FILE_COUNT}). Skipping remaining files."
-                        )
-                        break
-
-                    inner_path = Path(root) / file
-
-                    # Skip hidden/system files
-                    if file.startswith(".") or file.startswith("__"):
-                        continue
+                # 2. Select members
+                members = self._select_members(zip_ref)
 
-                    ext = inner_path.suffix.lower().lstrip(".")
-                    if not ext:
-                        continue
-
-                    try:
-                        # Find processor for this file type
-                        processor = IngestionFactory.get_processor(ext)
-
-                        # Process
-                        # Note: recursion works automatically if zip contains zip and factory returns ArchiveProcessor
-                        docs = await processor.process(str(inner_path))
-
-                        # Enrich metadata to indicate origin
-                        for doc in docs:
-                            doc.metadata["archive_source"] = zip_path.name
-                            doc.metadata["original_filename"] = file
-                            # If we want to preserve folder structure:
-                            rel_path = inner_path.relative_to(temp_dir)
-                            doc.metadata["archive_path"] = str(rel_path)
-
-                        processed_docs.extend(docs)
-                        file_count += 1
+                # 3. Delegate concurrently (results keep archive order)
+                semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_MEMBERS)
+                results = await asyncio.gather(
+                    *(
+                        self._process_member(zip_ref, zip_path, info, index, spool_dir, semaphore)
+                        for index, info in enumerate(members)
+                    )
+                )
 
-                    except Exception as e:
-                        # Log warning but continue processing other files
-                        logger.warning(f"Failed to process file inside zip: {file} | {e}")
+            for docs in results:
+                processed_docs.extend(docs)
 
         except zipfile.BadZipFile:
             raise TechnicalError(f"Invalid or corrupted zip file: {zip_path.name}")
@@ -104,7 +79,87 @@ class ArchiveProcessor(FileProcessor):
             logger.error(f"Archive Processing Failed: {zip_path.name} | {e}", exc_info=True)
             raise TechnicalError(f"Failed to process archive: {e}")
         finally:
-            # Cleanup temp dir
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            # Cleanup spooled members
+            shutil.rmtree(spool_dir, ignore_errors=True)
 
         return processed_docs
+
+    def _select_members(self, zip_ref: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+        """Regular, non-hidden files with an extension, up to MAX_FILE_COUNT."""
+        members: List[zipfile.ZipInfo] = []
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+
+            name = PurePosixPath(info.filename).name
+
+            # Skip hidden/system files
+            if name.startswith(".") or name.startswith("__"):
+                continue
+
+            if not PurePosixPath(name).suffix:
+                continue
+
+            if len(members) >= self.MAX_FILE_COUNT:
+                logger.warning(f"Zip file count limit reached ({self.MAX_FILE_COUNT}). Skipping remaining files.")
+                break
+
+            members.append(info)
+        return members
+
+    async def _process_member(
+        self,
+        zip_ref: zipfile.ZipFile,
+        zip_path: Path,
+        info: zipfile.ZipInfo,
+        index: int,
+        spool_dir: Path,
+        semaphore: asyncio.Semaphore,
+    ) -> List[ProcessedDocument]:
+        """Process one member; failures are logged and yield no documents."""
+        # Local imports to avoid circular dependency
+        from app.factories.ingestion_factory import IngestionFactory
+        from app.services.ingestion.extraction_executor import get_extraction_executor
+
+        name = PurePosixPath(info.filename).name
+
+        async with semaphore:
+            member_dir: Optional[Path] = None
+            try:
+                # Find processor for this file type
+                processor = IngestionFactory.get_processor(PurePosixPath(name).suffix.lower().lstrip("."))
+
+                if processor.SUPPORTS_STREAM:
+                    with zip_ref.open(info) as stream:
+                        docs = await processor.process_stream(stream, name)
+                else:
+                    # Spool to disk, keeping the original file name (processors rely on it)
+                    # Note: recursion works automatically if zip contains zip and factory returns ArchiveProcessor
+                    member_dir = spool_dir / str(index)
+                    member_path = await asyncio.to_thread(self._spool_member, zip_ref, info, member_dir / name)
+                    docs = await get_extraction_executor().extract(processor, str(member_path))
+
+                # Enrich metadata to indicate origin
+                for doc in docs:
+                    doc.metadata["archive_source"] = zip_path.name
+                    doc.metadata["original_filename"] = name
+                    # Preserve folder structure
+                    doc.metadata["archive_path"] = info.filename
+
+                return docs
+
+            except Exception as e:
+                # Log warning but continue processing other files
+                logger.warning(f"Failed to process file inside zip: {name} | {e}")
+                return []
+            finally:
+                if member_dir is not None:
+                    await asyncio.to_thread(shutil.rmtree, member_dir, True)
+
+    @staticmethod
+    def _spool_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path) -> Path:
+        """Copy a single member to target (blocking, run in a thread)."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with zip_ref.open(info) as source, open(target, "wb") as dest:
+            shutil.copyfileobj(source, dest)
+        return target
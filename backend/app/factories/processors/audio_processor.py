@@ -56,6 +56,9 @@ class AudioProcessor(FileProcessor):
                 if provider == "gemini":
                     client = await get_gemini_client(settings_service)
                     service = GeminiAudioService(client, settings_service)
+                    model_key = "gemini:" + await settings_service.get_value(
+                        "gemini_transcription_model", default="gemini-1.5-flash"
+                    )
                 elif provider in ["ollama", "local"]:
                     from app.services.whisper_audio_service import WhisperAudioService
 
@@ -67,38 +70,45 @@ class AudioProcessor(FileProcessor):
 
                     service = WhisperAudioService(settings_service)
 
-                logger.info(f"Audio Processing Started ({provider}): {path.name}")
-
-                # Call Service (delegation)
-                chunks = await service.transcribe_file(str(path))
-
-                documents = []
-                for i, chunk in enumerate(chunks):
-                    # Format text content for RAG
-                    formatted_text = f"[{chunk.timestamp_start}] {chunk.speaker}: {chunk.text}"
-
-                    # Metadata
-                    meta: DocumentMetadata = {
-                        "file_name": path.name,
-                        "file_size": path.stat().st_size,
-                        "page_number": 1,  # Audio doesn't have pages, use 1
-                        "chunk_index": i,
-                        "source_type": "audio",
-                        # Custom fields (not in TypedDict but allowed by Python dicts)
-                        "speaker": chunk.speaker,
-                        "timestamp_start": chunk.timestamp_start,
-                    }
-
-                    documents.append(ProcessedDocument(content=formatted_text, metadata=meta, success=True))
-
-                logger.info(f"Audio Processing Complete: {path.name} | {len(documents)} segments")
-                if not documents:
-                    logger.warning(f"Audio Processing Yielded No Content: {path.name}")
-                    # Return empty success doc or failure?
-                    # Better to return empty list usually, but Pipeline expects something.
-                    # If truly empty, maybe it was silent.
-
-                return documents
+                if provider != "gemini":
+                    model_key = "whisper:" + (await settings_service.get_value("ollama_transcription_model") or "base")
+
+                async def _transcribe() -> List[ProcessedDocument]:
+                    logger.info(f"Audio Processing Started ({provider}): {path.name}")
+
+                    # Call Service (delegation)
+                    chunks = await service.transcribe_file(str(path))
+
+                    documents = []
+                    for i, chunk in enumerate(chunks):
+                        # Format text content for RAG
+                        formatted_text = f"[{chunk.timestamp_start}] {chunk.speaker}: {chunk.text}"
+
+                        # Metadata
+                        meta: DocumentMetadata = {
+                            "file_name": path.name,
+                            "file_size": path.stat().st_size,
+                            "page_number": 1,  # Audio doesn't have pages, use 1
+                            "chunk_index": i,
+                            "source_type": "audio",
+                            # Custom fields (not in TypedDict but allowed by Python dicts)
+                            "speaker": chunk.speaker,
+                            "timestamp_start": chunk.timestamp_start,
+                        }
+
+                        documents.append(ProcessedDocument(content=formatted_text, metadata=meta, success=True))
+
+                    logger.info(f"Audio Processing Complete: {path.name} | {len(documents)} segments")
+                    if not documents:
+                        logger.warning(f"Audio Processing Yielded No Content: {path.name}")
+                        # Return empty success doc or failure?
+                        # Better to return empty list usually, but Pipeline expects something.
+                        # If truly empty, maybe it was silent.
+
+                    return documents
+
+                # Same audio content + model already transcribed -> reuse the transcript
+                return await self._with_extraction_cache(path, model_key, _transcribe)
 
         except Exception as e:
             logger.error(f"Audio Processing Failed: {path.name} | {e}", exc_info=True)
@@ -7,10 +7,22 @@ Defines the contract for processing different file types.
 from __future__ import annotations  # PEP 563 - Allows list[T] syntax in Python 3.8
 
 import asyncio
+import hashlib
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, TypedDict
+from typing import Awaitable, BinaryIO, Callable, ClassVar, Optional, TypedDict
+
+logger = logging.getLogger(__name__)
+
+# Metadata derived from the file location rather than its content: refreshed on extraction cache hits
+_PATH_METADATA = {
+    "file_path": lambda path: str(path),
+    "file_name": lambda path: path.name,
+    "file_size": lambda path: path.stat().st_size,
+    "file_name_hash": lambda path: hashlib.sha256(path.name.encode()).hexdigest()[:16],
+}
 
 
 class DocumentMetadata(TypedDict, total=False):
@@ -80,8 +92,26 @@ class FileProcessor(ABC):
         - Implementations MUST validate file paths to prevent directory traversal
         - Implementations SHOULD set file size limits to prevent DoS
         - Implementations MUST handle malformed/malicious files gracefully
+
+    Performance:
+        CPU_BOUND processors (pure-Python parsers holding the GIL) are run in the
+        extraction process pool by ingestion. They must be instantiable without
+        arguments, return picklable results and do no I/O through application
+        resources (DB sessions, shared clients): workers run their own event loop.
+
+        SUPPORTS_STREAM processors also implement process_stream(), so archive
+        members can be read straight from the archive instead of spooled to disk.
     """
 
+    # Run in the extraction process pool instead of the event loop process
+    CPU_BOUND: ClassVar[bool] = False
+
+    # Accepts file-like input through process_stream()
+    SUPPORTS_STREAM: ClassVar[bool] = False
+
+    # Part of the extraction cache key: bump when the processor's output changes
+    EXTRACTION_VERSION: ClassVar[str] = "1"
+
     def __init__(self, max_file_size_bytes: int = 100 * 1024 * 1024):
         """
         Initialize file processor.
@@ -137,6 +167,80 @@ class FileProcessor(ABC):
         """
         pass
 
+    async def process_stream(
+        self, stream: BinaryIO, file_name: str, ai_provider: Optional[str] = None
+    ) -> list[ProcessedDocument]:
+        """
+        Process content read from a binary file-like object (SUPPORTS_STREAM processors only).
+
+        Args:
+            stream: Readable binary stream (e.g. an archive member)
+            file_name: Name of the source file (extension and metadata)
+
+        Returns:
+            Same contract as process()
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support stream input")
+
+    async def _with_extraction_cache(
+        self,
+        path: Path,
+        model: Optional[str],
+        extract: Callable[[], Awaitable[list[ProcessedDocument]]],
+    ) -> list[ProcessedDocument]:
+        """
+        Run extract() unless a file with the same content was already extracted
+        by this processor (same EXTRACTION_VERSION) with the same model.
+
+        Only fully successful, non-empty results are cached. Cache failures never
+        fail the extraction: the processor simply runs uncached.
+
+        Args:
+            path: Validated file path (content is hashed)
+            model: Model producing the extraction (part of the key)
+            extract: Coroutine factory performing the actual extraction
+        """
+        from app.factories.processors.extraction_cache import ExtractionCache, get_extraction_cache, hash_file
+
+        cache = get_extraction_cache()
+        key = None
+        if cache is not None:
+            try:
+                content_hash = await asyncio.to_thread(hash_file, path)
+                key = ExtractionCache.make_key(content_hash, type(self).__name__, self.EXTRACTION_VERSION, model)
+                pages = await asyncio.to_thread(cache.get, key)
+                if pages is not None:
+                    logger.info(f"extraction_cache_hit | {type(self).__name__} | {len(pages)} page(s)")
+                    return [self._restore_cached_page(page, path) for page in pages]
+            except Exception as e:
+                logger.debug(f"extraction_cache_unavailable | {e}")
+                key = None
+
+        results = await extract()
+
+        if key is not None and results and all(doc.success for doc in results):
+            pages = [
+                {
+                    "content": doc.content,
+                    "metadata": {k: v for k, v in doc.metadata.items() if k not in _PATH_METADATA},
+                    "path_keys": [k for k in doc.metadata if k in _PATH_METADATA],
+                }
+                for doc in results
+            ]
+            try:
+                await asyncio.to_thread(cache.put, key, pages)
+            except Exception as e:
+                logger.warning(f"extraction_cache_write_fail | {e}")
+
+        return results
+
+    @staticmethod
+    def _restore_cached_page(page: dict, path: Path) -> ProcessedDocument:
+        metadata = dict(page["metadata"])
+        for key in page.get("path_keys", []):
+            metadata[key] = _PATH_METADATA[key](path)
+        return ProcessedDocument(content=page["content"], metadata=metadata, success=True)
+
     async def _validate_file_path(self, file_path: str) -> Path:
         """
         Validate and normalize file path (async, non-blocking).
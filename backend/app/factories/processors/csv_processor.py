@@ -70,6 +70,7 @@ class CsvProcessor(FileProcessor):
     """
 
     # Configuration
+    CPU_BOUND = True  # pure-Python parsing, runs in the extraction process pool
     MAX_FILE_SIZE_MB: Final[int] = 50
     MAX_ROWS_PER_FILE: Final[int] = 100_000
     MAX_CONTENT_SIZE_MB: Final[int] = 25  # P0: Prevent DoS (smaller for CSV)
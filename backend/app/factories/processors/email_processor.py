@@ -19,6 +19,8 @@ class EmailProcessor(FileProcessor):
     Uses standard library for .eml and 'extract-msg' for .msg.
     """
 
+    CPU_BOUND = True  # pure-Python parsing, runs in the extraction process pool
+
     def __init__(self) -> None:
         super().__init__(max_file_size_bytes=50 * 1024 * 1024)
 
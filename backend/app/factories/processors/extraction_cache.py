@@ -0,0 +1,164 @@
+"""
+Extraction Cache - Content-addressed store for expensive extraction results.
+
+Cloud extraction (Gemini PDF OCR, audio transcription, image captioning) costs a full upload and
+generation round trip per file. Results are stored here keyed by the SHA-256 of the file CONTENT plus
+processor, processor version and model, so a re-sync after a touch/rename or the same file in another
+connector is served locally. Invalidation is implicit: new content, a processor version bump or a model
+change all produce a new key.
+
+STORAGE: Single SQLite database (WAL mode, shared safely by extraction worker processes).
+BOUND: Total payload size is capped; least recently used entries are evicted first.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(".cache") / "extraction"
+SQLITE_FILE = "extraction_cache.sqlite3"
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of the file content (blocking, run in a thread)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Size-bounded LRU cache of extracted pages ([{"content": ..., "metadata": {...}}, ...]).
+
+    ARCHITECT NOTE: Same storage pattern as the ingestion cache (SqliteKVStore)
+    - Lazy connection guarded by a lock, WAL + busy timeout for cross-process access
+    - Blocking API: callers offload with asyncio.to_thread
+    """
+
+    def __init__(self, db_path: str, max_bytes: int, busy_timeout_ms: int = 30000):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+            max_bytes: Maximum total payload size before LRU eviction
+            busy_timeout_ms: How long writers wait for a concurrent lock before failing
+        """
+        self.db_path = str(db_path)
+        self.max_bytes = max_bytes
+        self.busy_timeout_ms = busy_timeout_ms
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(content_hash: str, processor: str, version: str, model: Optional[str]) -> str:
+        return f"{processor}:{version}:{model or '-'}:{content_hash}"
+
+    def _connection(self) -> sqlite3.Connection:
+        """Lazily open the connection (called with lock held)."""
+        if self._conn is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS extraction ("
+                "key TEXT PRIMARY KEY, pages TEXT NOT NULL, size_bytes INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_extraction_last_access ON extraction (last_access)")
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[List[dict]]:
+        """Return cached pages and mark the entry as recently used."""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT pages FROM extraction WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE extraction SET last_access = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key: str, pages: List[dict]) -> None:
+        """Store pages, then evict least recently used entries beyond max_bytes."""
+        payload = json.dumps(pages, ensure_ascii=False, default=str)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            logger.debug(f"extraction_cache_skip_oversized | {size} bytes")
+            return
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO extraction (key, pages, size_bytes, last_access) VALUES (?, ?, ?, ?)",
+                    (key, payload, size, time.time()),
+                )
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM extraction").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = []
+        for key, size in conn.execute("SELECT key, size_bytes FROM extraction ORDER BY last_access ASC"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM extraction WHERE key = ?", evicted)
+        logger.info(f"🧹 Extraction cache evicted {len(evicted)} entr(y/ies) (LRU)")
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._connection().execute("SELECT COUNT(*) FROM extraction").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the underlying connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global singleton (one per process: extraction workers open their own connection)
+_global_cache: Optional[ExtractionCache] = None
+_init_lock = threading.Lock()
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """
+    Get or create the global extraction cache singleton using double-checked locking.
+
+    Returns:
+        Global ExtractionCache instance, or None if EXTRACTION_CACHE_ENABLED is off
+    """
+    global _global_cache
+    if not settings.EXTRACTION_CACHE_ENABLED:
+        return None
+    if _global_cache is None:
+        with _init_lock:
+            if _global_cache is None:
+                _global_cache = ExtractionCache(
+                    str(CACHE_DIR / SQLITE_FILE), max_bytes=settings.EXTRACTION_CACHE_MAX_MB * 1024 * 1024
+                )
+    return _global_cache
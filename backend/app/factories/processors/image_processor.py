@@ -54,22 +54,28 @@ class ImageProcessor(FileProcessor):
 
                 client = await get_gemini_client(settings_service)
                 service = GeminiVisionService(client, settings_service)
+                # Part of the extraction cache key
+                model_name = await settings_service.get_value("gemini_vision_model", default="gemini-1.5-flash")
 
-                logger.info(f"Image Processing Started: {path.name} (Provider: {provider})")
+                async def _describe() -> List[ProcessedDocument]:
+                    logger.info(f"Image Processing Started: {path.name} (Provider: {provider})")
 
-                description = await service.analyze_image(str(path))
+                    description = await service.analyze_image(str(path))
 
-                # Metadata
-                meta: DocumentMetadata = {
-                    "file_name": path.name,
-                    "file_size": path.stat().st_size,
-                    "page_number": 1,
-                    "source_type": "image",
-                }
+                    # Metadata
+                    meta: DocumentMetadata = {
+                        "file_name": path.name,
+                        "file_size": path.stat().st_size,
+                        "page_number": 1,
+                        "source_type": "image",
+                    }
 
-                logger.info(f"Image Processing Complete: {path.name}")
+                    logger.info(f"Image Processing Complete: {path.name}")
 
-                return [ProcessedDocument(content=description, metadata=meta, success=True)]
+                    return [ProcessedDocument(content=description, metadata=meta, success=True)]
+
+                # Same image content + model already captioned -> reuse the description
+                return await self._with_extraction_cache(path, f"gemini:{model_name}", _describe)
 
         except Exception as e:
             logger.error(f"Image Processing Failed: {path.name} | {e}", exc_info=True)
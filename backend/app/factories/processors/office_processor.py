@@ -70,6 +70,7 @@ class OfficeProcessor(FileProcessor):
 
     # Configuration (P2: Inject from settings)
     _settings = get_settings()
+    CPU_BOUND = True  # pure-Python parsing, runs in the extraction process pool
     MAX_FILE_SIZE_MB: Final[int] = 50
     PARSE_TIMEOUT_SECONDS: Final[float] = 60.0
     MAX_CONTENT_SIZE_CHARS: Final[int] = 10_000_000  # 10M chars (~20MB text)
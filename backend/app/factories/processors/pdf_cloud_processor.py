@@ -102,6 +102,8 @@ class PdfCloudProcessor(FileProcessor):
             async with SessionLocal() as db:
                 settings_service = SettingsService(db)
                 api_key = await settings_service.get_value("gemini_api_key")
+                # Part of the extraction cache key
+                model_name = await settings_service.get_value("gemini_chat_model", get_settings().GEMINI_CHAT_MODEL)
 
             if not api_key:
                 raise ConfigurationError("GEMINI_API_KEY is missing in both DB and Env. Cannot process PDF.")
@@ -116,107 +118,11 @@ class PdfCloudProcessor(FileProcessor):
             file_hash = self._hash_filename(validated_path.name)
             file_extension = validated_path.suffix.lower()
 
-            # CACHE: Check if we already extracted this PDF (based on mtime + size)
-            import json
-            import os
-
-            cache_dir = Path(".cache/pdf_extraction")
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            cache_file = cache_dir / f"{file_hash}.json"
-
-            file_stat = validated_path.stat()
-            file_signature = f"{file_stat.st_mtime}_{file_stat.st_size}"
-
-            if cache_file.exists():
-                try:
-                    cached = json.loads(cache_file.read_text(encoding="utf-8"))
-                    if cached.get("signature") == file_signature:
-                        logger.info(f"pdf_cache_hit | Hash: {file_hash}")
-                        # Reconstruct ProcessedDocument from cache
-                        results = []
-                        for page in cached.get("pages", []):
-                            meta = page.get("metadata", {})
-                            meta["file_path"] = str(validated_path)
-                            results.append(ProcessedDocument(content=page["content"], metadata=meta, success=True))
-                        return results
-                except Exception as e:
-                    logger.warning(f"pdf_cache_read_fail | {e}")
-
-            logger.info(
-                "pdf_processing_started",
-                extra={
-                    "file_hash": file_hash,
-                    "extension": file_extension,
-                    "provider": "gemini",
-                    "max_timeout": self.PARSE_TIMEOUT_SECONDS,
-                },
-            )
-
-            # Process with Gemini (with timeout)
-            # Returns list of dicts: [{"page_number": 1, "content": "..."}]
-            pages_data = await asyncio.wait_for(
-                self._process_with_gemini(str(validated_path), file_hash), timeout=self.PARSE_TIMEOUT_SECONDS
+            # CACHE: Same content + model already extracted (any path, any connector) -> no Gemini round trip
+            return await self._with_extraction_cache(
+                validated_path, model_name, lambda: self._extract(validated_path, file_hash, file_extension)
             )
 
-            # P0: Enforce strict type check
-            if not isinstance(pages_data, list):
-                logger.warning("gemini_invalid_format", extra={"file_hash": file_hash, "type": str(type(pages_data))})
-                return self._create_error_document("Gemini returned invalid format")
-
-            results = []
-            max_bytes = self.MAX_CONTENT_SIZE_MB * 1024 * 1024
-
-            for page in pages_data:
-                content = page.get("content", "")
-                page_num = page.get("page_number", 0)
-
-                # Truncation check per page
-                content_bytes = len(content.encode("utf-8"))
-                truncated = False
-
-                if content_bytes > max_bytes:
-                    encoded = content.encode("utf-8")[:max_bytes]
-                    content = encoded.decode("utf-8", errors="ignore")
-                    truncated = True
-
-                # Metadata per page
-                pdf_metadata = PdfMetadata(
-                    file_name_hash=file_hash,
-                    source_tool="Gemini",
-                    truncated=truncated,
-                    content_size_bytes=len(content.encode("utf-8")),
-                )
-
-                # P2: Flatten metadata for frontend usage
-                meta_dict = pdf_metadata.model_dump()
-                meta_dict["page_number"] = page_num
-                # FIX: Ensure file_path is preserved for file opening
-                meta_dict["file_path"] = str(validated_path)
-
-                results.append(ProcessedDocument(content=content, metadata=meta_dict, success=True))
-
-            if not results:
-                logger.warning("gemini_no_pages_returned", extra={"file_hash": file_hash})
-                return self._create_error_document("No content extracted")
-
-            logger.info("pdf_processing_completed", extra={"file_hash": file_hash, "pages_extracted": len(results)})
-
-            # CACHE: Save extraction results
-            try:
-                cache_data = {
-                    "signature": file_signature,
-                    "pages": [
-                        {"content": r.content, "metadata": {k: v for k, v in r.metadata.items() if k != "file_path"}}
-                        for r in results
-                    ],
-                }
-                cache_file.write_text(json.dumps(cache_data, ensure_ascii=False), encoding="utf-8")
-                logger.debug(f"pdf_cache_saved | Hash: {file_hash}")
-            except Exception as e:
-                logger.warning(f"pdf_cache_write_fail | {e}")
-
-            return results
-
         except asyncio.TimeoutError:
             logger.error(
                 "pdf_processing_timeout", extra={"file_hash": file_hash, "timeout_seconds": self.PARSE_TIMEOUT_SECONDS}
@@ -239,6 +145,74 @@ class PdfCloudProcessor(FileProcessor):
             logger.error("pdf_unexpected_error", extra={"file_hash": file_hash}, exc_info=True)
             return self._create_error_document(f"Unexpected error: {str(e)}")
 
+    async def _extract(self, validated_path: Path, file_hash: str, file_extension: str) -> list[ProcessedDocument]:
+        """
+        Extract all pages with Gemini (cache miss path).
+
+        Raises:
+            asyncio.TimeoutError, GeminiProcessorError: Handled by process()
+        """
+        logger.info(
+            "pdf_processing_started",
+            extra={
+                "file_hash": file_hash,
+                "extension": file_extension,
+                "provider": "gemini",
+                "max_timeout": self.PARSE_TIMEOUT_SECONDS,
+            },
+        )
+
+        # Process with Gemini (with timeout)
+        # Returns list of dicts: [{"page_number": 1, "content": "..."}]
+        pages_data = await asyncio.wait_for(
+            self._process_with_gemini(str(validated_path), file_hash), timeout=self.PARSE_TIMEOUT_SECONDS
+        )
+
+        # P0: Enforce strict type check
+        if not isinstance(pages_data, list):
+            logger.warning("gemini_invalid_format", extra={"file_hash": file_hash, "type": str(type(pages_data))})
+            return self._create_error_document("Gemini returned invalid format")
+
+        results = []
+        max_bytes = self.MAX_CONTENT_SIZE_MB * 1024 * 1024
+
+        for page in pages_data:
+            content = page.get("content", "")
+            page_num = page.get("page_number", 0)
+
+            # Truncation check per page
+            content_bytes = len(content.encode("utf-8"))
+            truncated = False
+
+            if content_bytes > max_bytes:
+                encoded = content.encode("utf-8")[:max_bytes]
+                content = encoded.decode("utf-8", errors="ignore")
+                truncated = True
+
+            # Metadata per page
+            pdf_metadata = PdfMetadata(
+                file_name_hash=file_hash,
+                source_tool="Gemini",
+                truncated=truncated,
+                content_size_bytes=len(content.encode("utf-8")),
+            )
+
+            # P2: Flatten metadata for frontend usage
+            meta_dict = pdf_metadata.model_dump()
+            meta_dict["page_number"] = page_num
+            # FIX: Ensure file_path is preserved for file opening
+            meta_dict["file_path"] = str(validated_path)
+
+            results.append(ProcessedDocument(content=content, metadata=meta_dict, success=True))
+
+        if not results:
+            logger.warning("gemini_no_pages_returned", extra={"file_hash": file_hash})
+            return self._create_error_document("No content extracted")
+
+        logger.info("pdf_processing_completed", extra={"file_hash": file_hash, "pages_extracted": len(results)})
+
+        return results
+
     async def _process_with_gemini(self, file_path: str, file_hash: str) -> str:
         """
         Uploads and processes the PDF file using Gemini.
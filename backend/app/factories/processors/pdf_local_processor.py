@@ -55,6 +55,7 @@ class PdfLocalProcessor(FileProcessor):
     """
 
     # Configuration constants
+    CPU_BOUND = True  # pure-Python parsing, runs in the extraction process pool
     MAX_FILE_SIZE_MB: Final[int] = 100
     MAX_CONTENT_SIZE_MB: Final[int] = 50  # Prevent OOM
 
@@ -3,22 +3,27 @@ PDF Processor - Smart hybrid processor with quality-based routing.
 
 STRATEGY (LOCAL-FIRST FOR COST/SPEED OPTIMIZATION):
 1. Try PdfLocalProcessor (pypdf) first - FREE, fast, local
-2. Analyze quality with PdfQualityInspector:
-   - Empty text (scanned PDF) → Use cloud (Gemini) with OCR/Multimodal
+2. Analyze quality PAGE BY PAGE with PdfQualityInspector:
+   - Empty text (scanned page) → Use cloud (Gemini) with OCR/Multimodal
    - Corrupted encoding → Use cloud
    - Quality score < 40 → Use cloud
-   - Quality score >= 40 → Keep local result (SAVE LATENCY)
-3. Cloud fallback (Gemini) only if:
-   - Local quality insufficient
-   - API key available
+   - Quality score >= 40 → Keep local page (SAVE LATENCY)
+3. Cloud fallback (Gemini) only for failing pages, and only if an API key is available:
+   - Failing pages are copied into a smaller PDF, extracted, and merged back in page order
+   - Whole document goes to cloud only when every page fails or pypdf cannot read it
 
-COST OPTIMIZATION: 80%+ of PDFs with native text stay local.
+COST OPTIMIZATION: 80%+ of PDFs with native text stay local; cloud cost scales with bad pages.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import tempfile
 from pathlib import Path
+from typing import Optional
+
+import pypdf
 
 from app.core.exceptions import ConfigurationError
 from app.core.settings import get_settings
@@ -84,60 +89,47 @@ class PdfProcessor(FileProcessor):
         # ========== STRATEGY 1: TRY LOCAL FIRST (FREE) ==========
         logger.info("pdf_attempting_local_processing_first", extra={"processor": "pypdf", "cost": "$0"})
 
+        local_result: list[ProcessedDocument] = []
         try:
-            local_result = await self._local_processor.process(str(validated_path), ai_provider=ai_provider)
+            local_result = await self._extract_locally(validated_path, ai_provider)
+        except Exception as e:
+            # Unexpected local processing error
+            logger.error("pdf_local_processor_unexpected_error_trying_cloud", extra={"error": str(e)}, exc_info=True)
 
-            # Check if local processing succeeded
-            if local_result and local_result[0].success:
-                content = local_result[0].content
+        if local_result and local_result[0].success:
+            # ========== PER-PAGE QUALITY INSPECTION ==========
+            local_pages, page_count = self._index_pages(local_result)
+            cloud_pages = self._select_cloud_pages(local_pages, page_count)
 
-                # ========== 100% TEXT CHECK ==========
-                # User Requirement: "If not 100% text (i.e., has images), use Cloud"
-                has_images = any(doc.metadata.get("has_images", False) for doc in local_result)
+            if not cloud_pages:
+                # ✅ LOCAL QUALITY SUFFICIENT ON EVERY PAGE - KEEP RESULT
+                logger.info(
+                    "pdf_local_processing_sufficient",
+                    extra={"processor": "pypdf", "page_count": page_count, "decision": "local_accepted"},
+                )
+                return local_result
 
-                if has_images:
+            if len(cloud_pages) < page_count:
+                # ⚖️ MIXED DOCUMENT - ONLY BAD PAGES GO TO CLOUD
+                if not self._has_api_key:
                     logger.warning(
-                        "pdf_images_detected_forcing_cloud",
-                        extra={"processor": "pypdf", "reason": "not_100_percent_text", "next_step": "cloud_fallback"},
+                        "pdf_no_cloud_key_keeping_local_result",
+                        extra={"quality": "potentially_poor", "suggestion": "configure_GEMINI_API_KEY"},
                     )
-                    # Force fallback by skipping to Cloud block
-                    # We do this by NOT returning here
-                else:
-                    # ========== QUALITY INSPECTION ==========
-                    quality_score = PdfQualityInspector.calculate_quality_score(content)
-                    should_use_cloud = PdfQualityInspector.should_use_cloud(content)
-
-                    # Decision point
-                    if not should_use_cloud:
-                        # ✅ LOCAL QUALITY SUFFICIENT - KEEP RESULT
-                        logger.info(
-                            "pdf_local_processing_sufficient",
-                            extra={"processor": "pypdf", "quality_score": quality_score, "decision": "local_accepted"},
-                        )
-                        return local_result
-
-                    # ❌ QUALITY INSUFFICIENT - NEED CLOUD
-                    logger.warning(
-                        "pdf_local_quality_insufficient_trying_cloud",
-                        extra={
-                            "quality_score": quality_score,
-                            "reason": PdfQualityInspector._get_decision_reason(content, quality_score),
-                            "next_step": "cloud_fallback",
-                        },
-                    )
-            else:
-                # Local processing returned error
-                logger.warning(
-                    "pdf_local_processing_failed_trying_cloud",
-                    extra={
-                        "error": local_result[0].error_message if local_result else "unknown",
-                        "next_step": "cloud_fallback",
-                    },
-                )
+                    return local_result
+                return await self._process_pages_in_cloud(validated_path, local_pages, cloud_pages, ai_provider)
 
-        except Exception as e:
-            # Unexpected local processing error
-            logger.error("pdf_local_processor_unexpected_error_trying_cloud", extra={"error": str(e)}, exc_info=True)
+            # ❌ EVERY PAGE INSUFFICIENT - WHOLE DOCUMENT TO CLOUD
+            logger.warning(
+                "pdf_local_quality_insufficient_trying_cloud",
+                extra={"page_count": page_count, "next_step": "cloud_fallback"},
+            )
+        elif local_result:
+            # Local processing returned error
+            logger.warning(
+                "pdf_local_processing_failed_trying_cloud",
+                extra={"error": local_result[0].error_message, "next_step": "cloud_fallback"},
+            )
 
         # ========== STRATEGY 2: CLOUD FALLBACK (GEMINI) ==========
         if not self._has_api_key:
@@ -225,6 +217,108 @@ class PdfProcessor(FileProcessor):
             )
         ]
 
+    async def _extract_locally(self, validated_path: Path, ai_provider: Optional[str]) -> list[ProcessedDocument]:
+        """
+        pypdf stage in the extraction process pool (PdfLocalProcessor is CPU_BOUND).
+
+        Page routing and the cloud stage stay on this event loop: they are I/O-bound and use the
+        application's pooled DB engine, which must not be driven from a worker's event loop.
+        """
+        # Local import to avoid circular dependency
+        from app.services.ingestion.extraction_executor import get_extraction_executor
+
+        return await get_extraction_executor().extract(self._local_processor, str(validated_path), ai_provider)
+
+    @staticmethod
+    def _index_pages(local_result: list[ProcessedDocument]) -> tuple[dict[int, ProcessedDocument], int]:
+        """
+        Map page number -> local page and compute the document page count.
+
+        pypdf omits pages without extractable text, so page_count may exceed the number of local pages.
+        """
+        pages = {doc.metadata.get("page_number", idx): doc for idx, doc in enumerate(local_result, start=1)}
+        declared = max((doc.metadata.get("page_count") or 0 for doc in local_result), default=0)
+        return pages, max([declared, *pages])
+
+    @staticmethod
+    def _select_cloud_pages(local_pages: dict[int, ProcessedDocument], page_count: int) -> list[int]:
+        """Pages (1-based, ascending) missing from the local result or failing the quality inspection."""
+        return [
+            page
+            for page in range(1, page_count + 1)
+            if page not in local_pages or PdfQualityInspector.should_use_cloud(local_pages[page].content)
+        ]
+
+    async def _process_pages_in_cloud(
+        self,
+        validated_path: Path,
+        local_pages: dict[int, ProcessedDocument],
+        cloud_pages: list[int],
+        ai_provider: Optional[str],
+    ) -> list[ProcessedDocument]:
+        """
+        Send only the failing pages to the cloud (as a smaller PDF) and merge results in page order.
+
+        COST: Cloud latency/tokens scale with the number of bad pages, not the document size.
+        FALLBACK: A page the cloud could not extract keeps its local text (if any).
+        """
+        logger.info(
+            "pdf_partial_cloud_routing",
+            extra={"cloud_pages": len(cloud_pages), "local_pages": len(local_pages), "processor": "Gemini"},
+        )
+
+        cloud_docs: dict[int, ProcessedDocument] = {}
+        subset_path: Optional[Path] = None
+        try:
+            subset_path, cloud_pages = await asyncio.to_thread(self._write_page_subset, validated_path, cloud_pages)
+            cloud_result = await self._cloud_processor.process(str(subset_path), ai_provider=ai_provider)
+
+            if cloud_result and cloud_result[0].success:
+                for position, doc in enumerate(cloud_result, start=1):
+                    # Cloud numbers pages within the subset: map back to the original document
+                    subset_page = doc.metadata.get("page_number") or position
+                    if not 1 <= subset_page <= len(cloud_pages):
+                        subset_page = position
+                    if subset_page > len(cloud_pages):
+                        continue
+                    original_page = cloud_pages[subset_page - 1]
+                    doc.metadata["page_number"] = original_page
+                    doc.metadata["file_path"] = str(validated_path)
+                    cloud_docs[original_page] = doc
+            else:
+                logger.error(
+                    "pdf_cloud_processing_failed",
+                    extra={"reason": cloud_result[0].error_message if cloud_result else "unknown"},
+                )
+        except Exception as e:
+            logger.error("pdf_partial_cloud_unexpected_error", extra={"error": str(e)}, exc_info=True)
+        finally:
+            if subset_path is not None:
+                subset_path.unlink(missing_ok=True)
+
+        return [cloud_docs.get(page) or local_pages[page] for page in sorted(set(local_pages) | set(cloud_docs))]
+
+    @staticmethod
+    def _write_page_subset(source: Path, pages: list[int]) -> tuple[Path, list[int]]:
+        """
+        Write the given pages of a PDF into a new temporary PDF (blocking, run in a thread).
+
+        Every call gets its own file (concurrent runs on the same source never share one); the caller
+        deletes it.
+
+        Returns:
+            Tuple of (subset path, pages actually written in subset order)
+        """
+        reader = pypdf.PdfReader(str(source))
+        writer = pypdf.PdfWriter()
+        written = [page for page in pages if 1 <= page <= len(reader.pages)]
+        for page in written:
+            writer.add_page(reader.pages[page - 1])
+
+        with tempfile.NamedTemporaryFile(prefix="vectra_pdf_pages_", suffix=".pdf", delete=False) as f:
+            writer.write(f)
+        return Path(f.name), written
+
     def get_supported_extensions(self) -> list[str]:
         """Supported extensions."""
         return ["pdf"]
@@ -11,7 +11,7 @@ import asyncio
 import hashlib
 import logging
 from pathlib import Path
-from typing import Final, Optional
+from typing import BinaryIO, Final, Optional
 
 from pydantic import BaseModel, Field
 
@@ -50,6 +50,9 @@ class TextProcessor(FileProcessor):
     - P1: Robust encoding detection fallback
     """
 
+    # Archive members are decoded straight from the zip
+    SUPPORTS_STREAM = True
+
     # Configuration
     MAX_FILE_SIZE_MB: Final[int] = 25  # Text files shouldn't be massive
     MAX_CONTENT_SIZE_CHARS: Final[int] = 5_000_000  # 5M chars (~10MB UTF-8)
@@ -77,31 +80,7 @@ class TextProcessor(FileProcessor):
             # Read content in thread pool
             content, encoding = await asyncio.to_thread(self._read_text_safe, validated_path)
 
-            # P0: Enforce content size limit
-            truncated = False
-            if len(content) > self.MAX_CONTENT_SIZE_CHARS:
-                logger.warning(
-                    "text_content_truncated",
-                    extra={
-                        "file_hash": file_hash,
-                        "original_chars": len(content),
-                        "max_chars": self.MAX_CONTENT_SIZE_CHARS,
-                    },
-                )
-                content = content[: self.MAX_CONTENT_SIZE_CHARS]
-                truncated = True
-
-            # P2: Type-safe metadata
-            metadata = TextMetadata(
-                file_name_hash=file_hash, char_count=len(content), encoding_used=encoding, truncated=truncated
-            )
-
-            logger.info(
-                "text_processing_completed",
-                extra={"file_hash": file_hash, "char_count": metadata.char_count, "encoding": encoding},
-            )
-
-            return [ProcessedDocument(content=content, metadata=metadata.model_dump(), success=True)]
+            return self._build_documents(content, encoding, file_hash)
 
         except FileNotFoundError:
             logger.error("text_file_not_found", extra={"file_hash": file_hash})
@@ -115,6 +94,60 @@ class TextProcessor(FileProcessor):
             logger.error("text_unexpected_error", extra={"file_hash": file_hash}, exc_info=True)
             return self._create_error_document(f"Unexpected error: {str(e)}")
 
+    async def process_stream(
+        self, stream: BinaryIO, file_name: str, ai_provider: Optional[str] = None
+    ) -> list[ProcessedDocument]:
+        """Process text read from a file-like object (e.g. a zip member, no temp file)."""
+        file_hash = self._hash_filename(file_name)
+
+        try:
+            logger.info("text_processing_started", extra={"file_hash": file_hash})
+
+            # P0: Bounded read (same limit as files on disk)
+            data = await asyncio.to_thread(stream.read, self.max_file_size_bytes + 1)
+            if len(data) > self.max_file_size_bytes:
+                raise ValueError(f"File too large (maximum allowed: {self.max_file_size_bytes:,} bytes)")
+
+            content, encoding = self._decode_text_safe(data)
+
+            return self._build_documents(content, encoding, file_hash)
+
+        except ValueError as e:
+            logger.error("text_validation_error", extra={"file_hash": file_hash, "error": str(e)})
+            return self._create_error_document(f"Validation failed: {str(e)}")
+
+        except Exception as e:
+            logger.error("text_unexpected_error", extra={"file_hash": file_hash}, exc_info=True)
+            return self._create_error_document(f"Unexpected error: {str(e)}")
+
+    def _build_documents(self, content: str, encoding: str, file_hash: str) -> list[ProcessedDocument]:
+        """Apply content limits and build the result document."""
+        # P0: Enforce content size limit
+        truncated = False
+        if len(content) > self.MAX_CONTENT_SIZE_CHARS:
+            logger.warning(
+                "text_content_truncated",
+                extra={
+                    "file_hash": file_hash,
+                    "original_chars": len(content),
+                    "max_chars": self.MAX_CONTENT_SIZE_CHARS,
+                },
+            )
+            content = content[: self.MAX_CONTENT_SIZE_CHARS]
+            truncated = True
+
+        # P2: Type-safe metadata
+        metadata = TextMetadata(
+            file_name_hash=file_hash, char_count=len(content), encoding_used=encoding, truncated=truncated
+        )
+
+        logger.info(
+            "text_processing_completed",
+            extra={"file_hash": file_hash, "char_count": metadata.char_count, "encoding": encoding},
+        )
+
+        return [ProcessedDocument(content=content, metadata=metadata.model_dump(), success=True)]
+
     def _read_text_safe(self, path: Path) -> tuple[str, str]:
         """Read file with encoding fallback."""
         for enc in self.ENCODINGS:
@@ -128,6 +161,16 @@ class TextProcessor(FileProcessor):
         # Better to raise error for TextProcessor
         raise TextError(f"Could not decode text file with any of: {self.ENCODINGS}")
 
+    def _decode_text_safe(self, data: bytes) -> tuple[str, str]:
+        """Decode raw bytes with the same encoding fallback as _read_text_safe."""
+        for enc in self.ENCODINGS:
+            try:
+                return data.decode(enc), enc
+            except UnicodeDecodeError:
+                continue
+
+        raise TextError(f"Could not decode text file with any of: {self.ENCODINGS}")
+
     @staticmethod
     def _hash_filename(filename: str) -> str:
         """Hash filename for secure logging (P0: PII Protection)."""
@@ -18,6 +18,7 @@ from app.factories.chat_engine_factory import ChatEngineFactory
 from app.schemas.enums import ConnectorType
 from app.factories.llm_factory import LLMFactory
 from app.services.settings_service import SettingsService
+from app.services.query_engine_cache import QueryEngineCache, get_query_engine_cache
 from app.services.sql_discovery_service import SQLDiscoveryService, get_sql_discovery_service
 from app.services.vector_service import VectorService, get_vector_service
 from app.services.chat.tool_context import current_tool_name
@@ -113,9 +114,15 @@ class UnifiedQueryEngineFactory:
     2. Router Query Engine (Agentic Decision) -> if SQL IS configured.
     """
 
-    def __init__(self, vector_service: VectorService, sql_service: SQLDiscoveryService):
+    def __init__(
+        self,
+        vector_service: VectorService,
+        sql_service: SQLDiscoveryService,
+        engine_cache: Optional[QueryEngineCache] = None,
+    ):
         self.vector_service = vector_service
         self.sql_service = sql_service
+        self.engine_cache = engine_cache or get_query_engine_cache()
 
     async def is_configured(self, assistant: Any) -> bool:
         """Verify if SQL is configured for this assistant."""
@@ -152,6 +159,27 @@ class UnifiedQueryEngineFactory:
         return ctype in sql_types
 
     async def create_engine(self, assistant: Any, language: str = "en", **kwargs) -> BaseQueryEngine:
+        """
+        Returns the compiled query engine for this assistant, building it on the first message only.
+        Engines are cached per (assistant, language) and rebuilt when the assistant or one of its
+        linked connectors changes. Custom engine kwargs bypass the cache.
+        """
+        if kwargs:
+            return await self._build_engine(assistant, language, **kwargs)
+
+        version = QueryEngineCache.compute_version(assistant)
+        engine = self.engine_cache.get_engine(assistant.id, language, version)
+        if engine is not None:
+            return engine
+
+        start_time = time.time()
+        engine = await self._build_engine(assistant, language)
+        connector_ids = [conn.id for conn in (assistant.linked_connectors or [])]
+        self.engine_cache.set_engine(assistant.id, language, version, engine, connector_ids)
+        logger.info(f"ROUTER_LOGIC | Engine built in {round(time.time() - start_time, 3)}s")
+        return engine
+
+    async def _build_engine(self, assistant: Any, language: str = "en", **kwargs) -> BaseQueryEngine:
         """
         Creates the appropriate query engine based on system configuration.
         Implements Strict Routing:
@@ -95,6 +95,31 @@ async def lifespan(app: FastAPI):
         await start_dashboard_broadcast(interval_seconds=5)
         await start_analytics_broadcast(interval_seconds=10)
 
+        # 7. Start Document Status Index (search-time status filtering without SQL)
+        from app.services.document_status_index import start_document_status_index
+
+        await start_document_status_index()
+
+        # 8. Qdrant Collection Migrations: storage profiles, payload indexes (background)
+        from app.services.collection_migrations import start_collection_migrations
+
+        await start_collection_migrations()
+
+        # 9. Start Semantic Cache L1 invalidation subscriber (L1 serves only while subscribed)
+        from app.services.semantic_cache_l1 import start_semantic_cache_l1
+
+        await start_semantic_cache_l1()
+
+        # 10. Start Semantic Cache Index rebuilds (in-memory vectors of small assistant caches)
+        from app.services.semantic_cache_index import start_semantic_cache_index
+
+        await start_semantic_cache_index()
+
+        # 11. Start Semantic Cache Maintenance (capacity eviction, Qdrant orphan reconciliation)
+        from app.services.semantic_cache_maintenance import start_semantic_cache_maintenance
+
+        await start_semantic_cache_maintenance()
+
         logger.info("✅ Startup sequence complete.")
 
     except Exception as e:
@@ -111,9 +136,29 @@ async def lifespan(app: FastAPI):
     from app.api.v1.endpoints.dashboard import stop_broadcast_task as stop_dashboard_broadcast
     from app.api.v1.endpoints.analytics import stop_broadcast_task as stop_analytics_broadcast
 
-    await asyncio.gather(stop_dashboard_broadcast(), stop_analytics_broadcast(), return_exceptions=True)
+    from app.services.document_status_index import stop_document_status_index
+    from app.services.collection_migrations import stop_collection_migrations
+    from app.services.semantic_cache_l1 import stop_semantic_cache_l1
+    from app.services.semantic_cache_index import stop_semantic_cache_index
+    from app.services.semantic_cache_maintenance import stop_semantic_cache_maintenance
+
+    await asyncio.gather(
+        stop_dashboard_broadcast(),
+        stop_analytics_broadcast(),
+        stop_document_status_index(),
+        stop_collection_migrations(),
+        stop_semantic_cache_l1(),
+        stop_semantic_cache_index(),
+        stop_semantic_cache_maintenance(),
+        return_exceptions=True,
+    )
 
     scheduler_service.shutdown()
+
+    # Stop extraction worker processes (ingestion)
+    from app.services.ingestion.extraction_executor import shutdown_extraction_executor
+
+    shutdown_extraction_executor()
     logger.info("Goodbye.")
 
 
@@ -1,9 +1,10 @@
 import json
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
+import msgpack
 from fastapi import Depends
 from redis.asyncio import Redis
 from sqlalchemy import delete, select
@@ -21,6 +22,9 @@ class ChatRedisRepository:
     """
     Repository for accessing Chat History in Redis (Hot Storage).
     Handles Context Window (Sliding Window).
+
+    Messages are stored msgpack-encoded (the client must not decode responses); items written as JSON
+    by earlier versions are still read until the window expires.
     """
 
     WINDOW_SIZE = 10
@@ -33,25 +37,39 @@ class ChatRedisRepository:
     def _get_key(self, session_id: str) -> str:
         return f"{self.KEY_PREFIX}{session_id}"
 
+    @staticmethod
+    def _encode(message_data: Dict[str, Any]) -> bytes:
+        return msgpack.packb(message_data, use_bin_type=True)
+
+    @staticmethod
+    def _decode(item: Union[bytes, str]) -> Any:
+        if isinstance(item, str) or item[:1] == b"{":
+            # Legacy JSON item
+            return json.loads(item)
+        return msgpack.unpackb(item, raw=False)
+
     async def push_messages(self, session_id: str, messages: List[Dict[str, Any]]) -> None:
         """
         Atomic Bulk Push + Trim + Expire.
-        Uses a single pipeline for multiple messages.
+        A single MULTI pipeline for all the messages.
         """
         if not session_id or not messages:
             return
 
         key = self._get_key(session_id)
 
-        try:
-            async with self.redis.pipeline() as pipe:
-                for message_data in messages:
-                    try:
-                        message_json = json.dumps(message_data)
-                        pipe.rpush(key, message_json)
-                    except (TypeError, ValueError) as e:
-                        logger.error(f"Failed to serialize message for Redis: {e}")
+        encoded = []
+        for message_data in messages:
+            try:
+                encoded.append(self._encode(message_data))
+            except (TypeError, ValueError) as e:
+                logger.error(f"Failed to serialize message for Redis: {e}")
+        if not encoded:
+            return
 
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.rpush(key, *encoded)
                 pipe.ltrim(key, -self.WINDOW_SIZE, -1)
                 pipe.expire(key, self.TTL_SECONDS)
                 await pipe.execute()
@@ -68,21 +86,48 @@ class ChatRedisRepository:
         """
         Get the current sliding window.
         """
+        history, _ = await self.get_recent_messages_and_entries(session_id, [])
+        return history
+
+    async def get_recent_messages_and_entries(
+        self, session_id: str, keys: List[str]
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[Optional[bytes], int]]]:
+        """
+        Get the current sliding window and, in the same round trip, the value and remaining TTL (ms,
+        negative = none/missing) of other string keys (e.g. the exact semantic cache entry of the question).
+
+        Returns:
+            (window, [(value, ttl_ms) per key]), an empty window and no entries if Redis fails
+        """
         key = self._get_key(session_id)
         try:
-            raw_items = await self.redis.lrange(key, 0, -1)
-            history = []
-            for item in raw_items:
-                try:
-                    if isinstance(item, bytes):
-                        item = item.decode("utf-8")
-                    history.append(json.loads(item))
-                except json.JSONDecodeError:
-                    logger.warning(f"Skipping malformed history item in {session_id}")
-            return history
+            if keys:
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.lrange(key, 0, -1)
+                for entry_key in keys:
+                    pipe.get(entry_key)
+                    pipe.pttl(entry_key)
+                results = await pipe.execute()
+                raw_items = results[0]
+                entries = list(zip(results[1::2], results[2::2]))
+            else:
+                raw_items = await self.redis.lrange(key, 0, -1)
+                entries = []
         except Exception as e:
             logger.error(f"Redis read failed for session {session_id}: {e}")
-            return []
+            return [], []
+
+        history = []
+        for item in raw_items:
+            try:
+                message_data = self._decode(item)
+            except (TypeError, ValueError):
+                message_data = None
+            if isinstance(message_data, dict):
+                history.append(message_data)
+            else:
+                logger.warning(f"Skipping malformed history item in {session_id}")
+        return history, entries
 
     async def clear(self, session_id: str) -> None:
         """Clear Redis history."""
@@ -8,12 +8,14 @@ status filtering, and ACL-based access control.
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.exceptions import TechnicalError
 from app.models.connector_document import ConnectorDocument
@@ -128,6 +130,33 @@ class DocumentRepository(SQLRepository[ConnectorDocument, Any, Any]):
             logger.error(f"Database error getting documents by status {status}: {e}")
             raise TechnicalError(f"Failed to fetch documents by status: {e}")
 
+    async def get_indexed_refs(self) -> List[Tuple[UUID, UUID]]:
+        """Get (id, connector_id) of every INDEXED document (no row hydration, used by the status index)."""
+        try:
+            statement = select(ConnectorDocument.id, ConnectorDocument.connector_id).where(
+                ConnectorDocument.status == DocStatus.INDEXED
+            )
+            result = await self.db.execute(statement)
+            return [(row[0], row[1]) for row in result.all()]
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting indexed document refs: {e}")
+            raise TechnicalError(f"Failed to fetch indexed documents: {e}")
+
+    async def get_indexed_csv_schemas(self) -> List[Tuple[UUID, UUID, Dict[str, Any]]]:
+        """Get (id, connector_id, ai_schema) of every INDEXED CSV document mapped by schema discovery."""
+        try:
+            statement = select(
+                ConnectorDocument.id, ConnectorDocument.connector_id, ConnectorDocument.file_metadata
+            ).where(
+                ConnectorDocument.status == DocStatus.INDEXED,
+                func.lower(ConnectorDocument.file_path).like("%.csv"),
+            )
+            result = await self.db.execute(statement)
+            return [(row[0], row[1], row[2]["ai_schema"]) for row in result.all() if (row[2] or {}).get("ai_schema")]
+        except SQLAlchemyError as e:
+            logger.error(f"Database error getting indexed CSV schemas: {e}")
+            raise TechnicalError(f"Failed to fetch indexed CSV documents: {e}")
+
     async def get_pending_documents(self, limit: int = DEFAULT_LIMIT) -> List[ConnectorDocument]:
         """Get documents pending processing."""
         return await self.get_by_status(DocStatus.PENDING, skip=0, limit=limit)
@@ -265,6 +294,47 @@ class DocumentRepository(SQLRepository[ConnectorDocument, Any, Any]):
             logger.error(f"Failed to update status for document {document_id}: {e}")
             raise TechnicalError(f"Failed to update status: {e}")
 
+    async def bulk_update(self, updates: Dict[UUID, Dict[str, Any]]) -> int:
+        """
+        Apply partial updates to many documents in one transaction.
+
+        Rows sharing the same set of columns are sent as a single executemany UPDATE
+        (ORM bulk UPDATE by primary key), instead of one SELECT + UPDATE + commit per document.
+
+        Args:
+            updates: Document ID -> fields to update
+
+        Returns:
+            Number of documents updated
+
+        Raises:
+            TechnicalError: If database operation fails
+        """
+        if not updates:
+            return 0
+
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for doc_id, values in updates.items():
+            groups.setdefault(frozenset(values), []).append({"id": doc_id, **values})
+
+        try:
+            for rows in groups.values():
+                await self.db.execute(update(ConnectorDocument), rows)
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Database error bulk updating {len(updates)} documents: {e}", exc_info=True)
+            raise TechnicalError(f"Failed to bulk update documents: {e}")
+
+        # Keep already loaded instances in sync (the session does not expire on commit)
+        for doc_id, values in updates.items():
+            entity = self.db.identity_map.get(identity_key(ConnectorDocument, doc_id))
+            if entity is not None:
+                for key, value in values.items():
+                    set_committed_value(entity, key, value)
+
+        return len(updates)
+
     async def get_aggregate_stats(self) -> dict:
         """
         Calculates aggregate statistics for all documents.
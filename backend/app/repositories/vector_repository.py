@@ -5,22 +5,57 @@ Handles all interactions with the Vector Database using the async client to prev
 """
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.exceptions import UnexpectedResponse
-from qdrant_client.http.models import (FieldCondition, Filter, FilterSelector,
-                                       MatchAny, MatchValue, PointStruct)
+from qdrant_client.http.models import FieldCondition, Filter, FilterSelector, MatchAny, MatchValue, PointStruct
 
 from app.core.exceptions import ExternalDependencyError
+from app.core.sparse_encoder import SPARSE_VECTOR_NAME
+from app.schemas.enums import DocStatus
 
 logger = logging.getLogger(__name__)
 
 # Constants
 UPSERT_BATCH_SIZE = 100
+DELETE_BATCH_SIZE = 1000
+SCROLL_BATCH_SIZE = 1000
+
+# Document lifecycle mirrored into every point payload (filtered server-side at search time)
+DOC_STATUS_FIELD = "doc_status"
+IS_ACTIVE_FIELD = "is_active"
+NON_SEARCHABLE_STATUSES = [status.value for status in DocStatus if status != DocStatus.INDEXED]
+
+# Payload indexes of the system fields filtered on in every Vectra collection (documents, semantic cache,
+# trending). Without them each filter scans the payload of every point.
+SYSTEM_PAYLOAD_INDEXES: Dict[str, models.PayloadSchemaType] = {
+    "connector_id": models.PayloadSchemaType.KEYWORD,
+    "connector_document_id": models.PayloadSchemaType.KEYWORD,
+    "connector_acl": models.PayloadSchemaType.KEYWORD,
+    "assistant_id": models.PayloadSchemaType.KEYWORD,
+    "type": models.PayloadSchemaType.KEYWORD,
+    DOC_STATUS_FIELD: models.PayloadSchemaType.KEYWORD,
+    IS_ACTIVE_FIELD: models.PayloadSchemaType.BOOL,
+    "year_start": models.PayloadSchemaType.INTEGER,  # CSV year range enrichment (SmartRowTransformer)
+    "year_end": models.PayloadSchemaType.INTEGER,
+}
+
+
+def _copy_point(point: Any, vector_fn: Optional[Callable[[Any], Any]]) -> PointStruct:
+    vector = vector_fn(point) if vector_fn else point.vector
+    return PointStruct(id=point.id, vector=vector, payload=point.payload)
+
+
+def _payload_fingerprint(payload: Optional[Dict[str, Any]]) -> str:
+    """Version of a point for the profile migration catch-up (any payload write changes it)."""
+    encoded = json.dumps(payload or {}, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
 
 class VectorRepository:
@@ -145,6 +180,59 @@ class VectorRepository:
             logger.error(f"Failed to delete {context_name}: {e}")
             raise ExternalDependencyError(f"Vector DB Delete Failed: {e}", service="qdrant")
 
+    async def delete_points(self, collection_name: str, point_ids: List[str]) -> None:
+        """Deletes specific points by ID (batched)."""
+        if not point_ids:
+            return
+
+        try:
+            for i in range(0, len(point_ids), DELETE_BATCH_SIZE):
+                await self.client.delete(
+                    collection_name=collection_name,
+                    points_selector=models.PointIdsList(points=point_ids[i : i + DELETE_BATCH_SIZE]),
+                    wait=True,
+                )
+            logger.debug(f"Deleted {len(point_ids)} points from {collection_name}")
+
+        except Exception as e:
+            logger.error(f"Failed to delete {len(point_ids)} points from {collection_name}: {e}")
+            raise ExternalDependencyError(f"Vector DB Delete Failed: {e}", service="qdrant")
+
+    async def get_payload_field_by_document_id(
+        self, collection_name: str, document_id: UUID, field: str
+    ) -> Dict[str, Any]:
+        """
+        Returns {point_id: payload[field]} for every point of a document.
+        Scrolls with a payload projection (no vectors) to keep the transfer small.
+        """
+        values: Dict[str, Any] = {}
+        offset = None
+        try:
+            while True:
+                points, offset = await self.client.scroll(
+                    collection_name=collection_name,
+                    scroll_filter=Filter(
+                        must=[FieldCondition(key="connector_document_id", match=MatchValue(value=str(document_id)))]
+                    ),
+                    limit=SCROLL_BATCH_SIZE,
+                    offset=offset,
+                    with_payload=[field],
+                    with_vectors=False,
+                )
+                for point in points:
+                    values[str(point.id)] = (point.payload or {}).get(field)
+                if offset is None:
+                    break
+            return values
+
+        except Exception as e:
+            if "not found" in str(e).lower():
+                logger.warning(f"Collection {collection_name} not found during scroll. Ignoring.")
+                return {}
+
+            logger.error(f"Failed to scroll payloads for document {document_id}: {e}")
+            raise ExternalDependencyError(f"Vector DB Scroll Failed: {e}", service="qdrant")
+
     async def update_acl(
         self, collection_name: str, filter_key: str, filter_value: str, new_acl: Union[str, List[str]]
     ) -> None:
@@ -169,6 +257,391 @@ class VectorRepository:
             logger.error(f"Failed to update ACL: {e}")
             raise ExternalDependencyError(f"Vector DB ACL Update Failed: {e}", service="qdrant")
 
+    async def list_collections(self) -> List[str]:
+        """Names of every collection of the Qdrant instance."""
+        try:
+            response = await self.client.get_collections()
+            return [collection.name for collection in response.collections]
+        except Exception as e:
+            logger.error(f"Failed to list collections: {e}")
+            raise ExternalDependencyError(f"Vector DB List Collections Failed: {e}", service="qdrant")
+
+    async def get_payload_schema(self, collection_name: str) -> Dict[str, Any]:
+        """Indexed payload fields of a collection ({field: data type})."""
+        try:
+            info = await self.client.get_collection(collection_name)
+            return {field: getattr(schema, "data_type", None) for field, schema in (info.payload_schema or {}).items()}
+        except Exception as e:
+            logger.error(f"Failed to read payload schema of {collection_name}: {e}")
+            raise ExternalDependencyError(f"Vector DB Collection Info Failed: {e}", service="qdrant")
+
+    async def create_payload_indexes(
+        self, collection_name: str, schema: Dict[str, models.PayloadSchemaType], wait: bool = True
+    ) -> List[str]:
+        """
+        Creates the payload indexes of `schema` that do not exist yet.
+        With wait=False Qdrant builds them in the background (existing collections with many points).
+
+        Returns:
+            Fields whose index was created
+        """
+        existing = await self.get_payload_schema(collection_name)
+        created = []
+        try:
+            for field_name, field_schema in schema.items():
+                if field_name in existing:
+                    continue
+                await self.client.create_payload_index(
+                    collection_name=collection_name, field_name=field_name, field_schema=field_schema, wait=wait
+                )
+                created.append(field_name)
+        except Exception as e:
+            logger.error(f"Failed to create payload indexes on {collection_name}: {e}")
+            raise ExternalDependencyError(f"Vector DB Payload Index Failed: {e}", service="qdrant")
+
+        if created:
+            logger.info(f"Created payload indexes on {collection_name}: {created}")
+        return created
+
+    async def get_sample_payload(self, collection_name: str, document_id: UUID) -> Optional[Dict[str, Any]]:
+        """Payload of one point of a document (None if the document has no vectors)."""
+        try:
+            points, _ = await self.client.scroll(
+                collection_name=collection_name,
+                scroll_filter=Filter(
+                    must=[FieldCondition(key="connector_document_id", match=MatchValue(value=str(document_id)))]
+                ),
+                limit=1,
+                with_payload=True,
+                with_vectors=False,
+            )
+            return (points[0].payload or {}) if points else None
+        except Exception as e:
+            logger.error(f"Failed to sample payload of document {document_id}: {e}")
+            raise ExternalDependencyError(f"Vector DB Scroll Failed: {e}", service="qdrant")
+
+    async def get_collection_info(self, collection_name: str) -> Any:
+        """Collection info (config, points count...), alias names are resolved by Qdrant."""
+        try:
+            return await self.client.get_collection(collection_name)
+        except Exception as e:
+            logger.error(f"Failed to read collection {collection_name}: {e}")
+            raise ExternalDependencyError(f"Vector DB Collection Info Failed: {e}", service="qdrant")
+
+    async def get_alias_target(self, alias_name: str) -> Optional[str]:
+        """Collection an alias points to (None if the name is not an alias)."""
+        try:
+            response = await self.client.get_aliases()
+            for alias in response.aliases:
+                if alias.alias_name == alias_name:
+                    return alias.collection_name
+            return None
+        except Exception as e:
+            logger.error(f"Failed to read aliases: {e}")
+            raise ExternalDependencyError(f"Vector DB Aliases Failed: {e}", service="qdrant")
+
+    async def copy_points(
+        self,
+        source: str,
+        target: str,
+        batch_size: int = UPSERT_BATCH_SIZE,
+        vector_fn: Optional[Callable[[Any], Any]] = None,
+    ) -> int:
+        """
+        Copies every point (vectors + payload) of `source` into `target`.
+        Source stays readable and writable during the copy.
+        vector_fn(point) can rewrite the vectors on the way (e.g. add a sparse vector).
+
+        Returns:
+            Number of points copied
+        """
+        copied = 0
+        offset = None
+        try:
+            while True:
+                points, offset = await self.client.scroll(
+                    collection_name=source, limit=batch_size, offset=offset, with_payload=True, with_vectors=True
+                )
+                if points:
+                    await self.client.upsert(
+                        collection_name=target,
+                        points=[_copy_point(p, vector_fn) for p in points],
+                        wait=True,
+                    )
+                    copied += len(points)
+                if offset is None:
+                    return copied
+        except Exception as e:
+            logger.error(f"Failed to copy points from {source} to {target}: {e}")
+            raise ExternalDependencyError(f"Vector DB Copy Failed: {e}", service="qdrant")
+
+    async def sync_points(
+        self, source: str, target: str, vector_fn: Optional[Callable[[Any], Any]] = None
+    ) -> Tuple[int, Dict[Any, str]]:
+        """
+        Catch-up after copy_points: copies the points added to `source` meanwhile or modified since their copy
+        (different payload fingerprint: re-upserts, doc_status / is_active set_payload...) and drops the points
+        deleted from it.
+
+        Returns:
+            Number of points copied or deleted, and the fingerprints of `source` the target now matches
+            (the snapshot drain_points compares against)
+        """
+        snapshot = await self.point_fingerprints(source)
+        target_fingerprints = await self.point_fingerprints(target)
+        changed = [point_id for point_id, fp in snapshot.items() if target_fingerprints.get(point_id) != fp]
+        deleted = [point_id for point_id in target_fingerprints if point_id not in snapshot]
+
+        copied = await self.copy_point_ids(source, target, changed, vector_fn=vector_fn)
+        for point_id in changed:
+            # What was actually copied: the point may have changed (or gone) since the scroll
+            if point_id in copied:
+                snapshot[point_id] = copied[point_id]
+            else:
+                snapshot.pop(point_id, None)
+
+        await self.delete_points(target, deleted)
+        return len(changed) + len(deleted), snapshot
+
+    async def drain_points(
+        self,
+        source: str,
+        target: str,
+        snapshot: Dict[Any, str],
+        vector_fn: Optional[Callable[[Any], Any]] = None,
+    ) -> int:
+        """
+        Last catch-up, once the alias serves `target`: applies the writes that reached `source` after `snapshot`
+        (sync_points) was taken. A target point that no longer matches the snapshot was written through the
+        alias since the swap: it is newer and kept.
+
+        Returns:
+            Number of points copied or deleted
+        """
+        current = await self.point_fingerprints(source)
+        target_fingerprints = await self.point_fingerprints(target)
+        changed = [
+            point_id
+            for point_id, fp in current.items()
+            if snapshot.get(point_id) != fp and target_fingerprints.get(point_id) == snapshot.get(point_id)
+        ]
+        deleted = [
+            point_id
+            for point_id, fp in snapshot.items()
+            if point_id not in current and target_fingerprints.get(point_id) == fp
+        ]
+
+        await self.copy_point_ids(source, target, changed, vector_fn=vector_fn)
+        await self.delete_points(target, deleted)
+        return len(changed) + len(deleted)
+
+    async def copy_point_ids(
+        self, source: str, target: str, point_ids: List[Any], vector_fn: Optional[Callable[[Any], Any]] = None
+    ) -> Dict[Any, str]:
+        """
+        Copies the given points (vectors + payload) of `source` into `target`.
+
+        Returns:
+            Fingerprint of every point copied (ids missing from `source` are skipped)
+        """
+        copied: Dict[Any, str] = {}
+        try:
+            for i in range(0, len(point_ids), UPSERT_BATCH_SIZE):
+                points = await self.client.retrieve(
+                    collection_name=source,
+                    ids=point_ids[i : i + UPSERT_BATCH_SIZE],
+                    with_payload=True,
+                    with_vectors=True,
+                )
+                if points:
+                    await self.client.upsert(
+                        collection_name=target,
+                        points=[_copy_point(p, vector_fn) for p in points],
+                        wait=True,
+                    )
+                    copied.update((p.id, _payload_fingerprint(p.payload)) for p in points)
+            return copied
+        except Exception as e:
+            logger.error(f"Failed to catch up {target} with {source}: {e}")
+            raise ExternalDependencyError(f"Vector DB Copy Failed: {e}", service="qdrant")
+
+    async def scroll_points(
+        self,
+        collection_name: str,
+        payload_fields: Optional[List[str]] = None,
+        with_vectors: bool = True,
+        batch_size: int = SCROLL_BATCH_SIZE,
+    ) -> AsyncIterator[List[Any]]:
+        """Every point of a collection, one scroll page at a time (payload restricted to `payload_fields`)."""
+        offset = None
+        while True:
+            try:
+                points, offset = await self.client.scroll(
+                    collection_name=collection_name,
+                    limit=batch_size,
+                    offset=offset,
+                    with_payload=payload_fields if payload_fields is not None else True,
+                    with_vectors=with_vectors,
+                )
+            except Exception as e:
+                logger.error(f"Failed to scroll points of {collection_name}: {e}")
+                raise ExternalDependencyError(f"Vector DB Scroll Failed: {e}", service="qdrant")
+            if points:
+                yield points
+            if offset is None:
+                return
+
+    async def point_fingerprints(self, collection_name: str) -> Dict[Any, str]:
+        """Payload fingerprint of every point of a collection (no vectors, they derive from the payload text)."""
+        fingerprints: Dict[Any, str] = {}
+        async for points in self.scroll_points(collection_name, with_vectors=False):
+            fingerprints.update((point.id, _payload_fingerprint(point.payload)) for point in points)
+        return fingerprints
+
+    async def swap_collection_alias(self, alias_name: str, collection_name: str) -> None:
+        """Points the existing alias `alias_name` to `collection_name` (one atomic operation)."""
+        try:
+            await self.client.update_collection_aliases(
+                change_aliases_operations=[
+                    models.DeleteAliasOperation(delete_alias=models.DeleteAlias(alias_name=alias_name)),
+                    models.CreateAliasOperation(
+                        create_alias=models.CreateAlias(collection_name=collection_name, alias_name=alias_name)
+                    ),
+                ]
+            )
+        except Exception as e:
+            logger.error(f"Failed to swap alias {alias_name} to {collection_name}: {e}")
+            raise ExternalDependencyError(f"Vector DB Alias Swap Failed: {e}", service="qdrant")
+
+    async def replace_collection_with_alias(
+        self,
+        alias_name: str,
+        collection_name: str,
+        vector_fn: Optional[Callable[[Any], Any]] = None,
+        attempts: int = 3,
+    ) -> None:
+        """
+        Replaces the real collection `alias_name` with an alias to `collection_name`.
+
+        Qdrant forbids an alias with the name of a collection, so the collection is dropped first: queries
+        fail for the short time between the two calls, and a concurrent writer (ensure_collection_exists)
+        may recreate an empty collection under that name. Such a collection makes the alias creation fail:
+        the points written to it are copied into `collection_name`, it is dropped again and the alias retried.
+        """
+        for attempt in range(1, attempts + 1):
+            try:
+                await self.client.delete_collection(alias_name)
+                await self.client.update_collection_aliases(
+                    change_aliases_operations=[
+                        models.CreateAliasOperation(
+                            create_alias=models.CreateAlias(collection_name=collection_name, alias_name=alias_name)
+                        )
+                    ]
+                )
+                return
+            except Exception as e:
+                if attempt == attempts or not await self.client.collection_exists(alias_name):
+                    logger.error(f"Failed to replace collection {alias_name} with an alias to {collection_name}: {e}")
+                    raise ExternalDependencyError(f"Vector DB Alias Swap Failed: {e}", service="qdrant")
+
+                logger.warning(f"Collection {alias_name} was recreated during its replacement, merging it (retry)")
+                await self.copy_points(alias_name, collection_name, vector_fn=vector_fn)
+
+    @staticmethod
+    def build_search_filter(must: Optional[List[Any]] = None) -> Filter:
+        """
+        Search filter excluding points of non-indexed documents and disabled connectors.
+        Uses must_not so points written before the lifecycle payload existed stay searchable.
+        """
+        return Filter(
+            must=must or None,
+            must_not=[
+                FieldCondition(key=DOC_STATUS_FIELD, match=MatchAny(any=NON_SEARCHABLE_STATUSES)),
+                FieldCondition(key=IS_ACTIVE_FIELD, match=MatchValue(value=False)),
+            ],
+        )
+
+    async def set_document_status(self, collection_name: str, document_ids: List[UUID], status: str) -> None:
+        """
+        Mirrors a document status into the payload of all points of the given documents.
+        One filtered set_payload per DELETE_BATCH_SIZE documents (no point ids needed).
+        """
+        values = [str(doc_id) for doc_id in document_ids]
+        try:
+            for i in range(0, len(values), DELETE_BATCH_SIZE):
+                await self.client.set_payload(
+                    collection_name=collection_name,
+                    payload={DOC_STATUS_FIELD: str(status)},
+                    points=Filter(
+                        must=[
+                            FieldCondition(
+                                key="connector_document_id", match=MatchAny(any=values[i : i + DELETE_BATCH_SIZE])
+                            )
+                        ]
+                    ),
+                )
+            logger.debug(f"Set {DOC_STATUS_FIELD}={status} for {len(values)} documents in {collection_name}")
+
+        except Exception as e:
+            if "not found" in str(e).lower():
+                logger.warning(f"Collection {collection_name} not found during status update. Ignoring.")
+                return
+
+            logger.error(f"Failed to update document status payload: {e}")
+            raise ExternalDependencyError(f"Vector DB Status Update Failed: {e}", service="qdrant")
+
+    async def get_document_ids_by_status(self, collection_name: str, statuses: List[str]) -> set:
+        """
+        connector_document_id of every point whose mirrored doc_status is one of `statuses`.
+        Scrolls with a payload projection (no vectors); used to reconcile the payload with the database.
+        """
+        document_ids = set()
+        offset = None
+        try:
+            while True:
+                points, offset = await self.client.scroll(
+                    collection_name=collection_name,
+                    scroll_filter=Filter(must=[FieldCondition(key=DOC_STATUS_FIELD, match=MatchAny(any=statuses))]),
+                    limit=SCROLL_BATCH_SIZE,
+                    offset=offset,
+                    with_payload=["connector_document_id"],
+                    with_vectors=False,
+                )
+                for point in points:
+                    document_id = (point.payload or {}).get("connector_document_id")
+                    if document_id:
+                        document_ids.add(str(document_id))
+                if offset is None:
+                    return document_ids
+
+        except Exception as e:
+            if "not found" in str(e).lower():
+                logger.warning(f"Collection {collection_name} not found during status scroll. Ignoring.")
+                return set()
+
+            logger.error(f"Failed to scroll document statuses of {collection_name}: {e}")
+            raise ExternalDependencyError(f"Vector DB Scroll Failed: {e}", service="qdrant")
+
+    async def set_connector_active(self, collection_name: str, connector_id: UUID, is_active: bool) -> None:
+        """
+        Mirrors the connector enabled flag into the payload of all its points.
+        """
+        try:
+            await self.client.set_payload(
+                collection_name=collection_name,
+                payload={IS_ACTIVE_FIELD: bool(is_active)},
+                points=Filter(must=[FieldCondition(key="connector_id", match=MatchValue(value=str(connector_id)))]),
+            )
+            logger.info(f"Set {IS_ACTIVE_FIELD}={is_active} for connector {connector_id}")
+
+        except Exception as e:
+            if "not found" in str(e).lower():
+                logger.warning(f"Collection {collection_name} not found during active flag update. Ignoring.")
+                return
+
+            logger.error(f"Failed to update connector active payload: {e}")
+            raise ExternalDependencyError(f"Vector DB Active Flag Update Failed: {e}", service="qdrant")
+
     async def search(
         self,
         collection_name: str,
@@ -177,16 +650,39 @@ class VectorRepository:
         query_filter: Optional[models.Filter] = None,
         with_payload: bool = True,
         with_vectors: bool = False,
+        search_params: Optional[models.SearchParams] = None,
+        sparse_vector: Optional[models.SparseVector] = None,
+        prefetch_limit: Optional[int] = None,
+        rrf_k: int = 60,
     ) -> List[Any]:
         """
         Execute similarity search using query_points (Unified API).
+
+        With a sparse_vector (collections declaring SPARSE_VECTOR_NAME) the search is hybrid: dense and BM25
+        branches are prefetched (prefetch_limit candidates each, same filter) and fused by reciprocal rank
+        fusion, in one call. Hits are scored by their RRF score over the best possible one (ranked first by
+        both branches), in (0, 1]: a rank, not a similarity, so dense similarity cutoffs must not apply to it.
         """
+        if sparse_vector is not None and sparse_vector.indices:
+            return await self._hybrid_search(
+                collection_name,
+                query_vector,
+                sparse_vector,
+                limit=limit,
+                prefetch_limit=prefetch_limit or limit,
+                query_filter=query_filter,
+                search_params=search_params,
+                rrf_k=rrf_k,
+                with_payload=with_payload,
+            )
+
         try:
             result = await self.client.query_points(
                 collection_name=collection_name,
                 query=query_vector,
                 limit=limit,
                 query_filter=query_filter,  # Enforce ACLs here
+                search_params=search_params,
                 with_payload=with_payload,
                 with_vectors=with_vectors,
             )
@@ -198,6 +694,45 @@ class VectorRepository:
             logger.error(f"Search failed: {e}")
             raise ExternalDependencyError(f"Vector Search Failed: {e}", service="qdrant")
 
+    async def _hybrid_search(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        sparse_vector: models.SparseVector,
+        limit: int,
+        prefetch_limit: int,
+        query_filter: Optional[models.Filter],
+        search_params: Optional[models.SearchParams],
+        rrf_k: int,
+        with_payload: bool,
+    ) -> List[Any]:
+        """Dense + sparse prefetch fused by RRF (see search)."""
+        try:
+            result = await self.client.query_points(
+                collection_name=collection_name,
+                prefetch=[
+                    models.Prefetch(
+                        query=query_vector, filter=query_filter, params=search_params, limit=prefetch_limit
+                    ),
+                    models.Prefetch(
+                        query=sparse_vector, using=SPARSE_VECTOR_NAME, filter=query_filter, limit=prefetch_limit
+                    ),
+                ],
+                query=models.RrfQuery(rrf=models.Rrf(k=rrf_k)),
+                limit=limit,
+                with_payload=with_payload,
+                with_vectors=False,
+            )
+        except Exception as e:
+            logger.error(f"Hybrid search failed: {e}")
+            raise ExternalDependencyError(f"Vector Search Failed: {e}", service="qdrant")
+
+        points = result.points if hasattr(result, "points") else result
+        best_rrf = 2.0 / (rrf_k + 1)
+        for point in points:
+            point.score = min(point.score / best_rrf, 1.0)
+        return points
+
     async def count_by_document_id(self, collection_name: str, document_id: UUID) -> int:
         """Counts points for a specific document."""
         try:
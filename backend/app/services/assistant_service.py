@@ -21,6 +21,7 @@ from app.core.utils.ui import calculate_contrast_text_color
 from app.repositories.assistant_repository import AssistantRepository
 from app.schemas.assistant import AssistantCreate, AssistantResponse, AssistantUpdate
 from app.core.settings import get_settings
+from app.services.query_engine_cache import get_query_engine_cache
 from app.services.trending_service import TrendingService, get_trending_service
 
 if TYPE_CHECKING:
@@ -148,6 +149,9 @@ class AssistantService:
             if not updated_assistant:
                 return None
 
+            # Compiled chat engine depends on instructions, model and linked connectors
+            get_query_engine_cache().invalidate_assistant(assistant_id)
+
             logger.info(f"✅ Updated assistant: {assistant_id}")
             return AssistantResponse.model_validate(updated_assistant, from_attributes=True)
 
@@ -246,6 +250,9 @@ class AssistantService:
         # 1. Avatar (Async background, already safe)
         await self._cleanup_avatar_file(assistant_id)
 
+        # Compiled chat engines (in-memory, cannot fail)
+        get_query_engine_cache().invalidate_assistant(assistant_id)
+
         # 2. Cache (Soft Fail)
         if self.cache_service:
             try:
@@ -2,8 +2,14 @@
 Semantic Cache Service.
 
 Implements intelligent caching for RAG responses using:
+- In-process L1 for repeated questions (see app.services.semantic_cache_l1)
 - Redis for JSON storage (fast retrieval)
-- Qdrant for semantic similarity search (find similar questions)
+- Qdrant for semantic similarity search (find similar questions), or the optional in-memory
+  index for assistants with small caches (see app.services.semantic_cache_index)
+- Per-assistant usage sorted sets (cache_idx:<assistant_id>) for capacity eviction, and a
+  reconciliation of Qdrant points whose Redis entry expired (see app.services.semantic_cache_maintenance)
+- Per-document reverse index sets (cache_doc:<connector_document_id>) of the entries whose sources cite
+  the document, so re-ingesting or deleting a document invalidates only the answers built from it
 
 ARCHITECT NOTE:
 - Uses Singleton pattern for Redis Connection Pool to prevent connection leaks.
@@ -14,8 +20,10 @@ import asyncio
 import hashlib
 import json
 import logging
+import time
 import uuid
-from typing import Annotated, Any, Dict, List, Optional, Set
+from dataclasses import dataclass
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import redis.asyncio as aioredis
 from fastapi import Depends
@@ -24,6 +32,9 @@ from qdrant_client.models import Distance, FieldCondition, Filter, MatchValue, P
 
 from app.core.exceptions import TechnicalError
 from app.core.settings import settings
+from app.services.semantic_cache_index import get_semantic_cache_index
+from app.services.semantic_cache_l1 import get_semantic_cache_l1, publish_invalidation
+from app.services.semantic_cache_maintenance import record_cache_hit
 from app.services.vector_service import VectorService, get_vector_service
 
 logger = logging.getLogger(__name__)
@@ -34,6 +45,28 @@ EMBEDDING_DIM = 768  # Gemini text-embedding-004 dimension
 REDIS_CONNECT_TIMEOUT = 5.0
 MAX_REDIS_CONNECTIONS = 50
 SCAN_BATCH_COUNT = 100
+CACHE_COLLECTION_PREFIX = "semantic_cache_"
+USAGE_KEY_PREFIX = "cache_idx:"  # Sorted set per assistant: cache key -> last hit time (lru) or hit count (lfu)
+DOCUMENT_KEY_PREFIX = "cache_doc:"  # Set per connector document: cache keys whose sources cite it
+
+
+@dataclass
+class ExactLookup:
+    """
+    Exact cache entry of a question read ahead of get_cached_response, in another round trip of the turn
+    (the chat history window). Created by SemanticCacheService.prepare_exact_lookup.
+    """
+
+    cache_key: str
+    generation: int  # L1 generation captured before the read
+    value: Optional[str] = None
+    ttl_ms: int = -2
+    resolved: bool = False
+
+    def resolve(self, value: Optional[Union[bytes, str]], ttl_ms: int) -> None:
+        self.value = value.decode("utf-8") if isinstance(value, bytes) else value
+        self.ttl_ms = ttl_ms
+        self.resolved = True
 
 
 class SemanticCacheService:
@@ -64,13 +97,10 @@ class SemanticCacheService:
         Returns the resolved collection name.
         """
         # 1. Init Redis (Global)
-        if SemanticCacheService._redis_pool is None:
-            async with self._init_lock:
-                if SemanticCacheService._redis_pool is None:
-                    await self._init_redis_pool()
+        await self._ensure_redis()
 
         # 2. Resolve Collection Name
-        collection_name = f"semantic_cache_{provider}"
+        collection_name = f"{CACHE_COLLECTION_PREFIX}{provider}"
 
         # 3. Init Collection (Per Provider) - Logic moved to VectorService usually, but we call ensure here
         if provider not in SemanticCacheService._initialized_providers:
@@ -81,6 +111,13 @@ class SemanticCacheService:
 
         return collection_name
 
+    async def _ensure_redis(self) -> None:
+        """Ensure the shared Redis pool exists."""
+        if SemanticCacheService._redis_pool is None:
+            async with self._init_lock:
+                if SemanticCacheService._redis_pool is None:
+                    await self._init_redis_pool()
+
     async def _init_redis_pool(self) -> None:
         """Initialize the shared Redis connection pool."""
         if SemanticCacheService._redis_pool is not None:
@@ -110,71 +147,160 @@ class SemanticCacheService:
         embedding: Optional[List[float]] = None,
         embedding_provider: str = "ollama",
         min_score: float = settings.SEMANTIC_CACHE_SIMILARITY_THRESHOLD,
+        prefetched: Optional[ExactLookup] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Retrieve response from cache."""
+        """Retrieve response from cache (prefetched: exact entry already read, no Redis round trip for it)."""
         try:
+            exact_key = self._generate_cache_key(question, assistant_id)
+
+            # 0. In-process L1 (exact and recent semantic hits, no network round trip)
+            l1 = get_semantic_cache_l1()
+            if l1 is not None:
+                entry = l1.get_entry(exact_key, min_score)
+                if entry:
+                    logger.info(f"⚡ Cache HIT: L1 ({exact_key})")
+                    record_cache_hit(assistant_id, entry[1])
+                    return entry[0]
+            # Reads started before an invalidation are not stored in the L1
+            generation = l1.generation if l1 is not None else 0
+            if prefetched is not None and not (prefetched.resolved and prefetched.cache_key == exact_key):
+                prefetched = None
+
             collection_name = await self._ensure_resources(embedding_provider)
 
             if not self.redis:
                 return None
 
             # 1. Exact Match via Redis
-            exact_key = self._generate_cache_key(question, assistant_id)
-            cached_json = await self._find_exact_match(exact_key)
+            cached_json = await self._find_exact_match(exact_key, generation, prefetched)
             if cached_json:
+                record_cache_hit(assistant_id, exact_key)
                 return cached_json
 
             # 2. Semantic Search (Skip if no embedding)
             if embedding is None:
                 return None
 
-            return await self._find_semantic_match(embedding, assistant_id, min_score, collection_name)
+            return await self._find_semantic_match(
+                embedding,
+                assistant_id,
+                min_score,
+                collection_name,
+                asking_key=exact_key,
+                generation=generation,
+                provider=embedding_provider,
+            )
 
         except Exception as e:
             logger.error(f"Cache retrieval failed: {e}")
             return None
 
-    async def _find_exact_match(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Attempt to find an exact match in Redis."""
+    def prepare_exact_lookup(self, question: str, assistant_id: str) -> ExactLookup:
+        """
+        Exact lookup of a question to be read by the caller (same key as get_cached_response), then
+        passed back as get_cached_response(prefetched=...).
+        """
+        l1 = get_semantic_cache_l1()
+        return ExactLookup(
+            cache_key=self._generate_cache_key(question, assistant_id),
+            generation=l1.generation if l1 is not None else 0,
+        )
+
+    async def _find_exact_match(
+        self, cache_key: str, generation: int = 0, prefetched: Optional[ExactLookup] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Attempt to find an exact match in Redis (or in the entry read ahead)."""
         try:
-            cached_json = await self.redis.get(cache_key)
+            if prefetched is not None:
+                cached_json, ttl_ms, generation = prefetched.value, prefetched.ttl_ms, prefetched.generation
+            else:
+                cached_json, ttl_ms = await self._get_with_ttl(cache_key)
             if cached_json:
                 logger.info(f"⚡ Cache HIT: Exact match ({cache_key})")
+                self._remember(cache_key, cached_json, ttl_ms, generation)
                 return json.loads(cached_json)
         except Exception as e:
             logger.error(f"Redis lookup error: {e}")
         return None
 
+    async def _get_with_ttl(self, cache_key: str) -> Tuple[Optional[str], int]:
+        """Value and remaining TTL (ms, negative = none/missing) of a Redis entry in one round trip."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(cache_key)
+        pipe.pttl(cache_key)
+        cached_json, ttl_ms = await pipe.execute()
+        return cached_json, ttl_ms
+
+    def _remember(
+        self,
+        asking_key: str,
+        cached_json: str,
+        ttl_ms: int,
+        generation: int,
+        score: float = 1.0,
+        source_key: Optional[str] = None,
+    ) -> None:
+        """Store a Redis hit in the L1 (bounded by the Redis entry's remaining TTL)."""
+        l1 = get_semantic_cache_l1()
+        if l1 is None:
+            return
+        ttl_seconds = ttl_ms / 1000 if ttl_ms and ttl_ms > 0 else None
+        l1.put(asking_key, cached_json, generation, ttl_seconds=ttl_seconds, score=score, source_key=source_key)
+
     async def _find_semantic_match(
-        self, embedding: List[float], assistant_id: str, min_score: float, collection_name: str
+        self,
+        embedding: List[float],
+        assistant_id: str,
+        min_score: float,
+        collection_name: str,
+        asking_key: Optional[str] = None,
+        generation: int = 0,
+        provider: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Perform semantic similarity search in Qdrant."""
+        """Perform semantic similarity search in the in-memory index, or Qdrant when it does not cover the assistant."""
         try:
-            client = await self.vector_service.get_async_qdrant_client()
-            search_response = await client.query_points(
-                collection_name=collection_name,
-                query=embedding,
-                limit=1,
-                score_threshold=min_score,
-                search_params=SearchParams(exact=False),
-                query_filter=Filter(must=[FieldCondition(key="assistant_id", match=MatchValue(value=assistant_id))]),
+            index = get_semantic_cache_index()
+            covered, match = (
+                index.search(assistant_id, provider, embedding, min_score) if index and provider else (False, None)
             )
 
-            if not search_response.points:
-                return None
-
-            hit = search_response.points[0]
-            cache_key = hit.payload.get("cache_key")
+            if covered:
+                if match is None:
+                    return None
+                cache_key, score = match
+            else:
+                client = await self.vector_service.get_async_qdrant_client()
+                search_response = await client.query_points(
+                    collection_name=collection_name,
+                    query=embedding,
+                    limit=1,
+                    score_threshold=min_score,
+                    search_params=SearchParams(exact=False),
+                    query_filter=Filter(
+                        must=[FieldCondition(key="assistant_id", match=MatchValue(value=assistant_id))]
+                    ),
+                )
+
+                if not search_response.points:
+                    return None
+
+                hit = search_response.points[0]
+                cache_key, score = hit.payload.get("cache_key"), hit.score
 
             if not self._is_valid_cache_key(cache_key, assistant_id):
                 return None
 
-            cached_json = await self.redis.get(cache_key)
+            cached_json, ttl_ms = await self._get_with_ttl(cache_key)
             if not cached_json:
                 logger.warning(f"⚠️ Qdrant index exists but Redis key missing: {cache_key}")
                 return None
 
-            logger.info(f"✅ Cache HIT: Semantic match ({cache_key}, score={hit.score:.3f})")
+            source = "in-memory" if covered else "qdrant"
+            logger.info(f"✅ Cache HIT: Semantic match ({cache_key}, score={score:.3f}, {source})")
+            record_cache_hit(assistant_id, cache_key)
+            if asking_key:
+                # Same question asked again: served by the L1 without embedding nor Qdrant
+                self._remember(asking_key, cached_json, ttl_ms, generation, score=score, source_key=cache_key)
             return json.loads(cached_json)
 
         except Exception as e:
@@ -208,31 +334,66 @@ class SemanticCacheService:
 
             cache_key = self._generate_cache_key(question, assistant_id)
 
-            # 1. Redis Cache
-            await self._cache_in_redis(cache_key, response)
+            # 1. Redis Cache (+ usage tracking for capacity eviction)
+            await self._cache_in_redis(cache_key, response, assistant_id)
 
             # 2. Qdrant Cache
             await self._cache_in_qdrant(cache_key, question, assistant_id, embedding, collection_name)
+            index = get_semantic_cache_index()
+            if index is not None:
+                index.add(assistant_id, embedding_provider, cache_key, embedding)
+
+            # 3. Overwritten entry: drop stale L1 copies in every process
+            await publish_invalidation(self.redis, keys=[cache_key])
 
             logger.debug(f"💾 Cache entry set: {cache_key}")
 
         except Exception as e:
             logger.error(f"Cache storage error: {e}", exc_info=True)
 
-    async def _cache_in_redis(self, cache_key: str, response: Dict[str, Any]) -> None:
+    async def _cache_in_redis(self, cache_key: str, response: Dict[str, Any], assistant_id: str) -> None:
         response_json = json.dumps(response, default=str)
-        await self.redis.setex(
-            name=cache_key,
-            time=settings.REDIS_CACHE_TTL,
-            value=response_json,
-        )
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.setex(name=cache_key, time=settings.REDIS_CACHE_TTL, value=response_json)
+        if settings.SEMANTIC_CACHE_EVICTION_POLICY == "lfu":
+            pipe.zadd(self._usage_key(assistant_id), {cache_key: 1}, incr=True)
+        else:
+            pipe.zadd(self._usage_key(assistant_id), {cache_key: time.time()})
+        if settings.SEMANTIC_CACHE_DOCUMENT_INVALIDATION_ENABLED:
+            # Reverse index, kept as long as the newest entry citing the document
+            for document_id in self._source_document_ids(response):
+                document_key = self._document_key(document_id)
+                pipe.sadd(document_key, cache_key)
+                pipe.expire(document_key, settings.REDIS_CACHE_TTL)
+        await pipe.execute()
+
+    @staticmethod
+    def _usage_key(assistant_id: str) -> str:
+        return f"{USAGE_KEY_PREFIX}{assistant_id}"
+
+    @staticmethod
+    def _document_key(document_id: str) -> str:
+        return f"{DOCUMENT_KEY_PREFIX}{document_id}"
+
+    @staticmethod
+    def _source_document_ids(response: Dict[str, Any]) -> Set[str]:
+        """connector_document_id of every source of a cached response."""
+        document_ids = set()
+        for source in response.get("sources") or []:
+            metadata = source.get("metadata") if isinstance(source, dict) else None
+            if isinstance(metadata, dict) and metadata.get("connector_document_id"):
+                document_ids.add(str(metadata["connector_document_id"]))
+        return document_ids
+
+    @staticmethod
+    def _point_id(cache_key: str) -> str:
+        return str(uuid.uuid5(uuid.NAMESPACE_DNS, cache_key))
 
     async def _cache_in_qdrant(
         self, cache_key: str, question: str, assistant_id: str, embedding: List[float], collection_name: str
     ) -> None:
-        point_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, cache_key))
         point = PointStruct(
-            id=point_id,
+            id=self._point_id(cache_key),
             vector=embedding,
             payload={
                 "cache_key": cache_key,
@@ -253,18 +414,18 @@ class SemanticCacheService:
         # Ideally we iterate `_initialized_providers`.
 
         # Simplified: Just clear Redis keys (shared) and try to clear from all initialized collections.
-        if SemanticCacheService._redis_pool is None:
-            async with self._init_lock:
-                await self._init_redis_pool()
+        await self._ensure_redis()
 
         count = await self._purge_redis_keys(assistant_id)
+        await self.redis.delete(self._usage_key(assistant_id))
 
         # Best effort clear on all likely collections?
         # Or we rely on _initialized_providers
         for provider in SemanticCacheService._initialized_providers:
-            collection_name = f"semantic_cache_{provider}"
+            collection_name = f"{CACHE_COLLECTION_PREFIX}{provider}"
             await self._purge_qdrant_points(assistant_id, collection_name)
 
+        await publish_invalidation(self.redis, assistant_id=assistant_id)
         return count
 
     async def _purge_redis_keys(self, assistant_id: str) -> int:
@@ -289,6 +450,164 @@ class SemanticCacheService:
         vector_repo = VectorRepository(client)
         await vector_repo.delete_by_assistant_id(collection_name, assistant_id)
 
+    # --- Maintenance (see app.services.semantic_cache_maintenance) ---
+
+    async def flush_hits(self, hits: Dict[str, Dict[str, int]]) -> None:
+        """
+        Write buffered hit counts into the usage sorted sets, one pipelined round trip.
+        Entries no longer tracked (evicted, purged) are not recreated.
+
+        Args:
+            hits: assistant_id -> cache_key -> number of hits
+        """
+        await self._ensure_redis()
+        if not hits:
+            return
+
+        now = time.time()
+        lfu = settings.SEMANTIC_CACHE_EVICTION_POLICY == "lfu"
+        pipe = self.redis.pipeline(transaction=False)
+        for assistant_id, counts in hits.items():
+            usage_key = self._usage_key(assistant_id)
+            for cache_key, count in counts.items():
+                if lfu:
+                    pipe.zadd(usage_key, {cache_key: count}, xx=True, incr=True)
+                else:
+                    pipe.zadd(usage_key, {cache_key: now}, xx=True)
+        await pipe.execute()
+
+    async def evict_over_capacity(self, capacity: int) -> int:
+        """
+        Enforce the per-assistant capacity: expired entries are dropped from the usage sets, then the
+        least recently (lru) / least frequently (lfu) hit entries beyond `capacity` are evicted from
+        Redis, Qdrant and the in-process tiers of every process.
+
+        With lfu, hit counts are aged first (multiplied by SEMANTIC_CACHE_LFU_DECAY): entries start at one
+        hit, without aging the newest answers would always be evicted before old ones no longer asked.
+
+        Returns:
+            Number of entries evicted
+        """
+        await self._ensure_redis()
+        lfu = settings.SEMANTIC_CACHE_EVICTION_POLICY == "lfu"
+        evicted = 0
+        async for usage_key in self.redis.scan_iter(match=f"{USAGE_KEY_PREFIX}*", count=SCAN_BATCH_COUNT):
+            await self._drop_expired_members(usage_key)
+            if lfu:
+                await self.redis.zunionstore(usage_key, {usage_key: settings.SEMANTIC_CACHE_LFU_DECAY})
+
+            excess = await self.redis.zcard(usage_key) - capacity
+            if excess <= 0:
+                continue
+
+            victims = await self.redis.zrange(usage_key, 0, excess - 1)
+            await self._delete_entries(victims)
+            evicted += len(victims)
+            logger.info(f"🧹 Semantic cache: evicted {len(victims)} entries of {usage_key}")
+        return evicted
+
+    async def _drop_expired_members(self, usage_key: str) -> None:
+        """Remove the usage entries whose Redis entry expired (TTL)."""
+        members = await self.redis.zrange(usage_key, 0, -1)
+        for i in range(0, len(members), SCAN_BATCH_COUNT):
+            batch = members[i : i + SCAN_BATCH_COUNT]
+            expired = [key for key, exists in zip(batch, await self._exists_many(batch)) if not exists]
+            if expired:
+                await self.redis.zrem(usage_key, *expired)
+
+    async def reconcile_orphans(self) -> int:
+        """
+        Delete the Qdrant points whose Redis entry expired (every semantic cache collection, batched).
+
+        Returns:
+            Number of orphan points deleted
+        """
+        from app.repositories.vector_repository import VectorRepository
+
+        await self._ensure_redis()
+        repo = VectorRepository(await self.vector_service.get_async_qdrant_client())
+
+        deleted = 0
+        for collection_name in await self._cache_collections(repo):
+            async for points in repo.scroll_points(collection_name, payload_fields=["cache_key"], with_vectors=False):
+                keys = [(point.payload or {}).get("cache_key") for point in points]
+                exists = await self._exists_many([key or "" for key in keys])
+                orphans = [(point.id, key) for point, key, alive in zip(points, keys, exists) if not alive]
+                if not orphans:
+                    continue
+
+                await repo.delete_points(collection_name, [point_id for point_id, _ in orphans])
+                await publish_invalidation(self.redis, deleted_keys=[key for _, key in orphans if key])
+                deleted += len(orphans)
+
+        if deleted:
+            logger.info(f"🧹 Semantic cache: deleted {deleted} orphan Qdrant points")
+        return deleted
+
+    async def _exists_many(self, keys: List[str]) -> List[bool]:
+        """EXISTS of every key, one pipelined round trip."""
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.exists(key)
+        return [bool(result) for result in await pipe.execute()]
+
+    async def _delete_entries(self, cache_keys: List[str]) -> None:
+        """Remove cache entries from Redis, every semantic cache collection and every process' in-memory tiers."""
+        from app.repositories.vector_repository import VectorRepository
+
+        by_assistant: Dict[str, List[str]] = {}
+        for cache_key in cache_keys:
+            parts = cache_key.split(":")
+            if len(parts) == 3:
+                by_assistant.setdefault(parts[1], []).append(cache_key)
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(*cache_keys)
+        for assistant_id, keys in by_assistant.items():
+            pipe.zrem(self._usage_key(assistant_id), *keys)
+        await pipe.execute()
+
+        repo = VectorRepository(await self.vector_service.get_async_qdrant_client())
+        point_ids = [self._point_id(key) for key in cache_keys]
+        for collection_name in await self._cache_collections(repo):
+            await repo.delete_points(collection_name, point_ids)
+
+        await publish_invalidation(self.redis, deleted_keys=cache_keys)
+
+    # --- Document invalidation ---
+
+    async def invalidate_documents(self, document_ids: Iterable[Any]) -> int:
+        """
+        Invalidate the entries whose sources cite any of these connector documents (re-ingested with new
+        content or deleted), wherever they are cached. Entries of other documents are kept.
+
+        Returns:
+            Number of entries invalidated
+        """
+        await self._ensure_redis()
+        document_keys = [self._document_key(document_id) for document_id in dict.fromkeys(map(str, document_ids))]
+        if not document_keys:
+            return 0
+
+        # Read and drop the reverse index atomically: entries written meanwhile are indexed again
+        pipe = self.redis.pipeline(transaction=True)
+        for document_key in document_keys:
+            pipe.smembers(document_key)
+        pipe.delete(*document_keys)
+        results = await pipe.execute()
+
+        cache_keys = sorted(set().union(*results[:-1]))
+        for i in range(0, len(cache_keys), SCAN_BATCH_COUNT):
+            await self._delete_entries(cache_keys[i : i + SCAN_BATCH_COUNT])
+
+        if cache_keys:
+            logger.info(f"🧹 Semantic cache: invalidated {len(cache_keys)} entries of {len(document_keys)} documents")
+        return len(cache_keys)
+
+    @staticmethod
+    async def _cache_collections(repo: Any) -> List[str]:
+        return [name for name in await repo.list_collections() if name.startswith(CACHE_COLLECTION_PREFIX)]
+
     @classmethod
     async def shutdown(cls) -> None:
         if cls._redis_pool:
@@ -303,3 +622,18 @@ async def get_cache_service(
 ) -> SemanticCacheService:
     """Dependency Provider"""
     return SemanticCacheService(vector_service)
+
+
+async def invalidate_cached_answers(vector_service: VectorService, document_ids: Iterable[Any]) -> int:
+    """
+    Best-effort SemanticCacheService.invalidate_documents for ingestion and scans: a cache failure is
+    logged, never raised (entries still expire with REDIS_CACHE_TTL).
+    """
+    document_ids = list(document_ids)
+    if not document_ids or not settings.SEMANTIC_CACHE_DOCUMENT_INVALIDATION_ENABLED:
+        return 0
+    try:
+        return await SemanticCacheService(vector_service).invalidate_documents(document_ids)
+    except Exception as e:
+        logger.warning(f"Semantic cache invalidation failed for {len(document_ids)} document(s): {e}")
+        return 0
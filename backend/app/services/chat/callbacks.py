@@ -1,10 +1,11 @@
 import asyncio
 import logging
 import time
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
 from contextvars import ContextVar
 
-from llama_index.core.callbacks.base import BaseCallbackHandler
+from llama_index.core.callbacks.base import BaseCallbackHandler, CallbackManager
 from llama_index.core.callbacks.schema import CBEventType
 
 from app.services.chat.types import PipelineStepType
@@ -161,12 +162,21 @@ class StreamingCallbackHandler(BaseCallbackHandler):
         }
 
         try:
-            # We must use call_soon_threadsafe because these callbacks usually fire
-            # from a worker thread when engine.query is used via asyncio.to_thread
-            self.loop.call_soon_threadsafe(self.queue.put_nowait, event_data)
+            if self._on_loop_thread():
+                # aquery() path: callbacks fire on the event loop, hand the event over immediately
+                self.queue.put_nowait(event_data)
+            else:
+                # Callbacks fired from a worker thread (sync engines, Vanna)
+                self.loop.call_soon_threadsafe(self.queue.put_nowait, event_data)
         except asyncio.QueueFull:
             logger.warning("Streaming queue is full, dropping event.")
 
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
     def _determine_step_type(self, event_type: CBEventType, payload: Optional[Dict]) -> Optional[PipelineStepType]:
         """Encapsulates heuristic logic to identify pipeline steps from raw LlamaIndex events."""
 
@@ -392,3 +402,73 @@ class StreamingCallbackHandler(BaseCallbackHandler):
 
     def end_trace(self, trace_id: Optional[str] = None, trace_map: Optional[Dict[str, Any]] = None) -> None:
         pass
+
+
+# Handler of the chat request being processed. Compiled engines are cached and shared between
+# requests, so handlers are never added to their CallbackManager directly.
+_request_handler: ContextVar[Optional[BaseCallbackHandler]] = ContextVar("_request_callback_handler", default=None)
+
+
+class RequestCallbackRouter(BaseCallbackHandler):
+    """
+    Callback Handler attached once to a shared engine's CallbackManager that forwards
+    every event to the handler of the current request (propagated to tasks and asyncio.to_thread).
+    Events fired outside a chat request are dropped.
+    """
+
+    def __init__(self):
+        super().__init__(event_starts_to_ignore=[], event_ends_to_ignore=[])
+
+    def on_event_start(
+        self,
+        event_type: CBEventType,
+        payload: Optional[Dict[str, Any]] = None,
+        event_id: str = "",
+        parent_id: str = "",
+        **kwargs: Any,
+    ) -> str:
+        handler = _request_handler.get()
+        if handler is not None and event_type not in handler.event_starts_to_ignore:
+            handler.on_event_start(event_type, payload, event_id=event_id, parent_id=parent_id, **kwargs)
+        return event_id
+
+    def on_event_end(
+        self,
+        event_type: CBEventType,
+        payload: Optional[Dict[str, Any]] = None,
+        event_id: str = "",
+        **kwargs: Any,
+    ) -> None:
+        handler = _request_handler.get()
+        if handler is not None and event_type not in handler.event_ends_to_ignore:
+            handler.on_event_end(event_type, payload, event_id=event_id, **kwargs)
+
+    def start_trace(self, trace_id: Optional[str] = None) -> None:
+        handler = _request_handler.get()
+        if handler is not None:
+            handler.start_trace(trace_id)
+
+    def end_trace(self, trace_id: Optional[str] = None, trace_map: Optional[Dict[str, Any]] = None) -> None:
+        handler = _request_handler.get()
+        if handler is not None:
+            handler.end_trace(trace_id, trace_map)
+
+
+def attach_request_router(callback_manager: CallbackManager) -> None:
+    """Idempotently attaches the RequestCallbackRouter to a (possibly shared) CallbackManager."""
+    if not any(isinstance(h, RequestCallbackRouter) for h in callback_manager.handlers):
+        callback_manager.add_handler(RequestCallbackRouter())
+
+
+@contextmanager
+def use_request_callback_handler(handler: BaseCallbackHandler) -> Iterator[BaseCallbackHandler]:
+    """Routes engine callbacks fired in the current context to this request's handler."""
+    token = _request_handler.set(handler)
+    try:
+        yield handler
+    finally:
+        try:
+            _request_handler.reset(token)
+        except ValueError:
+            # Generator finalized from another context: nothing to restore there
+            pass
@@ -0,0 +1,194 @@
+"""
+Embedding Memo - Per-request memoization of question embeddings.
+
+A single chat turn used to embed the user message several times (semantic cache lookup, one query
+embedding per searched collection, the agentic background embedding, Vanna DDL and few-shot lookups).
+On CPU-bound providers each call costs seconds.
+
+ChatContext owns one EmbeddingMemo per request; ChatService activates it for the whole pipeline so
+components without access to the context (search strategies, Vanna running in a worker thread) reach
+it through current_embedding_memo() / the embed_* helpers.
+
+Keys are (provider, model, mode, text): the provider is the embedding class, the model its model_name,
+and the mode separates query embeddings from document (text) embeddings, which differ for
+asymmetric models. Concurrent requests for the same key share a single in-flight computation.
+Failures are not memoized.
+
+This memo sits in front of the process-wide EmbeddingCache (CachedEmbedding), which also serves
+vectors across requests; the memo adds in-flight deduplication within the request.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.factories.embedding_cache import CachedEmbedding
+
+logger = logging.getLogger(__name__)
+
+MODE_QUERY = "query"
+MODE_TEXT = "text"
+
+EmbeddingKey = Tuple[str, str, str, str]
+
+_current_memo: contextvars.ContextVar[Optional["EmbeddingMemo"]] = contextvars.ContextVar(
+    "embedding_memo", default=None
+)
+
+
+class EmbeddingMemo:
+    """Request-scoped embedding cache with in-flight deduplication (asyncio and worker threads)."""
+
+    def __init__(self) -> None:
+        self._results: Dict[EmbeddingKey, List[float]] = {}
+        self._inflight: Dict[EmbeddingKey, asyncio.Future] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(embed_model: Any, text: str, mode: str) -> EmbeddingKey:
+        if isinstance(embed_model, CachedEmbedding):
+            embed_model = embed_model.wrapped_model
+        model_name = getattr(embed_model, "model_name", None) or ""
+        return type(embed_model).__name__, str(model_name), mode, text
+
+    # --- Async API (event loop) ---
+
+    async def aget_query_embedding(self, embed_model: Any, text: str) -> List[float]:
+        return await self._aget(embed_model, text, MODE_QUERY, lambda: embed_model.aget_query_embedding(text))
+
+    async def aget_text_embedding(self, embed_model: Any, text: str) -> List[float]:
+        # P0 FIX: Offload blocking IO/CPU to thread pool
+        return await self._aget(
+            embed_model, text, MODE_TEXT, lambda: asyncio.to_thread(embed_model.get_text_embedding, text)
+        )
+
+    # --- Sync API (worker threads, e.g. Vanna) ---
+
+    def get_query_embedding(self, embed_model: Any, text: str) -> List[float]:
+        return self._get(embed_model, text, MODE_QUERY, lambda: embed_model.get_query_embedding(text))
+
+    def get_text_embedding(self, embed_model: Any, text: str) -> List[float]:
+        return self._get(embed_model, text, MODE_TEXT, lambda: embed_model.get_text_embedding(text))
+
+    # --- Internals ---
+
+    async def _aget(
+        self, embed_model: Any, text: str, mode: str, compute: Callable[[], Awaitable[List[float]]]
+    ) -> List[float]:
+        key = self.key(embed_model, text, mode)
+
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key]
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                self._loop = asyncio.get_running_loop()
+                future = self._loop.create_future()
+                self._inflight[key] = future
+            else:
+                self.hits += 1
+
+        if not owner:
+            # Shield: a cancelled waiter must not cancel the shared computation
+            return await asyncio.shield(future)
+
+        try:
+            result = await compute()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # Retrieved: waiters re-raise it, no "never retrieved" warning
+            else:
+                future.cancel()
+            raise
+
+        with self._lock:
+            self._results[key] = result
+            self._inflight.pop(key, None)
+        future.set_result(result)
+        return result
+
+    def _get(self, embed_model: Any, text: str, mode: str, compute: Callable[[], List[float]]) -> List[float]:
+        key = self.key(embed_model, text, mode)
+
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key]
+            future = self._inflight.get(key)
+            loop = self._loop
+
+        # Same embedding being computed on the event loop: wait for it instead of recomputing
+        if future is not None and loop is not None and not _is_running_on(loop):
+            try:
+                result = asyncio.run_coroutine_threadsafe(_await_shielded(future), loop).result()
+                with self._lock:
+                    self.hits += 1
+                return result
+            except Exception as e:
+                logger.debug(f"Embedding memo: in-flight computation unavailable ({e}), computing locally")
+
+        result = compute()
+        with self._lock:
+            self.misses += 1
+            self._results.setdefault(key, result)
+        return result
+
+
+async def _await_shielded(future: asyncio.Future) -> List[float]:
+    return await asyncio.shield(future)
+
+
+def _is_running_on(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def current_embedding_memo() -> Optional[EmbeddingMemo]:
+    """Memo of the chat request being processed, if any."""
+    return _current_memo.get()
+
+
+@contextmanager
+def use_embedding_memo(memo: EmbeddingMemo) -> Iterator[EmbeddingMemo]:
+    """Activates a memo for the current context (propagated to tasks and asyncio.to_thread)."""
+    token = _current_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        try:
+            _current_memo.reset(token)
+        except ValueError:
+            # Generator finalized from another context: nothing to restore there
+            pass
+
+
+# --- Helpers for components without access to the ChatContext ---
+
+
+async def embed_query(embed_model: Any, text: str) -> List[float]:
+    memo = current_embedding_memo()
+    if memo is None:
+        return await embed_model.aget_query_embedding(text)
+    return await memo.aget_query_embedding(embed_model, text)
+
+
+def embed_text_sync(embed_model: Any, text: str) -> List[float]:
+    memo = current_embedding_memo()
+    if memo is None:
+        return embed_model.get_text_embedding(text)
+    return memo.get_text_embedding(embed_model, text)
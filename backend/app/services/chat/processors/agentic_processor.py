@@ -6,12 +6,16 @@ import time
 from typing import Any, AsyncGenerator, Dict, Optional
 
 from llama_index.core import PromptTemplate
-from llama_index.core.base.response.schema import StreamingResponse
+from llama_index.core.base.response.schema import AsyncStreamingResponse, StreamingResponse
 from llama_index.core.callbacks import CallbackManager
 from llama_index.core.schema import QueryBundle
 
 from app.core.prompts import REWRITE_QUESTION_PROMPT
-from app.services.chat.callbacks import StreamingCallbackHandler
+from app.services.chat.callbacks import (
+    StreamingCallbackHandler,
+    attach_request_router,
+    use_request_callback_handler,
+)
 from app.services.chat.chat_metrics_manager import ChatMetricsManager
 from app.services.chat.processors.base_chat_processor import BaseChatProcessor
 from app.services.chat.source_service import SourceService
@@ -374,172 +378,178 @@ class AgenticProcessor(BaseChatProcessor):
 
     async def _execute_router_workflow(self, ctx: ChatContext, parent_span_id: str) -> AsyncGenerator[str, None]:
         """Executes the main LlamaIndex router workflow with robustness checks."""
-        try:
-            event_queue = asyncio.Queue()
-            stream_handler = StreamingCallbackHandler(event_queue, ctx.language)
-
-            # A. Initialize Engine
-            logger.info("[AgenticProcessor:Router] Initializing Query Engine...")
-            # Use ROUTER_PROCESSING type to avoid confusion with global INITIALIZATION step
-            sid_init = ctx.metrics.start_span(PipelineStepType.ROUTER_PROCESSING, parent_id=parent_span_id)
-            yield EventFormatter.format(
-                PipelineStepType.ROUTER_PROCESSING,
-                StepStatus.RUNNING,
-                sid_init,
-                parent_id=parent_span_id,
-                payload={"is_substep": True},
-            )
-            start_init = time.time()
-            engine = await self._initialize_engine(ctx, stream_handler)
-            dur_init = round(time.time() - start_init, 3)
-            ctx.metrics.end_span(sid_init, payload={"is_substep": True})
-            yield EventFormatter.format(
-                PipelineStepType.ROUTER_PROCESSING,
-                StepStatus.COMPLETED,
-                sid_init,
-                parent_id=parent_span_id,
-                duration=dur_init,
-                payload={"is_substep": True},
-            )
-            # NOTE: _record_router_metric removed here — end_span above already records
-            # the completed step in ChatMetricsManager, preventing double entries.
-
-            logger.info(f"[AgenticProcessor:Router] Engine ready in {dur_init}s. Launching query...")
-
-            # B. Launch Query & Background Tasks
-            # We use the synchronous query() method wrapped in to_thread because RouterQueryEngine's
-            # aquery() might not return a StreamingResponse. The sync query() returns the generator instantly.
-            logger.info("[AgenticProcessor] Calling sync query() via to_thread for Router...")
-
-            # Emit step to show user we're executing the query
-            sid_query = ctx.metrics.start_span(PipelineStepType.QUERY_EXECUTION, parent_id=parent_span_id)
-            yield EventFormatter.format(
-                PipelineStepType.QUERY_EXECUTION,
-                StepStatus.RUNNING,
-                sid_query,
-                parent_id=parent_span_id,
-                payload={"is_substep": True},
-            )
-            start_query = time.time()
-
-            embedding_task = asyncio.create_task(self._compute_background_embedding(ctx))
+        event_queue = asyncio.Queue()
+        stream_handler = StreamingCallbackHandler(event_queue, ctx.language)
 
+        # The engine is shared between requests: its callbacks reach this request's handler through the router
+        with use_request_callback_handler(stream_handler):
             try:
-                response = await asyncio.wait_for(
-                    asyncio.to_thread(engine.query, ctx.message),
-                    timeout=TIMEOUT_ROUTER_QUERY,
+                # A. Initialize Engine
+                logger.info("[AgenticProcessor:Router] Initializing Query Engine...")
+                # Use ROUTER_PROCESSING type to avoid confusion with global INITIALIZATION step
+                sid_init = ctx.metrics.start_span(PipelineStepType.ROUTER_PROCESSING, parent_id=parent_span_id)
+                yield EventFormatter.format(
+                    PipelineStepType.ROUTER_PROCESSING,
+                    StepStatus.RUNNING,
+                    sid_init,
+                    parent_id=parent_span_id,
+                    payload={"is_substep": True},
                 )
-            except asyncio.TimeoutError:
-                logger.warning(f"Router Query Timed Out ({TIMEOUT_ROUTER_QUERY}s).")
-                raise TimeoutError(f"Query timed out after {TIMEOUT_ROUTER_QUERY}s")
-
-            # C. Flush any callback events produced during aquery
-            while not event_queue.empty():
-                try:
-                    event = event_queue.get_nowait()
-                    yield self._process_router_event(ctx, event, parent_id=sid_query)
-                except asyncio.QueueEmpty:
-                    break
-
-            # Mark query as completed
-            dur_query = round(time.time() - start_query, 3)
-            ctx.metrics.end_span(sid_query, payload={"is_substep": True})
-            yield EventFormatter.format(
-                PipelineStepType.QUERY_EXECUTION,
-                StepStatus.COMPLETED,
-                sid_query,
-                parent_id=parent_span_id,
-                duration=dur_query,
-                payload={"is_substep": True},
-            )
-
-            # D. Handle Results
-            self._capture_sql_results(ctx, response)
+                start_init = time.time()
+                engine = await self._initialize_engine(ctx, stream_handler)
+                dur_init = round(time.time() - start_init, 3)
+                ctx.metrics.end_span(sid_init, payload={"is_substep": True})
+                yield EventFormatter.format(
+                    PipelineStepType.ROUTER_PROCESSING,
+                    StepStatus.COMPLETED,
+                    sid_init,
+                    parent_id=parent_span_id,
+                    duration=dur_init,
+                    payload={"is_substep": True},
+                )
+                # NOTE: _record_router_metric removed here — end_span above already records
+                # the completed step in ChatMetricsManager, preventing double entries.
+
+                logger.info(f"[AgenticProcessor:Router] Engine ready in {dur_init}s. Launching query...")
+
+                # B. Launch Query & Background Tasks
+                # Native async execution: tools run as coroutines on the event loop and no executor
+                # thread is held for the duration of the chat.
+                logger.info("[AgenticProcessor] Calling aquery() for Router...")
+
+                # Emit step to show user we're executing the query
+                sid_query = ctx.metrics.start_span(PipelineStepType.QUERY_EXECUTION, parent_id=parent_span_id)
+                yield EventFormatter.format(
+                    PipelineStepType.QUERY_EXECUTION,
+                    StepStatus.RUNNING,
+                    sid_query,
+                    parent_id=parent_span_id,
+                    payload={"is_substep": True},
+                )
+                start_query = time.time()
 
-            # Update the stream handler with the parent_id for callback events
-            stream_handler.parent_id = parent_span_id
+                embedding_task = asyncio.create_task(self._compute_background_embedding(ctx))
+                query_task = asyncio.create_task(
+                    asyncio.wait_for(engine.aquery(ctx.message), timeout=TIMEOUT_ROUTER_QUERY)
+                )
 
-            async for source_event in self._process_response_sources(ctx, response):
-                yield source_event
+                # C. Forward callback events (routing, retrieval, tools) live while the query runs
+                try:
+                    async for event in self._consume_event_queue(event_queue, query_task):
+                        yield self._process_router_event(ctx, event, parent_id=sid_query)
+                    response = await query_task
+                except asyncio.TimeoutError:
+                    logger.warning(f"Router Query Timed Out ({TIMEOUT_ROUTER_QUERY}s).")
+                    raise TimeoutError(f"Query timed out after {TIMEOUT_ROUTER_QUERY}s")
+                finally:
+                    # Client disconnected or failure: do not leave the query running
+                    if not query_task.done():
+                        query_task.cancel()
+
+                # Mark query as completed
+                dur_query = round(time.time() - start_query, 3)
+                ctx.metrics.end_span(sid_query, payload={"is_substep": True})
+                yield EventFormatter.format(
+                    PipelineStepType.QUERY_EXECUTION,
+                    StepStatus.COMPLETED,
+                    sid_query,
+                    parent_id=parent_span_id,
+                    duration=dur_query,
+                    payload={"is_substep": True},
+                )
 
-            # E. Stream Content — wrapped in ROUTER_SYNTHESIS for accurate timing.
-            # The LLM callbacks fire at ~0ms with streaming (they get a handle, not the full response).
-            # The REAL generation time lives here, in the token stream consumption.
-            synthesis_start = time.time()
-            sid_synth = ctx.metrics.start_span(PipelineStepType.ROUTER_SYNTHESIS, parent_id=parent_span_id)
-            yield EventFormatter.format(
-                PipelineStepType.ROUTER_SYNTHESIS,
-                StepStatus.RUNNING,
-                sid_synth,
-                parent_id=parent_span_id,
-                payload={"is_substep": True},
-            )
+                # D. Handle Results
+                self._capture_sql_results(ctx, response)
+
+                # Update the stream handler with the parent_id for callback events
+                stream_handler.parent_id = parent_span_id
+
+                async for source_event in self._process_response_sources(ctx, response):
+                    yield source_event
+
+                # E. Stream Content — wrapped in ROUTER_SYNTHESIS for accurate timing.
+                # The LLM callbacks fire at ~0ms with streaming (they get a handle, not the full response).
+                # The REAL generation time lives here, in the token stream consumption.
+                synthesis_start = time.time()
+                sid_synth = ctx.metrics.start_span(PipelineStepType.ROUTER_SYNTHESIS, parent_id=parent_span_id)
+                yield EventFormatter.format(
+                    PipelineStepType.ROUTER_SYNTHESIS,
+                    StepStatus.RUNNING,
+                    sid_synth,
+                    parent_id=parent_span_id,
+                    payload={"is_substep": True},
+                )
 
-            async for token_event in self._stream_response_content(ctx, response, stream_handler, event_queue):
-                yield token_event
+                async for token_event in self._stream_response_content(ctx, response, stream_handler, event_queue):
+                    yield token_event
 
-            synthesis_dur = round(time.time() - synthesis_start, 3)
-            # Get the final cumulative token counts from the handler
-            synth_input = getattr(stream_handler, "total_input_tokens", 0)
-            synth_output = getattr(stream_handler, "total_output_tokens", 0)
-            synth_payload: Dict = {"is_substep": True}
-            if synth_input or synth_output:
-                synth_payload["tokens"] = {"input": synth_input, "output": synth_output}
-            try:
-                model_val = ctx.metadata.get("specific_model_name") or (
-                    ctx.assistant.model.value if hasattr(ctx.assistant.model, "value") else str(ctx.assistant.model)
+                synthesis_dur = round(time.time() - synthesis_start, 3)
+                # Get the final cumulative token counts from the handler
+                synth_input = getattr(stream_handler, "total_input_tokens", 0)
+                synth_output = getattr(stream_handler, "total_output_tokens", 0)
+                synth_payload: Dict = {"is_substep": True}
+                if synth_input or synth_output:
+                    synth_payload["tokens"] = {"input": synth_input, "output": synth_output}
+                try:
+                    model_val = ctx.metadata.get("specific_model_name") or (
+                        ctx.assistant.model.value if hasattr(ctx.assistant.model, "value") else str(ctx.assistant.model)
+                    )
+                    synth_payload["model_name"] = model_val
+                    synth_payload["model_provider"] = ctx.assistant.model_provider
+                except Exception:
+                    pass
+                yield EventFormatter.format(
+                    PipelineStepType.ROUTER_SYNTHESIS,
+                    StepStatus.COMPLETED,
+                    sid_synth,
+                    parent_id=parent_span_id,
+                    duration=synthesis_dur,
+                    payload=synth_payload,
                 )
-                synth_payload["model_name"] = model_val
-                synth_payload["model_provider"] = ctx.assistant.model_provider
-            except Exception:
-                pass
-            yield EventFormatter.format(
-                PipelineStepType.ROUTER_SYNTHESIS,
-                StepStatus.COMPLETED,
-                sid_synth,
-                parent_id=parent_span_id,
-                duration=synthesis_dur,
-                payload=synth_payload,
-            )
-            ctx.metrics.end_span(sid_synth, payload=synth_payload)
+                ctx.metrics.end_span(sid_synth, payload=synth_payload)
 
-            # F. Finalize
-            step_metric = ctx.metrics.end_span(parent_span_id)
-            yield EventFormatter.format(
-                PipelineStepType.ROUTER, StepStatus.COMPLETED, parent_span_id, duration=step_metric.duration
-            )
+                # F. Finalize
+                step_metric = ctx.metrics.end_span(parent_span_id)
+                yield EventFormatter.format(
+                    PipelineStepType.ROUTER, StepStatus.COMPLETED, parent_span_id, duration=step_metric.duration
+                )
 
-            await embedding_task
-            ctx.should_stop = True
-            # Note: event_queue is not consumed after synthesis because aquery() is
-            # synchronous from the caller perspective once the response object is returned.
+                await embedding_task
+                ctx.should_stop = True
+                # Note: event_queue is not consumed after synthesis because aquery() is
+                # synchronous from the caller perspective once the response object is returned.
 
-        except Exception as e:
-            logger.error(f"Agentic Router Critical Failure: {e}", exc_info=True)
-            yield EventFormatter.format(
-                PipelineStepType.ROUTER, StepStatus.FAILED, parent_span_id, label=LABEL_ROUTER_ERROR % str(e)
-            )
+            except Exception as e:
+                logger.error(f"Agentic Router Critical Failure: {e}", exc_info=True)
+                yield EventFormatter.format(
+                    PipelineStepType.ROUTER, StepStatus.FAILED, parent_span_id, label=LABEL_ROUTER_ERROR % str(e)
+                )
 
     async def _initialize_engine(self, ctx: ChatContext, handler: StreamingCallbackHandler):
-        """Creates and configures the query engine."""
+        """
+        Returns the (cached) query engine for this assistant.
+        The per-request handler is not added to the engine: it is activated by use_request_callback_handler
+        and reached through the RequestCallbackRouter attached once to the engine's CallbackManager.
+        """
         engine = await ctx.query_engine_factory.create_engine(ctx.assistant, language=ctx.language)
 
-        if hasattr(engine, "callback_manager"):
-            engine.callback_manager.add_handler(handler)
-        else:
-            engine.callback_manager = CallbackManager([handler])
+        if getattr(engine, "callback_manager", None) is None:
+            engine.callback_manager = CallbackManager([])
+        attach_request_router(engine.callback_manager)
 
         return engine
 
     async def _consume_event_queue(self, queue: asyncio.Queue, task: asyncio.Task) -> AsyncGenerator[Dict, None]:
-        """Yields events from the queue until the task is done."""
+        """Yields events from the queue as soon as they arrive until the task is done (no polling)."""
         while not task.done():
+            getter = asyncio.ensure_future(queue.get())
             try:
-                # Wait briefly for new events
-                event = await asyncio.wait_for(queue.get(), timeout=0.1)
-                yield event
-            except asyncio.TimeoutError:
-                continue
+                await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                if not getter.done():
+                    getter.cancel()
+            if getter.done() and not getter.cancelled():
+                yield getter.result()
 
         # Flush remaining
         while not queue.empty():
@@ -563,8 +573,8 @@ class AgenticProcessor(BaseChatProcessor):
                             break
 
             embed_model = await ctx.vector_service.get_embedding_model(provider=provider)
-            # Run in thread pool
-            embedding = await asyncio.to_thread(embed_model.get_text_embedding, ctx.message)
+            # Run in thread pool (shared with Vanna's lookups of the same question)
+            embedding = await ctx.embedding_memo.aget_text_embedding(embed_model, ctx.message)
             ctx.question_embedding = embedding
         except Exception as e:
             logger.warning(LOG_EMBEDDING_FAIL, e)
@@ -643,12 +653,14 @@ class AgenticProcessor(BaseChatProcessor):
                             break
 
         try:
-            if isinstance(response, StreamingResponse):
+            if isinstance(response, (AsyncStreamingResponse, StreamingResponse)):
                 logger.info(LOG_STREAM_START)
-                if hasattr(response, "async_response_gen"):
-                    async for event in process_token_stream(response.async_response_gen):
+                if isinstance(response, AsyncStreamingResponse):
+                    # aquery() path: tokens are pulled from the LLM's async stream on the event loop
+                    async for event in process_token_stream(response.async_response_gen()):
                         yield event
                 else:
+                    # Sync stream (only returned by engines without native async streaming)
                     # synchronous generator wrapper
                     async def sync_gen_wrapper():
                         gen_iter = iter(response.response_gen)
@@ -308,7 +308,7 @@ class CSVRAGProcessor(BaseChatProcessor):
             # P1: Generate and capture embedding for Trending analysis
             # The retriever will generate it anyway, but we need to capture it explicitly
             try:
-                embedding = await components.embed_model.aget_query_embedding(ctx.message)
+                embedding = await ctx.embedding_memo.aget_query_embedding(components.embed_model, ctx.message)
                 ctx.question_embedding = embedding
             except Exception as e:
                 logger.warning(f"Failed to capture question embedding for trending: {e}")
@@ -68,7 +68,10 @@ class HistoryLoaderProcessor(BaseChatProcessor):
         )
 
     async def _load_history(self, ctx: ChatContext) -> List[Message]:
-        return await ctx.chat_history_service.get_history(ctx.session_id)
+        # The exact semantic cache entry of the question is read in the same Redis round trip
+        if ctx.cache_service and ctx.assistant.use_semantic_cache:
+            ctx.cache_prefetch = ctx.cache_service.prepare_exact_lookup(ctx.original_message, str(ctx.assistant.id))
+        return await ctx.chat_history_service.get_history(ctx.session_id, ctx.cache_prefetch)
 
     def _calculate_duration(self, start_time: float) -> float:
         return round(time.time() - start_time, ROUNDING_PRECISION)
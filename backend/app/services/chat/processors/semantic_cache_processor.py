@@ -94,6 +94,7 @@ class SemanticCacheProcessor(BaseChatProcessor):
                 question=ctx.original_message,
                 assistant_id=str(ctx.assistant.id),
                 embedding=None,  # Force exact match skip semantic
+                prefetched=ctx.cache_prefetch,  # Read with the history window (HistoryLoaderProcessor)
             )
 
             is_hit = bool(cached_res) and self._is_valid_cache_entry(cached_res)
@@ -166,11 +167,10 @@ class SemanticCacheProcessor(BaseChatProcessor):
     # --- Private Helpers: Core Logic ---
 
     async def _generate_query_embedding(self, ctx: ChatContext, provider: str) -> List[float]:
-        """Retrieves the embedding for the user's message in a non-blocking way."""
+        """Retrieves the embedding for the user's message in a non-blocking way (memoized per request)."""
         embed_model = await ctx.vector_service.get_embedding_model(provider=provider)
 
-        # P0 FIX: Offload blocking IO/CPU to thread pool
-        return await asyncio.to_thread(embed_model.get_text_embedding, ctx.original_message)
+        return await ctx.embedding_memo.aget_text_embedding(embed_model, ctx.original_message)
 
     # --- Private Helpers: Hit/Miss Processing ---
 
@@ -4,10 +4,11 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict
 
 from app.models.assistant import Assistant
 from app.schemas.chat import Message
+from app.services.chat.embedding_memo import EmbeddingMemo
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
-    from app.services.cache_service import SemanticCacheService
+    from app.services.cache_service import ExactLookup, SemanticCacheService
     from app.services.chat_history_service import ChatHistoryService
     from app.services.settings_service import SettingsService
     from app.services.vector_service import VectorService
@@ -93,9 +94,11 @@ class ChatContext:
     # Data Accumulators
     start_time: float = field(default_factory=lambda: __import__("time").time())
     history: List[Message] = field(default_factory=list)
+    cache_prefetch: Optional["ExactLookup"] = None  # Exact cache entry read with the history window
     question_embedding: Optional[List[float]] = None
     captured_source_embedding: Optional[List[float]] = None
     embedding_provider: Optional[str] = None  # Resolved provider for vectors
+    embedding_memo: EmbeddingMemo = field(default_factory=EmbeddingMemo)  # Each distinct embedding computed once
     full_response_text: str = ""
     retrieved_sources: List[Dict] = field(default_factory=list)
     sql_results: Optional[List] = None  # Raw SQL results (List[Tuple]) for visualization
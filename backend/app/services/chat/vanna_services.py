@@ -21,6 +21,7 @@ from vanna.base import VannaBase
 from app.core.settings import settings
 from app.factories.llm_factory import LLMFactory
 from app.factories.embedding_factory import EmbeddingProviderFactory
+from app.services.chat.embedding_memo import embed_text_sync
 from app.services.settings_service import SettingsService
 
 logger = logging.getLogger(__name__)
@@ -77,7 +78,7 @@ class VectraCustomVanna(VannaBase):
             point_id = str(uuid.uuid4())
 
             # 2. Embed the question
-            vector = self.embedding_service.get_text_embedding(question)
+            vector = embed_text_sync(self.embedding_service, question)
 
             # 3. Prepare payload
             payload = {
@@ -114,7 +115,7 @@ class VectraCustomVanna(VannaBase):
         try:
             # 1. Embed the question
             # self.embedding_service is the Model (BaseEmbedding), not the service.
-            query_vector = self.embedding_service.get_text_embedding(question)
+            query_vector = embed_text_sync(self.embedding_service, question)
 
             # 2. Get Sync Client (Pre-initialized in Factory)
             client = self.vector_service.client
@@ -192,7 +193,7 @@ class VectraCustomVanna(VannaBase):
             return []
 
         try:
-            query_vector = self.embedding_service.get_text_embedding(question)
+            query_vector = embed_text_sync(self.embedding_service, question)
             client = self.vector_service.client
             collection_name = self.collection_name
 
@@ -297,7 +298,7 @@ class VectraCustomVanna(VannaBase):
     def generate_embedding(self, data: str) -> List[float]:
         if not self.embedding_service:
             raise ValueError("Embedding Service not initialized in Vanna Service")
-        return self.embedding_service.get_text_embedding(data)
+        return embed_text_sync(self.embedding_service, data)
 
     def run_sql(self, sql: str, **kwargs) -> pd.DataFrame:
         params = getattr(self, "conn_params", {})
@@ -1,10 +1,13 @@
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from app.repositories.chat_history_repository import ChatRedisRepository
 from app.schemas.chat import MAX_CONTENT_LENGTH, Message, MessageRole
 
+if TYPE_CHECKING:
+    from app.services.cache_service import ExactLookup
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,20 +42,28 @@ class ChatHistoryService:
 
         await self.repository.push_message(session_id, message_data)
 
-    async def get_history(self, session_id: str) -> List[Message]:
+    async def get_history(self, session_id: str, prefetch: Optional["ExactLookup"] = None) -> List[Message]:
         """
         Retrieve current sliding window history.
         Implements Fallback Strategy: Redis (Hot) -> Postgres (Cold).
+
+        Args:
+            session_id: Chat session
+            prefetch: Exact semantic cache lookup of the turn, resolved in the same Redis round trip
         """
         # 1. Try Hot Storage (Redis)
-        raw_items = await self.repository.get_recent_messages(session_id)
+        if prefetch is None:
+            raw_items = await self.repository.get_recent_messages(session_id)
+        else:
+            raw_items, entries = await self.repository.get_recent_messages_and_entries(session_id, [prefetch.cache_key])
+            if entries:
+                prefetch.resolve(*entries[0])
 
         # 2. Fallback: If Redis is empty, try Cold Storage (Postgres)
         if not raw_items:
             logger.info(f"❄️ Redis empty for {session_id}. Attempting Cold Storage fallback...")
             from app.core.database import SessionLocal
-            from app.repositories.chat_history_repository import \
-                ChatPostgresRepository
+            from app.repositories.chat_history_repository import ChatPostgresRepository
 
             try:
                 # Create a temporary DB session for this specific fallback operation
@@ -119,8 +130,8 @@ async def get_redis_client() -> Redis:
             redis_url = (
                 f"redis://:{settings.REDIS_PASSWORD}@{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
             )
-            # decode_responses=True ensures we get str not bytes
-            _redis_client = redis_from_url(redis_url, decode_responses=True)
+            # Raw bytes: the history window is msgpack-encoded (see ChatRedisRepository)
+            _redis_client = redis_from_url(redis_url, decode_responses=False)
 
     return _redis_client
 
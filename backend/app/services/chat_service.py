@@ -15,6 +15,7 @@ from app.repositories.chat_history_repository import ChatPostgresRepository, get
 from app.schemas.chat import Message
 from app.services.cache_service import SemanticCacheService, get_cache_service
 from app.services.chat.chat_metrics_manager import ChatMetricsManager
+from app.services.chat.embedding_memo import use_embedding_memo
 from app.services.chat.processors.agentic_processor import AgenticProcessor
 from app.services.chat.processors.base_chat_processor import BaseChatProcessor
 from app.services.chat.processors.history_processor import HistoryLoaderProcessor
@@ -294,16 +295,22 @@ class ChatService:
     async def _execute_pipeline(
         self, processors: List[BaseChatProcessor], ctx: ChatContext
     ) -> AsyncGenerator[str, None]:
-        """Iterates through processors and yields their output."""
-        for processor in processors:
-            name = processor.__class__.__name__
-            logger.debug(LOG_PIPELINE_START, name)
+        """
+        Iterates through processors and yields their output.
+        The request's embedding memo is active for the whole pipeline (strategies, Vanna threads).
+        """
+        with use_embedding_memo(ctx.embedding_memo):
+            for processor in processors:
+                name = processor.__class__.__name__
+                logger.debug(LOG_PIPELINE_START, name)
+
+                async for chunk in processor.process(ctx):
+                    if chunk:
+                        yield chunk
 
-            async for chunk in processor.process(ctx):
-                if chunk:
-                    yield chunk
+                logger.debug(LOG_PIPELINE_END, name)
 
-            logger.debug(LOG_PIPELINE_END, name)
+        logger.debug(f"Embedding memo | hits={ctx.embedding_memo.hits} misses={ctx.embedding_memo.misses}")
 
     def _handle_pipeline_error(self, session_id: str, error: Exception) -> str:
         """Logs the critical error and returns a friendly JSON error message."""
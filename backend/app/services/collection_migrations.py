@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_migration_task: Optional[asyncio.Task] = None
+
+
+async def migrate_payload_indexes() -> Dict[str, int]:
+    """
+    Backfill the payload indexes of collections created before they were declared.
+
+    1. System fields (connector_id, doc_status, is_active...) on every collection.
+    2. Filter columns of every indexed CSV document, typed from one of its stored points.
+
+    Returns:
+        Number of collections and CSV documents processed
+    """
+    # Late import for clean dependency tree
+    from app.core.database import SessionLocal
+    from app.repositories.connector_repository import ConnectorRepository
+    from app.repositories.document_repository import DocumentRepository
+    from app.repositories.vector_repository import VectorRepository
+    from app.schemas.ingestion import IndexingStrategy
+    from app.services.ingestion.transformers.smart_row_transformer import SmartRowTransformer
+    from app.services.settings_service import SettingsService
+    from app.services.vector_service import VectorService
+
+    async with SessionLocal() as db:
+        vector_service = VectorService(SettingsService(db))
+        collections = await vector_service.migrate_payload_indexes()
+
+        csv_docs = await DocumentRepository(db).get_indexed_csv_schemas()
+        connector_repo = ConnectorRepository(db)
+        repo = VectorRepository(await vector_service.get_async_qdrant_client())
+
+        migrated = 0
+        for doc_id, connector_id, ai_schema in csv_docs:
+            try:
+                connector = await connector_repo.get_by_id(connector_id)
+                if not connector:
+                    continue
+                provider = (connector.configuration or {}).get("ai_provider")
+                collection_name = await vector_service.get_collection_name(provider)
+
+                sample = await repo.get_sample_payload(collection_name, doc_id)
+                if sample is None:
+                    continue
+
+                transformer = SmartRowTransformer(IndexingStrategy(**ai_schema))
+                await vector_service.ensure_payload_indexes(
+                    collection_name, transformer.payload_index_schema([sample]), wait=False
+                )
+                migrated += 1
+            except Exception as e:
+                logger.warning(f"⚠️ WARN | payload_index_migration | Doc {doc_id}: {e}")
+
+    return {"collections": collections, "csv_documents": migrated}
+
+
+async def migrate_collection_profiles() -> List[str]:
+    """Rebuild the provider collections whose storage profile changed (see VectorService.migrate_collection_profile)."""
+    from app.core.database import SessionLocal
+    from app.services.settings_service import SettingsService
+    from app.services.vector_service import VectorService
+
+    async with SessionLocal() as db:
+        return await VectorService(SettingsService(db)).migrate_collection_profiles()
+
+
+async def _run_migrations() -> None:
+    """Background task wrapper: migrations never block nor fail startup."""
+    if settings.VECTOR_PROFILE_MIGRATION_ENABLED:
+        # First, so the payload index backfill below already targets the rebuilt collections
+        logger.info("🗂️ START | vector_profile_migration")
+        try:
+            rebuilt = await migrate_collection_profiles()
+            logger.info(f"🗂️ DONE | vector_profile_migration | Rebuilt: {rebuilt}")
+        except Exception as e:
+            logger.error(f"⚠️ WARN | vector_profile_migration | Error: {e}")
+
+    if settings.PAYLOAD_INDEX_MIGRATION_ENABLED:
+        logger.info("🗂️ START | payload_index_migration")
+        try:
+            stats = await migrate_payload_indexes()
+            logger.info(f"🗂️ DONE | payload_index_migration | {stats}")
+        except Exception as e:
+            logger.error(f"⚠️ WARN | payload_index_migration | Error: {e}")
+
+
+async def start_collection_migrations() -> None:
+    """Start the one-shot Qdrant collection migrations (storage profiles, payload indexes) in the background."""
+    global _migration_task
+
+    if not (settings.VECTOR_PROFILE_MIGRATION_ENABLED or settings.PAYLOAD_INDEX_MIGRATION_ENABLED):
+        return
+
+    if _migration_task is not None and not _migration_task.done():
+        logger.warning("Collection migrations already running")
+        return
+
+    _migration_task = asyncio.create_task(_run_migrations())
+
+
+async def stop_collection_migrations() -> None:
+    """Cancel the migrations if they are still running."""
+    global _migration_task
+
+    if _migration_task is None:
+        return
+
+    _migration_task.cancel()
+    try:
+        await _migration_task
+    except asyncio.CancelledError:
+        pass
+    _migration_task = None
@@ -22,6 +22,7 @@ from app.schemas.enums import ConnectorStatus, ConnectorType
 from app.services.ingestion_service import IngestionService
 from app.services.scanner_service import ScannerService
 from app.services.settings_service import SettingsService, get_settings_service
+from app.services.query_engine_cache import get_query_engine_cache
 from app.services.sql_discovery_service import SQLDiscoveryService, get_sql_discovery_service
 from app.services.vector_service import VectorService, get_vector_service
 from app.repositories.connector_sync_log_repository import ConnectorSyncLogRepository
@@ -246,6 +247,15 @@ class ConnectorService:
             # Apply via Repository
             updated_connector = await self.connector_repo.update(connector_id, update_data)
 
+            # Mirror the enabled flag into the vectors payload (searches filter on is_active server-side)
+            if "is_enabled" in update_data and update_data["is_enabled"] != db_connector.is_enabled:
+                self._track_task(
+                    self._safe_update_active(connector_id, update_data["is_enabled"], updated_connector.configuration)
+                )
+
+            # Compiled chat engines embed this connector's tools (filters, provider, SQL engine)
+            get_query_engine_cache().invalidate_connector(connector_id)
+
             # Invalidate SQL engine cache when connector configuration changes
             if self.sql_discovery_service and self.sql_discovery_service.engine_cache:
                 if connector_update.configuration:
@@ -300,6 +310,8 @@ class ConnectorService:
             # 2. DB Cleanup
             await self.connector_repo.delete_with_relations(connector_id)
 
+            get_query_engine_cache().invalidate_connector(connector_id)
+
             # Invalidate SQL engine cache when connector is deleted
             if self.sql_discovery_service and self.sql_discovery_service.engine_cache:
                 invalidated = self.sql_discovery_service.engine_cache.invalidate_connector(connector_id)
@@ -603,6 +615,15 @@ class ConnectorService:
 
             logger.error(f"BACKGROUND ACL FAIL | Connector: {connector_id} | Error: {e}")
 
+    async def _safe_update_active(self, connector_id: UUID, is_active: bool, config: Optional[dict]):
+        """Supervised background update of the is_active payload flag."""
+        try:
+            await self.vector_service.set_connector_active(
+                connector_id, is_active, provider=(config or {}).get("ai_provider")
+            )
+        except Exception as e:
+            logger.error(f"BACKGROUND ACTIVE FLAG FAIL | Connector: {connector_id} | Error: {e}")
+
     async def _safe_delete_vectors(self, connector_id: UUID, config: dict):
         """Supervised background vector deletion."""
         try:
@@ -23,6 +23,7 @@ from app.repositories.connector_repository import ConnectorRepository
 from app.repositories.document_repository import DocumentRepository
 from app.schemas.connector import ConnectorResponse
 from app.schemas.documents import ConnectorDocumentCreate, ConnectorDocumentResponse, ConnectorDocumentUpdate
+from app.services.cache_service import invalidate_cached_answers
 from app.services.ingestion.utils import IngestionUtils
 from app.services.settings_service import SettingsService, get_settings_service
 from app.services.vector_service import VectorService, get_vector_service
@@ -270,7 +271,9 @@ class DocumentService:
                 await self._run_blocking_io(os.makedirs, upload_dir, exist_ok=True)
             except Exception as e:
                 logger.error(f"❌ PERMISSION DENIED | Could not create {upload_dir}: {e}")
-                raise TechnicalError(f"Storage error: Cannot create upload directory at {upload_dir}", error_code="UPLOAD_DIR_ERROR")
+                raise TechnicalError(
+                    f"Storage error: Cannot create upload directory at {upload_dir}", error_code="UPLOAD_DIR_ERROR"
+                )
 
             # os.path.join is purely string manipulation, safe in async.
             file_path = os.path.join(upload_dir, file.filename or "uploaded_file")
@@ -332,6 +335,7 @@ class DocumentService:
                 raise EntityNotFound(f"Document {document_id} not found")
 
             await self.document_repo.update(document_id, {"status": DocStatus.PENDING, "updated_at": func.now()})
+            await self._safe_mirror_status(doc, DocStatus.PENDING)
 
             await manager.emit_document_update(str(doc.id), DocStatus.PENDING, "Queued.")
             await manager.emit_trigger_document_sync(str(doc.id))
@@ -350,6 +354,7 @@ class DocumentService:
                 raise EntityNotFound(f"Document {document_id} not found")
 
             await self.document_repo.update(document_id, {"status": DocStatus.PAUSED})
+            await self._safe_mirror_status(doc, DocStatus.PAUSED)
             await manager.emit_document_update(str(doc.id), DocStatus.PAUSED, "Paused.")
             return True
         except Exception as e:
@@ -359,6 +364,15 @@ class DocumentService:
             raise TechnicalError("Stop failed", error_code="STOP_ERROR")
 
     # --- Helpers ---
+    async def _safe_mirror_status(self, doc: Any, status: DocStatus) -> None:
+        """Mirrors a status change into the document's vectors payload (search filters on it server-side)."""
+        try:
+            connector = await self.connector_repo.get_by_id(doc.connector_id)
+            provider = (connector.configuration or {}).get("ai_provider") if connector else None
+            await self.vector_service.set_document_status([doc.id], status, provider=provider)
+        except Exception as e:
+            logger.warning(f"STATUS MIRROR FAIL | Doc: {doc.id} | Error: {e}")
+
     async def _safe_delete_vectors(self, document_id: UUID, collection: str):
         """Supervised background vector deletion."""
         try:
@@ -368,6 +382,7 @@ class DocumentService:
             repo = VectorRepository(client)
             await repo.delete_by_document_id(collection, document_id)
             logger.info(f"BACKGROUND VECTOR CLEANUP SUCCESS | Doc: {document_id}")
+            await invalidate_cached_answers(self.vector_service, [document_id])
         except Exception as e:
             logger.error(f"BACKGROUND VECTOR CLEANUP FAIL | Doc: {document_id} | Error: {e}")
 
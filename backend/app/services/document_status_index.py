@@ -0,0 +1,277 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from app.core.settings import settings
+from app.schemas.enums import DocStatus
+
+logger = logging.getLogger(__name__)
+
+DocRef = Tuple[UUID, UUID]  # (document_id, connector_id)
+
+
+def _as_uuid(value: Any) -> Optional[UUID]:
+    if isinstance(value, UUID):
+        return value
+    try:
+        return UUID(str(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class DocumentStatusIndex:
+    """
+    In-memory set of INDEXED document ids, grouped per connector.
+
+    Replaces the per-search PostgreSQL round trip of HybridStrategy's status post-filter with an
+    O(1) membership test per candidate.
+
+    Kept current from the document frames ingestion already broadcasts (DOC_UPDATE,
+    DOC_DELETED, CONNECTOR_DELETED) and rebuilt periodically from the database to repair
+    anything missed (worker offline, bulk SQL updates). Each rebuild also reconciles the
+    doc_status payload of the vectors with it. Until the first rebuild succeeds, or
+    when the last one is older than max_age_seconds, the index is cold and callers must fall
+    back to the database.
+    """
+
+    def __init__(self, max_age_seconds: float = 900.0):
+        """
+        Initialize an empty (cold) index.
+
+        Args:
+            max_age_seconds: Age of the last successful rebuild after which the index is cold
+        """
+        self.max_age_seconds = max_age_seconds
+
+        # document_id -> connector_id (None when learned from a frame for a document not yet seen)
+        self._indexed: Dict[UUID, Optional[UUID]] = {}
+        self._by_connector: Dict[Optional[UUID], Set[UUID]] = {}
+
+        # Frames received while a rebuild is reading the database, replayed onto the new snapshot
+        self._journal: Optional[List[Dict[str, Any]]] = None
+        self._built_at: Optional[float] = None
+
+        # Thread safety
+        self._lock = threading.Lock()
+
+    @property
+    def is_warm(self) -> bool:
+        """True when the index was rebuilt recently enough to be trusted."""
+        built_at = self._built_at
+        return built_at is not None and time.monotonic() - built_at <= self.max_age_seconds
+
+    def is_indexed(self, document_id: UUID) -> bool:
+        """O(1) check that a document is currently INDEXED."""
+        return document_id in self._indexed
+
+    def indexed_ids(self, connector_id: UUID) -> Set[UUID]:
+        """Snapshot of the INDEXED document ids of one connector."""
+        with self._lock:
+            return set(self._by_connector.get(connector_id, ()))
+
+    def apply_event(self, message: Dict[str, Any]) -> None:
+        """
+        Apply a broadcast frame (websocket observer).
+
+        Only document status transitions are relevant, every other frame is ignored.
+        """
+        msg_type = message.get("type")
+        if msg_type not in ("DOC_UPDATE", "DOC_DELETED", "CONNECTOR_DELETED"):
+            return
+
+        with self._lock:
+            self._apply(self._indexed, self._by_connector, message)
+            if self._journal is not None:
+                self._journal.append(message)
+
+    def load(self, refs: Iterable[DocRef]) -> None:
+        """
+        Replace the index content with a full database snapshot and mark it warm.
+
+        Frames received since begin_rebuild() are replayed on top of the snapshot.
+        """
+        indexed: Dict[UUID, Optional[UUID]] = {}
+        by_connector: Dict[Optional[UUID], Set[UUID]] = {}
+        for doc_id, connector_id in refs:
+            indexed[doc_id] = connector_id
+            by_connector.setdefault(connector_id, set()).add(doc_id)
+
+        with self._lock:
+            for message in self._journal or ():
+                self._apply(indexed, by_connector, message)
+            self._indexed = indexed
+            self._by_connector = by_connector
+            self._journal = None
+            self._built_at = time.monotonic()
+
+        logger.info(f"DOC_STATUS_INDEX | Rebuilt - {len(indexed)} indexed documents, {len(by_connector)} connectors")
+
+    def begin_rebuild(self) -> None:
+        """Start journaling frames so none is lost while the snapshot is being read."""
+        with self._lock:
+            self._journal = []
+
+    def abort_rebuild(self) -> None:
+        """Stop journaling after a failed rebuild (the current content is kept)."""
+        with self._lock:
+            self._journal = None
+
+    async def rebuild(self, document_repo: Any) -> None:
+        """
+        Rebuild from the database.
+
+        Args:
+            document_repo: DocumentRepository bound to a live session
+        """
+        self.begin_rebuild()
+        try:
+            refs = await document_repo.get_indexed_refs()
+        except Exception:
+            self.abort_rebuild()
+            raise
+        self.load(refs)
+
+    def invalidate(self) -> None:
+        """Mark the index cold until the next successful rebuild."""
+        with self._lock:
+            self._built_at = None
+
+    def get_stats(self) -> dict:
+        """
+        Get index statistics for monitoring.
+
+        Returns:
+            Dictionary with index statistics
+        """
+        with self._lock:
+            built_at = self._built_at
+            return {
+                "warm": self.is_warm,
+                "indexed_documents": len(self._indexed),
+                "connectors": len(self._by_connector),
+                "age_seconds": round(time.monotonic() - built_at, 1) if built_at is not None else None,
+            }
+
+    @staticmethod
+    def _apply(
+        indexed: Dict[UUID, Optional[UUID]], by_connector: Dict[Optional[UUID], Set[UUID]], message: Dict[str, Any]
+    ) -> None:
+        """Apply one frame to the given maps (internal, called with lock held)."""
+        msg_type = message.get("type")
+
+        if msg_type == "CONNECTOR_DELETED":
+            connector_id = _as_uuid(message.get("id"))
+            for doc_id in by_connector.pop(connector_id, ()):
+                indexed.pop(doc_id, None)
+            return
+
+        doc_id = _as_uuid(message.get("id"))
+        if doc_id is None:
+            return
+
+        if msg_type == "DOC_UPDATE" and str(message.get("status", "")).lower() == DocStatus.INDEXED.value:
+            if doc_id not in indexed:
+                # DOC_UPDATE frames carry no connector: grouped under None until the next rebuild
+                connector_id = _as_uuid(message.get("connector_id"))
+                indexed[doc_id] = connector_id
+                by_connector.setdefault(connector_id, set()).add(doc_id)
+            return
+
+        # Any other status (re-processing, failed, paused...) or deletion drops the document
+        if doc_id in indexed:
+            connector_id = indexed.pop(doc_id)
+            bucket = by_connector.get(connector_id)
+            if bucket is not None:
+                bucket.discard(doc_id)
+                if not bucket:
+                    del by_connector[connector_id]
+
+
+# Global singleton and lock for thread-safe initialization
+_global_index: Optional[DocumentStatusIndex] = None
+_init_lock = threading.Lock()
+
+_rebuild_task: Optional[asyncio.Task] = None
+
+
+def get_document_status_index() -> DocumentStatusIndex:
+    """
+    Get or create the global document status index singleton using double-checked locking.
+
+    Returns:
+        Global DocumentStatusIndex instance
+    """
+    global _global_index
+    if _global_index is None:
+        with _init_lock:
+            if _global_index is None:
+                interval = settings.DOCUMENT_STATUS_INDEX_REBUILD_INTERVAL
+                _global_index = DocumentStatusIndex(max_age_seconds=interval * 3)
+    return _global_index
+
+
+async def _rebuild_loop(index: DocumentStatusIndex, interval_seconds: int) -> None:
+    """Background task rebuilding the index from the database every interval_seconds."""
+    # Late import for clean dependency tree
+    from app.core.database import SessionLocal
+    from app.repositories.document_repository import DocumentRepository
+    from app.services.settings_service import SettingsService
+    from app.services.vector_service import VectorService
+
+    logger.info("📇 START | document_status_index | Interval: %ds", interval_seconds)
+    try:
+        while True:
+            try:
+                # Fresh session per iteration to avoid pool/state issues
+                async with SessionLocal() as db:
+                    await index.rebuild(DocumentRepository(db))
+                    # Unhide INDEXED documents whose doc_status mirror was lost (Qdrant down mid-ingestion)
+                    await VectorService(SettingsService(db)).reconcile_document_status(index.is_indexed)
+            except Exception as e:
+                logger.error(f"⚠️ WARN | document_status_index | Rebuild Error: {e}")
+
+            await asyncio.sleep(interval_seconds)
+    finally:
+        logger.info("📇 STOP | document_status_index | Loop ended")
+
+
+async def start_document_status_index() -> None:
+    """Subscribe the index to document frames and start the periodic rebuild task."""
+    global _rebuild_task
+
+    if not settings.DOCUMENT_STATUS_INDEX_ENABLED:
+        return
+
+    if _rebuild_task is not None and not _rebuild_task.done():
+        logger.warning("Document status index task already running")
+        return
+
+    from app.core.websocket import manager
+
+    index = get_document_status_index()
+    manager.add_observer(index.apply_event)
+    _rebuild_task = asyncio.create_task(_rebuild_loop(index, settings.DOCUMENT_STATUS_INDEX_REBUILD_INTERVAL))
+
+
+async def stop_document_status_index() -> None:
+    """Stop the rebuild task and unsubscribe the index from document frames."""
+    global _rebuild_task
+
+    if _rebuild_task is None:
+        return
+
+    from app.core.websocket import manager
+
+    index = get_document_status_index()
+    manager.remove_observer(index.apply_event)
+    index.invalidate()
+
+    _rebuild_task.cancel()
+    try:
+        await _rebuild_task
+    except asyncio.CancelledError:
+        pass
+    _rebuild_task = None
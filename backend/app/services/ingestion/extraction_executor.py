@@ -0,0 +1,229 @@
+"""
+Extraction Executor - Process pool for CPU-bound file parsing.
+
+pypdf, MarkItDown, the email parsers and the CSV reader are pure Python: under asyncio.to_thread
+they all share one GIL, so a connector full of PDFs is parsed one file at a time. Processors flagged
+CPU_BOUND are executed here in worker processes instead, so ingest_files can extract many files in
+parallel. Other processors (cloud OCR, transcription) are I/O-bound and stay on the event loop;
+hybrid ones (PdfProcessor) send only their CPU-bound stage to the pool.
+
+FAILURE ISOLATION:
+- Every worker parses one file at a time, and files wait for an idle worker before their timeout starts
+- A worker crash (segfault, OOM kill) or a file exceeding the timeout fails that file alone: only its
+  worker is killed, and replaced on next use
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Set, Tuple, Type
+
+from app.core.exceptions import TechnicalError
+from app.core.settings import settings
+from app.factories.processors.base import FileProcessor, ProcessedDocument
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionError(TechnicalError):
+    """Raised when a file could not be extracted in the process pool."""
+
+    pass
+
+
+class ExtractionTimeoutError(ExtractionError):
+    """Raised when a file exceeds the per-file extraction timeout."""
+
+    pass
+
+
+# Per worker process: processors and the event loop are built once and reused across files
+_worker_processors: Dict[Type[FileProcessor], FileProcessor] = {}
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _extract_in_worker(
+    processor_cls: Type[FileProcessor], file_path: str, ai_provider: Optional[str]
+) -> Tuple[bool, object]:
+    """
+    Worker entry point. Returns (True, documents) or (False, error message).
+
+    Exceptions are flattened to strings: custom exception classes do not always survive pickling.
+    """
+    try:
+        processor = _worker_processors.get(processor_cls)
+        if processor is None:
+            processor = _worker_processors[processor_cls] = processor_cls()
+        return True, _worker_event_loop().run_until_complete(processor.process(file_path, ai_provider=ai_provider))
+    except Exception as e:
+        return False, str(e)
+
+
+def _worker_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    One event loop per worker process, kept for its lifetime: resources a processor binds to the
+    loop it first ran on (clients, pooled connections) stay usable for the next files.
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+class ExtractionExecutor:
+    """
+    Runs CPU_BOUND file processors in worker processes.
+
+    Each worker is its own single-process pool, handed to one file at a time: a file only gets a
+    worker when one is idle, so its timeout starts when its worker does (never while queued behind
+    other documents or archive members), and killing a stuck or crashed worker affects no other file.
+
+    ARCHITECT NOTE: Drop-in for processor.process()
+    extract() has the same contract as FileProcessor.process (returns ProcessedDocument list,
+    raises on failure), so callers do not care whether a file was parsed locally or in a worker.
+    """
+
+    def __init__(self, max_workers: int, timeout_seconds: float):
+        """
+        Initialize the executor (workers are started lazily).
+
+        Args:
+            max_workers: Worker processes (0 = parse in-process, legacy behavior)
+            timeout_seconds: Per-file extraction timeout, from the moment a worker takes the file
+                (includes the start-up of a cold worker)
+        """
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+
+        self._idle: List[ProcessPoolExecutor] = []  # Started workers waiting for a file
+        self._workers: Set[ProcessPoolExecutor] = set()  # Every started worker (shutdown)
+        self._lock = threading.Lock()
+
+        # Bounds files in workers to max_workers; bound to the running event loop (recreated if it changes)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def should_offload(self, processor: FileProcessor) -> bool:
+        """Whether this processor runs in the pool (mocks, patched instances and I/O-bound processors do not)."""
+        return (
+            self.max_workers > 0
+            and getattr(type(processor), "CPU_BOUND", False) is True
+            and "process" not in vars(processor)
+        )
+
+    async def extract(
+        self, processor: FileProcessor, file_path: str, ai_provider: Optional[str] = None
+    ) -> List[ProcessedDocument]:
+        """
+        Extract a file with the given processor.
+
+        Raises:
+            ExtractionTimeoutError: File exceeded INGESTION_EXTRACTION_TIMEOUT
+            ExtractionError: Processor failed or the file crashed its worker
+        """
+        if not self.should_offload(processor):
+            return await processor.process(file_path, ai_provider=ai_provider)
+
+        async with self._get_slots():
+            worker = self._checkout()
+            try:
+                result = await self._run(worker, processor, file_path, ai_provider)
+            except BaseException:
+                # Killed (timeout, crash) or abandoned (cancellation) mid-file: never reused
+                self._discard(worker)
+                raise
+            self._checkin(worker)
+            return result
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (restarted lazily on next use)."""
+        with self._lock:
+            workers, self._workers, self._idle = self._workers, set(), []
+        for worker in workers:
+            worker.shutdown(wait=False, cancel_futures=True)
+
+    # --- Worker management ---
+
+    async def _run(
+        self, worker: ProcessPoolExecutor, processor: FileProcessor, file_path: str, ai_provider: Optional[str]
+    ) -> List[ProcessedDocument]:
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(worker, _extract_in_worker, type(processor), file_path, ai_provider)
+            ok, payload = await asyncio.wait_for(future, timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.error(f"⏱️ Extraction timed out after {self.timeout_seconds:.0f}s, killing its worker")
+            raise ExtractionTimeoutError(f"Extraction timed out after {self.timeout_seconds:.0f}s")
+        except BrokenProcessPool as e:
+            logger.warning(f"⚠️ Extraction worker crashed ({e})")
+            raise ExtractionError("Extraction worker crashed while parsing this file")
+
+        if not ok:
+            raise ExtractionError(payload)
+        return payload
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots_loop = loop
+            self._slots = asyncio.Semaphore(self.max_workers)
+        return self._slots
+
+    def _checkout(self) -> ProcessPoolExecutor:
+        """An idle worker, or a new one (callers hold a slot, so at most max_workers exist)."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            # spawn: forking a process that owns an event loop, DB pools and threads is unsafe
+            worker = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            self._workers.add(worker)
+        logger.info(f"⚡ Extraction worker started ({len(self._workers)}/{self.max_workers})")
+        return worker
+
+    def _checkin(self, worker: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._idle.append(worker)
+
+    def _discard(self, worker: ProcessPoolExecutor) -> None:
+        """Kill a worker (its only file is the one that failed)."""
+        with self._lock:
+            self._workers.discard(worker)
+
+        for process in list((getattr(worker, "_processes", None) or {}).values()):
+            if process.is_alive():
+                process.terminate()
+        worker.shutdown(wait=False, cancel_futures=True)
+
+
+# Global singleton
+_global_executor: Optional[ExtractionExecutor] = None
+_init_lock = threading.Lock()
+
+
+def get_extraction_executor() -> ExtractionExecutor:
+    """
+    Get or create the global extraction executor singleton using double-checked locking.
+
+    Returns:
+        Global ExtractionExecutor instance
+    """
+    global _global_executor
+    if _global_executor is None:
+        with _init_lock:
+            if _global_executor is None:
+                _global_executor = ExtractionExecutor(
+                    max_workers=settings.computed_extraction_workers,
+                    timeout_seconds=settings.INGESTION_EXTRACTION_TIMEOUT,
+                )
+    return _global_executor
+
+
+def shutdown_extraction_executor() -> None:
+    """Stop the global executor's worker processes (application shutdown)."""
+    if _global_executor is not None:
+        _global_executor.shutdown()
@@ -0,0 +1,256 @@
+"""
+Ingestion Cache Backends - Persistent storage for the LlamaIndex IngestionCache and docstore.
+
+The legacy backend keeps everything in SimpleKVStore/SimpleDocumentStore JSON files, which are
+fully parsed on load and fully rewritten after every batch. The SQLite backend stores the same
+collections in a single WAL-mode database with O(1) keyed lookups and incremental writes.
+Both backends use the same IngestionCache / KVDocumentStore classes, so cache keys and document
+hashes are identical and switching backends never invalidates already-embedded content.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Tuple
+
+from llama_index.core.ingestion import IngestionCache
+from llama_index.core.storage.docstore import BaseDocumentStore, SimpleDocumentStore
+from llama_index.core.storage.docstore.keyval_docstore import KVDocumentStore
+from llama_index.core.storage.kvstore import SimpleKVStore
+from llama_index.core.storage.kvstore.types import DEFAULT_BATCH_SIZE, DEFAULT_COLLECTION, BaseKVStore
+
+logger = logging.getLogger(__name__)
+
+CacheBackend = Literal["json", "sqlite"]
+
+PIPELINE_CACHE_COLLECTION = "pipeline_cache"
+KV_JSON_FILE = "kv_store.json"
+DOCSTORE_JSON_FILE = "docstore.json"
+SQLITE_FILE = "ingestion_cache.sqlite3"
+MIGRATED_SUFFIX = ".migrated"
+
+
+class SqliteKVStore(BaseKVStore):
+    """
+    Embedded key-value store backed by SQLite in WAL mode.
+
+    ARCHITECT NOTE: Drop-in replacement for SimpleKVStore
+    - One row per (collection, key): lookups hit the primary key index, writes are appends to the WAL
+    - No full-file load on startup and no full rewrite on persist
+    - Safe across threads (connection guarded by a lock) and processes (WAL + busy timeout),
+      so it survives IngestionPipeline multiprocessing (connection is reopened after unpickling)
+    """
+
+    def __init__(self, db_path: str, busy_timeout_ms: int = 30000):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+            busy_timeout_ms: How long writers wait for a concurrent lock before failing
+        """
+        self.db_path = str(db_path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # --- Connection management ---
+
+    def _connection(self) -> sqlite3.Connection:
+        """Lazily open the connection (called with lock held)."""
+        if self._conn is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv ("
+                "collection TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (collection, key)) WITHOUT ROWID"
+            )
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __getstate__(self) -> dict:
+        # sqlite3.Connection and threading.Lock are not picklable (multiprocessing workers)
+        return {"db_path": self.db_path, "busy_timeout_ms": self.busy_timeout_ms}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["db_path"], state["busy_timeout_ms"])
+
+    # --- Sync API ---
+
+    def put(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
+        self.put_all([(key, val)], collection=collection)
+
+    def put_all(
+        self,
+        kv_pairs: List[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        # Single transaction regardless of batch_size: one fsync per call instead of per key
+        if not kv_pairs:
+            return
+        rows = [(collection, key, json.dumps(val)) for key, val in kv_pairs]
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("INSERT OR REPLACE INTO kv (collection, key, value) VALUES (?, ?, ?)", rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute("SELECT value FROM kv WHERE collection = ? AND key = ?", (collection, key))
+                .fetchone()
+            )
+        return json.loads(row[0]) if row else None
+
+    def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        with self._lock:
+            rows = (
+                self._connection().execute("SELECT key, value FROM kv WHERE collection = ?", (collection,)).fetchall()
+            )
+        return {key: json.loads(value) for key, value in rows}
+
+    def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        with self._lock:
+            cursor = self._connection().execute("DELETE FROM kv WHERE collection = ? AND key = ?", (collection, key))
+        return cursor.rowcount > 0
+
+    def count(self, collection: str = DEFAULT_COLLECTION) -> int:
+        """Number of keys in a collection (without loading values)."""
+        with self._lock:
+            row = self._connection().execute("SELECT COUNT(*) FROM kv WHERE collection = ?", (collection,)).fetchone()
+        return int(row[0])
+
+    def persist(self, persist_path: Optional[str] = None, fs=None) -> None:
+        """No-op: every write is already durable. Kept for SimpleKVStore API compatibility."""
+        return None
+
+    # --- Async API (offloaded to avoid blocking the event loop) ---
+
+    async def aput(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
+        await asyncio.to_thread(self.put, key, val, collection)
+
+    async def aput_all(
+        self,
+        kv_pairs: List[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        await asyncio.to_thread(self.put_all, kv_pairs, collection, batch_size)
+
+    async def aget(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
+        return await asyncio.to_thread(self.get, key, collection)
+
+    async def aget_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        return await asyncio.to_thread(self.get_all, collection)
+
+    async def adelete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        return await asyncio.to_thread(self.delete, key, collection)
+
+
+def migrate_json_cache(cache_dir: Path, kv_store: BaseKVStore) -> int:
+    """
+    One-shot migration of legacy JSON cache files into another KV store.
+
+    Both kv_store.json (IngestionCache) and docstore.json (SimpleDocumentStore) are
+    SimpleKVStore dumps ({collection: {key: value}}), so every collection is copied verbatim.
+    Migrated files are renamed with a '.migrated' suffix so the migration never runs twice.
+
+    Args:
+        cache_dir: Per-connector cache directory
+        kv_store: Destination store
+
+    Returns:
+        Number of keys migrated
+    """
+    migrated = 0
+    for file_name in (KV_JSON_FILE, DOCSTORE_JSON_FILE):
+        json_path = cache_dir / file_name
+        if not json_path.exists():
+            continue
+
+        try:
+            legacy = SimpleKVStore.from_persist_path(str(json_path)).to_dict()
+            for collection, entries in legacy.items():
+                kv_store.put_all(list(entries.items()), collection=collection)
+                migrated += len(entries)
+            os.replace(json_path, json_path.with_name(file_name + MIGRATED_SUFFIX))
+            logger.info(f"💾 Migrated {json_path} into {type(kv_store).__name__}")
+        except Exception as e:
+            # Keep the JSON file: a cold cache only costs re-embedding, never correctness
+            logger.warning(f"⚠️ Failed to migrate legacy cache {json_path}: {e}")
+
+    return migrated
+
+
+def build_ingestion_cache(
+    cache_dir: Path, backend: CacheBackend = "sqlite"
+) -> Tuple[IngestionCache, BaseDocumentStore]:
+    """
+    Build the IngestionCache and docstore for a connector cache directory.
+
+    Args:
+        cache_dir: Per-connector cache directory (created if missing)
+        backend: "sqlite" (indexed, incremental) or "json" (legacy SimpleKVStore files)
+
+    Returns:
+        Tuple of (IngestionCache, docstore)
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    if backend == "sqlite":
+        kv_store = SqliteKVStore(str(cache_dir / SQLITE_FILE))
+        migrate_json_cache(cache_dir, kv_store)
+        docstore = KVDocumentStore(kv_store)
+        logger.info(f"💾 SQLite ingestion cache at {kv_store.db_path}")
+    else:
+        kv_path = cache_dir / KV_JSON_FILE
+        kv_store = SimpleKVStore.from_persist_path(str(kv_path)) if kv_path.exists() else SimpleKVStore()
+
+        doc_path = cache_dir / DOCSTORE_JSON_FILE
+        if doc_path.exists():
+            docstore = SimpleDocumentStore.from_persist_path(str(doc_path))
+            logger.info(f"💾 Loaded docstore from {doc_path} with {len(docstore.docs)} docs")
+        else:
+            docstore = SimpleDocumentStore()
+            logger.info("🆕 Created new empty docstore")
+
+    cache = IngestionCache(cache=kv_store, collection=PIPELINE_CACHE_COLLECTION)
+    return cache, docstore
+
+
+def persist_ingestion_cache(
+    cache_dir: Path, cache: Optional[IngestionCache], docstore: Optional[BaseDocumentStore]
+) -> None:
+    """
+    Flush the cache and docstore to disk.
+
+    Only the legacy JSON backend needs this (full rewrite); the SQLite backend
+    commits every write as it happens, so this is a no-op for it.
+    """
+    if cache is not None and isinstance(cache.cache, SimpleKVStore):
+        cache.cache.persist(str(cache_dir / KV_JSON_FILE))
+
+    if docstore is not None and isinstance(docstore, SimpleDocumentStore):
+        docstore.persist(str(cache_dir / DOCSTORE_JSON_FILE))
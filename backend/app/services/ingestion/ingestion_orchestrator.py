@@ -1,5 +1,6 @@
 import asyncio
 import hashlib
+import itertools
 import json
 import logging
 import multiprocessing
@@ -24,6 +25,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.websocket import manager, Websocket
 from app.core.exceptions import TechnicalError
 from app.core.settings import settings
+from app.core.sparse_encoder import SPARSE_VECTOR_NAME, encode_document, to_sparse_vector
+from app.core.vector_profiles import collection_create_params
 from app.factories.ingestion_factory import IngestionFactory
 from app.models.connector import Connector
 from app.models.connector_document import ConnectorDocument
@@ -31,13 +34,20 @@ from app.models.enums import ConnectorStatus, DocStatus
 from app.repositories.connector_repository import ConnectorRepository
 from app.repositories.document_repository import DocumentRepository
 from app.repositories.vector_repository import VectorRepository
+from app.services.cache_service import invalidate_cached_answers
+from app.services.ingestion.extraction_executor import get_extraction_executor
+from app.services.ingestion.ingestion_cache import build_ingestion_cache, persist_ingestion_cache
 from app.services.ingestion.processors.csv_processor import CsvStreamProcessor
+from app.services.ingestion.status_buffer import DocumentStatusBuffer, ProgressCoalescer
 from app.services.settings_service import SettingsService
 from app.services.vector_service import VectorService
 
 logger = logging.getLogger(__name__)
 logger.debug("ingestion_orchestrator.py loaded")
 
+# Payload field holding the content hash of a CSV row (incremental re-ingestion)
+ROW_HASH_FIELD = "_row_hash"
+
 
 class IngestionStoppedError(Exception):
     pass
@@ -62,6 +72,38 @@ class ConnectorStatusCache:
         return self._status
 
 
+class AdaptiveBatchSizer:
+    """
+    AIMD batch sizing for embedding providers.
+    Halves the batch size on rate-limit errors and grows it back additively on success,
+    so CSV ingestion converges on the largest batch the provider accepts.
+    """
+
+    RATE_LIMIT_MARKERS = ("429", "rate limit", "rate_limit", "ratelimit", "resource_exhausted", "quota", "too many")
+
+    def __init__(self, initial: int = 50, minimum: int = 5, maximum: int = 200, max_retries: int = 6):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.size = min(max(initial, self.minimum), self.maximum)
+        self.max_retries = max_retries
+        self._step = max(1, self.size // 10)
+
+    def on_success(self) -> None:
+        self.size = min(self.maximum, self.size + self._step)
+
+    def on_rate_limit(self, attempt: int) -> float:
+        """Shrink the batch size and return the backoff delay (seconds) for this attempt."""
+        self.size = max(self.minimum, self.size // 2)
+        return min(30.0, 0.5 * (2 ** (attempt - 1)))
+
+    @classmethod
+    def is_rate_limit_error(cls, error: Exception) -> bool:
+        if getattr(error, "status_code", None) == 429 or getattr(error, "code", None) == 429:
+            return True
+        message = f"{type(error).__name__} {error}".lower()
+        return any(marker in message for marker in cls.RATE_LIMIT_MARKERS)
+
+
 from app.services.sql_discovery_service import SQLDiscoveryService
 
 
@@ -90,11 +132,16 @@ class IngestionOrchestrator:
         self.sql_discovery_service = sql_discovery_service
 
         self._processor_factory = CsvStreamProcessor
+        self.extraction_executor = get_extraction_executor()
 
         # Repositories associated with this session
         self.connector_repo = ConnectorRepository(db)
         self.doc_repo = DocumentRepository(db)
 
+        # AsyncSession forbids concurrent operations: serializes DB writes issued by
+        # the streaming producer and consumer stages of ingest_files.
+        self._db_lock = asyncio.Lock()
+
     # --- PUBLIC DISPATCHER METHODS ---
 
     async def ingest_document(self, doc_id: UUID) -> None:
@@ -154,11 +201,9 @@ class IngestionOrchestrator:
         # Routing by connector type: SQL (including Vanna SQL)
         if connector.connector_type in ["sql", "vanna_sql"]:
             logger.info(f"🗄️ SQL Batch Ingestion | Count: {len(docs)}")
-            for d in docs:
-                try:
-                    await self.ingest_sql_view(d.id, connector)
-                except Exception as e:
-                    logger.error(f"SQL View Ingestion Error {d.id}: {e}")
+            errors = await self.ingest_sql_views(connector, docs)
+            for doc_id, e in errors.items():
+                logger.error(f"SQL View Ingestion Error {doc_id}: {e}")
             return
 
         csv_docs = [d for d in docs if d.file_path.strip().lower().endswith(".csv")]
@@ -220,8 +265,6 @@ class IngestionOrchestrator:
             provider = connector.configuration.get("ai_provider")
             collection = await self.vector_service.get_collection_name(provider)
 
-            vector_store = QdrantVectorStore(client=client, aclient=aclient, collection_name=collection)
-
             workers = 5
             is_local = provider in ["local", "ollama"]
             if is_local:
@@ -242,14 +285,22 @@ class IngestionOrchestrator:
             )
 
             # Ensure Collection Exists
-            if not client.collection_exists(collection):
+            if not await self.vector_service.collection_exists(collection):
                 client.create_collection(
                     collection_name=collection,
-                    vectors_config=qmodels.VectorParams(
-                        size=len(embed_model.get_text_embedding("test")), distance=qmodels.Distance.COSINE
-                    ),
+                    **collection_create_params(collection, len(embed_model.get_text_embedding("test"))),
                 )
 
+            await self.vector_service.ensure_payload_indexes(collection)
+
+            # Dense + BM25 sparse vectors when the collection declares them (hybrid retrieval)
+            vector_store = QdrantVectorStore(
+                client=client,
+                aclient=aclient,
+                collection_name=collection,
+                **await self.vector_service.sparse_store_kwargs(collection),
+            )
+
             text_splitter = SentenceSplitter(chunk_size=connector.chunk_size, chunk_overlap=connector.chunk_overlap)
 
             # Build transformations pipeline
@@ -329,32 +380,13 @@ class IngestionOrchestrator:
             # ============================================================================
             # CACHE CONFIGURATION (P0: Cost/Performance Optimization)
             # ============================================================================
-            from llama_index.core.ingestion import IngestionCache
-            from llama_index.core.storage.docstore import SimpleDocumentStore
-            from llama_index.core.storage.kvstore import SimpleKVStore
-
             # Create cache directory per connector (isolated caches)
+            # Backend is pluggable: SQLite (indexed, incremental) or legacy JSON files.
+            # Existing JSON caches are migrated into SQLite on first load.
             cache_dir = Path(".cache") / "ingestion" / str(connector.id)
-            cache_dir.mkdir(parents=True, exist_ok=True)
-
-            # Initialize cache components
-            # SimpleKVStore uses a single file
-            kv_path = cache_dir / "kv_store.json"
-            if kv_path.exists():
-                kv_store = SimpleKVStore.from_persist_path(str(kv_path))
-            else:
-                kv_store = SimpleKVStore()
-
-            # SimpleDocumentStore usually persists to a file as well in simple mode
-            doc_path = cache_dir / "docstore.json"
-            if doc_path.exists():
-                docstore = SimpleDocumentStore.from_persist_path(str(doc_path))
-                logger.info(f"💾 Loaded docstore from {doc_path} with {len(docstore.docs)} docs")
-            else:
-                docstore = SimpleDocumentStore()
-                logger.info("🆕 Created new empty docstore")
-
-            cache = IngestionCache(cache=kv_store, docstore=docstore, collection="pipeline_cache")
+            cache, docstore = await asyncio.to_thread(
+                build_ingestion_cache, cache_dir, settings.INGESTION_CACHE_BACKEND
+            )
 
             logger.info(f"💾 Cache enabled at: {cache_dir}")
 
@@ -398,111 +430,279 @@ class IngestionOrchestrator:
     ):
         """
         Orchestrate the ingestion of a list of generic files (PDF, DOCX, etc).
-        Optimized to batch everything into a single pipeline execution for performance.
+
+        Streaming mode (default): file extraction (producer) and splitting/embedding/upsert (consumer)
+        run concurrently over a bounded queue. At most INGESTION_STREAM_HIGH_WATER_MARK extracted files
+        wait for the embedder, and the pipeline is flushed every INGESTION_STREAM_FLUSH_SEGMENTS segments,
+        so peak memory stays flat regardless of connector size and first vectors land early.
+        Files are extracted concurrently through the ExtractionExecutor (process pool for CPU-bound parsers).
+        Document status changes are written behind in bulk (DocumentStatusBuffer) and WebSocket progress
+        frames are coalesced (ProgressCoalescer); both are flushed before returning.
+
+        With streaming disabled, everything is batched into a single pipeline execution (legacy behavior).
         """
-        start_time_total = time.time()
-        status_cache = ConnectorStatusCache(self.connector_repo, connector_id)
+        status_buffer = DocumentStatusBuffer(
+            self.doc_repo,
+            self._db_lock,
+            interval_ms=settings.INGESTION_STATUS_FLUSH_INTERVAL_MS,
+            max_rows=settings.INGESTION_STATUS_FLUSH_MAX_ROWS,
+            on_status_flush=self._status_mirror(ai_provider),
+        )
+        progress = ProgressCoalescer(manager, interval_ms=settings.INGESTION_PROGRESS_INTERVAL_MS)
+
+        async with status_buffer, progress:
+            start_time_total = time.time()
+            status_cache = ConnectorStatusCache(self.connector_repo, connector_id)
+
+            streaming = settings.INGESTION_STREAMING_ENABLED
+            high_water_mark = max(1, settings.INGESTION_STREAM_HIGH_WATER_MARK) if streaming else 0  # 0 = unbounded
+            flush_segments = max(1, settings.INGESTION_STREAM_FLUSH_SEGMENTS) if streaming else None
+
+            # Files extracted in parallel (one per extraction worker; sequential when parsing in-process)
+            extraction_concurrency = max(1, self.extraction_executor.max_workers)
+
+            # Items: (ConnectorDocument, List[LlamaDocument]) | None (end-of-stream sentinel)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=high_water_mark)
+
+            # 1. PRODUCER (Reading files)
+            logger.info(
+                f"🔄 Preparing {len(file_paths)} file(s) for ingestion "
+                f"(streaming={streaming}, high_water_mark={high_water_mark}, extraction_concurrency={extraction_concurrency})..."
+            )
 
-        all_llama_documents = []
-        valid_docs = []  # ConnectorDocument objects we actually found/processed parts of
+            async def _produce():
+                # Files are extracted concurrently (CPU-bound parsers in the process pool);
+                # results are queued in completion order. Task -> doc, for cleanup on failure.
+                in_flight: Dict[asyncio.Task, Optional[ConnectorDocument]] = {}
+                processed_count = initial_processed_count
+
+                async def _collect_first_completed() -> None:
+                    nonlocal processed_count
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        in_flight.pop(task)
+                        prepared = task.result()
+                        if prepared:
+                            # Backpressure: blocks while the consumer is HIGH_WATER_MARK files behind
+                            await queue.put(prepared)
+
+                        # Progress update for reading phase
+                        processed_count += 1
+                        percent = (processed_count / overall_total_files) * 100 if overall_total_files > 0 else 0
+                        await progress.emit_connector_progress(
+                            connector_id, processed_count, overall_total_files, percent
+                        )
 
-        # 1. PREPARATION PHASE (Reading files)
-        logger.info(f"🔄 Preparing {len(file_paths)} file(s) for batch ingestion...")
+                try:
+                    for file_item in file_paths:
+                        path, rel_path = (
+                            file_item if isinstance(file_item, tuple) else (file_item, os.path.basename(file_item))
+                        )
+                        doc = docs_map.get(rel_path)
 
-        for i, file_item in enumerate(file_paths):
-            path, rel_path = file_item if isinstance(file_item, tuple) else (file_item, os.path.basename(file_item))
-            doc = docs_map.get(rel_path)
+                        if not ignore_connector_status:
+                            async with self._db_lock:
+                                current_status = await status_cache.get_status()
+                            if current_status == ConnectorStatus.PAUSED or current_status == ConnectorStatus.IDLE:
+                                raise IngestionStoppedError("Stopped by user or system")
 
-            if not ignore_connector_status:
-                current_status = await status_cache.get_status()
-                if current_status == ConnectorStatus.PAUSED or current_status == ConnectorStatus.IDLE:
-                    raise IngestionStoppedError("Stopped by user or system")
+                        if len(in_flight) >= extraction_concurrency:
+                            await _collect_first_completed()
 
-            if doc:
-                await self.doc_repo.update(doc.id, {"status": DocStatus.PROCESSING})
-                await manager.emit_document_update(str(doc.id), DocStatus.PROCESSING, "Reading...")
+                        task = asyncio.create_task(
+                            self._prepare_file(
+                                path, rel_path, doc, connector_id, connector_acl, ai_provider, status_buffer, progress
+                            )
+                        )
+                        in_flight[task] = doc
+
+                    while in_flight:
+                        await _collect_first_completed()
+                except IngestionStoppedError:
+                    # Pause/stop: files already being extracted are finished and indexed, nothing new starts
+                    while in_flight:
+                        await _collect_first_completed()
+                    await queue.put(None)
+                    raise
+                except BaseException as e:
+                    for task in in_flight:
+                        task.cancel()
+                    await asyncio.gather(*in_flight, return_exceptions=True)
+                    # Interrupted extractions would otherwise stay PROCESSING forever
+                    for doc in filter(None, in_flight.values()):
+                        await status_buffer.update(
+                            doc.id, {"status": DocStatus.FAILED, "error_message": "Ingestion interrupted"}
+                        )
+                    # Wake the consumer unless it is the one tearing us down
+                    if not isinstance(e, asyncio.CancelledError):
+                        await queue.put(None)
+                    raise
+                await queue.put(None)
+
+            producer = asyncio.create_task(_produce())
+
+            # 2. CONSUMER (Pipeline)
+            pending: List[tuple] = []
+            pending_segments = 0
+            prepared_files = 0
+            total_nodes = 0
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is not None:
+                        pending.append(item)
+                        pending_segments += len(item[1])
+                        prepared_files += 1
+
+                    end_of_stream = item is None
+                    if pending and (end_of_stream or (flush_segments and pending_segments >= flush_segments)):
+                        batch, pending, pending_segments = pending, [], 0
+                        total_nodes += await self._index_prepared_batch(
+                            batch, pipeline, num_workers, ai_provider, start_time_total, status_buffer, progress
+                        )
+
+                    if end_of_stream:
+                        break
+            except BaseException:
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+                # Docs already extracted but never indexed would otherwise stay PROCESSING forever
+                while not queue.empty():
+                    item = queue.get_nowait()
+                    if item is not None:
+                        pending.append(item)
+                for doc, _ in pending:
+                    await status_buffer.update(
+                        doc.id, {"status": DocStatus.FAILED, "error_message": "Pipeline execution failed"}
+                    )
+                    await progress.emit_document_update(str(doc.id), DocStatus.FAILED, "Pipeline Error")
+                raise
 
+            # Surface producer errors (e.g. IngestionStoppedError)
+            await producer
+
+            if prepared_files == 0:
+                logger.info("ℹ️ No documents prepared for indexing.")
+                return
+
+            logger.info(
+                f"✅ Ingestion pipeline complete: {total_nodes} total chunks indexed from {prepared_files} file(s)"
+            )
+
+            # 4. PERSIST CACHE
             try:
-                # Load document using factory
-                file_extension = Path(path).suffix
-                processor = IngestionFactory.get_processor(file_extension)
-                processed_docs = await processor.process(str(path), ai_provider=ai_provider)
+                cache_dir = Path(".cache") / "ingestion" / str(connector_id)
+                if hasattr(pipeline, "cache") and pipeline.cache:
+                    persist_ingestion_cache(cache_dir, pipeline.cache, docstore or getattr(pipeline, "docstore", None))
+                    logger.info(f"💾 Ingestion cache persisted to {cache_dir}")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to persist ingestion cache: {e}")
 
-                from llama_index.core import Document as LlamaDocument
+    async def _prepare_file(
+        self,
+        path: str,
+        rel_path: str,
+        doc: Optional[ConnectorDocument],
+        connector_id: UUID,
+        connector_acl: List[str],
+        ai_provider: Optional[str],
+        status_buffer: DocumentStatusBuffer,
+        progress: ProgressCoalescer,
+    ) -> Optional[tuple]:
+        """
+        Extract a single file into LlamaIndex documents (producer stage of ingest_files).
+        Returns (doc, llama_documents) or None if nothing is indexable. Failures are recorded on the doc.
+        """
+        if doc:
+            await status_buffer.update(doc.id, {"status": DocStatus.PROCESSING})
+            await progress.emit_document_update(str(doc.id), DocStatus.PROCESSING, "Reading...")
 
-                file_llama_docs = []
-                for idx, pd_doc in enumerate(processed_docs):
-                    if not pd_doc.success:
-                        logger.warning(f"Skipping failed part in {rel_path}: {pd_doc.error_message}")
-                        continue
+        try:
+            # Load document using factory
+            file_extension = Path(path).suffix
+            processor = IngestionFactory.get_processor(file_extension)
+            processed_docs = await self.extraction_executor.extract(processor, str(path), ai_provider=ai_provider)
 
-                    if not doc:
-                        continue
+            from llama_index.core import Document as LlamaDocument
 
-                    # Build metadata
-                    meta = pd_doc.metadata or {}
-                    meta["connector_id"] = str(connector_id)
-                    meta["connector_document_id"] = str(doc.id)
-                    meta["file_name"] = doc.file_name
-                    meta["connector_acl"] = connector_acl
-
-                    # Create DETERMINISTIC ID for cache to work across re-runs
-                    page_num = meta.get("page_number", idx)
-                    chunk_idx = meta.get("chunk_index", 0)  # Support for non-paged content (Audio/Video)
-                    stable_key = f"{path}:page:{page_num}:chunk:{chunk_idx}"
-                    unique_id = hashlib.md5(stable_key.encode()).hexdigest()
-
-                    llama_doc = LlamaDocument(
-                        text=pd_doc.content,
-                        id_=unique_id,
-                        metadata=meta,
-                        excluded_llm_metadata_keys=["connector_id", "connector_document_id"],
-                        metadata_separator="\n",
-                    )
-                    file_llama_docs.append(llama_doc)
+            file_llama_docs = []
+            for idx, pd_doc in enumerate(processed_docs):
+                if not pd_doc.success:
+                    logger.warning(f"Skipping failed part in {rel_path}: {pd_doc.error_message}")
+                    continue
 
-                if file_llama_docs:
-                    all_llama_documents.extend(file_llama_docs)
-                    if doc:
-                        valid_docs.append(doc)
-                else:
-                    logger.warning(f"No content extracted from {rel_path}")
-                    if doc:
-                        await self.doc_repo.update(
-                            doc.id, {"status": DocStatus.FAILED, "error_message": "No content extracted"}
-                        )
-                        await manager.emit_document_update(str(doc.id), DocStatus.FAILED, "No content extracted")
+                if not doc:
+                    continue
 
-            except Exception as e:
-                logger.error(f"File Preparation Fail for {rel_path}: {e}", exc_info=True)
-                if doc:
-                    await self.doc_repo.update(doc.id, {"status": DocStatus.FAILED, "error_message": str(e)})
-                    await manager.emit_document_update(str(doc.id), DocStatus.FAILED, "Preparation Error")
+                # Build metadata
+                meta = pd_doc.metadata or {}
+                meta["connector_id"] = str(connector_id)
+                meta["connector_document_id"] = str(doc.id)
+                meta["file_name"] = doc.file_name
+                meta["connector_acl"] = connector_acl
+
+                # Create DETERMINISTIC ID for cache to work across re-runs
+                page_num = meta.get("page_number", idx)
+                chunk_idx = meta.get("chunk_index", 0)  # Support for non-paged content (Audio/Video)
+                stable_key = f"{path}:page:{page_num}:chunk:{chunk_idx}"
+                unique_id = hashlib.md5(stable_key.encode()).hexdigest()
+
+                llama_doc = LlamaDocument(
+                    text=pd_doc.content,
+                    id_=unique_id,
+                    metadata=meta,
+                    excluded_llm_metadata_keys=["connector_id", "connector_document_id"],
+                    metadata_separator="\n",
+                )
+                file_llama_docs.append(llama_doc)
 
-            # Progress update for reading phase
-            processed_count = initial_processed_count + i + 1
-            percent = (processed_count / overall_total_files) * 100 if overall_total_files > 0 else 0
-            await manager.emit_connector_progress(connector_id, processed_count, overall_total_files, percent)
+            if file_llama_docs:
+                return doc, file_llama_docs
 
-        if not all_llama_documents:
-            logger.info("ℹ️ No documents prepared for indexing.")
-            return
+            logger.warning(f"No content extracted from {rel_path}")
+            if doc:
+                await status_buffer.update(
+                    doc.id, {"status": DocStatus.FAILED, "error_message": "No content extracted"}
+                )
+                await progress.emit_document_update(str(doc.id), DocStatus.FAILED, "No content extracted")
 
-        # 2. EXECUTION PHASE (Pipeline)
-        try:
-            # Use the workers value passed from setup_pipeline (P0 Dynamic scaling fix)
-            workers = num_workers
+        except Exception as e:
+            logger.error(f"File Preparation Fail for {rel_path}: {e}", exc_info=True)
+            if doc:
+                await status_buffer.update(doc.id, {"status": DocStatus.FAILED, "error_message": str(e)})
+                await progress.emit_document_update(str(doc.id), DocStatus.FAILED, "Preparation Error")
+
+        return None
 
+    async def _index_prepared_batch(
+        self,
+        batch: List[tuple],
+        pipeline: IngestionPipeline,
+        num_workers: int,
+        ai_provider: Optional[str],
+        start_time_total: float,
+        status_buffer: DocumentStatusBuffer,
+        progress: ProgressCoalescer,
+    ) -> int:
+        """
+        Split, embed and upsert a batch of prepared files (consumer stage of ingest_files),
+        then finalize the status of every document in the batch. Returns the number of nodes indexed.
+        """
+        valid_docs = [doc for doc, _ in batch]
+        llama_documents = [llama_doc for _, docs in batch for llama_doc in docs]
+
+        try:
             logger.info(
-                f"🚀 Running batch ingestion pipeline for {len(all_llama_documents)} segments from {len(valid_docs)} file(s)..."
+                f"🚀 Running ingestion pipeline for {len(llama_documents)} segments from {len(valid_docs)} file(s)..."
             )
 
             # Update all valid docs to 'Indexing'
             for doc in valid_docs:
-                await manager.emit_document_update(str(doc.id), DocStatus.PROCESSING, "Embedding and indexing...")
+                await progress.emit_document_update(str(doc.id), DocStatus.PROCESSING, "Embedding and indexing...")
 
-            logger.info(f"⏳ Executing pipeline with {workers} workers...")
-            nodes = await pipeline.arun(documents=all_llama_documents, num_workers=workers, show_progress=False)
+            # Use the workers value passed from setup_pipeline (P0 Dynamic scaling fix)
+            logger.info(f"⏳ Executing pipeline with {num_workers} workers...")
+            nodes = await pipeline.arun(documents=llama_documents, num_workers=num_workers, show_progress=False)
 
             # 3. FINALIZATION PHASE (Cleanup & Updates)
             nodes_by_doc: Dict[str, List] = {}
@@ -517,10 +717,9 @@ class IngestionOrchestrator:
             # P0 FIX: Helper for Self-Healing Stats
             async def _recover_vector_count(d_id):
                 try:
-                    provider = connector.configuration.get("ai_provider")
-                    col = await self.vector_service.get_collection_name(provider)
+                    col = await self.vector_service.get_collection_name(ai_provider)
                     return await self.vector_repo.count_by_document_id(col, d_id)
-                except:
+                except Exception:
                     return 0
 
             now = datetime.now()
@@ -531,11 +730,11 @@ class IngestionOrchestrator:
 
                 if total_chunks == 0:
                     elapsed_ms = (time.time() - start_time_total) * 1000
-                    await self.doc_repo.update(
+                    await status_buffer.update(
                         doc.id,
                         {"status": DocStatus.INDEXED, "last_vectorized_at": now, "processing_duration_ms": elapsed_ms},
                     )
-                    await manager.emit_document_update(
+                    await progress.emit_document_update(
                         str(doc.id),
                         DocStatus.INDEXED,
                         "Already indexed (cache hit)",
@@ -546,7 +745,7 @@ class IngestionOrchestrator:
                     # P0 FIX: Update DB with actual count (Self-Healing)
                     actual_count = await _recover_vector_count(doc.id)
                     if actual_count > 0:
-                        await self.doc_repo.update(
+                        await status_buffer.update(
                             doc.id, {"vector_point_count": actual_count, "chunks_total": actual_count}
                         )
                         logger.info(f"💾 CACHE HIT | Updated Doc {doc.id} with {actual_count} vectors")
@@ -554,7 +753,7 @@ class IngestionOrchestrator:
                     token_count = sum(len(n.get_content()) for n in doc_nodes)
                     elapsed_ms = (time.time() - start_time_total) * 1000
 
-                    await self.doc_repo.update(
+                    await status_buffer.update(
                         doc.id,
                         {
                             "chunks_total": total_chunks,
@@ -567,7 +766,7 @@ class IngestionOrchestrator:
                         },
                     )
 
-                    await manager.emit_document_update(
+                    await progress.emit_document_update(
                         str(doc.id),
                         DocStatus.INDEXED,
                         f"Indexed {total_chunks} chunks",
@@ -577,33 +776,54 @@ class IngestionOrchestrator:
                         processing_duration_ms=elapsed_ms,
                     )
 
-            logger.info(f"✅ Batch pipeline complete: {len(nodes) if nodes else 0} total chunks indexed")
+            # Re-embedded documents changed: drop the cached answers built from their previous content
+            await invalidate_cached_answers(self.vector_service, nodes_by_doc)
+
+            return len(nodes) if nodes else 0
 
         except Exception as e:
             logger.error(f"❌ Batch pipeline execution failed: {e}", exc_info=True)
             for doc in valid_docs:
-                await self.doc_repo.update(
+                await status_buffer.update(
                     doc.id, {"status": DocStatus.FAILED, "error_message": "Pipeline execution failed"}
                 )
-                await manager.emit_document_update(str(doc.id), DocStatus.FAILED, "Pipeline Error")
+                await progress.emit_document_update(str(doc.id), DocStatus.FAILED, "Pipeline Error")
             raise
 
-        # 4. PERSIST CACHE
+    def _status_mirror(self, ai_provider: Optional[str]):
+        """
+        Callback mirroring status transitions ({status: [doc ids]}) into the vectors payload (doc_status),
+        so searches filter non-indexed documents server-side.
+
+        Raises the first failure once every status was attempted: DocumentStatusBuffer keeps the
+        transitions pending and retries them on its next flush (set_payload is idempotent).
+        """
+
+        async def _mirror(by_status: Dict[str, List[UUID]]) -> None:
+            error: Optional[Exception] = None
+            for status, doc_ids in by_status.items():
+                try:
+                    await self.vector_service.set_document_status(doc_ids, status, provider=ai_provider)
+                except Exception as e:
+                    logger.warning(f"Failed to mirror status '{status}' of {len(doc_ids)} document(s) to Qdrant: {e}")
+                    error = error or e
+            if error is not None:
+                raise error
+
+        return _mirror
+
+    async def _mirror_status_once(self, ai_provider: Optional[str], status: DocStatus, doc_id: UUID) -> None:
+        """
+        Unbuffered status mirror (single-document CSV path).
+        A failure is only logged: the status index rebuild reconciles doc_status with the database.
+        """
         try:
-            cache_dir = Path(".cache") / "ingestion" / str(connector_id)
-            if hasattr(pipeline, "cache") and pipeline.cache:
-                kv_path = cache_dir / "kv_store.json"
-                if hasattr(pipeline.cache, "cache") and hasattr(pipeline.cache.cache, "persist"):
-                    pipeline.cache.cache.persist(str(kv_path))
-
-                doc_path = cache_dir / "docstore.json"
-                docstore_ref = docstore or getattr(pipeline.cache, "docstore", None)
-                if docstore_ref and hasattr(docstore_ref, "persist"):
-                    docstore_ref.persist(str(doc_path))
-
-                logger.info(f"💾 Ingestion cache persisted to {cache_dir}")
+            await self._status_mirror(ai_provider)({status: [doc_id]})
         except Exception as e:
-            logger.warning(f"⚠️ Failed to persist ingestion cache: {e}")
+            logger.warning(
+                f"STATUS MIRROR FAIL | Doc: {doc_id} | Status: {status} | Left to the status index reconcile: {e}",
+                exc_info=True,
+            )
 
     # --- CSV SPECIALIZED INGESTION ---
 
@@ -616,6 +836,7 @@ class IngestionOrchestrator:
         logger.info(f"Orchestrating SMART CSV ingestion for Doc {doc_id}")
 
         doc = None
+        connector = None
         try:
             doc = await self.doc_repo.get_by_id(doc_id)
             if not doc:
@@ -627,6 +848,7 @@ class IngestionOrchestrator:
 
             # 2. Setup
             await self.doc_repo.update(doc.id, {"status": DocStatus.PROCESSING})
+            await self._mirror_status_once(connector.configuration.get("ai_provider"), DocStatus.PROCESSING, doc.id)
 
             # Resolve Dependencies - Path Reconstruction
             from app.core.interfaces.base_connector import get_full_path_from_connector
@@ -663,89 +885,162 @@ class IngestionOrchestrator:
 
             # P0 FIX: Ensure Collection Exists (was missing in CSV flow)
             client = await self.vector_service.get_qdrant_client()
-            if not client.collection_exists(collection_name):
+            if not await self.vector_service.collection_exists(collection_name):
                 logger.info(f"Creating collection {collection_name}")
-                from qdrant_client.http import models as qmodels
-
                 client.create_collection(
                     collection_name=collection_name,
-                    vectors_config=qmodels.VectorParams(
-                        size=len(embed_model.get_text_embedding("test")), distance=qmodels.Distance.COSINE
-                    ),
+                    **collection_create_params(collection_name, len(embed_model.get_text_embedding("test"))),
                 )
 
-            # 2.5 CLEANUP (Fix Re-vectorization append bug)
-            try:
-                await self.vector_repo.delete_by_document_id(collection_name, doc.id)
-            except Exception as e:
-                logger.warning(f"Pre-ingestion cleanup failed for CSV doc {doc.id}: {e}")
+            await self.vector_service.ensure_payload_indexes(collection_name)
 
-            # 3. Stream & Process
-            # 3. Stream & Process (Non-Blocking)
-            # P0: Offload CPU-bound CSV parsing to thread pool to prevent Event Loop blocking
-            processor = self._processor_factory()
+            sparse = await self.vector_service.has_sparse_vectors(collection_name)
 
-            def _process_stream():
-                """CPU-bound sync generator wrapper"""
-                iterator = enumerate(processor.iter_records(file_path=full_path, renaming_map=strategy.renaming_map))
-                return list(iterator)  # Consuming iterator in thread
+            # 2.5 CHANGE DETECTION / CLEANUP
+            # Incremental mode (strategy has a primary key): point IDs are derived from the row's
+            # primary key and each payload carries a content hash, so only new/changed rows are
+            # embedded and only vanished rows are deleted. Otherwise: full delete + re-ingest.
+            incremental = bool(strategy.primary_id_col)
+            existing_hashes: Dict[str, Optional[str]] = {}
+            if incremental:
+                try:
+                    existing_hashes = await self.vector_repo.get_payload_field_by_document_id(
+                        collection_name, doc.id, ROW_HASH_FIELD
+                    )
+                    logger.info(f"🔁 Incremental CSV sync | {len(existing_hashes)} existing rows for Doc {doc.id}")
+                except Exception as e:
+                    logger.warning(f"Change detection unavailable for CSV doc {doc.id}, full re-ingest: {e}")
+                    incremental = False
 
-            # Run parsing in thread
-            records_with_lines = await asyncio.to_thread(_process_stream)
-            logger.info(f"📊 CSV Parser found {len(records_with_lines)} records for Doc {doc.id}")
+            if not incremental:
+                # Fix Re-vectorization append bug
+                try:
+                    await self.vector_repo.delete_by_document_id(collection_name, doc.id)
+                except Exception as e:
+                    logger.warning(f"Pre-ingestion cleanup failed for CSV doc {doc.id}: {e}")
+
+            # 3. Stream & Process (Non-Blocking, Pipelined)
+            # P0: Rows are read and transformed lazily in a worker thread, one batch at a time.
+            # Up to INGESTION_CSV_CONCURRENCY batches are embedded/upserted concurrently, so the
+            # upsert of one batch overlaps the embedding of the next, and memory is bounded by
+            # (concurrency x batch size) rows regardless of file size.
+            processor = self._processor_factory()
+            records = enumerate(processor.iter_records(file_path=full_path, renaming_map=strategy.renaming_map))
+            sizer = AdaptiveBatchSizer(
+                initial=settings.INGESTION_CSV_BATCH_SIZE,
+                minimum=settings.INGESTION_CSV_MIN_BATCH_SIZE,
+                maximum=settings.INGESTION_CSV_MAX_BATCH_SIZE,
+            )
+            concurrency = max(1, settings.INGESTION_CSV_CONCURRENCY)
+            connector_acl = connector.configuration.get("connector_acl", [])
+
+            seen_point_ids: set = set()
+            unchanged = {"rows": 0, "tokens": 0}
+
+            def _read_batch(size: int):
+                """CPU-bound: pull and transform the next `size` rows (runs in thread)"""
+                texts, metadatas, point_ids = [], [], []
+                exhausted = True
+                for line_idx, record in itertools.islice(records, size):
+                    exhausted = False
+                    try:
+                        semantic_text, payload = transformer.transform(record, line_idx)
+                    except Exception as e:
+                        logger.warning(f"Skipping malformed row {line_idx}: {e}")
+                        continue
+
+                    if incremental:
+                        point_id = self._csv_row_point_id(doc.id, payload.get("primary_id"), line_idx, seen_point_ids)
+                        seen_point_ids.add(point_id)
+                        row_hash = self._csv_row_hash(semantic_text, payload, connector_acl)
+                        payload[ROW_HASH_FIELD] = row_hash
+                        if existing_hashes.get(point_id) == row_hash:
+                            unchanged["rows"] += 1
+                            unchanged["tokens"] += len(semantic_text)
+                            continue
+                        point_ids.append(point_id)
+
+                    texts.append(semantic_text)
+                    metadatas.append(payload)
+                return texts, metadatas, (point_ids or None), exhausted
+
+            async def _run_batch(texts: List[str], metadatas: List[dict], point_ids: Optional[List[str]]):
+                try:
+                    tokens = await self._process_smart_batch(
+                        texts,
+                        metadatas,
+                        doc,
+                        connector,
+                        embed_model,
+                        collection_name,
+                        connector_acl=connector_acl,
+                        sizer=sizer,
+                        point_ids=point_ids,
+                        sparse=sparse,
+                    )
+                    return len(texts), tokens
+                except Exception as e:
+                    # Same policy as serial mode: a failed batch is skipped, the file continues
+                    logger.warning(f"Skipping failed batch of {len(texts)} rows for Doc {doc.id}: {e}")
+                    return 0, 0
 
             total_processed = 0
             total_tokens = 0
+            in_flight: set = set()
+            csv_indexed = False
 
-            # Batch Buffers
-            batch_texts = []
-            batch_metadatas = []
-            BATCH_SIZE = 50
+            def _collect(done_tasks):
+                nonlocal total_processed, total_tokens
+                for task in done_tasks:
+                    rows, tokens = task.result()
+                    total_processed += rows
+                    total_tokens += tokens
 
-            # Transformer is lightweight enough to run in loop,
-            # or could be moved inside _process_stream if very heavy.
-            # Given it's just dict manipulation, main loop is OK providing we await I/O.
+            try:
+                while True:
+                    texts, metadatas, point_ids, exhausted = await asyncio.to_thread(_read_batch, sizer.size)
+                    if exhausted:
+                        break
+                    if not texts:
+                        continue
 
-            for line_idx, record in records_with_lines:
-                # --- TRANSFORM ROW ---
-                try:
-                    semantic_text, payload = transformer.transform(record, line_idx)
-
-                    batch_texts.append(semantic_text)
-                    batch_metadatas.append(payload)
-
-                    # --- PROCESS BATCH (Async I/O) ---
-                    if len(batch_texts) >= BATCH_SIZE:
-                        batch_tokens = await self._process_smart_batch(
-                            batch_texts,
-                            batch_metadatas,
-                            doc,
-                            connector,
-                            embed_model,
-                            collection_name,
-                            connector_acl=connector.configuration.get("connector_acl", []),
+                    if not csv_indexed:
+                        # Filter columns are indexed before the first upsert, typed from the transformed rows
+                        csv_indexed = True
+                        await self.vector_service.ensure_payload_indexes(
+                            collection_name, transformer.payload_index_schema(metadatas)
                         )
-                        total_processed += len(batch_texts)
-                        total_tokens += batch_tokens
-                        batch_texts = []
-                        batch_metadatas = []
-                except Exception as e:
-                    logger.warning(f"Skipping malformed row {line_idx}: {e}")
-                    continue
 
-            # Final Batch
-            if batch_texts:
-                batch_tokens = await self._process_smart_batch(
-                    batch_texts,
-                    batch_metadatas,
-                    doc,
-                    connector,
-                    embed_model,
-                    collection_name,
-                    connector_acl=connector.configuration.get("connector_acl", []),
+                    # Backpressure: never more than `concurrency` batches in flight
+                    while len(in_flight) >= concurrency:
+                        done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        _collect(done)
+
+                    in_flight.add(asyncio.create_task(_run_batch(texts, metadatas, point_ids)))
+
+                if in_flight:
+                    done, in_flight = await asyncio.wait(in_flight)
+                    _collect(done)
+            except BaseException:
+                for task in in_flight:
+                    task.cancel()
+                raise
+
+            content_changed = not incremental or total_processed > 0
+            if incremental:
+                # Rows that disappeared from the file (or legacy line-based points)
+                stale_ids = [pid for pid in existing_hashes if pid not in seen_point_ids]
+                if stale_ids:
+                    await self.vector_repo.delete_points(collection_name, stale_ids)
+                    content_changed = True
+                logger.info(
+                    f"🔁 Incremental CSV sync | upserted={total_processed} unchanged={unchanged['rows']} "
+                    f"deleted={len(stale_ids)} for Doc {doc.id}"
                 )
-                total_processed += len(batch_texts)
-                total_tokens += batch_tokens
+                total_processed += unchanged["rows"]
+                total_tokens += unchanged["tokens"]
+
+            logger.info(f"📊 CSV pipeline processed {total_processed} records for Doc {doc.id}")
 
             # 4. Success State
             elapsed_ms = (time.time() - start_time) * 1000
@@ -762,6 +1057,10 @@ class IngestionOrchestrator:
                     "processing_duration_ms": elapsed_ms,
                 },
             )
+            # Unchanged rows (incremental sync) kept their previous status payload
+            await self._mirror_status_once(provider, DocStatus.INDEXED, doc.id)
+            if content_changed:
+                await invalidate_cached_answers(self.vector_service, [doc.id])
             # Emit stats for frontend update
             await manager.emit_document_update(
                 str(doc.id),
@@ -781,6 +1080,10 @@ class IngestionOrchestrator:
             if doc:
                 try:
                     await self.doc_repo.update(doc.id, {"status": DocStatus.FAILED, "error_message": str(e)})
+                    if connector is not None:
+                        await self._mirror_status_once(
+                            connector.configuration.get("ai_provider"), DocStatus.FAILED, doc.id
+                        )
                     await manager.emit_document_update(str(doc.id), DocStatus.FAILED, f"Error: {str(e)}")
                 except Exception as ex:
                     logger.warning(f"Failed to record failure for {doc_id}: {ex}")
@@ -793,92 +1096,176 @@ class IngestionOrchestrator:
         Ingests a SQL View by extracting its schema description and vectorizing it.
         This allows the RAG system to find this table when answering questions.
         """
-        start_time = time.time()
         logger.info(f"Orchestrating SQL ingestion for Doc {doc_id}")
 
         doc = await self.doc_repo.get_by_id(doc_id)
         if not doc:
             raise ValueError(f"Document {doc_id} not found")
 
-        if not self.sql_discovery_service:
-            raise TechnicalError("SQL Discovery Service not injected into Orchestrator")
+        errors = await self.ingest_sql_views(connector, [doc])
+        if doc.id in errors:
+            raise errors[doc.id]
 
-        try:
-            # 1. Update status
-            await self.doc_repo.update(doc.id, {"status": DocStatus.PROCESSING})
-            await manager.emit_document_update(str(doc.id), DocStatus.PROCESSING, "Extracting Schema...")
+    async def ingest_sql_views(self, connector: Connector, docs: List[ConnectorDocument]) -> Dict[UUID, Exception]:
+        """
+        Ingests many SQL Views of a connector with a single pipeline.
 
-            # 2. Extract or Use Pre-stored Schema
-            view_name = doc.file_name
+        Schemas are introspected concurrently (INGESTION_SQL_VIEW_CONCURRENCY) through SQLDiscoveryService,
+        embedded in batches of INGESTION_SQL_VIEW_BATCH_SIZE views per pipeline run, and the ingestion cache
+        is persisted once at the end.
 
-            # OPTIMIZATION: For Vanna SQL, DDL is stored in metadata
-            file_metadata = doc.file_metadata or {}
-            stored_ddl = file_metadata.get("ddl")
+        Returns the errors of the views that failed (doc id -> exception); the other views are still indexed.
+        """
+        if not docs:
+            return {}
 
-            if stored_ddl:
-                logger.info(f"Using pre-stored DDL for {view_name} (Vanna SQL)")
-                markdown_content = stored_ddl
-            else:
-                # Standard SQL: Generate DDL dynamically
-                logger.info(f"Generating DDL dynamically for {view_name} (Standard SQL)")
-                markdown_content = await self.sql_discovery_service.get_view_schema_markdown(connector, view_name)
+        if not self.sql_discovery_service:
+            raise TechnicalError("SQL Discovery Service not injected into Orchestrator")
 
-            # 3. Create LlamaDocument
-            import hashlib
+        start_time = time.time()
+        errors: Dict[UUID, Exception] = {}
+
+        status_buffer = DocumentStatusBuffer(
+            self.doc_repo,
+            self._db_lock,
+            interval_ms=settings.INGESTION_STATUS_FLUSH_INTERVAL_MS,
+            max_rows=settings.INGESTION_STATUS_FLUSH_MAX_ROWS,
+            on_status_flush=self._status_mirror((connector.configuration or {}).get("ai_provider")),
+        )
+        progress = ProgressCoalescer(manager, interval_ms=settings.INGESTION_PROGRESS_INTERVAL_MS)
+
+        async def _fail(doc: ConnectorDocument, e: Exception) -> None:
+            errors[doc.id] = e
+            await status_buffer.update(doc.id, {"status": DocStatus.FAILED, "error_message": str(e)})
+            await progress.emit_document_update(str(doc.id), DocStatus.FAILED, "Schema Vectorization Error")
+
+        async with status_buffer, progress:
+            # 1. Update status
+            for doc in docs:
+                await status_buffer.update(doc.id, {"status": DocStatus.PROCESSING})
+                await progress.emit_document_update(str(doc.id), DocStatus.PROCESSING, "Extracting Schema...")
 
-            from llama_index.core import Document as LlamaDocument
+            try:
+                # 2. Extract or Use Pre-stored Schema
+                # OPTIMIZATION: For Vanna SQL, DDL is stored in metadata
+                to_introspect = [doc.file_name for doc in docs if not (doc.file_metadata or {}).get("ddl")]
+                schemas: Dict[str, str] = {}
+                if to_introspect:
+                    # Standard SQL: Generate DDL dynamically
+                    logger.info(f"Generating DDL dynamically for {len(to_introspect)} view(s) (Standard SQL)")
+                    schemas = await self.sql_discovery_service.get_views_schema_markdown(
+                        connector, to_introspect, concurrency=settings.INGESTION_SQL_VIEW_CONCURRENCY
+                    )
 
-            # Deterministic ID for cache
-            stable_key = f"sql_view:{connector.id}:{view_name}"
-            unique_id = hashlib.md5(stable_key.encode()).hexdigest()
-
-            llama_doc = LlamaDocument(
-                text=markdown_content,
-                id_=unique_id,
-                metadata={
-                    "connector_id": str(connector.id),
-                    "connector_document_id": str(doc.id),
-                    "file_name": view_name,
-                    "type": "sql_view_schema",
-                    "connector_acl": ["system:sql_schema"],  # Separate ACL for Router access only
-                },
-                excluded_llm_metadata_keys=["connector_id", "connector_document_id", "type", "connector_acl"],
-                metadata_separator="\n",
-            )
+                # 3. Create LlamaDocuments
+                llama_docs = [
+                    self._build_sql_view_document(
+                        connector, doc, (doc.file_metadata or {}).get("ddl") or schemas[doc.file_name]
+                    )
+                    for doc in docs
+                ]
 
-            # 4. Run Pipeline (Disable Smart Extraction for SQL DDL -> We want raw code, not summary)
-            pipeline, vector_store, _, workers, _, docstore = await self.setup_pipeline(
-                connector, disable_extraction=True
-            )
+                # 4. Setup Pipeline once (Disable Smart Extraction for SQL DDL -> We want raw code, not summary)
+                pipeline, _, _, _, _, docstore = await self.setup_pipeline(connector, disable_extraction=True)
+            except Exception as e:
+                logger.error(f"SQL Ingestion FAILED | {len(docs)} view(s) | {e}", exc_info=True)
+                for doc in docs:
+                    await _fail(doc, e)
+                return errors
+
+            # 5. Run Pipeline in batches
+            batch_size = max(1, settings.INGESTION_SQL_VIEW_BATCH_SIZE)
+            for offset in range(0, len(docs), batch_size):
+                batch_docs = docs[offset : offset + batch_size]
+                batch_llama_docs = llama_docs[offset : offset + batch_size]
+
+                logger.info(f"Computing embeddings for {len(batch_docs)} SQL Schema(s)")
+                try:
+                    nodes = await pipeline.arun(
+                        documents=batch_llama_docs,
+                        num_workers=0,  # Force sync for safety with specialized docs
+                        show_progress=False,
+                    )
+                    await self._finalize_sql_views(
+                        connector, batch_docs, nodes or [], start_time, status_buffer, progress
+                    )
+                except Exception as e:
+                    logger.error(f"SQL Ingestion FAILED | {len(batch_docs)} view(s) | {e}", exc_info=True)
+                    for doc in batch_docs:
+                        await _fail(doc, e)
 
-            logger.info(f"Computing embeddings for SQL Schema: {view_name}")
+            # 6. Persist Cache (once for all views)
+            try:
+                cache_dir = Path(".cache") / "ingestion" / str(connector.id)
+                if hasattr(pipeline, "cache") and pipeline.cache:
+                    persist_ingestion_cache(cache_dir, pipeline.cache, docstore)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to persist ingestion cache: {e}")
 
-            nodes = await pipeline.arun(
-                documents=[llama_doc], num_workers=0, show_progress=False  # Force sync for safety with specialized docs
-            )
+        logger.info(f"SQL Ingestion DONE | {len(docs) - len(errors)}/{len(docs)} view(s) indexed")
+        return errors
 
-            total_chunks = len(nodes)
-            token_count = sum(len(n.get_content()) for n in nodes)
+    @staticmethod
+    def _build_sql_view_document(connector: Connector, doc: ConnectorDocument, markdown_content: str):
+        """Schema document of a SQL View (deterministic ID for cache)."""
+        from llama_index.core import Document as LlamaDocument
+
+        view_name = doc.file_name
+        stable_key = f"sql_view:{connector.id}:{view_name}"
+        unique_id = hashlib.md5(stable_key.encode()).hexdigest()
+
+        return LlamaDocument(
+            text=markdown_content,
+            id_=unique_id,
+            metadata={
+                "connector_id": str(connector.id),
+                "connector_document_id": str(doc.id),
+                "file_name": view_name,
+                "type": "sql_view_schema",
+                "connector_acl": ["system:sql_schema"],  # Separate ACL for Router access only
+            },
+            excluded_llm_metadata_keys=["connector_id", "connector_document_id", "type", "connector_acl"],
+            metadata_separator="\n",
+        )
+
+    async def _finalize_sql_views(
+        self,
+        connector: Connector,
+        docs: List[ConnectorDocument],
+        nodes: List,
+        start_time: float,
+        status_buffer: DocumentStatusBuffer,
+        progress: ProgressCoalescer,
+    ) -> None:
+        """Record the stats of a batch of vectorized SQL Views."""
+        nodes_by_doc: Dict[str, List] = {}
+        for node in nodes:
+            nodes_by_doc.setdefault(node.metadata.get("connector_document_id"), []).append(node)
+
+        # P0 FIX: Self-Healing Stats for Cache Hits (Nodes empty if cached)
+        async def _recover_vector_count(doc: ConnectorDocument) -> int:
+            try:
+                provider = connector.configuration.get("ai_provider")
+                collection = await self.vector_service.get_collection_name(provider)
+                count = await self.vector_repo.count_by_document_id(collection, doc.id)
+                if count > 0:
+                    logger.info(f"💾 CACHE HIT | Recovered {count} vectors from Qdrant for SQL View {doc.id}")
+                return count
+            except Exception as e:
+                logger.warning(f"Failed to recover vector count for {doc.id}: {e}")
+                return 0
 
-            # P0 FIX: Self-Healing Stats for Cache Hits (Nodes empty if cached)
-            if total_chunks == 0:
-                try:
-                    provider = connector.configuration.get("ai_provider")
-                    collection = await self.vector_service.get_collection_name(provider)
-                    total_chunks = await self.vector_repo.count_by_document_id(collection, doc.id)
-                    if total_chunks > 0:
-                        logger.info(
-                            f"💾 CACHE HIT | Recovered {total_chunks} vectors from Qdrant for SQL View {doc.id}"
-                        )
-                        # Estimate tokens? Hard without content, keep 0 or fetch.
-                except Exception as e:
-                    logger.warning(f"Failed to recover vector count for {doc.id}: {e}")
+        cache_hits = [doc for doc in docs if not nodes_by_doc.get(str(doc.id))]
+        recovered = dict(zip((d.id for d in cache_hits), await asyncio.gather(*map(_recover_vector_count, cache_hits))))
 
-            # 5. Update Stats & Success
-            elapsed_ms = (time.time() - start_time) * 1000
-            now = datetime.now()
+        elapsed_ms = (time.time() - start_time) * 1000
+        now = datetime.now()
+        for doc in docs:
+            doc_nodes = nodes_by_doc.get(str(doc.id), [])
+            total_chunks = len(doc_nodes) or recovered.get(doc.id, 0)
+            token_count = sum(len(n.get_content()) for n in doc_nodes)
 
-            await self.doc_repo.update(
+            await status_buffer.update(
                 doc.id,
                 {
                     "chunks_total": total_chunks,
@@ -891,7 +1278,7 @@ class IngestionOrchestrator:
                 },
             )
 
-            await manager.emit_document_update(
+            await progress.emit_document_update(
                 str(doc.id),
                 DocStatus.INDEXED,
                 "Schema Vectorized",
@@ -901,25 +1288,9 @@ class IngestionOrchestrator:
                 processing_duration_ms=elapsed_ms,
             )
 
-            # Persist Cache
-            try:
-                cache_dir = Path(".cache") / "ingestion" / str(connector.id)
-                if hasattr(pipeline, "cache") and pipeline.cache:
-                    doc_path = cache_dir / "docstore.json"
-                    kv_path = cache_dir / "kv_store.json"
-                    if hasattr(pipeline.cache.cache, "persist"):
-                        pipeline.cache.cache.persist(str(kv_path))
-                    if docstore:
-                        docstore.persist(str(doc_path))
-            except:
-                pass
+            logger.info(f"SQL Ingestion SUCCESS | {doc.file_name}")
 
-            logger.info(f"SQL Ingestion SUCCESS | {view_name}")
-
-        except Exception as e:
-            logger.error(f"SQL Ingestion FAILED | {doc_id} | {e}", exc_info=True)
-            await self.doc_repo.update(doc.id, {"status": DocStatus.FAILED, "error_message": str(e)})
-            raise e
+        await invalidate_cached_answers(self.vector_service, [doc.id for doc in docs if nodes_by_doc.get(str(doc.id))])
 
     async def _process_smart_batch(
         self,
@@ -930,9 +1301,15 @@ class IngestionOrchestrator:
         embed_model,
         collection_name,
         connector_acl: list = None,
+        sizer: Optional["AdaptiveBatchSizer"] = None,
+        point_ids: Optional[List[str]] = None,
+        sparse: bool = False,
     ) -> int:
         """
         Processes a pre-transformed batch (Smart Strategy).
+        When a sizer is given, embedding calls adapt to provider rate limits.
+        When point_ids are given (incremental mode) they are used instead of line-based IDs.
+        With sparse, each point also gets the BM25 sparse vector of its semantic text (hybrid retrieval).
         """
         if not texts:
             return 0
@@ -944,25 +1321,35 @@ class IngestionOrchestrator:
             meta["connector_acl"] = connector_acl or []
 
         # 1. Async Embedding
-        embeddings = await embed_model.aget_text_embedding_batch(texts)
+        if sizer is None:
+            embeddings = await embed_model.aget_text_embedding_batch(texts)
+        else:
+            embeddings = await self._embed_with_backoff(embed_model, texts, sizer)
 
         # 2. Point Creation
         points = []
         for i, text in enumerate(texts):
             # Deterministic ID using LINE NUMBER (injected by transformer)
             # This is the "Magic Fix" for 1-to-1 mapping
-            line_num = metadatas[i].get("_line_number", i)
-            point_id = hashlib.md5(f"{doc.id}_line_{line_num}".encode()).hexdigest()
+            if point_ids is not None:
+                point_id = point_ids[i]
+            else:
+                line_num = metadatas[i].get("_line_number", i)
+                point_id = hashlib.md5(f"{doc.id}_line_{line_num}".encode()).hexdigest()
 
             # LlamaIndex Schema Compliance:
             # 1. Flat Payload: Used for Qdrant Filters (e.g. make="Ford")
             # 2. _node_content: Used for LlamaIndex Node reconstruction. MUST include metadata inside to populate node.metadata.
             node_content = {"text": text, "metadata": metadatas[i]}  # P0 FIX: Duplicate metadata here for LlamaIndex
 
+            vector = embeddings[i]
+            if sparse:
+                vector = {"": embeddings[i], SPARSE_VECTOR_NAME: to_sparse_vector(encode_document(text))}
+
             points.append(
                 PointStruct(
                     id=point_id,
-                    vector=embeddings[i],
+                    vector=vector,
                     payload={**metadatas[i], "_node_content": json.dumps(node_content)},
                 )
             )
@@ -972,6 +1359,53 @@ class IngestionOrchestrator:
 
         return sum(len(t) for t in texts)
 
+    @staticmethod
+    def _csv_row_point_id(doc_id: UUID, primary_id, line_idx: int, taken: set) -> str:
+        """
+        Stable point ID for a CSV row: keyed on the primary key so inserting/removing rows
+        does not shift the IDs of the rows after it. Falls back to the line number for rows
+        with an empty or duplicated primary key.
+        """
+        if primary_id is not None and str(primary_id).strip():
+            point_id = str(UUID(hashlib.md5(f"{doc_id}_pk_{str(primary_id).strip()}".encode()).hexdigest()))
+            if point_id not in taken:
+                return point_id
+        return str(UUID(hashlib.md5(f"{doc_id}_line_{line_idx}".encode()).hexdigest()))
+
+    @staticmethod
+    def _csv_row_hash(semantic_text: str, payload: dict, connector_acl: list) -> str:
+        """Content hash of everything that ends up in the point (except the volatile line number)."""
+        content = {k: v for k, v in payload.items() if k not in ("_line_number", ROW_HASH_FIELD)}
+        raw = json.dumps([semantic_text, content, connector_acl or []], sort_keys=True, default=str)
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    async def _embed_with_backoff(self, embed_model, texts: List[str], sizer: "AdaptiveBatchSizer") -> List:
+        """
+        Embed texts in sub-batches of the sizer's current size.
+        Rate-limit errors shrink the batch size and retry after an exponential backoff.
+        """
+        embeddings: List = []
+        offset = 0
+        attempts = 0
+        while offset < len(texts):
+            chunk = texts[offset : offset + sizer.size]
+            try:
+                embeddings.extend(await embed_model.aget_text_embedding_batch(chunk))
+            except Exception as e:
+                if not AdaptiveBatchSizer.is_rate_limit_error(e) or attempts >= sizer.max_retries:
+                    raise
+                attempts += 1
+                delay = sizer.on_rate_limit(attempts)
+                logger.warning(f"⏳ Embedding rate limited, retrying in {delay:.1f}s with batch size {sizer.size}")
+                await asyncio.sleep(delay)
+                continue
+
+            attempts = 0
+            offset += len(chunk)
+            sizer.on_success()
+
+        return embeddings
+
     async def _process_batch_async(
         self, records: List[dict], schema, doc, connector, embed_model, collection_name, connector_acl: list = None
     ) -> int:
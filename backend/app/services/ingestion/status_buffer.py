@@ -0,0 +1,188 @@
+"""
+Status Buffer - Write-behind document status updates and coalesced progress frames.
+
+A large sync used to issue one UPDATE round trip per status change (PROCESSING, then INDEXED or
+FAILED, then the self-healed vector count) and several WebSocket broadcasts per file. During
+ingestion these are buffered instead:
+
+- DocumentStatusBuffer merges the pending changes of each document and writes them with one bulk
+  UPDATE every INGESTION_STATUS_FLUSH_INTERVAL_MS, or as soon as INGESTION_STATUS_FLUSH_MAX_ROWS
+  documents are pending
+- Status transitions of each flush are handed to an optional callback (grouped by status), used to
+  mirror them into the Qdrant payload with one bulk set_payload per status. Callbacks run one at a
+  time in database write order, and transitions whose callback failed stay pending for the next flush
+- ProgressCoalescer keeps only the latest frame per document / connector and broadcasts at most one
+  of them per INGESTION_PROGRESS_INTERVAL_MS
+
+Both flush everything on close(), so final states (INDEXED/FAILED) are never lost.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.repositories.document_repository import DocumentRepository
+
+logger = logging.getLogger(__name__)
+
+StatusFlushCallback = Callable[[Dict[str, List[UUID]]], Awaitable[None]]
+
+
+class _PeriodicFlusher:
+    """Runs flush() every interval in a background task until closed."""
+
+    def __init__(self, interval_ms: int):
+        self.interval = max(1, interval_ms) / 1000
+        self._task: Optional[asyncio.Task] = None
+
+    async def flush(self) -> None:
+        raise NotImplementedError
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background task and flush what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                # Pending changes are kept and retried on the next tick / on close
+                logger.warning(f"{type(self).__name__} periodic flush failed: {e}")
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+class DocumentStatusBuffer(_PeriodicFlusher):
+    """
+    Write-behind buffer for ConnectorDocument updates.
+    Successive updates of a document are merged (later values win) into a single row.
+    """
+
+    def __init__(
+        self,
+        doc_repo: DocumentRepository,
+        db_lock: asyncio.Lock,
+        interval_ms: int = 500,
+        max_rows: int = 200,
+        on_status_flush: Optional[StatusFlushCallback] = None,
+    ):
+        super().__init__(interval_ms)
+        self._repo = doc_repo
+        self._db_lock = db_lock
+        self.max_rows = max(1, max_rows)
+        self._on_status_flush = on_status_flush
+        self._pending: Dict[UUID, Dict[str, Any]] = {}
+        # Latest status written to the database and not mirrored yet (doc id -> status)
+        self._mirror_pending: Dict[UUID, str] = {}
+        self._mirror_lock = asyncio.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    @property
+    def mirror_pending_count(self) -> int:
+        return len(self._mirror_pending)
+
+    async def update(self, doc_id: UUID, values: Dict[str, Any]) -> None:
+        self._pending.setdefault(doc_id, {}).update(values)
+        if len(self._pending) >= self.max_rows:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self._pending:
+            batch, self._pending = self._pending, {}
+            try:
+                # AsyncSession forbids concurrent operations (shared with the rest of the orchestrator)
+                async with self._db_lock:
+                    await self._repo.bulk_update(batch)
+                    # Recorded before releasing the lock, so a later flush always overwrites an earlier one
+                    if self._on_status_flush is not None:
+                        for doc_id, values in batch.items():
+                            if "status" in values:
+                                self._mirror_pending[doc_id] = str(values["status"])
+            except BaseException:
+                # Re-queue without overwriting changes buffered during the failed flush
+                for doc_id, values in batch.items():
+                    self._pending[doc_id] = {**values, **self._pending.get(doc_id, {})}
+                raise
+
+        await self._flush_mirror()
+
+    async def _flush_mirror(self) -> None:
+        """Hand the pending status transitions to the callback, one call at a time."""
+        if not self._mirror_pending:
+            return
+
+        async with self._mirror_lock:
+            sent = dict(self._mirror_pending)
+            if not sent:
+                return
+
+            by_status: Dict[str, List[UUID]] = {}
+            for doc_id, status in sent.items():
+                by_status.setdefault(status, []).append(doc_id)
+            try:
+                await self._on_status_flush(by_status)
+            except Exception as e:
+                logger.warning(f"Status flush callback failed, {len(sent)} transition(s) kept for retry: {e}")
+                return
+
+            # Transitions recorded while the callback ran are newer and stay pending
+            for doc_id, status in sent.items():
+                if self._mirror_pending.get(doc_id) == status:
+                    del self._mirror_pending[doc_id]
+
+    async def close(self) -> None:
+        await super().close()
+        if self._mirror_pending:
+            # Repaired from the database by the status index rebuild
+            logger.warning(f"{len(self._mirror_pending)} status transition(s) could not be mirrored before close")
+
+
+class ProgressCoalescer(_PeriodicFlusher):
+    """
+    Coalesces WebSocket progress frames (same signatures as the Websocket emitters).
+    Only the latest frame of each document / connector is kept until the next flush.
+    """
+
+    def __init__(self, emitter: Any, interval_ms: int = 250):
+        super().__init__(interval_ms)
+        self._emitter = emitter
+        # (frame type, entity id) -> (emitter method, args, kwargs); insertion order kept for flushing
+        self._pending: Dict[Tuple[str, str], Tuple[str, tuple, dict]] = {}
+
+    async def emit_document_update(self, doc_id: str, *args: Any, **kwargs: Any) -> None:
+        self._queue(("doc", str(doc_id)), "emit_document_update", (doc_id, *args), kwargs)
+
+    async def emit_connector_progress(self, connector_id: UUID, *args: Any, **kwargs: Any) -> None:
+        self._queue(("connector", str(connector_id)), "emit_connector_progress", (connector_id, *args), kwargs)
+
+    def _queue(self, key: Tuple[str, str], method: str, args: tuple, kwargs: dict) -> None:
+        self._pending.pop(key, None)  # Latest frame moves to the end
+        self._pending[key] = (method, args, kwargs)
+
+    async def flush(self) -> None:
+        frames, self._pending = self._pending, {}
+        for method, args, kwargs in frames.values():
+            try:
+                await getattr(self._emitter, method)(*args, **kwargs)
+            except Exception as e:
+                # Progress frames are best effort
+                logger.warning(f"Failed to emit {method}: {e}")
@@ -1,6 +1,8 @@
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
+from qdrant_client.http.models import PayloadSchemaType
+
 from app.schemas.ingestion import IndexingStrategy
 
 logger = logging.getLogger(__name__)
@@ -95,6 +97,27 @@ class SmartRowTransformer:
 
         return semantic_text, payload
 
+    def payload_index_schema(self, sample_payloads: List[Dict[str, Any]]) -> Dict[str, PayloadSchemaType]:
+        """
+        Qdrant payload indexes of the strategy's filter columns, typed from transformed payloads.
+
+        Exact filters are integer-indexed when every sampled value is an int (after type enforcement),
+        keyword-indexed otherwise. Range filters are integer- or float-indexed the same way.
+        """
+        schema: Dict[str, PayloadSchemaType] = {}
+        for col in self.strategy.filter_exact_cols:
+            schema[col] = (
+                PayloadSchemaType.INTEGER if self._all_ints(sample_payloads, col) else PayloadSchemaType.KEYWORD
+            )
+        for col in self.strategy.filter_range_cols:
+            schema[col] = PayloadSchemaType.INTEGER if self._all_ints(sample_payloads, col) else PayloadSchemaType.FLOAT
+        return schema
+
+    @staticmethod
+    def _all_ints(payloads: List[Dict[str, Any]], col: str) -> bool:
+        values = [p[col] for p in payloads if p.get(col) is not None]
+        return bool(values) and all(isinstance(v, int) and not isinstance(v, bool) for v in values)
+
     def _enforce_type(self, value: Any) -> Any:
         """
         Type enforcement helper: Cast to int/float if possible, otherwise keep as string.
@@ -0,0 +1,243 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[UUID, str]
+
+
+class QueryEngineCache:
+    """
+    Thread-safe, versioned cache of compiled chat query engines.
+
+    Building the agentic engine (settings reload, LLM clients, one QdrantVectorStore + index per
+    provider, IsolatedQueryEngine tools, LLMMultiSelector router) is done once per
+    (assistant_id, language) and reused until the assistant's version changes.
+
+    The version fingerprints the assistant's updated_at and every linked connector's type,
+    configuration and updated_at, so stale engines are never served even without an explicit
+    invalidation. Invalidation hooks (assistant, connector, settings changes) free them early.
+
+    Per-request callback handlers are NOT part of the cached engine: they are routed through
+    RequestCallbackRouter (see app.services.chat.callbacks).
+    """
+
+    def __init__(self, max_size: int = 50, ttl_seconds: int = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of engines to cache (LRU eviction)
+            ttl_seconds: Time-to-live in seconds (default 1 hour)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        # Cache storage: key = (assistant_id, language), value = (engine, version, connector_ids, timestamp)
+        self._cache: Dict[CacheKey, Tuple[Any, str, Set[UUID], float]] = {}
+
+        # Thread safety
+        self._lock = threading.Lock()
+
+        # Access tracking for LRU
+        self._access_times: Dict[CacheKey, float] = {}
+
+        logger.info(f"QUERY_ENGINE_CACHE | Initialized (max_size={max_size}, ttl={ttl_seconds}s)")
+
+    @staticmethod
+    def compute_version(assistant: Any) -> str:
+        """
+        Fingerprint of everything the compiled engine depends on in the assistant row.
+
+        Args:
+            assistant: Assistant with its linked_connectors loaded
+
+        Returns:
+            Stable hash, changes whenever the assistant or one of its connectors is updated
+        """
+        parts = [str(getattr(assistant, "updated_at", None))]
+        connectors = getattr(assistant, "linked_connectors", None) or []
+        for conn in sorted(connectors, key=lambda c: str(c.id)):
+            parts.append(
+                "|".join(
+                    [
+                        str(conn.id),
+                        str(conn.connector_type),
+                        str(getattr(conn, "updated_at", None)),
+                        json.dumps(conn.configuration or {}, sort_keys=True, default=str),
+                    ]
+                )
+            )
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def get_engine(self, assistant_id: UUID, language: str, version: str) -> Optional[Any]:
+        """
+        Retrieve cached engine if available, not expired and built from the same version.
+
+        Args:
+            assistant_id: ID of the assistant
+            language: Response language the engine prompts were built for
+            version: Current version of the assistant (see compute_version)
+
+        Returns:
+            Cached engine or None if not found/expired/stale
+        """
+        key = (assistant_id, language)
+
+        with self._lock:
+            if key not in self._cache:
+                logger.debug(f"QUERY_ENGINE_CACHE | Miss - Key not found: {key}")
+                return None
+
+            engine, cached_version, _, created_at = self._cache[key]
+
+            age = time.time() - created_at
+            if age > self.ttl_seconds or cached_version != version:
+                reason = "Expired" if age > self.ttl_seconds else "Stale version"
+                logger.info(f"QUERY_ENGINE_CACHE | {reason} - Assistant: {assistant_id}, Age: {age:.1f}s")
+                self._remove(key)
+                return None
+
+            self._access_times[key] = time.time()
+
+            logger.info(f"QUERY_ENGINE_CACHE | Hit - Assistant: {assistant_id}, Language: {language}, Age: {age:.1f}s")
+            return engine
+
+    def set_engine(
+        self, assistant_id: UUID, language: str, version: str, engine: Any, connector_ids: Iterable[UUID] = ()
+    ) -> None:
+        """
+        Store engine in cache.
+
+        Args:
+            assistant_id: ID of the assistant
+            language: Response language the engine prompts were built for
+            version: Version of the assistant the engine was built from
+            engine: Compiled query engine
+            connector_ids: Linked connectors (for connector-level invalidation)
+        """
+        key = (assistant_id, language)
+
+        with self._lock:
+            if len(self._cache) >= self.max_size and key not in self._cache:
+                self._evict_lru()
+
+            self._cache[key] = (engine, version, set(connector_ids), time.time())
+            self._access_times[key] = time.time()
+
+            logger.info(
+                f"QUERY_ENGINE_CACHE | Stored - Assistant: {assistant_id}, Language: {language}, "
+                f"Cache Size: {len(self._cache)}"
+            )
+
+    def invalidate_assistant(self, assistant_id: UUID) -> int:
+        """
+        Invalidate all engines (every language) of a specific assistant.
+
+        Returns:
+            Number of entries invalidated
+        """
+        with self._lock:
+            keys_to_remove = [key for key in self._cache if key[0] == assistant_id]
+            for key in keys_to_remove:
+                self._remove(key)
+
+        count = len(keys_to_remove)
+        if count > 0:
+            logger.info(f"QUERY_ENGINE_CACHE | Invalidated {count} entries for assistant {assistant_id}")
+        return count
+
+    def invalidate_connector(self, connector_id: UUID) -> int:
+        """
+        Invalidate all engines using a specific connector.
+
+        Returns:
+            Number of entries invalidated
+        """
+        with self._lock:
+            keys_to_remove = [key for key, entry in self._cache.items() if connector_id in entry[2]]
+            for key in keys_to_remove:
+                self._remove(key)
+
+        count = len(keys_to_remove)
+        if count > 0:
+            logger.info(f"QUERY_ENGINE_CACHE | Invalidated {count} entries for connector {connector_id}")
+        return count
+
+    def clear(self) -> int:
+        """
+        Clear entire cache (e.g. global settings such as API keys or models changed).
+
+        Returns:
+            Number of entries cleared
+        """
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+            self._access_times.clear()
+
+        if count > 0:
+            logger.info(f"QUERY_ENGINE_CACHE | Cleared {count} entries")
+        return count
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove an entry (internal, called with lock held)."""
+        self._cache.pop(key, None)
+        self._access_times.pop(key, None)
+
+    def _evict_lru(self) -> None:
+        """Evict least recently used entry (internal, called with lock held)."""
+        if not self._access_times:
+            return
+
+        lru_key = min(self._access_times.items(), key=lambda x: x[1])[0]
+        self._remove(lru_key)
+
+        logger.debug(f"QUERY_ENGINE_CACHE | Evicted LRU entry: {lru_key}")
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "entries": [
+                    {
+                        "assistant_id": str(key[0]),
+                        "language": key[1],
+                        "age_seconds": round(time.time() - created_at, 1),
+                    }
+                    for key, (_, _, _, created_at) in self._cache.items()
+                ],
+            }
+
+
+# Global singleton and lock for thread-safe initialization
+_global_cache: Optional[QueryEngineCache] = None
+_init_lock = threading.Lock()
+
+
+def get_query_engine_cache() -> QueryEngineCache:
+    """
+    Get or create the global query engine cache singleton using double-checked locking.
+
+    Returns:
+        Global QueryEngineCache instance
+    """
+    global _global_cache
+    if _global_cache is None:
+        with _init_lock:
+            if _global_cache is None:
+                _global_cache = QueryEngineCache(max_size=50, ttl_seconds=3600)
+    return _global_cache
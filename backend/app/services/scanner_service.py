@@ -20,6 +20,7 @@ from app.models.connector_document import ConnectorDocument
 from app.models.enums import ConnectorStatus, DocStatus
 from app.repositories.connector_repository import ConnectorRepository
 from app.repositories.document_repository import DocumentRepository
+from app.services.cache_service import invalidate_cached_answers
 from app.services.ingestion.utils import IngestionUtils
 from app.services.vector_service import VectorService, get_vector_service
 
@@ -117,6 +118,7 @@ class ScannerService:
             to_create = []
             to_update = []
             to_delete_ids = []
+            changed_ids = []  # Modified at source: cached answers built from them are stale
 
             stats = {"added": 0, "updated": 0, "ignored": 0, "deleted": 0}
             last_ws_update = time.time()
@@ -147,6 +149,7 @@ class ScannerService:
                     to_create.append(data)
                 elif action == "update":
                     to_update.append(data)
+                    changed_ids.append(data["id"])
                 elif action == "ignore":
                     to_create.append(data)  # "Ignore" means create as UNSUPPORTED
                 elif action == "update_ignore":
@@ -194,6 +197,9 @@ class ScannerService:
                     asyncio.create_task(self._safe_delete_vectors(d_id))
                     await manager.emit_document_deleted(str(d_id), str(connector_id))
 
+            if self.vector_service and (changed_ids or to_delete_ids):
+                await invalidate_cached_answers(self.vector_service, changed_ids + to_delete_ids)
+
             # 7. Update connector stats
             total_count = await self.document_repo.count_by_connector(connector_id)
             updated_connector = await self.connector_repo.update(connector_id, {"total_docs_count": total_count})
@@ -0,0 +1,421 @@
+"""
+Semantic Cache Index - Brute-force in-memory vectors of the semantic cache, per (assistant, provider).
+
+For assistants with a few thousand cached questions, one matrix-vector product over a contiguous
+float32 matrix of normalised embeddings answers a semantic lookup in well under a millisecond,
+where SemanticCacheService would otherwise pay a Qdrant round trip.
+
+- Built from the semantic_cache_<provider> collections by a background task (at startup, then every
+  SEMANTIC_CACHE_INDEX_REBUILD_INTERVAL), kept current by this process' cache writes and by assistant
+  purges received on the semantic cache invalidation channel.
+- An assistant above SEMANTIC_CACHE_INDEX_MAX_VECTORS is not indexed: its lookups go to Qdrant.
+- A provider not scanned yet, or whose last scan is older than three intervals, is cold: lookups go to Qdrant.
+- Entries written by other processes are indexed by the next rebuild. Until then such a lookup can miss
+  where Qdrant would have hit, never the opposite: every match is still read back from Redis.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_COLLECTION_PREFIX = "semantic_cache_"
+INITIAL_CAPACITY = 64
+
+# Journaled operation replayed after a rebuild:
+# ("add", assistant_id, cache_key, unit) / ("remove", assistant_id, cache_key) / ("clear", assistant_id)
+_Operation = Tuple[Any, ...]
+
+
+def _unit(vector: Any) -> Optional[np.ndarray]:
+    """float32 unit vector (None for empty / zero vectors). Qdrant named vectors: the default one."""
+    if isinstance(vector, dict):
+        vector = vector.get("")
+    if vector is None:
+        return None
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array))
+    if array.ndim != 1 or norm == 0.0:
+        return None
+    return array / norm
+
+
+class _VectorMatrix:
+    """Contiguous float32 matrix of unit vectors and their cache keys (the last row fills removed rows)."""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.matrix = np.empty((INITIAL_CAPACITY, dimension), dtype=np.float32)
+        self.keys: List[str] = []
+        self.rows: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def upsert(self, key: str, unit: np.ndarray) -> None:
+        row = self.rows.get(key)
+        if row is None:
+            row = len(self.keys)
+            if row == self.matrix.shape[0]:
+                grown = np.empty((row * 2, self.dimension), dtype=np.float32)
+                grown[:row] = self.matrix
+                self.matrix = grown
+            self.keys.append(key)
+            self.rows[key] = row
+        self.matrix[row] = unit
+
+    def remove(self, key: str) -> bool:
+        row = self.rows.pop(key, None)
+        if row is None:
+            return False
+        last = len(self.keys) - 1
+        if row != last:
+            moved = self.keys[last]
+            self.keys[row] = moved
+            self.rows[moved] = row
+            self.matrix[row] = self.matrix[last]
+        self.keys.pop()
+        return True
+
+    def best(self, unit: np.ndarray) -> Tuple[Optional[str], float]:
+        """Closest key by cosine similarity (one matrix-vector product)."""
+        if not self.keys:
+            return None, 0.0
+        scores = self.matrix[: len(self.keys)] @ unit
+        row = int(np.argmax(scores))
+        return self.keys[row], float(scores[row])
+
+
+class SemanticCacheIndex:
+    """
+    Thread-safe in-memory semantic cache vectors, grouped per provider then assistant.
+    """
+
+    def __init__(self, max_vectors: int = 5000, max_age_seconds: float = 900.0):
+        """
+        Initialize an empty (cold) index.
+
+        Args:
+            max_vectors: Vectors per (assistant, provider) above which the assistant is left to Qdrant
+            max_age_seconds: Age of a provider's last rebuild after which it is cold
+        """
+        self.max_vectors = max_vectors
+        self.max_age_seconds = max_age_seconds
+
+        # provider -> assistant_id -> vectors
+        self._matrices: Dict[str, Dict[str, _VectorMatrix]] = {}
+        # provider -> assistants above max_vectors (or with mixed dimensions)
+        self._unindexed: Dict[str, Set[str]] = {}
+        self._built_at: Dict[str, float] = {}
+
+        # Writes received while a provider is being rebuilt, replayed onto the new snapshot
+        self._journals: Dict[str, List[_Operation]] = {}
+
+        # Thread safety
+        self._lock = threading.Lock()
+
+    def is_warm(self, provider: str) -> bool:
+        """True when the provider's vectors were rebuilt recently enough to be trusted."""
+        built_at = self._built_at.get(provider)
+        return built_at is not None and time.monotonic() - built_at <= self.max_age_seconds
+
+    def search(
+        self, assistant_id: str, provider: str, embedding: Sequence[float], min_score: float
+    ) -> Tuple[bool, Optional[Tuple[str, float]]]:
+        """
+        Closest cached question of an assistant.
+
+        Returns:
+            (covered, match): covered=False means the index cannot answer and Qdrant must be queried;
+            match is (cache_key, score) when the best score reaches min_score
+        """
+        unit = _unit(embedding)
+        with self._lock:
+            if not self.is_warm(provider) or assistant_id in self._unindexed.get(provider, ()):
+                return False, None
+            vectors = self._matrices.get(provider, {}).get(assistant_id)
+            if vectors is None:
+                # Scanned provider without entries for this assistant
+                return True, None
+            if unit is None or unit.shape[0] != vectors.dimension:
+                return False, None
+            key, score = vectors.best(unit)
+
+        if key is None or score < min_score:
+            return True, None
+        return True, (key, score)
+
+    def add(self, assistant_id: str, provider: str, cache_key: str, embedding: Sequence[float]) -> None:
+        """Index a cache entry written by this process."""
+        unit = _unit(embedding)
+        if unit is None:
+            return
+        with self._lock:
+            journal = self._journals.get(provider)
+            if journal is not None:
+                journal.append(("add", assistant_id, cache_key, unit))
+            self._add(
+                self._matrices.setdefault(provider, {}),
+                self._unindexed.setdefault(provider, set()),
+                assistant_id,
+                cache_key,
+                unit,
+            )
+
+    def invalidate_assistant(self, assistant_id: str) -> None:
+        """Drop every vector of an assistant (its cache was purged)."""
+        with self._lock:
+            for provider in set(self._matrices) | set(self._unindexed) | set(self._journals):
+                journal = self._journals.get(provider)
+                if journal is not None:
+                    journal.append(("clear", assistant_id))
+                self._clear(self._matrices.get(provider, {}), self._unindexed.get(provider, set()), assistant_id)
+
+    def remove_keys(self, cache_keys: Sequence[str]) -> int:
+        """Drop the vectors of cache entries removed from the cache (keys are cache:<assistant_id>:<hash>)."""
+        removed = 0
+        with self._lock:
+            for cache_key in cache_keys:
+                parts = cache_key.split(":")
+                if len(parts) != 3:
+                    continue
+                assistant_id = parts[1]
+                for provider in set(self._matrices) | set(self._journals):
+                    journal = self._journals.get(provider)
+                    if journal is not None:
+                        journal.append(("remove", assistant_id, cache_key))
+                    vectors = self._matrices.get(provider, {}).get(assistant_id)
+                    if vectors is not None and vectors.remove(cache_key):
+                        removed += 1
+        return removed
+
+    def apply_message(self, message: Dict[str, Any]) -> None:
+        """Apply a semantic cache invalidation message (see app.services.semantic_cache_l1)."""
+        if message.get("assistant_id"):
+            self.invalidate_assistant(str(message["assistant_id"]))
+        if message.get("deleted_keys"):
+            self.remove_keys(message["deleted_keys"])
+
+    def begin_rebuild(self, provider: str) -> None:
+        """Start journaling writes so none is lost while the collection is being scanned."""
+        with self._lock:
+            self._journals[provider] = []
+
+    def abort_rebuild(self, provider: str) -> None:
+        """Stop journaling after a failed rebuild (the current content is kept)."""
+        with self._lock:
+            self._journals.pop(provider, None)
+
+    def load(self, provider: str, points: Any) -> None:
+        """
+        Replace a provider's vectors with a full collection snapshot and mark it warm.
+
+        Args:
+            provider: Embedding provider of the collection
+            points: Iterable of (assistant_id, cache_key, vector)
+        """
+        matrices: Dict[str, _VectorMatrix] = {}
+        unindexed: Set[str] = set()
+        self._fill(matrices, unindexed, points)
+        self._install(provider, matrices, unindexed)
+
+    async def rebuild(self, provider: str, vector_repo: Any) -> None:
+        """
+        Rebuild a provider's vectors from its semantic cache collection.
+
+        Args:
+            provider: Embedding provider (collection semantic_cache_<provider>)
+            vector_repo: VectorRepository bound to a live client
+        """
+        self.begin_rebuild(provider)
+        try:
+            matrices: Dict[str, _VectorMatrix] = {}
+            unindexed: Set[str] = set()
+            async for batch in vector_repo.scroll_points(
+                f"{CACHE_COLLECTION_PREFIX}{provider}", payload_fields=["assistant_id", "cache_key"]
+            ):
+                # Indexed page by page: raw vectors of the whole collection are never held at once
+                self._fill(
+                    matrices,
+                    unindexed,
+                    (
+                        ((p.payload or {}).get("assistant_id"), (p.payload or {}).get("cache_key"), p.vector)
+                        for p in batch
+                    ),
+                )
+        except Exception:
+            self.abort_rebuild(provider)
+            raise
+        self._install(provider, matrices, unindexed)
+
+    def _install(self, provider: str, matrices: Dict[str, "_VectorMatrix"], unindexed: Set[str]) -> None:
+        """Replace a provider's vectors with a snapshot plus the journaled writes (internal)."""
+        with self._lock:
+            for operation in self._journals.pop(provider, None) or ():
+                if operation[0] == "add":
+                    self._add(matrices, unindexed, *operation[1:])
+                elif operation[0] == "remove":
+                    vectors = matrices.get(operation[1])
+                    if vectors is not None:
+                        vectors.remove(operation[2])
+                else:
+                    self._clear(matrices, unindexed, operation[1])
+            self._matrices[provider] = matrices
+            self._unindexed[provider] = unindexed
+            self._built_at[provider] = time.monotonic()
+
+        indexed = sum(len(vectors) for vectors in matrices.values())
+        logger.info(
+            f"SEMANTIC_CACHE_INDEX | Rebuilt {provider} - {indexed} vectors, {len(matrices)} assistants "
+            f"({len(unindexed)} left to Qdrant)"
+        )
+
+    def invalidate(self) -> None:
+        """Mark every provider cold until its next successful rebuild."""
+        with self._lock:
+            self._built_at.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Get index statistics for monitoring.
+
+        Returns:
+            Dictionary with index statistics
+        """
+        with self._lock:
+            return {
+                provider: {
+                    "warm": self.is_warm(provider),
+                    "assistants": len(self._matrices.get(provider, {})),
+                    "vectors": sum(len(vectors) for vectors in self._matrices.get(provider, {}).values()),
+                    "unindexed_assistants": len(self._unindexed.get(provider, ())),
+                }
+                for provider in self._built_at
+            }
+
+    def _fill(self, matrices: Dict[str, _VectorMatrix], unindexed: Set[str], points: Any) -> None:
+        """Index (assistant_id, cache_key, vector) triples into private maps (internal)."""
+        for assistant_id, cache_key, vector in points:
+            unit = _unit(vector)
+            if assistant_id and cache_key and unit is not None:
+                self._add(matrices, unindexed, str(assistant_id), cache_key, unit)
+
+    def _add(
+        self,
+        matrices: Dict[str, _VectorMatrix],
+        unindexed: Set[str],
+        assistant_id: str,
+        cache_key: str,
+        unit: np.ndarray,
+    ) -> None:
+        """Index one vector, the assistant is left to Qdrant once too large (internal, lock held or private maps)."""
+        if assistant_id in unindexed:
+            return
+        vectors = matrices.get(assistant_id)
+        if vectors is None:
+            vectors = matrices[assistant_id] = _VectorMatrix(unit.shape[0])
+        if unit.shape[0] != vectors.dimension or (len(vectors) >= self.max_vectors and cache_key not in vectors.rows):
+            del matrices[assistant_id]
+            unindexed.add(assistant_id)
+            return
+        vectors.upsert(cache_key, unit)
+
+    @staticmethod
+    def _clear(matrices: Dict[str, _VectorMatrix], unindexed: Set[str], assistant_id: str) -> None:
+        """Forget an assistant whose cache was purged: known empty again (internal)."""
+        matrices.pop(assistant_id, None)
+        unindexed.discard(assistant_id)
+
+
+# Global singleton and lock for thread-safe initialization
+_global_index: Optional[SemanticCacheIndex] = None
+_init_lock = threading.Lock()
+
+_rebuild_task: Optional[asyncio.Task] = None
+
+
+def get_semantic_cache_index() -> Optional[SemanticCacheIndex]:
+    """
+    Get or create the global semantic cache index singleton using double-checked locking.
+
+    Returns:
+        Global SemanticCacheIndex instance, or None if SEMANTIC_CACHE_INDEX_ENABLED is off
+    """
+    global _global_index
+    if not settings.SEMANTIC_CACHE_INDEX_ENABLED:
+        return None
+    if _global_index is None:
+        with _init_lock:
+            if _global_index is None:
+                interval = settings.SEMANTIC_CACHE_INDEX_REBUILD_INTERVAL
+                _global_index = SemanticCacheIndex(
+                    max_vectors=settings.SEMANTIC_CACHE_INDEX_MAX_VECTORS, max_age_seconds=interval * 3
+                )
+    return _global_index
+
+
+async def _rebuild_loop(index: SemanticCacheIndex, interval_seconds: int) -> None:
+    """Background task rebuilding every provider's vectors from Qdrant every interval_seconds."""
+    # Late import for clean dependency tree
+    from app.core.database import SessionLocal
+    from app.repositories.vector_repository import VectorRepository
+    from app.services.settings_service import SettingsService
+    from app.services.vector_service import VectorService
+
+    logger.info("🧮 START | semantic_cache_index | Interval: %ds", interval_seconds)
+    try:
+        while True:
+            try:
+                async with SessionLocal() as db:
+                    client = await VectorService(SettingsService(db)).get_async_qdrant_client()
+                repo = VectorRepository(client)
+                for collection_name in await repo.list_collections():
+                    if collection_name.startswith(CACHE_COLLECTION_PREFIX):
+                        await index.rebuild(collection_name[len(CACHE_COLLECTION_PREFIX) :], repo)
+            except Exception as e:
+                logger.error(f"⚠️ WARN | semantic_cache_index | Rebuild Error: {e}")
+
+            await asyncio.sleep(interval_seconds)
+    finally:
+        logger.info("🧮 STOP | semantic_cache_index | Loop ended")
+
+
+async def start_semantic_cache_index() -> None:
+    """Start the periodic rebuild task (lookups use Qdrant until a provider's first rebuild)."""
+    global _rebuild_task
+
+    index = get_semantic_cache_index()
+    if index is None:
+        return
+
+    if _rebuild_task is not None and not _rebuild_task.done():
+        logger.warning("Semantic cache index task already running")
+        return
+
+    _rebuild_task = asyncio.create_task(_rebuild_loop(index, settings.SEMANTIC_CACHE_INDEX_REBUILD_INTERVAL))
+
+
+async def stop_semantic_cache_index() -> None:
+    """Stop the rebuild task, lookups go back to Qdrant."""
+    global _rebuild_task
+
+    if _rebuild_task is None:
+        return
+
+    index = get_semantic_cache_index()
+    if index is not None:
+        index.invalidate()
+
+    _rebuild_task.cancel()
+    try:
+        await _rebuild_task
+    except asyncio.CancelledError:
+        pass
+    _rebuild_task = None
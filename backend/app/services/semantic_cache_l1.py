@@ -0,0 +1,372 @@
+"""
+Semantic Cache L1 - In-process tier in front of SemanticCacheService's Redis + Qdrant lookups.
+
+Entries are keyed by the exact cache key (cache:<assistant_id>:<question hash>) of the question ASKED:
+- exact hits: the Redis entry of that key
+- recent semantic hits: the Redis entry of the matched question, stored under the asking key with the
+  similarity score, so asking the same paraphrase again needs neither an embedding nor Qdrant
+
+COHERENCE:
+- Expiry: an entry never outlives the Redis entry it was read from (remaining TTL read with the
+  value), nor SEMANTIC_CACHE_L1_TTL.
+- Invalidation: writers (set_cached_response, clear_assistant_cache, cache maintenance, document
+  invalidation) publish on INVALIDATION_CHANNEL and every process drops the matching entries (by key,
+  by source key of semantic hits, or per assistant).
+  Reads that started before an invalidation are not stored (generation counter).
+- The L1 only serves while the process is subscribed to the channel: a subscriber failure clears it
+  and disables it until the subscription is restored, so no invalidation can be missed.
+
+The same messages keep the in-memory semantic cache index current (app.services.semantic_cache_index).
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+import redis.asyncio as aioredis
+
+from app.core.settings import settings
+from app.services.semantic_cache_index import get_semantic_cache_index
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "vectra:semantic_cache:invalidate"
+REDIS_CONNECT_TIMEOUT = 5.0
+SUBSCRIBER_RETRY_SECONDS = 5.0
+
+
+@dataclass
+class _L1Entry:
+    value: str  # Raw JSON from Redis, parsed on every hit so callers never share a mutable dict
+    score: float
+    source_key: str
+    expires_at: float
+
+
+class SemanticCacheL1:
+    """
+    Thread-safe LRU + TTL of semantic cache responses (see module docstring).
+    """
+
+    def __init__(self, max_entries: int = 5000, ttl_seconds: int = 300):
+        """
+        Initialize an empty, inactive tier.
+
+        Args:
+            max_entries: Maximum number of responses kept in process (LRU eviction)
+            ttl_seconds: Maximum lifetime of an entry in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[str, _L1Entry]" = OrderedDict()
+        # source cache key -> asking keys whose entry was read from it
+        self._by_source: Dict[str, Set[str]] = {}
+
+        # Serving requires a live invalidation subscription (see set_active)
+        self._active = False
+        self._generation = 0
+
+        # Thread safety
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter, captured before a Redis read and checked by put()."""
+        return self._generation
+
+    def set_active(self, active: bool) -> None:
+        """Enable or disable serving. Entries are dropped on every change (invalidations may have been missed)."""
+        with self._lock:
+            self._active = active
+            self._generation += 1
+            self._entries.clear()
+            self._by_source.clear()
+
+    def get(self, key: str, min_score: float = 0.0) -> Optional[Dict[str, Any]]:
+        """
+        Cached response of an asking key, if fresh and (semantic hits) at least as similar as min_score.
+        """
+        entry = self.get_entry(key, min_score)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str, min_score: float = 0.0) -> Optional[Tuple[Dict[str, Any], str]]:
+        """get() with the cache key the response was read from (usage accounting)."""
+        if not self._active:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._misses += 1
+                return None
+            if entry.score < min_score:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value, source_key = entry.value, entry.source_key
+
+        return json.loads(value), source_key
+
+    def put(
+        self,
+        key: str,
+        value: str,
+        generation: int,
+        ttl_seconds: Optional[float] = None,
+        score: float = 1.0,
+        source_key: Optional[str] = None,
+    ) -> None:
+        """
+        Store a response read from Redis.
+
+        Args:
+            key: Asking cache key
+            value: Raw JSON read from Redis
+            generation: self.generation captured before the Redis read (stale reads are dropped)
+            ttl_seconds: Remaining TTL of the Redis entry (None = unknown / no expiry)
+            score: Similarity of the matched question (1.0 for exact hits)
+            source_key: Cache key the value was read from (defaults to key)
+        """
+        lifetime = self.ttl_seconds if ttl_seconds is None else min(self.ttl_seconds, ttl_seconds)
+        if lifetime <= 0:
+            return
+
+        source_key = source_key or key
+        with self._lock:
+            if not self._active or generation != self._generation:
+                return
+            self._remove(key)
+            self._entries[key] = _L1Entry(value, score, source_key, time.monotonic() + lifetime)
+            self._by_source.setdefault(source_key, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_keys(self, keys: Iterable[str]) -> int:
+        """Drop the entries of these cache keys and every semantic hit read from them."""
+        with self._lock:
+            self._generation += 1
+            count = 0
+            for key in keys:
+                for asking_key in list(self._by_source.get(key, ())) + [key]:
+                    if asking_key in self._entries:
+                        self._remove(asking_key)
+                        count += 1
+        return count
+
+    def invalidate_assistant(self, assistant_id: str) -> int:
+        """Drop every entry of an assistant."""
+        prefix = f"cache:{assistant_id}:"
+        with self._lock:
+            self._generation += 1
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def apply_message(self, message: Dict[str, Any]) -> None:
+        """Apply an invalidation message ({"assistant_id": ...}, {"keys": [...]} and/or {"deleted_keys": [...]})."""
+        if message.get("assistant_id"):
+            self.invalidate_assistant(str(message["assistant_id"]))
+        if message.get("keys"):
+            self.invalidate_keys(message["keys"])
+        if message.get("deleted_keys"):
+            self.invalidate_keys(message["deleted_keys"])
+
+    def clear(self) -> int:
+        with self._lock:
+            self._generation += 1
+            count = len(self._entries)
+            self._entries.clear()
+            self._by_source.clear()
+        return count
+
+    def get_stats(self) -> dict:
+        """
+        Get tier statistics for monitoring.
+
+        Returns:
+            Dictionary with tier statistics
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "active": self._active,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else None,
+            }
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry (internal, called with lock held)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        bucket = self._by_source.get(entry.source_key)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._by_source[entry.source_key]
+
+
+# Global singleton and lock for thread-safe initialization
+_global_l1: Optional[SemanticCacheL1] = None
+_init_lock = threading.Lock()
+
+_subscriber_task: Optional[asyncio.Task] = None
+
+
+def get_semantic_cache_l1() -> Optional[SemanticCacheL1]:
+    """
+    Get or create the global semantic cache L1 singleton using double-checked locking.
+
+    Returns:
+        Global SemanticCacheL1 instance, or None if SEMANTIC_CACHE_L1_ENABLED is off
+    """
+    global _global_l1
+    if not settings.SEMANTIC_CACHE_L1_ENABLED:
+        return None
+    if _global_l1 is None:
+        with _init_lock:
+            if _global_l1 is None:
+                _global_l1 = SemanticCacheL1(
+                    max_entries=settings.SEMANTIC_CACHE_L1_MAX_ENTRIES, ttl_seconds=settings.SEMANTIC_CACHE_L1_TTL
+                )
+    return _global_l1
+
+
+async def publish_invalidation(
+    redis: Optional[aioredis.Redis],
+    assistant_id: Optional[str] = None,
+    keys: Optional[Iterable[str]] = None,
+    deleted_keys: Optional[Iterable[str]] = None,
+) -> None:
+    """
+    Invalidate L1 entries in every process (this one immediately, the others through Redis pub/sub).
+
+    Args:
+        redis: Redis client used to publish (None = this process only)
+        assistant_id: Every entry of an assistant was purged
+        keys: Entries overwritten (still cached)
+        deleted_keys: Entries removed from the cache (evicted, orphaned...)
+    """
+    message: Dict[str, Any] = {}
+    if assistant_id:
+        message["assistant_id"] = assistant_id
+    if keys:
+        message["keys"] = list(keys)
+    if deleted_keys:
+        message["deleted_keys"] = list(deleted_keys)
+    if not message:
+        return
+
+    _apply_invalidation(message)
+
+    if redis is None:
+        return
+    try:
+        await redis.publish(INVALIDATION_CHANNEL, json.dumps(message))
+    except Exception as e:
+        # Other processes stop serving their L1 when their own subscription breaks, not on a failed publish
+        logger.error(f"⚠️ WARN | semantic_cache_l1 | Invalidation publish failed: {e}")
+
+
+def _apply_invalidation(message: Dict[str, Any]) -> None:
+    """Apply an invalidation message to the in-process tiers of this process."""
+    l1 = get_semantic_cache_l1()
+    if l1 is not None:
+        l1.apply_message(message)
+    index = get_semantic_cache_index()
+    if index is not None:
+        index.apply_message(message)
+
+
+async def _subscriber_loop(l1: Optional[SemanticCacheL1]) -> None:
+    """Background task applying invalidation messages, the L1 serves only while subscribed."""
+    logger.info("🧊 START | semantic_cache_l1 | Channel: %s", INVALIDATION_CHANNEL)
+    try:
+        while True:
+            client = aioredis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                password=settings.REDIS_PASSWORD,
+                db=settings.REDIS_DB,
+                socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+                decode_responses=True,
+            )
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "subscribe":
+                        if l1 is not None:
+                            l1.set_active(True)
+                    elif message.get("type") == "message":
+                        try:
+                            _apply_invalidation(json.loads(message["data"]))
+                        except (TypeError, ValueError) as e:
+                            logger.warning(f"semantic_cache_l1 | Ignored invalid message: {e}")
+            except Exception as e:
+                logger.error(f"⚠️ WARN | semantic_cache_l1 | Subscriber Error: {e}")
+            finally:
+                if l1 is not None:
+                    l1.set_active(False)
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except Exception:
+                    pass
+
+            await asyncio.sleep(SUBSCRIBER_RETRY_SECONDS)
+    finally:
+        logger.info("🧊 STOP | semantic_cache_l1 | Subscriber ended")
+
+
+async def start_semantic_cache_l1() -> None:
+    """Start the invalidation subscriber (the L1 stays inactive until it is subscribed)."""
+    global _subscriber_task
+
+    l1 = get_semantic_cache_l1()
+    if l1 is None and get_semantic_cache_index() is None:
+        return
+
+    if _subscriber_task is not None and not _subscriber_task.done():
+        logger.warning("Semantic cache L1 subscriber already running")
+        return
+
+    _subscriber_task = asyncio.create_task(_subscriber_loop(l1))
+
+
+async def stop_semantic_cache_l1() -> None:
+    """Stop the invalidation subscriber (the L1 is cleared and stops serving)."""
+    global _subscriber_task
+
+    if _subscriber_task is None:
+        return
+
+    _subscriber_task.cancel()
+    try:
+        await _subscriber_task
+    except asyncio.CancelledError:
+        pass
+    _subscriber_task = None
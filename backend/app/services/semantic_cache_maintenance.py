@@ -0,0 +1,132 @@
+"""
+Semantic Cache Maintenance - Keeps the semantic cache bounded over months of operation.
+
+Redis entries expire after REDIS_CACHE_TTL but their Qdrant points do not, and nothing limited how many
+questions an assistant could cache. Every SEMANTIC_CACHE_MAINTENANCE_INTERVAL:
+1. Each process flushes its buffered cache hits into the per-assistant usage sorted sets (hits are
+   counted in memory so lookups, including L1 hits, never pay a Redis write).
+2. One process (Redis lock) evicts the entries beyond SEMANTIC_CACHE_MAX_ENTRIES_PER_ASSISTANT, least
+   recently or least frequently hit first (SEMANTIC_CACHE_EVICTION_POLICY), then deletes the Qdrant
+   points whose Redis entry expired.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+MAINTENANCE_LOCK_KEY = "vectra:semantic_cache:maintenance"
+MAX_PENDING_HITS = 50000  # Distinct (assistant, entry) pairs buffered between two flushes
+
+# assistant_id -> cache_key -> hits since the last flush
+_pending_hits: Dict[str, Dict[str, int]] = {}
+_pending_count = 0
+_hits_lock = threading.Lock()
+
+_maintenance_task: Optional[asyncio.Task] = None
+
+
+def record_cache_hit(assistant_id: str, cache_key: str) -> None:
+    """Count a cache hit (in memory, flushed by the maintenance task)."""
+    global _pending_count
+
+    if not settings.SEMANTIC_CACHE_MAINTENANCE_ENABLED:
+        return
+
+    with _hits_lock:
+        counts = _pending_hits.setdefault(assistant_id, {})
+        if cache_key not in counts:
+            if _pending_count >= MAX_PENDING_HITS:
+                return
+            _pending_count += 1
+        counts[cache_key] = counts.get(cache_key, 0) + 1
+
+
+def drain_hits() -> Dict[str, Dict[str, int]]:
+    """Buffered hits since the last call."""
+    global _pending_hits, _pending_count
+
+    with _hits_lock:
+        hits, _pending_hits, _pending_count = _pending_hits, {}, 0
+    return hits
+
+
+async def run_maintenance(cache_service, interval_seconds: int) -> Dict[str, int]:
+    """
+    One maintenance pass (see module docstring).
+
+    Args:
+        cache_service: SemanticCacheService
+        interval_seconds: Interval of the maintenance loop (lifetime of the Redis lock)
+
+    Returns:
+        Number of entries evicted and orphan points deleted (0 when another process holds the lock)
+    """
+    await cache_service.flush_hits(drain_hits())
+
+    if not await cache_service.redis.set(MAINTENANCE_LOCK_KEY, "1", nx=True, ex=max(interval_seconds - 1, 1)):
+        return {"evicted": 0, "orphans": 0}
+
+    evicted = await cache_service.evict_over_capacity(settings.SEMANTIC_CACHE_MAX_ENTRIES_PER_ASSISTANT)
+    orphans = await cache_service.reconcile_orphans()
+    return {"evicted": evicted, "orphans": orphans}
+
+
+async def _maintenance_loop(interval_seconds: int) -> None:
+    """Background task running a maintenance pass every interval_seconds."""
+    # Late import for clean dependency tree
+    from app.core.database import SessionLocal
+    from app.services.cache_service import SemanticCacheService
+    from app.services.settings_service import SettingsService
+    from app.services.vector_service import VectorService
+
+    logger.info("🧹 START | semantic_cache_maintenance | Interval: %ds", interval_seconds)
+    try:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                # Fresh session per iteration to avoid pool/state issues
+                async with SessionLocal() as db:
+                    cache_service = SemanticCacheService(VectorService(SettingsService(db)))
+                    result = await run_maintenance(cache_service, interval_seconds)
+                if result["evicted"] or result["orphans"]:
+                    logger.info(
+                        f"🧹 semantic_cache_maintenance | {result['evicted']} evicted, {result['orphans']} orphans"
+                    )
+            except Exception as e:
+                logger.error(f"⚠️ WARN | semantic_cache_maintenance | Error: {e}")
+    finally:
+        logger.info("🧹 STOP | semantic_cache_maintenance | Loop ended")
+
+
+async def start_semantic_cache_maintenance() -> None:
+    """Start the periodic maintenance task."""
+    global _maintenance_task
+
+    if not settings.SEMANTIC_CACHE_MAINTENANCE_ENABLED:
+        return
+
+    if _maintenance_task is not None and not _maintenance_task.done():
+        logger.warning("Semantic cache maintenance task already running")
+        return
+
+    _maintenance_task = asyncio.create_task(_maintenance_loop(settings.SEMANTIC_CACHE_MAINTENANCE_INTERVAL))
+
+
+async def stop_semantic_cache_maintenance() -> None:
+    """Stop the maintenance task."""
+    global _maintenance_task
+
+    if _maintenance_task is None:
+        return
+
+    _maintenance_task.cancel()
+    try:
+        await _maintenance_task
+    except asyncio.CancelledError:
+        pass
+    _maintenance_task = None
@@ -12,6 +12,7 @@ from app.core.settings import settings as env_settings
 from app.core.utils.model_normalization import normalize_model_name
 from app.models.setting import Setting
 from app.repositories.setting_repository import SettingRepository
+from app.services.query_engine_cache import get_query_engine_cache
 
 logger = logging.getLogger(__name__)
 
@@ -193,6 +194,9 @@ class SettingsService:
             async with self.__class__._cache_lock:
                 self.__class__._cache[key] = setting.value
 
+            # Compiled chat engines hold LLM clients built from these settings (API keys, models)
+            get_query_engine_cache().clear()
+
             return setting
 
         except Exception as e:
@@ -253,6 +257,8 @@ class SettingsService:
                     await self.db.refresh(s)
                     self.__class__._cache[s.key] = s.value
 
+            get_query_engine_cache().clear()
+
             return updated_settings
 
         except Exception as e:
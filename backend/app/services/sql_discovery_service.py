@@ -1,7 +1,7 @@
 import asyncio
 import json
 import logging
-from typing import Annotated, Any, Optional
+from typing import Annotated, Any, Dict, List, Optional
 from uuid import UUID
 
 import pandas as pd
@@ -121,8 +121,11 @@ class VannaQueryEngineWrapper:
                         )
                     logger.info(f"VANNA_QUERY | Synthesizing answer in {'French' if is_french else 'English'}...")
 
-                    # Use Vanna's LLM to generate response
-                    if hasattr(self.vanna.llm, "complete"):
+                    # Use Vanna's LLM to generate response (natively async when possible)
+                    if hasattr(self.vanna.llm, "acomplete"):
+                        llm_response = await self.vanna.llm.acomplete(prompt)
+                        response_text = str(llm_response)
+                    elif hasattr(self.vanna.llm, "complete"):
                         llm_response = self.vanna.llm.complete(prompt)
                         response_text = str(llm_response)
                     elif hasattr(self.vanna.llm, "submit_prompt"):
@@ -330,6 +333,16 @@ class SQLDiscoveryService:
 
     async def get_view_schema_markdown(self, connector: Any, view_name: str) -> str:
         """Generates markdown schema description."""
+        schemas = await self.get_views_schema_markdown(connector, [view_name], concurrency=1)
+        return schemas[view_name]
+
+    async def get_views_schema_markdown(
+        self, connector: Any, view_names: List[str], concurrency: int = 8
+    ) -> Dict[str, str]:
+        """
+        Generates markdown schema descriptions for many views at once.
+        One engine is shared by all views (disposed at the end); up to `concurrency` views are inspected in parallel.
+        """
         config = connector.configuration
         drivername, is_mssql, _, query_params, port = self._detect_db_type(config)
         url = URL.create(
@@ -344,9 +357,17 @@ class SQLDiscoveryService:
         default_schema = "dbo" if is_mssql else "public"
         schema = config.get("schema", default_schema)
 
-        def _get_schema_sync():
+        concurrency = max(1, concurrency)
+        try:
+            engine = create_engine(url, pool_size=concurrency, max_overflow=0)
+        except Exception as e:
+            logger.error(f"SQL_DISCOVERY | Schema extraction failed for {len(view_names)} view(s): {e}")
+            return {name: f"# Table: {name}\n\nSchema info unavailable." for name in view_names}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        def _get_schema_sync(view_name: str) -> str:
             try:
-                engine = create_engine(url)
+                # Inspectors are not thread-safe: one per view, connections come from the shared pool
                 inspector = inspect(engine)
                 columns = inspector.get_columns(view_name, schema=schema)
                 md_lines = [f"# Table: {view_name}", "", "## Columns"]
@@ -357,7 +378,15 @@ class SQLDiscoveryService:
                 logger.error(f"SQL_DISCOVERY | Schema extraction failed for {view_name}: {e}")
                 return f"# Table: {view_name}\n\nSchema info unavailable."
 
-        return await asyncio.to_thread(_get_schema_sync)
+        async def _get_schema(view_name: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(_get_schema_sync, view_name)
+
+        try:
+            results = await asyncio.gather(*(_get_schema(name) for name in view_names))
+            return dict(zip(view_names, results))
+        finally:
+            await asyncio.to_thread(engine.dispose)
 
     async def discover_vanna_tables(self, connector: Any) -> list[dict]:
         """Discovers tables/views for Vanna with full DDL."""
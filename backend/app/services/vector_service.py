@@ -1,9 +1,11 @@
 import asyncio
+import json
 import logging
 import threading
 import time
 import warnings
-from typing import Annotated, Any, Dict, Optional, Type, TypeVar
+from typing import Annotated, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+from uuid import UUID
 
 import qdrant_client
 from fastapi import Depends
@@ -11,6 +13,14 @@ from llama_index.core.base.embeddings.base import BaseEmbedding
 
 from app.core.exceptions import ExternalDependencyError, TechnicalError
 from app.core.settings import get_settings
+from app.core.sparse_encoder import (
+    SPARSE_VECTOR_NAME,
+    encode_document,
+    encode_documents,
+    encode_queries,
+    to_sparse_vector,
+)
+from app.core.vector_profiles import collection_create_params, get_collection_profile, profile_matches
 from app.services.settings_service import SettingsService, get_settings_service
 
 logger = logging.getLogger(__name__)
@@ -18,6 +28,7 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_MODEL_NAME = "bge-m3"
 DEFAULT_EMBEDDING_DIM = 768
+PROFILE_MIGRATION_SYNC_PASSES = 3  # Catch-up passes before the alias swap (each one shortens the next)
 
 # TypeVars for clear generics
 TClient = TypeVar("TClient", bound=qdrant_client.QdrantClient)
@@ -44,6 +55,8 @@ class VectorService:
     _aclient_lock: Optional[asyncio.Lock] = None
     _cache_lock: threading.Lock = threading.Lock()
     _dimension_cache: Dict[str, int] = {}
+    _payload_indexed: Set[Tuple[str, str]] = set()  # (collection, field) indexes ensured by this process
+    _sparse_collections: Dict[str, bool] = {}  # collection -> declares the BM25 sparse vector
 
     @classmethod
     def _is_loop_alive(cls, lock: Optional[asyncio.Lock]) -> bool:
@@ -279,28 +292,186 @@ class VectorService:
         client = await self.get_async_qdrant_client()
 
         try:
-            exists = await client.collection_exists(collection_name)
+            exists = await self.collection_exists(collection_name)
             if exists:
+                await self.ensure_payload_indexes(collection_name)
                 return
 
             # Dynamic Dimension Detection (Probe Embedding)
             dimension = await self._detect_dimension(provider)
-            logger.info(f"Creating collection '{collection_name}' with detected dim={dimension}")
-
-            from qdrant_client.http import models as qmodels
+            profile = get_collection_profile(collection_name)
+            logger.info(f"Creating collection '{collection_name}' with detected dim={dimension}, profile={profile}")
 
             await client.create_collection(
-                collection_name=collection_name,
-                vectors_config=qmodels.VectorParams(size=dimension, distance=qmodels.Distance.COSINE),
+                collection_name=collection_name, **collection_create_params(collection_name, dimension)
             )
+            VectorService._sparse_collections.pop(collection_name, None)
+            await self.ensure_payload_indexes(collection_name)
         except Exception as e:
             logger.error(f"Failed to ensure collection {collection_name} exists: {e}", exc_info=True)
             raise TechnicalError(f"Vector database collection initialization failed: {e}")
 
+    async def collection_exists(self, collection_name: str) -> bool:
+        """True if the collection exists, directly or as an alias (collections rebuilt by the profile migration)."""
+        from app.repositories.vector_repository import VectorRepository
+
+        client = await self.get_async_qdrant_client()
+        if await client.collection_exists(collection_name):
+            return True
+        return await VectorRepository(client).get_alias_target(collection_name) is not None
+
+    async def has_sparse_vectors(self, collection_name: str) -> bool:
+        """
+        True if the collection declares the BM25 sparse vector (hybrid search). Collections created before
+        hybrid search stay dense-only until rebuilt by the profile migration.
+        """
+        if not self.env_settings.HYBRID_SEARCH_ENABLED:
+            return False
+
+        cached = VectorService._sparse_collections.get(collection_name)
+        if cached is not None:
+            return cached
+
+        from app.repositories.vector_repository import VectorRepository
+
+        try:
+            info = await VectorRepository(await self.get_async_qdrant_client()).get_collection_info(collection_name)
+        except Exception as e:
+            logger.warning(f"Sparse vector detection failed for {collection_name}: {e}")
+            return False
+
+        sparse = SPARSE_VECTOR_NAME in (info.config.params.sparse_vectors or {})
+        VectorService._sparse_collections[collection_name] = sparse
+        return sparse
+
+    async def sparse_store_kwargs(self, collection_name: str) -> Dict[str, Any]:
+        """QdrantVectorStore arguments writing BM25 sparse vectors next to the dense ones (if the collection has them)."""
+        if not await self.has_sparse_vectors(collection_name):
+            return {}
+        return {
+            "enable_hybrid": True,
+            "sparse_doc_fn": encode_documents,
+            "sparse_query_fn": encode_queries,
+            "sparse_vector_name": SPARSE_VECTOR_NAME,
+        }
+
+    async def ensure_payload_indexes(
+        self, collection_name: str, schema: Optional[Dict[str, Any]] = None, wait: bool = True
+    ) -> None:
+        """
+        Creates the payload indexes of a collection (system fields by default, or the given {field: schema}).
+        Fields already ensured by this process are skipped; failures are logged and retried on the next call
+        (filters still work without an index, through a full payload scan).
+        """
+        from app.repositories.vector_repository import SYSTEM_PAYLOAD_INDEXES, VectorRepository
+
+        schema = SYSTEM_PAYLOAD_INDEXES if schema is None else schema
+        missing = {field: t for field, t in schema.items() if (collection_name, field) not in self._payload_indexed}
+        if not missing:
+            return
+
+        try:
+            repo = VectorRepository(await self.get_async_qdrant_client())
+            await repo.create_payload_indexes(collection_name, missing, wait=wait)
+            VectorService._payload_indexed.update((collection_name, field) for field in missing)
+        except Exception as e:
+            logger.warning(f"Payload index creation failed for {collection_name}: {e}")
+
+    async def migrate_payload_indexes(self) -> int:
+        """
+        Creates the missing system payload indexes on every existing collection.
+        Indexes are built by Qdrant in the background (wait=False).
+
+        Returns:
+            Number of collections processed
+        """
+        from app.repositories.vector_repository import VectorRepository
+
+        repo = VectorRepository(await self.get_async_qdrant_client())
+        collections = await repo.list_collections()
+        for collection_name in collections:
+            await self.ensure_payload_indexes(collection_name, wait=False)
+        return len(collections)
+
+    async def migrate_collection_profile(self, collection_name: str) -> bool:
+        """
+        Rebuilds a collection under its configured storage profile, without downtime for reads.
+
+        1. A new physical collection `<name>__<profile>_<timestamp>` is created with the profile
+           and the payload indexes of the current one.
+        2. Points are copied while the current collection keeps serving queries and ingestion, then
+           catch-up passes copy the points added or modified (payload fingerprint) and drop the points
+           deleted during the copy, until a pass finds nothing left or PROFILE_MIGRATION_SYNC_PASSES is reached.
+           With hybrid search enabled, BM25 sparse vectors are computed from the point text on the way.
+        3. `collection_name` becomes an alias of the new collection. When it already was one, writes that
+           reached the old collection during the swap are drained into the new one before the old one is
+           dropped. A real collection is replaced instead (see VectorRepository.replace_collection_with_alias):
+           it cannot be drained, so a write landing between its last catch-up pass and the drop is lost
+           (only the first migration of a collection takes this path).
+
+        Returns:
+            True if the collection was rebuilt, False if it already matches its profile
+        """
+        from app.repositories.vector_repository import VectorRepository
+
+        repo = VectorRepository(await self.get_async_qdrant_client())
+        info = await repo.get_collection_info(collection_name)
+        if profile_matches(collection_name, info):
+            return False
+
+        profile = get_collection_profile(collection_name)
+        previous = await repo.get_alias_target(collection_name) or collection_name
+        target = f"{collection_name}__{profile}_{int(time.time())}"
+        dimension = info.config.params.vectors.size
+        logger.info(f"PROFILE_MIGRATION | {collection_name} ({previous}) -> {target} | Profile: {profile}")
+
+        client = await self.get_async_qdrant_client()
+        await client.create_collection(collection_name=target, **collection_create_params(collection_name, dimension))
+        await repo.create_payload_indexes(target, await repo.get_payload_schema(previous))
+
+        vector_fn = _with_sparse_vector if self.env_settings.HYBRID_SEARCH_ENABLED else None
+        copied = await repo.copy_points(previous, target, vector_fn=vector_fn)
+        caught_up = 0
+        for _ in range(PROFILE_MIGRATION_SYNC_PASSES):
+            changed, snapshot = await repo.sync_points(previous, target, vector_fn=vector_fn)
+            caught_up += changed
+            if not changed:
+                break
+
+        if previous == collection_name:
+            await repo.replace_collection_with_alias(collection_name, target, vector_fn=vector_fn)
+        else:
+            await repo.swap_collection_alias(collection_name, target)
+            caught_up += await repo.drain_points(previous, target, snapshot, vector_fn=vector_fn)
+            await client.delete_collection(previous)
+        VectorService._sparse_collections.pop(collection_name, None)
+
+        logger.info(f"PROFILE_MIGRATION | {collection_name} now serves {target} | {copied} copied, {caught_up} synced")
+        return True
+
+    async def migrate_collection_profiles(self) -> List[str]:
+        """
+        Rebuilds every provider collection whose storage profile changed (one at a time).
+
+        Returns:
+            Collections rebuilt
+        """
+        rebuilt = []
+        for provider in ("openai", "gemini", "ollama"):
+            collection_name = await self.get_collection_name(provider)
+            try:
+                if not await self.collection_exists(collection_name):
+                    continue
+                if await self.migrate_collection_profile(collection_name):
+                    rebuilt.append(collection_name)
+            except Exception as e:
+                logger.error(f"PROFILE_MIGRATION | {collection_name} failed: {e}", exc_info=True)
+        return rebuilt
+
     async def _detect_dimension(self, provider: str) -> int:
         """Dynamically detects the dimension of an embedding model using a probe."""
         provider = provider.lower().strip()
-        
+
         # Check cache
         if provider in VectorService._dimension_cache:
             return VectorService._dimension_cache[provider]
@@ -308,14 +479,14 @@ class VectorService:
         try:
             logger.info(f"Probe | Detecting dimension for provider: {provider}")
             model = await self.get_embedding_model(provider=provider)
-            
+
             # Use a dummy string to get a real vector
             probe_vector = await model.aget_text_embedding("probe")
             dim = len(probe_vector)
-            
+
             with VectorService._cache_lock:
                 VectorService._dimension_cache[provider] = dim
-                
+
             logger.info(f"Probe | Detected dimension: {dim} for {provider}")
             return dim
         except Exception as e:
@@ -359,6 +530,56 @@ class VectorService:
         await repo.delete_by_document_id(collection_name, document_id)
         logger.info(f"DELETED | Document vectors | {document_id}")
 
+    async def set_document_status(
+        self, document_ids: Iterable[UUID], status: str, provider: Optional[str] = None
+    ) -> None:
+        """Mirror a document status transition into the payload of the documents' vectors."""
+        document_ids = list(document_ids)
+        if not document_ids:
+            return
+        collection_name = await self.get_collection_name(provider)
+        client = await self.get_async_qdrant_client()
+        from app.repositories.vector_repository import VectorRepository
+
+        repo = VectorRepository(client)
+        await repo.set_document_status(collection_name, document_ids, status)
+
+    async def reconcile_document_status(self, is_indexed: Callable[[UUID], bool]) -> int:
+        """
+        Repairs documents hidden from search by a lost status mirror: points whose doc_status says
+        non-indexed while the database (is_indexed) says INDEXED are set back to indexed.
+        The other direction is harmless, search post-filters candidates on the database status.
+
+        Returns:
+            Number of documents repaired
+        """
+        from app.repositories.vector_repository import NON_SEARCHABLE_STATUSES, VectorRepository
+        from app.schemas.enums import DocStatus
+
+        repo = VectorRepository(await self.get_async_qdrant_client())
+        repaired = 0
+        for provider in ("openai", "gemini", "ollama"):
+            collection_name = await self.get_collection_name(provider)
+            if not await self.collection_exists(collection_name):
+                continue
+            hidden = await repo.get_document_ids_by_status(collection_name, NON_SEARCHABLE_STATUSES)
+            stale = [doc_id for doc_id in map(UUID, hidden) if is_indexed(doc_id)]
+            if stale:
+                await repo.set_document_status(collection_name, stale, DocStatus.INDEXED.value)
+                logger.warning(f"STATUS_RECONCILE | {collection_name} | {len(stale)} indexed document(s) unhidden")
+                repaired += len(stale)
+        return repaired
+
+    async def set_connector_active(self, connector_id: UUID, is_active: bool, provider: Optional[str] = None) -> None:
+        """Mirror the connector enabled flag into the payload of all its vectors."""
+        collection_name = await self.get_collection_name(provider)
+        client = await self.get_async_qdrant_client()
+        from app.repositories.vector_repository import VectorRepository
+
+        repo = VectorRepository(client)
+        await repo.set_connector_active(collection_name, connector_id, is_active)
+        logger.info(f"UPDATED | Connector active flag | {connector_id} -> {is_active}")
+
     async def update_connector_acl(self, connector_id: str, new_acl: Any, provider: Optional[str] = None) -> None:
         """Update ACLs for all connector vectors."""
         collection_name = await self.get_collection_name(provider)
@@ -427,6 +648,19 @@ class VectorService:
         return index.as_query_engine(**kwargs)
 
 
+def _with_sparse_vector(point: Any) -> Dict[str, Any]:
+    """Vectors of a copied point with its BM25 sparse vector computed from the node text (profile migration)."""
+    vectors = dict(point.vector) if isinstance(point.vector, dict) else {"": point.vector}
+    payload = point.payload or {}
+    text = payload.get("text") or payload.get("content") or ""
+    try:
+        text = json.loads(payload["_node_content"]).get("text") or text
+    except (KeyError, TypeError, ValueError):
+        pass
+    vectors[SPARSE_VECTOR_NAME] = to_sparse_vector(encode_document(text))
+    return vectors
+
+
 async def get_vector_service(
     settings_service: Annotated[SettingsService, Depends(get_settings_service)],
 ) -> VectorService:
@@ -77,6 +77,7 @@ class SearchResult(BaseModel):
     score: Annotated[float, Field(ge=0.0, le=1.0)] = Field(..., description="Similarity score between 0 and 1")
     content: str = Field(..., min_length=1, max_length=100000, description="Document content")
     metadata: SearchMetadata = Field(default_factory=SearchMetadata, description="Document metadata")
+    fused: bool = Field(default=False, description="Score is a normalized rank-fusion score, not a similarity")
 
 
 class SearchStrategyError(Exception):
@@ -6,10 +6,15 @@ from uuid import UUID
 from pydantic import Field
 from qdrant_client.http import models
 
+from app.core.settings import settings
+from app.core.sparse_encoder import encode_query, to_sparse_vector
+from app.core.vector_profiles import search_params
 from app.models.enums import ConnectorStatus
 from app.repositories.connector_repository import ConnectorRepository
 from app.repositories.document_repository import DocumentRepository
 from app.repositories.vector_repository import VectorRepository
+from app.services.chat.embedding_memo import embed_query
+from app.services.document_status_index import DocumentStatusIndex, get_document_status_index
 from app.services.vector_service import VectorService
 from app.strategies.search.base import (
     DEFAULT_TOP_K,
@@ -25,19 +30,18 @@ from app.strategies.search.base import (
 logger = logging.getLogger(__name__)
 
 # Constants
-CANDIDATE_MULTIPLIER = 2  # Fetch 2x candidates for post-filtering
 DEFAULT_COLLECTION = "vectra_vectors"  # Fallback
 
 
 class HybridStrategy(SearchStrategy):
     """
-    Hybrid search combining vector similarity and SQL metadata filtering.
+    Hybrid search combining dense + BM25 lexical retrieval and metadata filtering.
 
     ARCHITECT NOTE: Pipeline Execution
     1. Resolve Collection (via Connector)
-    2. Vectorize Query (via VectorService)
-    3. Retrieval (Qdrant)
-    4. Metadata Filtering (PostgreSQL) - Critical for status enforcement
+    2. Vectorize Query (dense via VectorService, sparse via the local BM25 encoder)
+    3. Retrieval (Qdrant, dense and sparse prefetch fused by RRF in one call)
+    4. Metadata Filtering (DocumentStatusIndex, PostgreSQL when cold) - Critical for status enforcement
     5. Fusion/Ranking
     """
 
@@ -47,6 +51,7 @@ class HybridStrategy(SearchStrategy):
         document_repo: DocumentRepository,
         connector_repo: ConnectorRepository,
         vector_service: VectorService,
+        status_index: Optional[DocumentStatusIndex] = None,
     ):
         """
         Initialize with all required dependencies for hybrid RAG.
@@ -56,6 +61,7 @@ class HybridStrategy(SearchStrategy):
         self.document_repo = document_repo
         self.connector_repo = connector_repo
         self.vector_service = vector_service
+        self.status_index = status_index or get_document_status_index()
 
     async def search(
         self,
@@ -77,7 +83,7 @@ class HybridStrategy(SearchStrategy):
                 self._log_search_complete(0, 0)
                 return []
 
-            # 2. Build Pre-Filter (ACLs only for Qdrant)
+            # 2. Build Pre-Filter (document lifecycle + ACLs, enforced by Qdrant)
             qdrant_filter = self._build_qdrant_filter(filters)
 
             # 3. Query all collections in parallel
@@ -87,7 +93,7 @@ class HybridStrategy(SearchStrategy):
                     collection_name=coll_info["name"],
                     provider=coll_info["provider"],
                     query=query,
-                    top_k=top_k * CANDIDATE_MULTIPLIER,
+                    top_k=top_k,  # Non-indexed documents are filtered server-side, no over-fetch
                     qdrant_filter=qdrant_filter,
                 )
                 search_tasks.append(task)
@@ -106,11 +112,11 @@ class HybridStrategy(SearchStrategy):
                 self._log_search_complete(0, 0)
                 return []
 
-            # 5. SQL Post-Filtering (P0 Security: Enforce current DB status)
+            # 5. Status Post-Filtering (P0 Security: Enforce current DB status, also covers payloads not mirrored yet)
             effective_filters = filters or SearchFilters()
             merged_results = await self._apply_sql_filters(merged_results, effective_filters)
 
-            # 6. Sort and Limit
+            # 6. Sort and Limit (stable: the results of one collection already come in score order)
             merged_results.sort(key=lambda x: x.score, reverse=True)
             final_results = merged_results[:top_k]
 
@@ -128,18 +134,28 @@ class HybridStrategy(SearchStrategy):
     ) -> list[SearchResult]:
         """
         Search a single collection with provider-specific embeddings.
+        Collections declaring the BM25 sparse vector are searched dense + lexical, fused by RRF in Qdrant.
         """
         try:
             embedding_model = await self.vector_service.get_embedding_model(provider=provider)
-            query_vector = await embedding_model.aget_query_embedding(query)
+            # Memoized per chat request: collections sharing a provider embed the query once
+            query_vector = await embed_query(embedding_model, query)
+
+            sparse_vector = None
+            if await self.vector_service.has_sparse_vectors(collection_name):
+                sparse_vector = to_sparse_vector(encode_query(query))
 
             candidates = await self.vector_repo.search(
                 collection_name=collection_name,
                 query_vector=query_vector,
                 limit=top_k,
                 query_filter=qdrant_filter,
+                search_params=search_params(collection_name),
                 with_payload=True,
                 with_vectors=False,
+                sparse_vector=sparse_vector,
+                prefetch_limit=top_k * settings.HYBRID_PREFETCH_MULTIPLIER,
+                rrf_k=settings.HYBRID_RRF_K,
             )
 
             results = []
@@ -158,6 +174,7 @@ class HybridStrategy(SearchStrategy):
                         SearchResult(
                             document_id=doc_id,
                             score=hit.score,
+                            fused=sparse_vector is not None and bool(sparse_vector.indices),
                             content=content[:100000],
                             metadata=SearchMetadata(
                                 file_name=payload.get("file_name"),
@@ -219,7 +236,15 @@ class HybridStrategy(SearchStrategy):
         if not results:
             return []
 
-        # 1. Batch fetch from SQL (P1: Optimization)
+        # Only INDEXED documents are ever returned, so any other explicit status filter matches nothing
+        if filters.status and filters.status.upper() != "INDEXED":
+            return []
+
+        # 1. Warm index: O(1) membership per candidate, no database round trip
+        if self.status_index.is_warm:
+            return [res for res in results if self.status_index.is_indexed(res.document_id)]
+
+        # 2. Cold index: batch fetch from SQL (P1: Optimization)
         doc_ids = [r.document_id for r in results]
         db_docs = await self.document_repo.get_by_ids(doc_ids)
 
@@ -232,14 +257,9 @@ class HybridStrategy(SearchStrategy):
             if not doc:
                 continue
 
-            # 2. Status Enforcement
-            # Default to INDEXED if status check is desired but status filter not explicitly set,
-            # but usually we only filter if filters.status is present.
-            if filters.status and doc.status != filters.status:
-                continue
-
             # P1 Security: Ensure we only return indexed content by default in prod
-            if doc.status not in ["INDEXED"]:
+            # (DocStatus values are lowercase, SearchFilters.status is uppercase)
+            if str(doc.status).upper() != "INDEXED":
                 logger.debug(f"Skipping doc {doc.id} with status {doc.status}")
                 continue
 
@@ -251,11 +271,10 @@ class HybridStrategy(SearchStrategy):
     def strategy_name(self) -> str:
         return "Hybrid"
 
-    def _build_qdrant_filter(self, filters: Optional[SearchFilters]) -> Optional[models.Filter]:
-        """Construct Qdrant Filter for ACL pre-filtering."""
-        if not filters or not filters.user_acl:
-            return None
+    def _build_qdrant_filter(self, filters: Optional[SearchFilters]) -> models.Filter:
+        """Construct Qdrant Filter for document lifecycle (doc_status / is_active) and ACL pre-filtering."""
+        must = []
+        if filters and filters.user_acl:
+            must.append(models.FieldCondition(key="connector_acl", match=models.MatchAny(any=filters.user_acl)))
 
-        return models.Filter(
-            must=[models.FieldCondition(key="connector_acl", match=models.MatchAny(any=filters.user_acl))]
-        )
+        return VectorRepository.build_search_filter(must)
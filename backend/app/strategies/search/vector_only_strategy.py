@@ -6,8 +6,10 @@ from uuid import UUID
 from pydantic import Field
 from qdrant_client.http import models
 
+from app.core.vector_profiles import search_params
 from app.repositories.connector_repository import ConnectorRepository
 from app.repositories.vector_repository import VectorRepository
+from app.services.chat.embedding_memo import embed_query
 from app.services.vector_service import VectorService
 from app.strategies.search.base import (
     DEFAULT_TOP_K,
@@ -71,7 +73,7 @@ class VectorOnlyStrategy(SearchStrategy):
                 self._log_search_complete(0, 0)
                 return []
 
-            # 2. Build Pre-Filter (ACLs only)
+            # 2. Build Pre-Filter (document lifecycle + ACLs)
             qdrant_filter = self._build_qdrant_filter(filters)
 
             # 3. Query all collections in parallel
@@ -121,13 +123,15 @@ class VectorOnlyStrategy(SearchStrategy):
         """
         try:
             embedding_model = await self.vector_service.get_embedding_model(provider=provider)
-            query_vector = await embedding_model.aget_query_embedding(query)
+            # Memoized per chat request: collections sharing a provider embed the query once
+            query_vector = await embed_query(embedding_model, query)
 
             candidates = await self.vector_repo.search(
                 collection_name=collection_name,
                 query_vector=query_vector,
                 limit=top_k,
                 query_filter=qdrant_filter,
+                search_params=search_params(collection_name),
                 with_payload=True,
                 with_vectors=False,
             )
@@ -205,11 +209,10 @@ class VectorOnlyStrategy(SearchStrategy):
     def strategy_name(self) -> str:
         return "VectorOnly"
 
-    def _build_qdrant_filter(self, filters: Optional[SearchFilters]) -> Optional[models.Filter]:
-        """Construct Qdrant Filter for ACL pre-filtering."""
-        if not filters or not filters.user_acl:
-            return None
+    def _build_qdrant_filter(self, filters: Optional[SearchFilters]) -> models.Filter:
+        """Construct Qdrant Filter for document lifecycle (doc_status / is_active) and ACL pre-filtering."""
+        must = []
+        if filters and filters.user_acl:
+            must.append(models.FieldCondition(key="connector_acl", match=models.MatchAny(any=filters.user_acl)))
 
-        return models.Filter(
-            must=[models.FieldCondition(key="connector_acl", match=models.MatchAny(any=filters.user_acl))]
-        )
+        return VectorRepository.build_search_filter(must)
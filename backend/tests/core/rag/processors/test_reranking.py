@@ -2,10 +2,19 @@ import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from app.core.rag.processors.reranking import RerankingProcessor
+from app.core.rag.rerank_batcher import get_rerank_batcher
 from app.core.rag.types import PipelineContext, PipelineEvent
 from llama_index.core.schema import NodeWithScore, TextNode
 
 
+@pytest.fixture(autouse=True)
+def clear_rerank_cache():
+    # The score cache is shared across requests (and tests)
+    get_rerank_batcher().cache.clear()
+    yield
+    get_rerank_batcher().cache.clear()
+
+
 @pytest.fixture
 def mock_ctx():
     assistant = MagicMock()
@@ -115,3 +124,45 @@ async def test_reranking_cutoff_filtering(mock_ctx):
 
     assert len(mock_ctx.retrieved_nodes) == 1
     assert mock_ctx.retrieved_nodes[0].node.text == "doc1"
+
+
+@pytest.mark.asyncio
+async def test_reranking_reuses_cached_scores(mock_ctx):
+    processor = RerankingProcessor()
+    mock_cohere = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.results = [
+        MagicMock(index=0, relevance_score=0.9),
+        MagicMock(index=1, relevance_score=0.8),
+        MagicMock(index=2, relevance_score=0.1),
+    ]
+    mock_cohere.rerank.return_value = mock_result
+    nodes = list(mock_ctx.retrieved_nodes)
+
+    with patch("app.factories.rerank_factory.RerankProviderFactory.create_reranker", return_value=mock_cohere):
+        async for _ in processor.process(mock_ctx):
+            pass
+        mock_ctx.retrieved_nodes = nodes
+        async for _ in processor.process(mock_ctx):
+            pass
+
+    # Second request served from the score cache
+    assert mock_cohere.rerank.await_count == 1
+    assert [n.node.text for n in mock_ctx.retrieved_nodes] == ["doc1", "doc2"]
+
+
+@pytest.mark.asyncio
+async def test_reranking_local_provider(mock_ctx):
+    processor = RerankingProcessor()
+    mock_ctx.assistant.rerank_provider = "local"
+
+    local = MagicMock(spec=["rerank_pairs", "model_name"])
+    local.model_name = "test-model"
+    local.rerank_pairs.return_value = [0.2, 0.9, 0.7]
+
+    with patch("app.factories.rerank_factory.RerankProviderFactory.create_reranker", return_value=local):
+        async for _ in processor.process(mock_ctx):
+            pass
+
+    assert [n.node.text for n in mock_ctx.retrieved_nodes] == ["doc2", "doc3"]
+    assert mock_ctx.retrieved_nodes[0].score == 0.9
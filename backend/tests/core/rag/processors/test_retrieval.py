@@ -80,6 +80,23 @@ async def test_retrieval_cutoff_filtering(mock_ctx):
     assert mock_ctx.retrieved_nodes[0].node.get_content() == "above"
 
 
+@pytest.mark.asyncio
+async def test_retrieval_cutoff_does_not_apply_to_rank_fused_scores(mock_ctx):
+    processor = RetrievalProcessor()
+
+    # Hybrid hit found by the lexical branch only (exact part number): low fused score, still relevant
+    results = [
+        SearchResult(document_id="00000000-0000-0000-0000-000000000001", score=0.49, content="PN-4711", fused=True),
+        SearchResult(document_id="00000000-0000-0000-0000-000000000002", score=0.3, content="dense"),
+    ]
+    mock_ctx.search_strategy.search.return_value = results
+
+    async for _ in processor.process(mock_ctx):
+        pass
+
+    assert [n.node.get_content() for n in mock_ctx.retrieved_nodes] == ["PN-4711"]
+
+
 @pytest.mark.asyncio
 async def test_retrieval_error_handling(mock_ctx):
     processor = RetrievalProcessor()
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.rag.rerank_batcher import RerankBatcher, RerankScoreCache
+
+
+def _pairs_reranker():
+    reranker = MagicMock(spec=["rerank_pairs"])
+    reranker.rerank_pairs.side_effect = lambda pairs, batch_size: [float(len(doc)) for _, doc in pairs]
+    return reranker
+
+
+@pytest.mark.asyncio
+async def test_concurrent_jobs_share_one_forward_pass():
+    batcher = RerankBatcher(window_ms=50)
+    reranker = _pairs_reranker()
+
+    first, second = await asyncio.gather(
+        batcher.score_local(reranker, "local:test", "q1", ["a", "bb"]),
+        batcher.score_local(reranker, "local:test", "q2", ["ccc"]),
+    )
+
+    assert first == [1.0, 2.0]
+    assert second == [3.0]
+    reranker.rerank_pairs.assert_called_once()
+    assert reranker.rerank_pairs.call_args.args[0] == [("q1", "a"), ("q1", "bb"), ("q2", "ccc")]
+    assert batcher.get_stats()["avg_jobs_per_batch"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_pairs_skip_the_reranker():
+    batcher = RerankBatcher(window_ms=1)
+    score_fn = AsyncMock(side_effect=lambda query, docs: [0.5] * len(docs))
+
+    await batcher.score("cohere:m", "q", ["a", "b"], score_fn)
+    scores = await batcher.score("cohere:m", "q", ["b", "c"], score_fn)
+
+    assert scores == [0.5, 0.5]
+    # Only the unseen document is scored the second time
+    assert score_fn.await_args_list[1].args == ("q", ["c"])
+    # Namespaces (reranker models) do not share scores
+    await batcher.score("cohere:other", "q", ["a"], score_fn)
+    assert score_fn.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_unscored_documents_are_not_cached():
+    batcher = RerankBatcher(window_ms=1)
+    score_fn = AsyncMock(return_value=[0.9, None])
+
+    assert await batcher.score("cohere:m", "q", ["a", "b"], score_fn) == [0.9, None]
+    assert batcher.cache.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rerank_dict_results_fallback():
+    batcher = RerankBatcher(window_ms=1)
+    reranker = MagicMock(spec=["rerank"])
+    reranker.rerank.return_value = [{"index": 1, "score": 0.8}, {"index": 0, "score": 0.1}]
+
+    assert await batcher.score_local(reranker, "local:test", "q", ["a", "b"]) == [0.1, 0.8]
+
+
+@pytest.mark.asyncio
+async def test_reranker_error_is_raised_to_callers():
+    batcher = RerankBatcher(window_ms=1)
+    reranker = MagicMock(spec=["rerank_pairs"])
+    reranker.rerank_pairs.side_effect = RuntimeError("onnx")
+
+    with pytest.raises(RuntimeError):
+        await batcher.score_local(reranker, "local:test", "q", ["a"])
+    assert batcher.cache.stats()["entries"] == 0
+
+
+def test_score_cache_lru_and_ttl():
+    cache = RerankScoreCache(max_entries=2, ttl_seconds=60)
+    keys = RerankScoreCache.keys("ns", "q", ["a", "b", "c"])
+
+    cache.put_many({keys[0]: 0.1, keys[1]: 0.2})
+    cache.get_many([keys[0]])
+    cache.put_many({keys[2]: 0.3})
+    assert cache.get_many(keys) == [0.1, None, 0.3]
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get_many([keys[0]]) == [None]
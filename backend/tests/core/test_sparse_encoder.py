@@ -0,0 +1,42 @@
+from app.core.sparse_encoder import encode_document, encode_documents, encode_query, tokenize
+
+
+def test_tokenize_keeps_codes_whole_and_split():
+    assert tokenize("Error E-4012 on part AB_77.x") == [
+        "error",
+        "e-4012",
+        "e",
+        "4012",
+        "part",
+        "ab_77.x",
+        "ab",
+        "77",
+        "x",
+    ]
+
+
+def test_tokenize_folds_case_and_accents_and_drops_stopwords():
+    assert tokenize("Le Réglage de la Pompe") == tokenize("reglage pompe") == ["reglage", "pompe"]
+
+
+def test_document_weights_saturate_with_term_frequency():
+    indices, values = encode_document("pump pump pump pump valve")
+    weights = dict(zip(indices, values))
+    (pump,), _ = encode_query("pump")
+    (valve,), _ = encode_query("valve")
+
+    assert weights[pump] > weights[valve]
+    assert weights[pump] < 4 * weights[valve]
+
+
+def test_query_counts_each_token_once_and_matches_document_ids():
+    indices, values = encode_query("pump pump valve")
+    doc_indices, _ = encode_document("valve for the pump")
+
+    assert len(indices) == 2
+    assert values == [1.0, 1.0]
+    assert set(indices) == set(doc_indices)
+
+
+def test_batch_encoder_handles_empty_texts():
+    assert encode_documents(["", "the"]) == ([[], []], [[], []])
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pytest
+from qdrant_client.http import models as qmodels
+
+from app.core import vector_profiles
+from app.core.sparse_encoder import SPARSE_VECTOR_NAME
+from app.core.vector_profiles import collection_create_params, get_collection_profile, profile_matches, search_params
+
+
+@pytest.fixture
+def profiles(monkeypatch):
+    monkeypatch.setattr(vector_profiles.settings, "VECTOR_STORAGE_PROFILE", "default")
+    monkeypatch.setattr(vector_profiles.settings, "VECTOR_STORAGE_PROFILES", {"documents_gemini": "int8_on_disk"})
+    monkeypatch.setattr(vector_profiles.settings, "VECTOR_HNSW_M", 32)
+    monkeypatch.setattr(vector_profiles.settings, "VECTOR_HNSW_EF_CONSTRUCT", 200)
+    monkeypatch.setattr(vector_profiles.settings, "VECTOR_QUANTIZATION_OVERSAMPLING", 3.0)
+    monkeypatch.setattr(vector_profiles.settings, "HYBRID_SEARCH_ENABLED", True)
+
+
+def _info(quantized: bool, on_disk: bool, m: int = 32, ef_construct: int = 200, sparse: bool = True):
+    return SimpleNamespace(
+        config=SimpleNamespace(
+            params=SimpleNamespace(
+                vectors=qmodels.VectorParams(size=8, distance="Cosine", on_disk=on_disk),
+                sparse_vectors={SPARSE_VECTOR_NAME: object()} if sparse else None,
+            ),
+            quantization_config=object() if quantized else None,
+            hnsw_config=SimpleNamespace(m=m, ef_construct=ef_construct),
+        )
+    )
+
+
+def test_profile_is_selected_per_collection(profiles):
+    assert get_collection_profile("documents_gemini") == "int8_on_disk"
+    assert get_collection_profile("documents_openai") == "default"
+
+
+def test_quantized_on_disk_create_params(profiles):
+    params = collection_create_params("documents_gemini", 768)
+
+    assert params["vectors_config"].size == 768
+    assert params["vectors_config"].on_disk is True
+    assert params["hnsw_config"].m == 32
+    assert params["hnsw_config"].ef_construct == 200
+    scalar = params["quantization_config"].scalar
+    assert scalar.type == qmodels.ScalarType.INT8
+    assert scalar.always_ram is True
+
+
+def test_default_profile_keeps_float_vectors_in_ram(profiles):
+    params = collection_create_params("documents_openai", 1536)
+
+    assert params["vectors_config"].on_disk is False
+    assert "quantization_config" not in params
+    assert search_params("documents_openai") is None
+
+
+def test_quantized_profile_rescores_with_oversampling(profiles):
+    params = search_params("documents_gemini")
+
+    assert params.quantization.rescore is True
+    assert params.quantization.oversampling == 3.0
+
+
+def test_profile_matches_compares_storage_layout(profiles):
+    assert profile_matches("documents_gemini", _info(quantized=True, on_disk=True))
+    assert not profile_matches("documents_gemini", _info(quantized=False, on_disk=False))
+    assert profile_matches("documents_openai", _info(quantized=False, on_disk=False))
+    assert not profile_matches("documents_openai", _info(quantized=False, on_disk=False, m=16))
+
+
+def test_hybrid_collections_declare_the_bm25_sparse_vector(profiles):
+    sparse = collection_create_params("documents_openai", 1536)["sparse_vectors_config"][SPARSE_VECTOR_NAME]
+
+    assert sparse.modifier == qmodels.Modifier.IDF
+    assert not profile_matches("documents_openai", _info(quantized=False, on_disk=False, sparse=False))
@@ -0,0 +1,124 @@
+import asyncio
+import io
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.core.exceptions import TechnicalError
+from app.factories.processors.archive_processor import ArchiveProcessor
+from app.factories.processors.base import FileProcessor, ProcessedDocument
+from app.factories.processors.text_processor import TextProcessor
+from app.services.ingestion.extraction_executor import ExtractionExecutor
+
+
+class _SpooledProcessor(FileProcessor):
+    """Path-only processor recording the files it saw and its peak concurrency."""
+
+    def __init__(self):
+        super().__init__()
+        self.seen_paths = []
+        self.active = 0
+        self.peak = 0
+
+    async def process(self, file_path, ai_provider=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            path = Path(file_path)
+            self.seen_paths.append(path)
+            content = path.read_bytes().decode()
+            await asyncio.sleep(0.01)
+            if content == "boom":
+                raise ValueError("corrupted member")
+            return [ProcessedDocument(content=content, metadata={"file_name": path.name})]
+        finally:
+            self.active -= 1
+
+    def get_supported_extensions(self):
+        return ["bin"]
+
+
+def _make_zip(path: Path, members: dict) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+@pytest.fixture
+def spooled():
+    processor = _SpooledProcessor()
+    text = TextProcessor()
+
+    def get_processor(ext):
+        return text if ext == "txt" else processor
+
+    with (
+        patch("app.factories.ingestion_factory.IngestionFactory.get_processor", side_effect=get_processor),
+        patch(
+            "app.services.ingestion.extraction_executor.get_extraction_executor",
+            return_value=ExtractionExecutor(max_workers=0, timeout_seconds=10),
+        ),
+    ):
+        yield processor
+
+
+@pytest.mark.asyncio
+async def test_stream_capable_members_are_not_spooled(tmp_path, spooled):
+    archive = _make_zip(tmp_path / "a.zip", {"docs/readme.txt": "hello", ".hidden.txt": "x", "noext": "y"})
+
+    with patch.object(ArchiveProcessor, "_spool_member") as spool:
+        docs = await ArchiveProcessor().process(str(archive))
+
+    spool.assert_not_called()
+    assert [d.content for d in docs] == ["hello"]
+    assert docs[0].metadata["archive_source"] == "a.zip"
+    assert docs[0].metadata["original_filename"] == "readme.txt"
+    assert docs[0].metadata["archive_path"] == "docs/readme.txt"
+
+
+@pytest.mark.asyncio
+async def test_members_are_spooled_individually_and_processed_concurrently(tmp_path, spooled):
+    members = {f"dir/file{i}.bin": f"content {i}" for i in range(10)}
+    members["dir/bad.bin"] = "boom"
+    archive = _make_zip(tmp_path / "b.zip", members)
+
+    docs = await ArchiveProcessor().process(str(archive))
+
+    # Archive order is preserved and the failing member is skipped
+    assert [d.content for d in docs] == [f"content {i}" for i in range(10)]
+    assert 1 < spooled.peak <= ArchiveProcessor.MAX_CONCURRENT_MEMBERS
+    # Original names are kept and spooled files are cleaned up
+    assert docs[0].metadata["file_name"] == "file0.bin"
+    assert not any(p.exists() for p in spooled.seen_paths)
+
+
+@pytest.mark.asyncio
+async def test_file_count_limit(tmp_path, spooled):
+    archive = _make_zip(tmp_path / "c.zip", {f"f{i}.txt": str(i) for i in range(5)})
+    processor = ArchiveProcessor()
+    processor.MAX_FILE_COUNT = 3
+
+    docs = await processor.process(str(archive))
+
+    assert [d.content for d in docs] == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_zip_raises(tmp_path):
+    path = tmp_path / "broken.zip"
+    path.write_bytes(b"not a zip")
+
+    with pytest.raises(TechnicalError, match="Invalid or corrupted zip"):
+        await ArchiveProcessor().process(str(path))
+
+
+@pytest.mark.asyncio
+async def test_text_process_stream_uses_encoding_fallback():
+    docs = await TextProcessor().process_stream(io.BytesIO("café".encode("latin-1")), "notes.txt")
+
+    assert docs[0].success
+    assert docs[0].content == "café"
+    assert docs[0].metadata["encoding_used"] == "latin-1"
@@ -0,0 +1,155 @@
+import pickle
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from llama_index.core.base.embeddings.base import BaseEmbedding
+
+from app.factories.embedding_cache import CachedEmbedding, EmbeddingCache, normalize_text
+
+
+class CountingEmbedding(BaseEmbedding):
+    """Deterministic provider recording every text it actually embeds."""
+
+    calls: List[List[str]] = []
+
+    def __init__(self, **kwargs):
+        super().__init__(model_name="counting", embed_batch_size=4, **kwargs)
+        self.calls = []
+
+    def _vector(self, text: str, offset: float) -> List[float]:
+        return [offset, float(len(text)), float(sum(map(ord, text)) % 97)]
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        self.calls.append([query])
+        return self._vector(query, 1.0)
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._get_text_embeddings([text])[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return [self._vector(t, 2.0) for t in texts]
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._get_text_embeddings(texts)
+
+
+def _embedded(model: CountingEmbedding) -> List[str]:
+    return [t for batch in model.calls for t in batch]
+
+
+@pytest.mark.asyncio
+async def test_batch_embeds_only_unique_missing_texts():
+    inner = CountingEmbedding()
+    cached = CachedEmbedding(inner, EmbeddingCache(max_entries=100))
+
+    first = await cached.aget_text_embedding_batch(["red", "blue", "red", "  red "])
+    assert _embedded(inner) == ["red", "blue"]
+    assert first[0] == first[2] == first[3] == inner._vector("red", 2.0)
+
+    second = await cached.aget_text_embedding_batch(["blue", "green", "red"])
+    assert _embedded(inner) == ["red", "blue", "green"]
+    assert second == [first[1], inner._vector("green", 2.0), first[0]]
+
+
+def test_query_and_text_modes_are_cached_separately():
+    inner = CountingEmbedding()
+    cached = CachedEmbedding(inner, EmbeddingCache(max_entries=100))
+
+    assert cached.get_query_embedding("hello") == inner._vector("hello", 1.0)
+    assert cached.get_text_embedding("hello") == inner._vector("hello", 2.0)
+    cached.get_query_embedding("hello")
+    cached.get_text_embedding("hello")
+
+    assert inner.calls == [["hello"], ["hello"]]
+    assert cached.cache.stats()["hits"] == 2
+
+
+def test_lru_evicts_least_recently_used_and_counts():
+    cache = EmbeddingCache(max_entries=2)
+    cache.put_many({"a": [1.0], "b": [2.0]})
+    assert cache.get_many(["a"]) == [[1.0]]
+
+    cache.put_many({"c": [3.0]})
+
+    assert cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+    assert cache.stats() | {"hit_rate": None} == {
+        "entries": 2,
+        "max_entries": 2,
+        "hits": 3,
+        "misses": 1,
+        "redis_hits": 0,
+        "evictions": 1,
+        "hit_rate": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_read_through_and_written_back():
+    redis = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis.pipeline.return_value = pipe
+    redis.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+
+    writer = CachedEmbedding(CountingEmbedding(), EmbeddingCache(max_entries=10, redis=redis, redis_ttl=60))
+    vector = await writer.aget_text_embedding("shared")
+    key, payload = pipe.set.call_args.args
+    assert pipe.set.call_args.kwargs == {"ex": 60}
+
+    # Another process: empty L1, Redis holds the vector
+    redis.mget = AsyncMock(return_value=[payload])
+    inner = CountingEmbedding()
+    reader = CachedEmbedding(inner, EmbeddingCache(max_entries=10, redis=redis))
+
+    assert await reader.aget_text_embedding("shared") == vector
+    assert inner.calls == []
+    assert reader.cache.stats()["redis_hits"] == 1
+    redis.mget.assert_awaited_once_with([key])
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_falls_back_to_process_cache():
+    redis = MagicMock()
+    redis.mget = AsyncMock(side_effect=ConnectionError("redis down"))
+    inner = CountingEmbedding()
+    cached = CachedEmbedding(inner, EmbeddingCache(max_entries=10, redis=redis))
+
+    await cached.aget_text_embedding("x")
+    await cached.aget_text_embedding("x")
+
+    assert inner.calls == [["x"]]
+    redis.mget.assert_awaited_once()  # Tier disabled for the cooldown after the failure
+    redis.pipeline.assert_not_called()
+
+
+def test_pickled_model_embeds_with_the_cache_of_its_process():
+    """IngestionPipeline(num_workers>1) pickles the transformations into its worker processes."""
+    cached = CachedEmbedding(CountingEmbedding(), EmbeddingCache(max_entries=100))
+    worker_cache = EmbeddingCache(max_entries=100)
+
+    with patch("app.factories.embedding_cache.get_embedding_cache", return_value=worker_cache):
+        restored = pickle.loads(pickle.dumps(cached))
+
+    assert restored.cache is worker_cache
+    assert restored.namespace == cached.namespace
+    assert restored.get_text_embedding_batch(["red", "red"]) == [CountingEmbedding()._vector("red", 2.0)] * 2
+    assert worker_cache.stats()["entries"] == 1
+
+
+def test_serialization_is_delegated_to_provider_model():
+    inner = CountingEmbedding()
+    cached = CachedEmbedding(inner, EmbeddingCache(max_entries=10))
+
+    assert cached.to_dict() == inner.to_dict()
+    assert cached.model_name == "counting"
+    assert cached.embed_batch_size == 4
+
+
+def test_normalize_text_collapses_whitespace_but_keeps_case():
+    assert normalize_text("  Hello\n\tWorld ") == "Hello World"
+    assert normalize_text("Hello") != normalize_text("hello")
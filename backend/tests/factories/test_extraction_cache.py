@@ -0,0 +1,116 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.factories.processors.base import FileProcessor, ProcessedDocument
+from app.factories.processors.extraction_cache import ExtractionCache
+
+
+class _CloudLikeProcessor(FileProcessor):
+    def __init__(self, extract_mock):
+        super().__init__()
+        self.extract_mock = extract_mock
+
+    async def process(self, file_path, ai_provider=None, model="model-a"):
+        path = await self._validate_file_path(file_path)
+
+        async def _extract():
+            return await self.extract_mock(path)
+
+        return await self._with_extraction_cache(path, model, _extract)
+
+    def get_supported_extensions(self):
+        return ["bin"]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ExtractionCache(str(tmp_path / "cache.sqlite3"), max_bytes=10_000)
+    with patch("app.factories.processors.extraction_cache.get_extraction_cache", return_value=c):
+        yield c
+    c.close()
+
+
+def _extracted(path):
+    return [
+        ProcessedDocument(
+            content="page one",
+            metadata={"page_number": 1, "file_path": str(path), "file_name": path.name, "source_tool": "Gemini"},
+        )
+    ]
+
+
+def test_put_get_roundtrip(tmp_path):
+    c = ExtractionCache(str(tmp_path / "cache.sqlite3"), max_bytes=10_000)
+    c.put("k", [{"content": "x", "metadata": {"page_number": 1}}])
+
+    assert c.get("k") == [{"content": "x", "metadata": {"page_number": 1}}]
+    assert c.get("missing") is None
+    c.close()
+
+
+def test_lru_eviction_respects_size_bound(tmp_path):
+    page = [{"content": "x" * 300, "metadata": {}}]
+    c = ExtractionCache(str(tmp_path / "cache.sqlite3"), max_bytes=1000)
+
+    c.put("a", page)
+    c.put("b", page)
+    c.put("c", page)
+    assert c.get("a") is not None  # 'a' becomes most recently used
+    c.put("d", page)  # over budget -> evicts least recently used ('b')
+
+    assert c.get("b") is None
+    assert c.get("a") is not None and c.get("d") is not None
+    assert c.count() == 3
+    c.close()
+
+
+@pytest.mark.asyncio
+async def test_same_content_is_extracted_once_across_paths(cache, tmp_path):
+    first = tmp_path / "connector_a" / "report.bin"
+    second = tmp_path / "connector_b" / "renamed.bin"
+    for path in (first, second):
+        path.parent.mkdir()
+        path.write_bytes(b"identical content")
+
+    extract = AsyncMock(side_effect=_extracted)
+    processor = _CloudLikeProcessor(extract)
+
+    await processor.process(str(first))
+    result = await processor.process(str(second))
+
+    extract.assert_awaited_once()
+    assert result[0].content == "page one"
+    # Location-derived metadata reflects the file actually processed
+    assert result[0].metadata["file_path"] == str(second)
+    assert result[0].metadata["file_name"] == "renamed.bin"
+    assert result[0].metadata["source_tool"] == "Gemini"
+
+
+@pytest.mark.asyncio
+async def test_model_and_content_changes_miss_the_cache(cache, tmp_path):
+    path = tmp_path / "doc.bin"
+    path.write_bytes(b"v1")
+    extract = AsyncMock(side_effect=_extracted)
+    processor = _CloudLikeProcessor(extract)
+
+    await processor.process(str(path))
+    await processor.process(str(path), model="model-b")
+    path.write_bytes(b"v2")
+    await processor.process(str(path))
+
+    assert extract.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_extractions_are_not_cached(cache, tmp_path):
+    path = tmp_path / "doc.bin"
+    path.write_bytes(b"content")
+    failure = [ProcessedDocument(content="", success=False, error_message="quota")]
+    extract = AsyncMock(side_effect=[failure, _extracted(path)])
+    processor = _CloudLikeProcessor(extract)
+
+    assert (await processor.process(str(path)))[0].success is False
+    assert (await processor.process(str(path)))[0].success is True
+    assert extract.await_count == 2
+    assert cache.count() == 1
@@ -371,3 +371,140 @@ class TestPdfProcessorCostOptimization:
 
                 # Verify cloud called only 2 times (20% of PDFs)
                 assert mock_cloud.call_count == 2
+
+
+class TestPdfProcessorPerPageRouting:
+    """Only pages failing the quality inspection are sent to the cloud."""
+
+    @staticmethod
+    def _write_pdf(path, page_count):
+        import pypdf
+
+        writer = pypdf.PdfWriter()
+        for _ in range(page_count):
+            writer.add_blank_page(width=72, height=72)
+        with open(path, "wb") as f:
+            writer.write(f)
+
+    @staticmethod
+    def _local_page(content, page_number, page_count):
+        return ProcessedDocument(
+            content=content,
+            metadata={"page_number": page_number, "page_count": page_count, "source_tool": "pypdf (Local)"},
+            success=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_bad_pages_are_sent_to_cloud_and_merged_in_order(self, tmp_path):
+        """Page 2 (garbled) and page 3 (no text, e.g. scanned) go to cloud; pages 1 and 4 stay local."""
+        pdf_path = tmp_path / "manual.pdf"
+        self._write_pdf(pdf_path, 4)
+
+        with patch("app.factories.processors.pdf_processor.get_settings") as mock_settings:
+            mock_settings.return_value.GEMINI_API_KEY = "valid-key"
+            processor = PdfProcessor()
+
+        local_result = [
+            self._local_page("good page one", 1, 4),
+            self._local_page("garbled", 2, 4),
+            self._local_page("good page four", 4, 4),
+        ]
+        subset_page_counts = []
+
+        async def _cloud(subset_path, ai_provider=None):
+            import pypdf
+
+            subset_page_counts.append(len(pypdf.PdfReader(subset_path).pages))
+            return [
+                ProcessedDocument(content="cloud page two", metadata={"page_number": 1, "source_tool": "Gemini"}),
+                ProcessedDocument(content="cloud page three", metadata={"page_number": 2, "source_tool": "Gemini"}),
+            ]
+
+        with (
+            patch("app.factories.processors.pdf_processor.get_settings") as mock_settings,
+            patch.object(processor._local_processor, "process", new_callable=AsyncMock, return_value=local_result),
+            patch.object(processor._cloud_processor, "process", new_callable=AsyncMock, side_effect=_cloud),
+            patch("app.factories.processors.pdf_processor.PdfQualityInspector") as mock_inspector,
+        ):
+            mock_settings.return_value.GEMINI_API_KEY = "valid-key"
+            mock_inspector.should_use_cloud.side_effect = lambda text: text == "garbled"
+
+            result = await processor.process(str(pdf_path))
+
+        assert subset_page_counts == [2]
+        assert [doc.content for doc in result] == [
+            "good page one",
+            "cloud page two",
+            "cloud page three",
+            "good page four",
+        ]
+        assert [doc.metadata["page_number"] for doc in result] == [1, 2, 3, 4]
+        assert result[1].metadata["file_path"] == str(pdf_path)
+
+    def test_page_subsets_of_the_same_pages_never_share_a_file(self, tmp_path):
+        """Concurrent runs on one source (retries, two connectors) each write and delete their own subset."""
+        import pypdf
+
+        pdf_path = tmp_path / "manual.pdf"
+        self._write_pdf(pdf_path, 3)
+
+        first, pages = PdfProcessor._write_page_subset(pdf_path, [2, 3, 7])
+        second, _ = PdfProcessor._write_page_subset(pdf_path, [2, 3, 7])
+        try:
+            assert first != second
+            assert pages == [2, 3]
+            assert len(pypdf.PdfReader(str(first)).pages) == 2
+        finally:
+            first.unlink()
+            second.unlink()
+
+    @pytest.mark.asyncio
+    async def test_cloud_failure_on_subset_keeps_local_pages(self, tmp_path):
+        pdf_path = tmp_path / "manual.pdf"
+        self._write_pdf(pdf_path, 2)
+
+        with patch("app.factories.processors.pdf_processor.get_settings") as mock_settings:
+            mock_settings.return_value.GEMINI_API_KEY = "valid-key"
+            processor = PdfProcessor()
+
+        local_result = [self._local_page("good", 1, 2), self._local_page("garbled", 2, 2)]
+
+        with (
+            patch("app.factories.processors.pdf_processor.get_settings") as mock_settings,
+            patch.object(processor._local_processor, "process", new_callable=AsyncMock, return_value=local_result),
+            patch.object(processor._cloud_processor, "process", new_callable=AsyncMock, side_effect=Exception("quota")),
+            patch("app.factories.processors.pdf_processor.PdfQualityInspector") as mock_inspector,
+        ):
+            mock_settings.return_value.GEMINI_API_KEY = "valid-key"
+            mock_inspector.should_use_cloud.side_effect = lambda text: text == "garbled"
+
+            result = await processor.process(str(pdf_path))
+
+        assert [doc.content for doc in result] == ["good", "garbled"]
+        assert all(doc.success for doc in result)
+
+
+class TestPdfProcessorExtractionPool:
+    """Only the pypdf stage runs in the extraction process pool."""
+
+    @pytest.mark.asyncio
+    async def test_local_stage_is_offloaded_and_routing_stays_in_process(self, mock_settings, tmp_path):
+        from app.services.ingestion.extraction_executor import ExtractionExecutor
+
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        processor = PdfProcessor()
+        executor = ExtractionExecutor(max_workers=2, timeout_seconds=1)
+        local_result = [ProcessedDocument(content="Well formed text " * 20, metadata={"page_count": 1})]
+
+        assert not executor.should_offload(processor)
+        assert executor.should_offload(processor._local_processor)
+
+        with (
+            patch("app.services.ingestion.extraction_executor.get_extraction_executor", return_value=executor),
+            patch.object(executor, "extract", new_callable=AsyncMock, return_value=local_result) as mock_extract,
+        ):
+            result = await processor.process(str(pdf))
+
+        mock_extract.assert_awaited_once_with(processor._local_processor, str(pdf), None)
+        assert result == local_result
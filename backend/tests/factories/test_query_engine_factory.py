@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 from app.factories.query_engine_factory import UnifiedQueryEngineFactory
+from app.services.query_engine_cache import QueryEngineCache
 from app.schemas.enums import ConnectorType
 
 
@@ -23,7 +24,9 @@ def mock_sql_service():
 
 @pytest.fixture
 def factory(mock_vector_service, mock_sql_service):
-    return UnifiedQueryEngineFactory(vector_service=mock_vector_service, sql_service=mock_sql_service)
+    return UnifiedQueryEngineFactory(
+        vector_service=mock_vector_service, sql_service=mock_sql_service, engine_cache=QueryEngineCache()
+    )
 
 
 @pytest.fixture
@@ -173,3 +176,30 @@ async def test_create_engine_hybrid_success(factory, mock_vector_service, mock_s
 
         # Verify LLMMultiSelector was used
         mock_selector_cls.from_defaults.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_engine_is_cached_until_assistant_changes(factory, mock_sql_service, mock_assistant):
+    mock_sql_service.is_configured.return_value = True
+    mock_assistant.updated_at = "2026-01-01"
+    conn = MagicMock()
+    conn.id = uuid4()
+    conn.connector_type = ConnectorType.SQL
+    conn.configuration = {"host": "db"}
+    mock_assistant.linked_connectors = [conn]
+    mock_sql_service.get_engine.side_effect = lambda assistant: MagicMock()
+
+    first = await factory.create_engine(mock_assistant, language="en")
+    assert await factory.create_engine(mock_assistant, language="en") is first
+    assert mock_sql_service.get_engine.call_count == 1
+
+    # Other language, then a connector update: both rebuild
+    assert await factory.create_engine(mock_assistant, language="fr") is not first
+    conn.configuration = {"host": "replica"}
+    assert await factory.create_engine(mock_assistant, language="en") is not first
+    assert mock_sql_service.get_engine.call_count == 3
+
+    # Invalidation hook
+    rebuilt = await factory.create_engine(mock_assistant, language="en")
+    factory.engine_cache.invalidate_connector(conn.id)
+    assert await factory.create_engine(mock_assistant, language="en") is not rebuilt
@@ -84,6 +84,50 @@ async def test_redis_get_recent_messages_malformed(redis_repo, mock_redis):
     assert result == []
 
 
+@pytest.mark.asyncio
+async def test_redis_messages_are_msgpack_encoded(redis_repo, mock_redis):
+    """Messages round-trip through msgpack, legacy JSON items are still read."""
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock()
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=pipeline)
+    ctx.__aexit__ = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=ctx)
+
+    messages = [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi", "metadata": {"k": 1}}]
+    await redis_repo.push_messages("test-session", messages)
+
+    # One MULTI: a single RPUSH of every message, then trim and expire
+    mock_redis.pipeline.assert_called_once_with(transaction=True)
+    key, *encoded = pipeline.rpush.call_args.args
+    assert key == redis_repo._get_key("test-session")
+    assert all(isinstance(item, bytes) for item in encoded)
+
+    mock_redis.lrange.return_value = [json.dumps({"role": "user", "content": "Legacy"}).encode()] + encoded
+    result = await redis_repo.get_recent_messages("test-session")
+
+    assert result == [{"role": "user", "content": "Legacy"}] + messages
+
+
+@pytest.mark.asyncio
+async def test_redis_get_recent_messages_and_entries_single_round_trip(redis_repo, mock_redis):
+    """Other keys are read in the same pipeline as the window."""
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock(
+        return_value=[[ChatRedisRepository._encode({"role": "user", "content": "Hello"})], b"cached", 5000]
+    )
+    mock_redis.pipeline = MagicMock(return_value=pipeline)
+
+    history, entries = await redis_repo.get_recent_messages_and_entries("test-session", ["cache:a1:hash"])
+
+    assert history == [{"role": "user", "content": "Hello"}]
+    assert entries == [(b"cached", 5000)]
+    pipeline.lrange.assert_called_once_with(redis_repo._get_key("test-session"), 0, -1)
+    pipeline.get.assert_called_once_with("cache:a1:hash")
+    pipeline.execute.assert_awaited_once()
+    mock_redis.lrange.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_redis_clear(redis_repo, mock_redis):
     """Test clearing Redis history."""
@@ -115,3 +115,44 @@ async def test_get_aggregate_stats(document_repo, mock_db):
     assert stats["total_docs"] == 10
     assert stats["total_tokens"] == 1000
     assert stats["total_vectors"] == 50
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_groups_rows_by_column_set(document_repo, mock_db):
+    """One executemany UPDATE per distinct column set, single commit, loaded instances kept in sync."""
+    loaded = ConnectorDocument(connector_id=uuid4(), file_path="a.txt", file_name="a.txt", status=DocStatus.PROCESSING)
+    mock_db.identity_map = MagicMock()
+    mock_db.identity_map.get.side_effect = lambda key: loaded if key[1] == (loaded.id,) else None
+
+    other_id = uuid4()
+    count = await document_repo.bulk_update(
+        {
+            loaded.id: {"status": DocStatus.INDEXED},
+            other_id: {"status": DocStatus.FAILED, "error_message": "boom"},
+            uuid4(): {"status": DocStatus.INDEXED},
+        }
+    )
+
+    assert count == 3
+    assert mock_db.execute.await_count == 2
+    row_sets = sorted((c.args[1] for c in mock_db.execute.await_args_list), key=len)
+    assert row_sets[0] == [{"id": other_id, "status": DocStatus.FAILED, "error_message": "boom"}]
+    assert len(row_sets[1]) == 2
+    mock_db.commit.assert_awaited_once()
+    assert loaded.status == DocStatus.INDEXED
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_rollback_on_error(document_repo, mock_db):
+    mock_db.execute.side_effect = SQLAlchemyError("DB Error")
+
+    with pytest.raises(TechnicalError):
+        await document_repo.bulk_update({uuid4(): {"status": DocStatus.INDEXED}})
+
+    mock_db.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_empty_is_noop(document_repo, mock_db):
+    assert await document_repo.bulk_update({}) == 0
+    mock_db.execute.assert_not_called()
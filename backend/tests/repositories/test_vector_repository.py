@@ -2,6 +2,7 @@ import pytest
 from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock, ANY
 from qdrant_client.http.exceptions import UnexpectedResponse
+from qdrant_client.http.models import PayloadSchemaType, SparseVector
 from app.repositories.vector_repository import VectorRepository
 from app.core.exceptions import ExternalDependencyError
 
@@ -85,3 +86,252 @@ async def test_count_by_document_id(vector_repo, mock_client):
 
     assert count == 42
     mock_client.count.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_points_batches(vector_repo, mock_client):
+    """Test point deletion by ID is chunked."""
+    ids = [str(uuid4()) for _ in range(2500)]
+
+    await vector_repo.delete_points("test_collection", ids)
+
+    assert mock_client.delete.await_count == 3
+    first_batch = mock_client.delete.call_args_list[0].kwargs["points_selector"].points
+    assert len(first_batch) == 1000
+
+
+@pytest.mark.asyncio
+async def test_delete_points_empty_is_noop(vector_repo, mock_client):
+    await vector_repo.delete_points("test_collection", [])
+    mock_client.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_payload_field_by_document_id_paginates(vector_repo, mock_client):
+    """Test scroll pagination with payload projection."""
+    p1 = MagicMock(id="a", payload={"_row_hash": "h1"})
+    p2 = MagicMock(id="b", payload={"_row_hash": "h2"})
+    mock_client.scroll.side_effect = [([p1], "next"), ([p2], None)]
+
+    result = await vector_repo.get_payload_field_by_document_id("test_collection", uuid4(), "_row_hash")
+
+    assert result == {"a": "h1", "b": "h2"}
+    assert mock_client.scroll.await_count == 2
+    assert mock_client.scroll.call_args.kwargs["with_payload"] == ["_row_hash"]
+    assert mock_client.scroll.call_args.kwargs["with_vectors"] is False
+
+
+@pytest.mark.asyncio
+async def test_set_document_status_batches_filtered_set_payload(vector_repo, mock_client, monkeypatch):
+    """Status is mirrored with one filtered set_payload per batch of documents."""
+    monkeypatch.setattr("app.repositories.vector_repository.DELETE_BATCH_SIZE", 2)
+    doc_ids = [uuid4() for _ in range(3)]
+
+    await vector_repo.set_document_status("test_collection", doc_ids, "processing")
+
+    assert mock_client.set_payload.await_count == 2
+    first = mock_client.set_payload.await_args_list[0].kwargs
+    assert first["payload"] == {"doc_status": "processing"}
+    assert first["points"].must[0].match.any == [str(d) for d in doc_ids[:2]]
+
+
+@pytest.mark.asyncio
+async def test_get_document_ids_by_status_paginates_without_vectors(vector_repo, mock_client):
+    doc_a, doc_b = str(uuid4()), str(uuid4())
+    pages = [
+        (
+            [MagicMock(payload={"connector_document_id": doc_a}), MagicMock(payload={"connector_document_id": doc_a})],
+            "n",
+        ),
+        ([MagicMock(payload={"connector_document_id": doc_b})], None),
+    ]
+    mock_client.scroll.side_effect = pages
+
+    result = await vector_repo.get_document_ids_by_status("test_collection", ["processing", "failed"])
+
+    assert result == {doc_a, doc_b}
+    kwargs = mock_client.scroll.call_args.kwargs
+    assert kwargs["scroll_filter"].must[0].match.any == ["processing", "failed"]
+    assert kwargs["with_vectors"] is False
+
+
+@pytest.mark.asyncio
+async def test_set_connector_active_ignores_missing_collection(vector_repo, mock_client):
+    mock_client.set_payload.side_effect = Exception("Collection not found")
+
+    await vector_repo.set_connector_active("missing", uuid4(), False)
+
+
+def test_build_search_filter_excludes_non_indexed_and_inactive_points():
+    search_filter = VectorRepository.build_search_filter()
+
+    assert search_filter.must is None
+    status_cond, active_cond = search_filter.must_not
+    assert status_cond.key == "doc_status"
+    assert "indexed" not in status_cond.match.any and "processing" in status_cond.match.any
+    assert active_cond.key == "is_active" and active_cond.match.value is False
+
+
+@pytest.mark.asyncio
+async def test_create_payload_indexes_skips_existing_fields(vector_repo, mock_client):
+    mock_client.get_collection.return_value = MagicMock(payload_schema={"connector_id": MagicMock(data_type="keyword")})
+
+    created = await vector_repo.create_payload_indexes(
+        "col", {"connector_id": PayloadSchemaType.KEYWORD, "price": PayloadSchemaType.FLOAT}, wait=False
+    )
+
+    assert created == ["price"]
+    mock_client.create_payload_index.assert_awaited_once_with(
+        collection_name="col", field_name="price", field_schema=PayloadSchemaType.FLOAT, wait=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_copy_points_scrolls_with_vectors_and_upserts(vector_repo, mock_client):
+    page = [MagicMock(id=1, vector=[0.1], payload={"a": 1}), MagicMock(id=2, vector=[0.2], payload={"a": 2})]
+    mock_client.scroll.side_effect = [(page, "next"), (page[:1], None)]
+
+    assert await vector_repo.copy_points("old", "new") == 3
+
+    assert mock_client.scroll.call_args_list[1].kwargs["offset"] == "next"
+    assert mock_client.scroll.call_args_list[0].kwargs["with_vectors"] is True
+    assert mock_client.upsert.await_count == 2
+    assert mock_client.upsert.call_args_list[0].kwargs["collection_name"] == "new"
+
+
+@pytest.mark.asyncio
+async def test_scroll_points_yields_pages_with_selected_payload(vector_repo, mock_client):
+    mock_client.scroll.side_effect = [([MagicMock(id=1)], "next"), ([], None)]
+
+    pages = [page async for page in vector_repo.scroll_points("col", payload_fields=["cache_key"])]
+
+    assert len(pages) == 1
+    assert mock_client.scroll.call_args_list[0].kwargs["with_payload"] == ["cache_key"]
+    assert mock_client.scroll.call_args_list[1].kwargs["offset"] == "next"
+
+    mock_client.scroll.side_effect = Exception("down")
+    with pytest.raises(ExternalDependencyError):
+        async for _ in vector_repo.scroll_points("col"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_sync_points_copies_new_modified_and_drops_deleted_points(vector_repo, mock_client):
+    mock_client.scroll.side_effect = [
+        ([MagicMock(id=1, payload={"doc_status": "indexed"}), MagicMock(id=2, payload={})], None),  # source
+        ([MagicMock(id=1, payload={"doc_status": "processing"}), MagicMock(id=3, payload={})], None),  # target
+    ]
+    mock_client.retrieve.return_value = [
+        MagicMock(id=1, vector=[0.1], payload={"doc_status": "indexed"}),
+        MagicMock(id=2, vector=[0.2], payload={}),
+    ]
+
+    changed, snapshot = await vector_repo.sync_points("old", "new")
+
+    assert changed == 3
+    assert mock_client.retrieve.call_args.kwargs["ids"] == [1, 2]  # Same id, newer payload: copied again
+    assert mock_client.delete.call_args.kwargs["points_selector"].points == [3]
+    assert set(snapshot) == {1, 2}
+
+
+async def _synced_snapshot(vector_repo, mock_client, payloads):
+    points = [MagicMock(id=point_id, payload=payload) for point_id, payload in payloads.items()]
+    mock_client.scroll.side_effect = [(points, None), ([], None)]
+    mock_client.retrieve.return_value = [MagicMock(id=p.id, vector=[0.0], payload=p.payload) for p in points]
+    return await vector_repo.sync_points("old", "new")
+
+
+@pytest.mark.asyncio
+async def test_drain_points_applies_late_source_writes_without_clobbering_newer_target_writes(vector_repo, mock_client):
+    """Points 1-2 were written to the old collection after the snapshot; point 2 was written again through the alias."""
+    _, snapshot = await _synced_snapshot(vector_repo, mock_client, {1: {"v": 0}, 2: {"v": 0}, 3: {"v": 0}})
+    mock_client.retrieve.reset_mock()
+    mock_client.scroll.side_effect = [
+        ([MagicMock(id=1, payload={"v": 1}), MagicMock(id=2, payload={"v": 1})], None),  # source: 3 deleted
+        (
+            [
+                MagicMock(id=1, payload={"v": 0}),
+                MagicMock(id=2, payload={"v": 2}),
+                MagicMock(id=3, payload={"v": 0}),
+            ],
+            None,
+        ),  # target
+    ]
+    mock_client.retrieve.return_value = [MagicMock(id=1, vector=[0.1], payload={"v": 1})]
+
+    assert await vector_repo.drain_points("old", "new", snapshot) == 2
+
+    assert mock_client.retrieve.call_args.kwargs["ids"] == [1]
+    assert mock_client.delete.call_args.kwargs["points_selector"].points == [3]
+
+
+@pytest.mark.asyncio
+async def test_swap_collection_alias_is_atomic(vector_repo, mock_client):
+    await vector_repo.swap_collection_alias("documents", "documents__int8_2")
+
+    operations = mock_client.update_collection_aliases.call_args.kwargs["change_aliases_operations"]
+    assert [type(op).__name__ for op in operations] == ["DeleteAliasOperation", "CreateAliasOperation"]
+    mock_client.delete_collection.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_replace_collection_with_alias(vector_repo, mock_client):
+    await vector_repo.replace_collection_with_alias("documents", "documents__int8_2")
+
+    mock_client.delete_collection.assert_awaited_once_with("documents")
+    operations = mock_client.update_collection_aliases.call_args.kwargs["change_aliases_operations"]
+    assert operations[0].create_alias.collection_name == "documents__int8_2"
+
+
+@pytest.mark.asyncio
+async def test_replace_collection_with_alias_merges_a_concurrently_recreated_collection(vector_repo, mock_client):
+    """ensure_collection_exists recreated the collection between the drop and the alias: merged, then retried."""
+    mock_client.update_collection_aliases.side_effect = [UnexpectedResponse(409, "Conflict", b"", {}), None]
+    mock_client.collection_exists.return_value = True
+    late = MagicMock(id=7, vector=[0.7], payload={})
+    mock_client.scroll.return_value = ([late], None)
+
+    await vector_repo.replace_collection_with_alias("documents", "documents__int8_2")
+
+    assert mock_client.delete_collection.await_count == 2
+    assert mock_client.update_collection_aliases.await_count == 2
+    upserted = mock_client.upsert.call_args.kwargs
+    assert upserted["collection_name"] == "documents__int8_2"
+    assert [p.id for p in upserted["points"]] == [7]
+
+
+@pytest.mark.asyncio
+async def test_replace_collection_with_alias_gives_up_when_nothing_was_recreated(vector_repo, mock_client):
+    mock_client.update_collection_aliases.side_effect = Exception("down")
+    mock_client.collection_exists.return_value = False
+
+    with pytest.raises(ExternalDependencyError):
+        await vector_repo.replace_collection_with_alias("documents", "documents__int8_2")
+    mock_client.update_collection_aliases.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fuses_prefetches_in_one_call_and_normalizes_scores(vector_repo, mock_client):
+    both = MagicMock(score=2.0 / 61)  # First in both branches
+    lexical = MagicMock(score=1.0 / 61)  # First in the sparse branch only
+    mock_client.query_points.return_value = MagicMock(points=[both, lexical])
+    sparse = SparseVector(indices=[1, 2], values=[1.0, 1.0])
+
+    results = await vector_repo.search("col", [1.0, 0.0], limit=5, sparse_vector=sparse, prefetch_limit=20, rrf_k=60)
+
+    mock_client.query_points.assert_awaited_once()
+    kwargs = mock_client.query_points.call_args.kwargs
+    assert [p.using for p in kwargs["prefetch"]] == [None, "bm25"]
+    assert all(p.limit == 20 for p in kwargs["prefetch"])
+    assert kwargs["query"].rrf.k == 60
+    assert kwargs["with_vectors"] is False
+    assert [r.score for r in results] == [pytest.approx(1.0), pytest.approx(0.5)]
+
+
+@pytest.mark.asyncio
+async def test_search_without_sparse_terms_stays_dense(vector_repo, mock_client):
+    mock_client.query_points.return_value = MagicMock(points=[])
+
+    await vector_repo.search("col", [0.1], sparse_vector=SparseVector(indices=[], values=[]))
+
+    assert "prefetch" not in mock_client.query_points.call_args.kwargs
@@ -103,3 +103,55 @@ class TestAgenticProcessor:
         mock_llm.acomplete.return_value = "false"
         result = await processor._detect_visualization_intent(mock_context)
         assert result is False
+
+    @pytest.mark.asyncio
+    async def test_router_workflow_runs_natively_async(self, mock_context):
+        import asyncio
+
+        from llama_index.core.base.response.schema import AsyncStreamingResponse
+        from llama_index.core.callbacks import CallbackManager
+
+        async def tokens():
+            for token in ["Hel", "lo"]:
+                yield token
+
+        engine = MagicMock()
+        engine.callback_manager = CallbackManager([])
+        engine.aquery = AsyncMock(return_value=AsyncStreamingResponse(response_gen=tokens(), metadata={}))
+        mock_context.query_engine_factory = MagicMock()
+        mock_context.query_engine_factory.create_engine = AsyncMock(return_value=engine)
+        mock_context.question_embedding = [0.1]  # No background embedding
+        mock_context.metrics.end_span.return_value = MagicMock(duration=0.1)
+
+        processor = AgenticProcessor()
+        with (
+            patch("asyncio.to_thread", side_effect=AssertionError("no worker thread expected")),
+            patch("app.services.chat.processors.agentic_processor.SourceService.process_sources", new=AsyncMock()),
+        ):
+            events = [e async for e in processor._execute_router_workflow(mock_context, parent_span_id="root")]
+
+        engine.aquery.assert_awaited_once_with("Hello")
+        engine.query.assert_not_called()
+        assert mock_context.full_response_text == "Hello"
+        assert not any('"failed"' in e for e in events)
+
+    @pytest.mark.asyncio
+    async def test_consume_event_queue_forwards_events_while_task_runs(self):
+        import asyncio
+
+        queue = asyncio.Queue()
+        received_while_running = []
+
+        async def _work():
+            for i in range(3):
+                queue.put_nowait({"step": i})
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(_work())
+        events = []
+        async for event in AgenticProcessor()._consume_event_queue(queue, task):
+            events.append(event)
+            received_while_running.append(not task.done())
+
+        assert events == [{"step": 0}, {"step": 1}, {"step": 2}]
+        assert all(received_while_running)
@@ -16,6 +16,8 @@ class TestHistoryLoaderProcessor:
         ctx.session_id = "test-session"
         ctx.language = "en"
         ctx.chat_history_service = AsyncMock()
+        ctx.cache_service = None
+        ctx.cache_prefetch = None
         ctx.metrics = MagicMock()
         ctx.history = []
         return ctx
@@ -46,6 +48,23 @@ class TestHistoryLoaderProcessor:
         # Verify Events
         assert len(events) == 2  # Start + Complete
 
+    @pytest.mark.asyncio
+    async def test_process_reads_exact_cache_entry_with_history(self, mock_context):
+        """The exact cache lookup of the question is resolved in the history round trip."""
+        processor = HistoryLoaderProcessor()
+        mock_context.original_message = "Hello"
+        mock_context.assistant = MagicMock(id="assistant_123", use_semantic_cache=True)
+        mock_context.cache_service = MagicMock()
+        lookup = mock_context.cache_service.prepare_exact_lookup.return_value
+        mock_context.chat_history_service.get_history.return_value = []
+
+        async for _ in processor.process(mock_context):
+            pass
+
+        mock_context.cache_service.prepare_exact_lookup.assert_called_once_with("Hello", "assistant_123")
+        mock_context.chat_history_service.get_history.assert_awaited_once_with("test-session", lookup)
+        assert mock_context.cache_prefetch is lookup
+
     @pytest.mark.asyncio
     async def test_process_timeout(self, mock_context):
         """Should fallback to empty history on timeout."""
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
+from app.services.chat.embedding_memo import EmbeddingMemo
 from app.services.chat.processors.semantic_cache_processor import SemanticCacheProcessor
 from app.services.chat.types import ChatContext, PipelineStepType
 
@@ -17,6 +18,7 @@ def mock_context():
     ctx.assistant.cache_similarity_threshold = 0.9
     ctx.cache_service = AsyncMock()
     ctx.vector_service = AsyncMock()
+    ctx.embedding_memo = EmbeddingMemo()
     ctx.metrics = MagicMock()
     ctx.should_stop = False
     return ctx
@@ -1,8 +1,9 @@
 import pytest
 import asyncio
 from unittest.mock import MagicMock
-from app.services.chat.callbacks import StreamingCallbackHandler
+from app.services.chat.callbacks import StreamingCallbackHandler, attach_request_router, use_request_callback_handler
 from app.services.chat.types import PipelineStepType
+from llama_index.core.callbacks.base import CallbackManager
 from llama_index.core.callbacks.schema import CBEventType
 
 
@@ -104,3 +105,38 @@ class TestStreamingCallbackHandler:
 
         # Verify queue is still full but didn't crash
         assert q.full()
+
+
+class TestRequestCallbackRouter:
+
+    def test_events_reach_only_the_active_request_handler(self):
+        manager = CallbackManager([])
+        attach_request_router(manager)
+        attach_request_router(manager)
+        assert len(manager.handlers) == 1
+
+        first, second = MagicMock(event_starts_to_ignore=[], event_ends_to_ignore=[]), MagicMock(
+            event_starts_to_ignore=[], event_ends_to_ignore=[]
+        )
+
+        with use_request_callback_handler(first):
+            manager.on_event_start(CBEventType.LLM, payload={}, event_id="e1")
+        with use_request_callback_handler(second):
+            manager.on_event_end(CBEventType.LLM, payload={}, event_id="e2")
+        manager.on_event_start(CBEventType.LLM, payload={}, event_id="outside")
+
+        assert [c.kwargs["event_id"] for c in first.on_event_start.call_args_list] == ["e1"]
+        first.on_event_end.assert_not_called()
+        assert [c.kwargs["event_id"] for c in second.on_event_end.call_args_list] == ["e2"]
+        second.on_event_start.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handler_propagates_to_worker_threads(self):
+        manager = CallbackManager([])
+        attach_request_router(manager)
+        handler = MagicMock(event_starts_to_ignore=[], event_ends_to_ignore=[])
+
+        with use_request_callback_handler(handler):
+            await asyncio.to_thread(manager.on_event_start, CBEventType.QUERY, {}, "threaded")
+
+        handler.on_event_start.assert_called_once()
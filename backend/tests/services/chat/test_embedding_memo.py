@@ -0,0 +1,122 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.chat.embedding_memo import (
+    EmbeddingMemo,
+    current_embedding_memo,
+    embed_query,
+    embed_text_sync,
+    use_embedding_memo,
+)
+
+
+class FakeEmbedding:
+    """Counts calls; query and text embeddings differ like asymmetric models."""
+
+    def __init__(self, model_name="fake-model", delay=0.0):
+        self.model_name = model_name
+        self.delay = delay
+        self.query_calls = 0
+        self.text_calls = 0
+
+    async def aget_query_embedding(self, text):
+        self.query_calls += 1
+        await asyncio.sleep(self.delay)
+        return [1.0, float(len(text))]
+
+    def get_query_embedding(self, text):
+        self.query_calls += 1
+        return [1.0, float(len(text))]
+
+    def get_text_embedding(self, text):
+        self.text_calls += 1
+        return [2.0, float(len(text))]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_query_embeddings_are_computed_once():
+    memo = EmbeddingMemo()
+    model = FakeEmbedding(delay=0.01)
+
+    results = await asyncio.gather(*(memo.aget_query_embedding(model, "hello") for _ in range(5)))
+
+    assert model.query_calls == 1
+    assert all(r == [1.0, 5.0] for r in results)
+    assert await memo.aget_query_embedding(model, "hello") == [1.0, 5.0]
+    assert model.query_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_modes_models_and_texts_are_keyed_separately():
+    memo = EmbeddingMemo()
+    model = FakeEmbedding()
+    other = FakeEmbedding(model_name="other-model")
+
+    assert await memo.aget_query_embedding(model, "hello") == [1.0, 5.0]
+    assert await memo.aget_text_embedding(model, "hello") == [2.0, 5.0]
+    await memo.aget_query_embedding(other, "hello")
+    await memo.aget_query_embedding(model, "bye")
+
+    assert model.query_calls == 2
+    assert model.text_calls == 1
+    assert other.query_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_are_shared_but_not_memoized():
+    memo = EmbeddingMemo()
+    model = MagicMock(model_name="flaky")
+    model.aget_query_embedding = AsyncMock(side_effect=[RuntimeError("provider down"), [0.5]])
+
+    with pytest.raises(RuntimeError):
+        await memo.aget_query_embedding(model, "hello")
+
+    assert await memo.aget_query_embedding(model, "hello") == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_worker_thread_reuses_in_flight_loop_computation():
+    memo = EmbeddingMemo()
+    model = FakeEmbedding()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _slow_text_embedding():
+        started.set()
+        await release.wait()
+        return [9.0]
+
+    owner = asyncio.create_task(memo._aget(model, "hello", "text", _slow_text_embedding))
+    await started.wait()
+
+    thread_result = asyncio.to_thread(memo.get_text_embedding, model, "hello")
+    thread_task = asyncio.ensure_future(thread_result)
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await owner == [9.0]
+    assert await thread_task == [9.0]
+    assert model.text_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_helpers_use_the_active_memo_and_propagate_to_threads():
+    memo = EmbeddingMemo()
+    model = FakeEmbedding()
+
+    assert current_embedding_memo() is None
+    with use_embedding_memo(memo):
+        await embed_query(model, "q")
+        await embed_query(model, "q")
+        await asyncio.to_thread(embed_text_sync, model, "q")
+        await asyncio.to_thread(embed_text_sync, model, "q")
+    assert current_embedding_memo() is None
+
+    assert model.query_calls == 1
+    assert model.text_calls == 1
+
+    # Without an active memo the helpers call the model directly
+    await embed_query(model, "q")
+    assert model.query_calls == 2
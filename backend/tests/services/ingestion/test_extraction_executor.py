@@ -0,0 +1,148 @@
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.factories.processors.base import FileProcessor, ProcessedDocument
+from app.services.ingestion.extraction_executor import ExtractionError, ExtractionExecutor, ExtractionTimeoutError
+
+
+# Module-level processors: spawned workers import them by reference
+class EchoProcessor(FileProcessor):
+    CPU_BOUND = True
+
+    async def process(self, file_path, ai_provider=None):
+        return [ProcessedDocument(content=f"{file_path}:{os.getpid()}", metadata={"provider": ai_provider})]
+
+    def get_supported_extensions(self):
+        return ["echo"]
+
+
+class CrashProcessor(FileProcessor):
+    CPU_BOUND = True
+
+    async def process(self, file_path, ai_provider=None):
+        os._exit(1)  # simulates a segfault / OOM kill
+
+    def get_supported_extensions(self):
+        return ["crash"]
+
+
+class SlowProcessor(FileProcessor):
+    CPU_BOUND = True
+
+    async def process(self, file_path, ai_provider=None):
+        if file_path == "slow":
+            time.sleep(60)
+        elif file_path.startswith("nap"):
+            time.sleep(3)
+        return [ProcessedDocument(content=file_path)]
+
+    def get_supported_extensions(self):
+        return ["slow"]
+
+
+class FailingProcessor(FileProcessor):
+    CPU_BOUND = True
+
+    async def process(self, file_path, ai_provider=None):
+        raise ValueError("corrupted file")
+
+    def get_supported_extensions(self):
+        return ["bad"]
+
+
+@pytest.fixture(scope="module")
+def executor():
+    # Shared across tests: spawning workers (app imports) is the slow part
+    ex = ExtractionExecutor(max_workers=2, timeout_seconds=30)
+    yield ex
+    ex.shutdown()
+
+
+def test_should_offload_only_cpu_bound_processors():
+    pooled = ExtractionExecutor(max_workers=2, timeout_seconds=1)
+    in_process = ExtractionExecutor(max_workers=0, timeout_seconds=1)
+
+    assert pooled.should_offload(EchoProcessor())
+    assert not pooled.should_offload(AsyncMock())
+    assert not in_process.should_offload(EchoProcessor())
+
+
+def test_patched_processors_are_not_offloaded():
+    processor = EchoProcessor()
+    processor.process = AsyncMock()
+
+    assert not ExtractionExecutor(max_workers=2, timeout_seconds=1).should_offload(processor)
+
+
+@pytest.mark.asyncio
+async def test_in_process_fallback_calls_processor_directly():
+    processor = AsyncMock()
+    processor.process.return_value = [ProcessedDocument(content="x")]
+
+    result = await ExtractionExecutor(max_workers=0, timeout_seconds=1).extract(processor, "f.pdf", "gemini")
+
+    assert result[0].content == "x"
+    processor.process.assert_awaited_once_with("f.pdf", ai_provider="gemini")
+
+
+@pytest.mark.asyncio
+async def test_extracts_files_in_worker_processes(executor):
+    results = await asyncio.gather(*(executor.extract(EchoProcessor(), f"file{i}", "ollama") for i in range(4)))
+
+    assert [r[0].content.split(":")[0] for r in results] == [f"file{i}" for i in range(4)]
+    assert all(int(r[0].content.split(":")[1]) != os.getpid() for r in results)
+    assert results[0][0].metadata == {"provider": "ollama"}
+
+
+@pytest.mark.asyncio
+async def test_processor_errors_are_raised_as_extraction_errors(executor):
+    with pytest.raises(ExtractionError, match="corrupted file"):
+        await executor.extract(FailingProcessor(), "f.bad")
+
+
+@pytest.mark.asyncio
+async def test_worker_crash_fails_only_that_file(executor):
+    crash, ok = await asyncio.gather(
+        executor.extract(CrashProcessor(), "boom"),
+        executor.extract(EchoProcessor(), "fine"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(crash, ExtractionError)
+    assert ok[0].content.startswith("fine:")
+    # Pool is usable again afterwards
+    assert (await executor.extract(EchoProcessor(), "after"))[0].content.startswith("after:")
+
+
+@pytest.mark.asyncio
+async def test_timeout_fails_only_that_file(executor):
+    # Warm up both workers so start-up does not count against the short timeout
+    await asyncio.gather(executor.extract(EchoProcessor(), "w1"), executor.extract(EchoProcessor(), "w2"))
+    executor.timeout_seconds = 15  # above worker start-up time, below the slow file
+    try:
+        slow, fast = await asyncio.gather(
+            executor.extract(SlowProcessor(), "slow"),
+            executor.extract(SlowProcessor(), "fast"),
+            return_exceptions=True,
+        )
+    finally:
+        executor.timeout_seconds = 30
+
+    assert isinstance(slow, ExtractionTimeoutError)
+    assert fast[0].content == "fast"
+
+
+@pytest.mark.asyncio
+async def test_time_queued_for_a_worker_does_not_count_against_the_timeout(executor):
+    await asyncio.gather(executor.extract(EchoProcessor(), "w1"), executor.extract(EchoProcessor(), "w2"))
+    executor.timeout_seconds = 5  # each file takes 3s, the last two wait 3s for a worker
+    try:
+        results = await asyncio.gather(*(executor.extract(SlowProcessor(), f"nap{i}") for i in range(4)))
+    finally:
+        executor.timeout_seconds = 30
+
+    assert [r[0].content for r in results] == [f"nap{i}" for i in range(4)]
@@ -0,0 +1,116 @@
+import pickle
+
+import pytest
+from llama_index.core.ingestion import IngestionCache
+from llama_index.core.schema import TextNode
+from llama_index.core.storage.docstore import SimpleDocumentStore
+from llama_index.core.storage.kvstore import SimpleKVStore
+
+from app.services.ingestion.ingestion_cache import (
+    DOCSTORE_JSON_FILE,
+    KV_JSON_FILE,
+    PIPELINE_CACHE_COLLECTION,
+    SqliteKVStore,
+    build_ingestion_cache,
+    migrate_json_cache,
+    persist_ingestion_cache,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    kv = SqliteKVStore(str(tmp_path / "cache.sqlite3"))
+    yield kv
+    kv.close()
+
+
+def test_put_get_delete_roundtrip(store):
+    store.put("a", {"x": 1}, collection="c1")
+    store.put("a", {"x": 2}, collection="c2")
+
+    assert store.get("a", collection="c1") == {"x": 1}
+    assert store.get("a", collection="c2") == {"x": 2}
+    assert store.get("missing", collection="c1") is None
+
+    assert store.delete("a", collection="c1") is True
+    assert store.delete("a", collection="c1") is False
+    assert store.get("a", collection="c1") is None
+
+
+def test_put_all_overwrites_and_counts(store):
+    store.put_all([("k1", {"v": 1}), ("k2", {"v": 2})], collection="c")
+    store.put_all([("k1", {"v": 10})], collection="c")
+
+    assert store.get_all(collection="c") == {"k1": {"v": 10}, "k2": {"v": 2}}
+    assert store.count(collection="c") == 2
+
+
+def test_data_survives_reopen(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = SqliteKVStore(path)
+    first.put("k", {"v": 1})
+    first.close()
+
+    second = SqliteKVStore(path)
+    assert second.get("k") == {"v": 1}
+    second.close()
+
+
+def test_store_is_picklable_for_pipeline_workers(store):
+    store.put("k", {"v": 1})
+    clone = pickle.loads(pickle.dumps(store))
+    assert clone.get("k") == {"v": 1}
+    clone.close()
+
+
+@pytest.mark.asyncio
+async def test_async_api(store):
+    await store.aput("k", {"v": 1})
+    await store.aput_all([("k2", {"v": 2})])
+    assert await store.aget("k") == {"v": 1}
+    assert await store.aget_all() == {"k": {"v": 1}, "k2": {"v": 2}}
+    assert await store.adelete("k") is True
+
+
+def test_migrate_json_cache_preserves_cache_and_docstore(tmp_path):
+    """Legacy JSON caches are copied verbatim so hashes and cache keys stay valid."""
+    legacy_cache = IngestionCache(cache=SimpleKVStore(), collection=PIPELINE_CACHE_COLLECTION)
+    legacy_cache.put("transform-hash", [TextNode(text="hello", id_="n1")])
+    legacy_cache.cache.persist(str(tmp_path / KV_JSON_FILE))
+
+    legacy_docstore = SimpleDocumentStore()
+    legacy_docstore.set_document_hash("doc-1", "hash-1")
+    legacy_docstore.persist(str(tmp_path / DOCSTORE_JSON_FILE))
+
+    cache, docstore = build_ingestion_cache(tmp_path, "sqlite")
+
+    assert [n.text for n in cache.get("transform-hash")] == ["hello"]
+    assert docstore.get_document_hash("doc-1") == "hash-1"
+
+    # JSON files are retired so the migration runs only once
+    assert not (tmp_path / KV_JSON_FILE).exists()
+    assert (tmp_path / (KV_JSON_FILE + ".migrated")).exists()
+    assert migrate_json_cache(tmp_path, cache.cache) == 0
+    cache.cache.close()
+
+
+def test_sqlite_backend_writes_are_durable_without_persist(tmp_path):
+    cache, docstore = build_ingestion_cache(tmp_path, "sqlite")
+    docstore.set_document_hash("doc-1", "hash-1")
+    persist_ingestion_cache(tmp_path, cache, docstore)  # no-op for sqlite
+    cache.cache.close()
+
+    assert not (tmp_path / DOCSTORE_JSON_FILE).exists()
+    _, reopened = build_ingestion_cache(tmp_path, "sqlite")
+    assert reopened.get_document_hash("doc-1") == "hash-1"
+
+
+def test_json_backend_persists_files(tmp_path):
+    cache, docstore = build_ingestion_cache(tmp_path, "json")
+    docstore.set_document_hash("doc-1", "hash-1")
+    persist_ingestion_cache(tmp_path, cache, docstore)
+
+    assert (tmp_path / KV_JSON_FILE).exists()
+    assert (tmp_path / DOCSTORE_JSON_FILE).exists()
+    _, reloaded = build_ingestion_cache(tmp_path, "json")
+    assert reloaded.get_document_hash("doc-1") == "hash-1"
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -6,6 +7,7 @@ import pytest
 
 from app.core.exceptions import TechnicalError
 from app.models.enums import ConnectorStatus, DocStatus
+from app.services.ingestion.extraction_executor import ExtractionExecutor
 from app.services.ingestion.ingestion_orchestrator import IngestionOrchestrator, IngestionStoppedError
 
 
@@ -97,8 +99,9 @@ async def test_ingest_files_success(mock_dependencies):
                 text_splitter=text_splitter,
             )
 
-            # Verify status update to INDEXED
-            assert orchestrator.doc_repo.update.call_count >= 2
+            # Verify status update to INDEXED (written behind in bulk)
+            assert _final_statuses(orchestrator.doc_repo) == {doc_id: DocStatus.INDEXED}
+            orchestrator.doc_repo.update.assert_not_called()
             # Verify stats emission
             mock_manager.emit_document_update.assert_called_with(
                 str(doc_id),
@@ -139,3 +142,245 @@ async def test_ingest_stopped_error(mock_dependencies):
             num_workers=1,
             docs_map=docs_map,
         )
+
+
+def _make_orchestrator(mock_dependencies):
+    orchestrator = IngestionOrchestrator(
+        db=mock_dependencies["db"],
+        vector_repo=mock_dependencies["vector_repo"],
+        vector_service=mock_dependencies["vector_service"],
+        settings_service=mock_dependencies["settings_service"],
+    )
+    orchestrator.connector_repo = mock_dependencies["connector_repo"]
+    orchestrator.doc_repo = mock_dependencies["doc_repo"]
+    return orchestrator
+
+
+def _configure_status_flush(mock_settings):
+    mock_settings.INGESTION_STATUS_FLUSH_INTERVAL_MS = 10
+    mock_settings.INGESTION_STATUS_FLUSH_MAX_ROWS = 200
+    mock_settings.INGESTION_PROGRESS_INTERVAL_MS = 10
+
+
+def _final_statuses(doc_repo):
+    """Last status written for each document across all bulk updates."""
+    statuses = {}
+    for c in doc_repo.bulk_update.call_args_list:
+        for doc_id, values in c.args[0].items():
+            if "status" in values:
+                statuses[doc_id] = values["status"]
+    return statuses
+
+
+def _success_processor():
+    processor_mock = AsyncMock()
+    processor_mock.process.side_effect = lambda *a, **k: [
+        MagicMock(success=True, content="content", metadata={}),
+    ]
+    return processor_mock
+
+
+@pytest.mark.asyncio
+async def test_ingest_files_streaming_flushes_in_bounded_batches(mock_dependencies):
+    """Streaming mode runs the pipeline every INGESTION_STREAM_FLUSH_SEGMENTS segments."""
+    orchestrator = _make_orchestrator(mock_dependencies)
+
+    docs_map = {}
+    file_paths = []
+    for i in range(5):
+        d = MagicMock()
+        d.id = uuid4()
+        docs_map[f"f{i}.pdf"] = d
+        file_paths.append((f"/tmp/f{i}.pdf", f"f{i}.pdf"))
+
+    async def _arun(documents, num_workers, show_progress):
+        nodes = []
+        for llama_doc in documents:
+            n = MagicMock(get_content=lambda: "chunk")
+            n.metadata = {"connector_document_id": llama_doc.metadata["connector_document_id"]}
+            nodes.append(n)
+        return nodes
+
+    pipeline = MagicMock()
+    pipeline.arun = AsyncMock(side_effect=_arun)
+
+    with (
+        patch("app.factories.ingestion_factory.IngestionFactory.get_processor", return_value=_success_processor()),
+        patch("app.services.ingestion.ingestion_orchestrator.manager", new_callable=AsyncMock),
+        patch("app.services.ingestion.ingestion_orchestrator.settings") as mock_settings,
+    ):
+        mock_settings.INGESTION_STREAMING_ENABLED = True
+        _configure_status_flush(mock_settings)
+        mock_settings.INGESTION_STREAM_HIGH_WATER_MARK = 1
+        mock_settings.INGESTION_STREAM_FLUSH_SEGMENTS = 2
+
+        await orchestrator.ingest_files(
+            file_paths=file_paths,
+            pipeline=pipeline,
+            vector_store=MagicMock(),
+            connector_id=uuid4(),
+            connector_acl=[],
+            ai_provider="gemini",
+            batch_size=10,
+            num_workers=0,
+            docs_map=docs_map,
+            ignore_connector_status=True,
+        )
+
+    # 5 single-segment files flushed by 2 -> [2, 2, 1]
+    batch_sizes = [len(c.kwargs["documents"]) for c in pipeline.arun.call_args_list]
+    assert batch_sizes == [2, 2, 1]
+
+    statuses = _final_statuses(orchestrator.doc_repo)
+    assert statuses == {d.id: DocStatus.INDEXED for d in docs_map.values()}
+
+
+@pytest.mark.asyncio
+async def test_ingest_files_legacy_mode_single_pipeline_run(mock_dependencies):
+    """With streaming disabled, all files go through a single pipeline.arun call."""
+    orchestrator = _make_orchestrator(mock_dependencies)
+    mock_dependencies["vector_repo"].count_by_document_id.return_value = 0
+
+    docs_map = {f"f{i}.pdf": MagicMock(id=uuid4()) for i in range(3)}
+    file_paths = [(f"/tmp/{name}", name) for name in docs_map]
+
+    pipeline = MagicMock()
+    pipeline.arun = AsyncMock(return_value=[])
+
+    with (
+        patch("app.factories.ingestion_factory.IngestionFactory.get_processor", return_value=_success_processor()),
+        patch("app.services.ingestion.ingestion_orchestrator.manager", new_callable=AsyncMock),
+        patch("app.services.ingestion.ingestion_orchestrator.settings") as mock_settings,
+    ):
+        mock_settings.INGESTION_STREAMING_ENABLED = False
+        _configure_status_flush(mock_settings)
+
+        await orchestrator.ingest_files(
+            file_paths=file_paths,
+            pipeline=pipeline,
+            vector_store=MagicMock(),
+            connector_id=uuid4(),
+            connector_acl=[],
+            ai_provider="gemini",
+            batch_size=10,
+            num_workers=0,
+            docs_map=docs_map,
+            ignore_connector_status=True,
+        )
+
+    pipeline.arun.assert_called_once()
+    assert len(pipeline.arun.call_args.kwargs["documents"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_ingest_files_streaming_pipeline_failure_marks_pending_docs_failed(mock_dependencies):
+    """A pipeline failure fails the in-flight batch and every extracted doc still waiting in the queue."""
+    orchestrator = _make_orchestrator(mock_dependencies)
+
+    docs_map = {f"f{i}.pdf": MagicMock(id=uuid4()) for i in range(3)}
+    file_paths = [(f"/tmp/{name}", name) for name in docs_map]
+
+    pipeline = MagicMock()
+    pipeline.arun = AsyncMock(side_effect=RuntimeError("qdrant down"))
+
+    with (
+        patch("app.factories.ingestion_factory.IngestionFactory.get_processor", return_value=_success_processor()),
+        patch("app.services.ingestion.ingestion_orchestrator.manager", new_callable=AsyncMock),
+        patch("app.services.ingestion.ingestion_orchestrator.settings") as mock_settings,
+    ):
+        mock_settings.INGESTION_STREAMING_ENABLED = True
+        _configure_status_flush(mock_settings)
+        mock_settings.INGESTION_STREAM_HIGH_WATER_MARK = 8
+        mock_settings.INGESTION_STREAM_FLUSH_SEGMENTS = 1
+
+        with pytest.raises(RuntimeError):
+            await orchestrator.ingest_files(
+                file_paths=file_paths,
+                pipeline=pipeline,
+                vector_store=MagicMock(),
+                connector_id=uuid4(),
+                connector_acl=[],
+                ai_provider="gemini",
+                batch_size=10,
+                num_workers=0,
+                docs_map=docs_map,
+                ignore_connector_status=True,
+            )
+
+    # Every doc that was extracted before the failure must be FAILED, none left PROCESSING
+    statuses = _final_statuses(orchestrator.doc_repo)
+    assert statuses
+    assert DocStatus.PROCESSING not in statuses.values()
+
+
+@pytest.mark.asyncio
+async def test_ingest_files_extracts_files_concurrently(mock_dependencies):
+    """Up to one file per extraction worker is parsed at a time; every file still gets indexed."""
+    orchestrator = _make_orchestrator(mock_dependencies)
+    orchestrator.extraction_executor = ExtractionExecutor(max_workers=3, timeout_seconds=30)
+
+    docs_map = {f"f{i}.pdf": MagicMock(id=uuid4()) for i in range(7)}
+    file_paths = [(f"/tmp/{name}", name) for name in docs_map]
+
+    in_flight = 0
+    peak = 0
+
+    async def _process(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [MagicMock(success=True, content="content", metadata={})]
+
+    processor = AsyncMock()
+    processor.process.side_effect = _process
+
+    pipeline = MagicMock()
+    pipeline.arun = AsyncMock(return_value=[])
+    mock_dependencies["vector_repo"].count_by_document_id.return_value = 0
+
+    with (
+        patch("app.factories.ingestion_factory.IngestionFactory.get_processor", return_value=processor),
+        patch("app.services.ingestion.ingestion_orchestrator.manager", new_callable=AsyncMock),
+        patch("app.services.ingestion.ingestion_orchestrator.settings") as mock_settings,
+    ):
+        mock_settings.INGESTION_STREAMING_ENABLED = False
+        _configure_status_flush(mock_settings)
+
+        await orchestrator.ingest_files(
+            file_paths=file_paths,
+            pipeline=pipeline,
+            vector_store=MagicMock(),
+            connector_id=uuid4(),
+            connector_acl=[],
+            ai_provider="gemini",
+            batch_size=10,
+            num_workers=0,
+            docs_map=docs_map,
+            ignore_connector_status=True,
+        )
+
+    assert peak == 3
+    assert processor.process.await_count == 7
+    assert len(pipeline.arun.call_args.kwargs["documents"]) == 7
+
+
+@pytest.mark.asyncio
+async def test_unbuffered_status_mirror_failure_is_logged(mock_dependencies, caplog):
+    """A lost CSV status mirror keeps the document hidden until the reconcile: it must leave a trace."""
+    orchestrator = IngestionOrchestrator(
+        db=mock_dependencies["db"],
+        vector_repo=mock_dependencies["vector_repo"],
+        vector_service=mock_dependencies["vector_service"],
+        settings_service=mock_dependencies["settings_service"],
+    )
+    mock_dependencies["vector_service"].set_document_status.side_effect = RuntimeError("qdrant down")
+    doc_id = uuid4()
+
+    with caplog.at_level("WARNING", logger="app.services.ingestion.ingestion_orchestrator"):
+        await orchestrator._mirror_status_once("ollama", DocStatus.INDEXED, doc_id)
+
+    record = next(r for r in caplog.records if "STATUS MIRROR FAIL" in r.getMessage())
+    assert str(doc_id) in record.getMessage()
+    assert record.exc_info is not None
@@ -0,0 +1,220 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.enums import DocStatus
+from app.services.ingestion.ingestion_orchestrator import AdaptiveBatchSizer, IngestionOrchestrator
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+@pytest.fixture
+def orchestrator():
+    vector_service = AsyncMock()
+    vector_service.get_collection_name = AsyncMock(return_value="test_collection")
+    vector_service.get_qdrant_client = AsyncMock()
+    vector_service.get_qdrant_client.return_value.collection_exists = MagicMock(return_value=True)
+
+    orch = IngestionOrchestrator(
+        db=AsyncMock(),
+        vector_repo=AsyncMock(),
+        vector_service=vector_service,
+        settings_service=AsyncMock(),
+    )
+    orch.connector_repo = AsyncMock()
+    orch.doc_repo = AsyncMock()
+    return orch
+
+
+@pytest.fixture
+def csv_doc(orchestrator, tmp_path):
+    csv_file = tmp_path / "data.csv"
+    rows = ["id,name"] + [f"{i},item {i}" for i in range(23)]
+    csv_file.write_text("\n".join(rows), encoding="utf-8")
+
+    doc = MagicMock()
+    doc.id = uuid4()
+    doc.connector_id = uuid4()
+    doc.file_path = "data.csv"
+    doc.file_metadata = {}
+
+    connector = MagicMock()
+    connector.id = doc.connector_id
+    connector.configuration = {"ai_provider": "gemini", "connector_acl": ["public"]}
+
+    orchestrator.doc_repo.get_by_id.return_value = doc
+    orchestrator.connector_repo.get_by_id.return_value = connector
+    return doc, str(csv_file)
+
+
+def test_adaptive_batch_sizer_aimd():
+    sizer = AdaptiveBatchSizer(initial=40, minimum=5, maximum=50)
+
+    delay = sizer.on_rate_limit(attempt=1)
+    assert sizer.size == 20
+    assert delay > 0
+
+    sizer.on_success()
+    assert sizer.size > 20
+
+    for _ in range(10):
+        sizer.on_rate_limit(attempt=1)
+    assert sizer.size == 5
+
+    for _ in range(100):
+        sizer.on_success()
+    assert sizer.size == 50
+
+
+def test_adaptive_batch_sizer_detects_rate_limits():
+    assert AdaptiveBatchSizer.is_rate_limit_error(RateLimitError("boom"))
+    assert AdaptiveBatchSizer.is_rate_limit_error(Exception("429 RESOURCE_EXHAUSTED"))
+    assert not AdaptiveBatchSizer.is_rate_limit_error(ValueError("bad input"))
+
+
+@pytest.mark.asyncio
+async def test_embed_with_backoff_shrinks_batch_on_rate_limit(orchestrator):
+    embed_model = MagicMock()
+    calls = []
+
+    async def _embed(chunk):
+        calls.append(len(chunk))
+        if len(calls) == 1:
+            raise RateLimitError("Too Many Requests")
+        return [[0.1]] * len(chunk)
+
+    embed_model.aget_text_embedding_batch = AsyncMock(side_effect=_embed)
+    sizer = AdaptiveBatchSizer(initial=8, minimum=2, maximum=8)
+
+    with patch("app.services.ingestion.ingestion_orchestrator.asyncio.sleep", new_callable=AsyncMock):
+        embeddings = await orchestrator._embed_with_backoff(embed_model, [f"t{i}" for i in range(8)], sizer)
+
+    assert len(embeddings) == 8
+    assert calls[0] == 8
+    assert calls[1] == 4  # retried with halved batch
+
+
+@pytest.mark.asyncio
+async def test_embed_with_backoff_raises_non_rate_limit_errors(orchestrator):
+    embed_model = MagicMock()
+    embed_model.aget_text_embedding_batch = AsyncMock(side_effect=ValueError("bad"))
+
+    with pytest.raises(ValueError):
+        await orchestrator._embed_with_backoff(embed_model, ["a"], AdaptiveBatchSizer())
+
+
+@pytest.mark.asyncio
+async def test_ingest_csv_document_pipelines_batches_under_concurrency_limit(orchestrator, csv_doc):
+    doc, full_path = csv_doc
+    in_flight = 0
+    peak = 0
+
+    async def _embed(chunk):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[0.1, 0.2]] * len(chunk)
+
+    embed_model = MagicMock()
+    embed_model.aget_text_embedding_batch = AsyncMock(side_effect=_embed)
+    orchestrator.vector_service.get_embedding_model = AsyncMock(return_value=embed_model)
+
+    with (
+        patch("app.core.interfaces.base_connector.get_full_path_from_connector", return_value=full_path),
+        patch("app.services.ingestion.ingestion_orchestrator.manager", new_callable=AsyncMock),
+        patch("app.services.ingestion.ingestion_orchestrator.settings") as mock_settings,
+    ):
+        mock_settings.INGESTION_CSV_CONCURRENCY = 2
+        mock_settings.INGESTION_CSV_BATCH_SIZE = 5
+        mock_settings.INGESTION_CSV_MIN_BATCH_SIZE = 5
+        mock_settings.INGESTION_CSV_MAX_BATCH_SIZE = 5
+
+        await orchestrator.ingest_csv_document(doc.id)
+
+    assert peak == 2
+    upserted = [p for c in orchestrator.vector_repo.upsert_points.call_args_list for p in c.kwargs["points"]]
+    assert len(upserted) == 23
+    assert all(p.payload["connector_acl"] == ["public"] for p in upserted)
+
+    final_update = orchestrator.doc_repo.update.call_args_list[-1].args[1]
+    assert final_update["status"] == DocStatus.INDEXED
+    assert final_update["vector_point_count"] == 23
+
+
+@pytest.mark.asyncio
+async def test_ingest_csv_document_incremental_only_embeds_diff(orchestrator, tmp_path):
+    """With a primary key, unchanged rows are skipped and vanished rows are deleted."""
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("id,name\n1,alpha\n2,beta\n3,gamma\n", encoding="utf-8")
+
+    doc = MagicMock()
+    doc.id = uuid4()
+    doc.connector_id = uuid4()
+    doc.file_path = "data.csv"
+    doc.file_metadata = {"ai_schema": {"renaming_map": {}, "semantic_cols": ["name"], "primary_id_col": "id"}}
+
+    connector = MagicMock()
+    connector.id = doc.connector_id
+    connector.configuration = {"ai_provider": "gemini", "connector_acl": []}
+    orchestrator.doc_repo.get_by_id.return_value = doc
+    orchestrator.connector_repo.get_by_id.return_value = connector
+
+    # Row 1 already indexed with identical content, row 2 indexed with stale content,
+    # plus a point for a row that no longer exists.
+    from app.schemas.ingestion import IndexingStrategy
+    from app.services.ingestion.transformers.smart_row_transformer import SmartRowTransformer
+
+    transformer = SmartRowTransformer(IndexingStrategy(**doc.file_metadata["ai_schema"]))
+    text, payload = transformer.transform({"id": "1", "name": "alpha"}, 0)
+    id_1 = IngestionOrchestrator._csv_row_point_id(doc.id, "1", 0, set())
+    id_2 = IngestionOrchestrator._csv_row_point_id(doc.id, "2", 1, set())
+    gone = IngestionOrchestrator._csv_row_point_id(doc.id, "99", 5, set())
+    orchestrator.vector_repo.get_payload_field_by_document_id.return_value = {
+        id_1: IngestionOrchestrator._csv_row_hash(text, payload, []),
+        id_2: "outdated",
+        gone: "whatever",
+    }
+
+    embed_model = MagicMock()
+    embed_model.aget_text_embedding_batch = AsyncMock(side_effect=lambda chunk: [[0.1]] * len(chunk))
+    orchestrator.vector_service.get_embedding_model = AsyncMock(return_value=embed_model)
+
+    with (
+        patch("app.core.interfaces.base_connector.get_full_path_from_connector", return_value=str(csv_file)),
+        patch("app.services.ingestion.ingestion_orchestrator.manager", new_callable=AsyncMock),
+        patch(
+            "app.services.ingestion.ingestion_orchestrator.invalidate_cached_answers", new_callable=AsyncMock
+        ) as mock_invalidate,
+    ):
+        await orchestrator.ingest_csv_document(doc.id)
+
+    # Changed rows: cached answers built from the document are dropped
+    mock_invalidate.assert_awaited_once_with(orchestrator.vector_service, [doc.id])
+    orchestrator.vector_repo.delete_by_document_id.assert_not_called()
+    upserted = [p for c in orchestrator.vector_repo.upsert_points.call_args_list for p in c.kwargs["points"]]
+    assert sorted(p.payload["name"] for p in upserted) == ["beta", "gamma"]
+    assert id_2 in {p.id for p in upserted}
+    assert all(p.payload["_row_hash"] for p in upserted)
+    orchestrator.vector_repo.delete_points.assert_awaited_once_with("test_collection", [gone])
+
+    final_update = orchestrator.doc_repo.update.call_args_list[-1].args[1]
+    assert final_update["vector_point_count"] == 3
+
+
+def test_csv_row_point_id_is_keyed_on_primary_key():
+    doc_id = uuid4()
+    assert IngestionOrchestrator._csv_row_point_id(doc_id, "A1", 0, set()) == IngestionOrchestrator._csv_row_point_id(
+        doc_id, "A1", 57, set()
+    )
+    # Empty or duplicated keys fall back to the line number
+    taken = {IngestionOrchestrator._csv_row_point_id(doc_id, "A1", 0, set())}
+    assert IngestionOrchestrator._csv_row_point_id(doc_id, "A1", 3, taken) not in taken
+    assert IngestionOrchestrator._csv_row_point_id(doc_id, "", 3, set()) == IngestionOrchestrator._csv_row_point_id(
+        doc_id, None, 3, set()
+    )
@@ -0,0 +1,133 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.enums import DocStatus
+from app.services.ingestion.ingestion_orchestrator import IngestionOrchestrator
+
+
+@pytest.fixture
+def orchestrator():
+    vector_service = AsyncMock()
+    vector_service.get_collection_name = AsyncMock(return_value="test_collection")
+
+    orch = IngestionOrchestrator(
+        db=AsyncMock(),
+        vector_repo=AsyncMock(),
+        vector_service=vector_service,
+        settings_service=AsyncMock(),
+        sql_discovery_service=AsyncMock(),
+    )
+    orch.connector_repo = AsyncMock()
+    orch.doc_repo = AsyncMock()
+    orch.vector_repo.count_by_document_id.return_value = 0
+    return orch
+
+
+@pytest.fixture
+def connector():
+    connector = MagicMock()
+    connector.id = uuid4()
+    connector.connector_type = "sql"
+    connector.configuration = {"ai_provider": "gemini"}
+    return connector
+
+
+def _view_docs(count, ddl_every=0):
+    docs = []
+    for i in range(count):
+        doc = MagicMock()
+        doc.id = uuid4()
+        doc.file_name = f"view_{i}"
+        doc.file_metadata = {"ddl": f"CREATE VIEW view_{i} (id INT);"} if ddl_every and i % ddl_every == 0 else {}
+        docs.append(doc)
+    return docs
+
+
+def _pipeline(fail_on_call=None):
+    calls = []
+
+    async def _arun(documents, num_workers, show_progress):
+        calls.append(documents)
+        if fail_on_call == len(calls):
+            raise RuntimeError("embedding provider down")
+        nodes = []
+        for llama_doc in documents:
+            node = MagicMock(get_content=lambda: "schema")
+            node.metadata = {"connector_document_id": llama_doc.metadata["connector_document_id"]}
+            nodes.append(node)
+        return nodes
+
+    pipeline = MagicMock()
+    pipeline.cache = None
+    pipeline.arun = AsyncMock(side_effect=_arun)
+    return pipeline
+
+
+def _final_statuses(doc_repo):
+    statuses = {}
+    for c in doc_repo.bulk_update.call_args_list:
+        for doc_id, values in c.args[0].items():
+            if "status" in values:
+                statuses[doc_id] = values["status"]
+    return statuses
+
+
+@pytest.mark.asyncio
+async def test_ingest_batch_builds_pipeline_once_and_embeds_in_batches(orchestrator, connector):
+    docs = _view_docs(5, ddl_every=2)
+    orchestrator.connector_repo.get_by_id.return_value = connector
+    orchestrator.sql_discovery_service.get_views_schema_markdown.side_effect = lambda c, names, concurrency: {
+        name: f"# Table: {name}" for name in names
+    }
+    pipeline = _pipeline()
+    orchestrator.setup_pipeline = AsyncMock(return_value=(pipeline, MagicMock(), 10, 0, None, None))
+
+    with (
+        patch("app.services.ingestion.ingestion_orchestrator.manager", new_callable=AsyncMock),
+        patch("app.services.ingestion.ingestion_orchestrator.settings.INGESTION_SQL_VIEW_BATCH_SIZE", 2),
+    ):
+        await orchestrator.ingest_batch(connector.id, docs)
+
+    orchestrator.setup_pipeline.assert_awaited_once_with(connector, disable_extraction=True)
+    assert [len(c.kwargs["documents"]) for c in pipeline.arun.call_args_list] == [2, 2, 1]
+
+    # Only views without stored DDL are introspected, all in one call
+    orchestrator.sql_discovery_service.get_views_schema_markdown.assert_awaited_once()
+    assert orchestrator.sql_discovery_service.get_views_schema_markdown.call_args.args[1] == ["view_1", "view_3"]
+    texts = [d.text for c in pipeline.arun.call_args_list for d in c.kwargs["documents"]]
+    assert texts[0] == "CREATE VIEW view_0 (id INT);"
+    assert texts[1] == "# Table: view_1"
+
+    assert _final_statuses(orchestrator.doc_repo) == {d.id: DocStatus.INDEXED for d in docs}
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_does_not_stop_other_views(orchestrator, connector):
+    docs = _view_docs(4, ddl_every=1)
+    pipeline = _pipeline(fail_on_call=1)
+    orchestrator.setup_pipeline = AsyncMock(return_value=(pipeline, MagicMock(), 10, 0, None, None))
+
+    with (
+        patch("app.services.ingestion.ingestion_orchestrator.manager", new_callable=AsyncMock),
+        patch("app.services.ingestion.ingestion_orchestrator.settings.INGESTION_SQL_VIEW_BATCH_SIZE", 2),
+    ):
+        errors = await orchestrator.ingest_sql_views(connector, docs)
+
+    assert set(errors) == {docs[0].id, docs[1].id}
+    statuses = _final_statuses(orchestrator.doc_repo)
+    assert [statuses[d.id] for d in docs] == [DocStatus.FAILED, DocStatus.FAILED, DocStatus.INDEXED, DocStatus.INDEXED]
+
+
+@pytest.mark.asyncio
+async def test_ingest_sql_view_raises_on_failure(orchestrator, connector):
+    doc = _view_docs(1, ddl_every=1)[0]
+    orchestrator.doc_repo.get_by_id.return_value = doc
+    orchestrator.setup_pipeline = AsyncMock(side_effect=RuntimeError("qdrant down"))
+
+    with patch("app.services.ingestion.ingestion_orchestrator.manager", new_callable=AsyncMock):
+        with pytest.raises(RuntimeError, match="qdrant down"):
+            await orchestrator.ingest_sql_view(doc.id, connector)
+
+    assert _final_statuses(orchestrator.doc_repo) == {doc.id: DocStatus.FAILED}
@@ -107,7 +107,7 @@ async def test_image_processor_respects_provider():
                     result = await processor.process("test.png", ai_provider=None)
                     assert len(result) == 1
                     assert result[0].content == "desc"
-                    mock_settings_service.get_value.assert_awaited_with("embedding_provider")
+                    mock_settings_service.get_value.assert_any_await("embedding_provider")
 
 
 @pytest.mark.asyncio
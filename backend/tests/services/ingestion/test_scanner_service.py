@@ -154,6 +154,38 @@ async def test_scan_folder_zombie_cleanup_batched(
         mock_vector_del.assert_called_with(doc_id)
 
 
+@pytest.mark.asyncio
+async def test_scan_folder_invalidates_cached_answers_of_changed_files(
+    scanner_service, mock_doc_repo, mock_connector_repo, mock_connector, mock_vector_service, connector_id
+):
+    """Modified and deleted files invalidate the semantic cache entries citing them, after commit."""
+    mock_connector_repo.get_by_id.return_value = mock_connector
+    mock_connector_repo.update.return_value = mock_connector
+
+    modified, unchanged, gone = MagicMock(id=uuid4()), MagicMock(id=uuid4()), MagicMock(id=uuid4())
+    modified.file_path, unchanged.file_path, gone.file_path = "modified.txt", "unchanged.txt", "gone.txt"
+    mock_doc_repo.get_by_connector.return_value = [modified, unchanged, gone]
+
+    deltas = {"modified.txt": ("update", {"id": modified.id}), "unchanged.txt": (None, None)}
+
+    with (
+        patch("app.services.scanner_service.ScannerService._run_blocking_io") as mock_io,
+        patch(
+            "app.services.scanner_service.ScannerService._determine_file_delta",
+            new=AsyncMock(side_effect=lambda rel_path, *args: deltas[rel_path]),
+        ),
+        patch("app.services.scanner_service.ScannerService._safe_emit", new_callable=AsyncMock),
+        patch("app.services.scanner_service.ScannerService._safe_delete_vectors", new_callable=AsyncMock),
+        patch("app.services.scanner_service.manager.emit_document_deleted", new_callable=AsyncMock),
+        patch("app.services.scanner_service.invalidate_cached_answers", new_callable=AsyncMock) as mock_invalidate,
+    ):
+        mock_io.side_effect = [True, {"modified.txt": "/tmp/modified.txt", "unchanged.txt": "/tmp/unchanged.txt"}]
+
+        await scanner_service.scan_folder(connector_id, "/tmp")
+
+    mock_invalidate.assert_awaited_once_with(mock_vector_service, [modified.id, gone.id])
+
+
 @pytest.mark.asyncio
 async def test_determine_file_delta_new(scanner_service, mock_doc_repo, connector_id):
     """Test _determine_file_delta for a new file."""
@@ -0,0 +1,150 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.exceptions import TechnicalError
+from app.models.enums import DocStatus
+from app.services.ingestion.status_buffer import DocumentStatusBuffer, ProgressCoalescer
+
+
+def _buffer(max_rows=100, interval_ms=10_000):
+    repo = AsyncMock()
+    return DocumentStatusBuffer(repo, asyncio.Lock(), interval_ms=interval_ms, max_rows=max_rows), repo
+
+
+@pytest.mark.asyncio
+async def test_updates_are_merged_per_document():
+    buffer, repo = _buffer()
+    doc_id = uuid4()
+
+    await buffer.update(doc_id, {"status": DocStatus.PROCESSING})
+    await buffer.update(doc_id, {"status": DocStatus.INDEXED, "chunks_total": 3})
+    await buffer.close()
+
+    repo.bulk_update.assert_awaited_once_with({doc_id: {"status": DocStatus.INDEXED, "chunks_total": 3}})
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_max_rows_pending():
+    buffer, repo = _buffer(max_rows=2)
+
+    await buffer.update(uuid4(), {"status": DocStatus.INDEXED})
+    repo.bulk_update.assert_not_called()
+    await buffer.update(uuid4(), {"status": DocStatus.INDEXED})
+
+    repo.bulk_update.assert_awaited_once()
+    assert buffer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_flushes_periodically_in_background():
+    buffer, repo = _buffer(interval_ms=10)
+
+    async with buffer:
+        await buffer.update(uuid4(), {"status": DocStatus.PROCESSING})
+        await asyncio.sleep(0.05)
+        repo.bulk_update.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_newer_changes():
+    buffer, repo = _buffer()
+    doc_id = uuid4()
+    repo.bulk_update.side_effect = TechnicalError("db down")
+
+    await buffer.update(doc_id, {"status": DocStatus.PROCESSING, "error_message": None})
+    with pytest.raises(TechnicalError):
+        await buffer.flush()
+    await buffer.update(doc_id, {"status": DocStatus.FAILED})
+
+    repo.bulk_update.side_effect = None
+    await buffer.flush()
+
+    repo.bulk_update.assert_awaited_with({doc_id: {"status": DocStatus.FAILED, "error_message": None}})
+
+
+@pytest.mark.asyncio
+async def test_progress_coalescer_sends_latest_frame_per_entity():
+    emitter = AsyncMock()
+    progress = ProgressCoalescer(emitter, interval_ms=10_000)
+    connector_id = uuid4()
+
+    for i in range(1, 101):
+        await progress.emit_connector_progress(connector_id, i, 100, float(i))
+    await progress.emit_document_update("doc-1", DocStatus.PROCESSING, "Reading...")
+    await progress.emit_document_update("doc-1", DocStatus.INDEXED, "Indexed 2 chunks", vector_point_count=2)
+    await progress.emit_document_update("doc-2", DocStatus.FAILED, "Preparation Error")
+    await progress.close()
+
+    emitter.emit_connector_progress.assert_awaited_once_with(connector_id, 100, 100, 100.0)
+    assert emitter.emit_document_update.await_count == 2
+    emitter.emit_document_update.assert_any_await("doc-1", DocStatus.INDEXED, "Indexed 2 chunks", vector_point_count=2)
+    emitter.emit_document_update.assert_any_await("doc-2", DocStatus.FAILED, "Preparation Error")
+
+
+@pytest.mark.asyncio
+async def test_status_transitions_are_handed_to_callback_grouped_by_status():
+    repo = AsyncMock()
+    on_status_flush = AsyncMock()
+    buffer = DocumentStatusBuffer(repo, asyncio.Lock(), interval_ms=10_000, on_status_flush=on_status_flush)
+    indexed_a, indexed_b, failed = uuid4(), uuid4(), uuid4()
+
+    await buffer.update(indexed_a, {"status": DocStatus.PROCESSING})
+    await buffer.update(indexed_a, {"status": DocStatus.INDEXED})
+    await buffer.update(indexed_b, {"status": DocStatus.INDEXED})
+    await buffer.update(failed, {"status": DocStatus.FAILED})
+    await buffer.update(uuid4(), {"vector_point_count": 3})  # No status change
+    await buffer.close()
+
+    on_status_flush.assert_awaited_once_with({"indexed": [indexed_a, indexed_b], "failed": [failed]})
+
+
+@pytest.mark.asyncio
+async def test_failed_status_callback_is_retried_on_next_flush():
+    repo = AsyncMock()
+    on_status_flush = AsyncMock(side_effect=RuntimeError("qdrant down"))
+    buffer = DocumentStatusBuffer(repo, asyncio.Lock(), interval_ms=10_000, on_status_flush=on_status_flush)
+    doc_id = uuid4()
+
+    await buffer.update(doc_id, {"status": DocStatus.PROCESSING})
+    await buffer.flush()  # Database write succeeds, mirror fails
+    repo.bulk_update.assert_awaited_once()
+    assert buffer.pending_count == 0
+    assert buffer.mirror_pending_count == 1
+
+    on_status_flush.side_effect = None
+    await buffer.update(doc_id, {"status": DocStatus.INDEXED})
+    await buffer.flush()
+
+    # Only the latest status is sent: a stale PROCESSING can never land after INDEXED
+    on_status_flush.assert_awaited_with({"indexed": [doc_id]})
+    assert buffer.mirror_pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_status_callbacks_run_one_at_a_time_in_write_order():
+    repo = AsyncMock()
+    mirrored = []
+    release = asyncio.Event()
+
+    async def on_status_flush(by_status):
+        if not mirrored:
+            await release.wait()  # First mirror is slow
+        mirrored.append(by_status)
+
+    buffer = DocumentStatusBuffer(repo, asyncio.Lock(), interval_ms=10_000, on_status_flush=on_status_flush)
+    doc_id = uuid4()
+
+    await buffer.update(doc_id, {"status": DocStatus.PROCESSING})
+    first = asyncio.create_task(buffer.flush())
+    await asyncio.sleep(0)
+    await buffer.update(doc_id, {"status": DocStatus.INDEXED})
+    second = asyncio.create_task(buffer.flush())
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert mirrored == [{"processing": [doc_id]}, {"indexed": [doc_id]}]
+    assert buffer.mirror_pending_count == 0
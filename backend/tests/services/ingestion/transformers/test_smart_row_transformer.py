@@ -1,6 +1,7 @@
 import sys
 from unittest.mock import MagicMock
 import pytest
+from qdrant_client.http.models import PayloadSchemaType
 
 # Mock dependencies globally for test collection
 sys.modules["pyodbc"] = MagicMock()
@@ -86,3 +87,28 @@ def test_enforce_type_edge_cases(transformer):
     assert transformer._enforce_type("") is None
     assert transformer._enforce_type(None) is None
     assert transformer._enforce_type(123) == 123
+
+
+def test_payload_index_schema_types_filter_columns(transformer):
+    """Exact filters: integer when every value is an int, keyword otherwise. Range filters: integer or float."""
+    rows = [
+        {"title": "A", "category": "Brakes", "id": "123", "value": "19.99"},
+        {"title": "B", "category": "Tires", "id": "124", "value": "5"},
+    ]
+    payloads = [transformer.transform(row, i)[1] for i, row in enumerate(rows, start=1)]
+
+    schema = transformer.payload_index_schema(payloads)
+
+    assert schema == {
+        "category": PayloadSchemaType.KEYWORD,
+        "id": PayloadSchemaType.INTEGER,
+        "value": PayloadSchemaType.FLOAT,
+    }
+
+
+def test_payload_index_schema_without_samples_uses_widest_types(transformer):
+    assert transformer.payload_index_schema([]) == {
+        "category": PayloadSchemaType.KEYWORD,
+        "id": PayloadSchemaType.KEYWORD,
+        "value": PayloadSchemaType.FLOAT,
+    }
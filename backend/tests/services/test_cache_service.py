@@ -0,0 +1,346 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import semantic_cache_index, semantic_cache_l1
+from app.services.cache_service import SemanticCacheService
+from app.services.semantic_cache_index import SemanticCacheIndex
+from app.services.semantic_cache_l1 import INVALIDATION_CHANNEL, SemanticCacheL1
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return command
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.zsets = {}
+        self.sets = {}
+        self.round_trips = 0
+        self.publish = AsyncMock()
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def pttl(self, key):
+        return 60000 if key in self.values else -2
+
+    async def setex(self, name, time, value):
+        self.values[name] = value
+
+    async def set(self, name, value, nx=False, ex=None):
+        if nx and name in self.values:
+            return None
+        self.values[name] = value
+        return True
+
+    async def exists(self, key):
+        return int(key in self.values)
+
+    async def scan(self, cursor, match, count):
+        prefix = match.rstrip("*")
+        return 0, [key for key in list(self.values) + list(self.zsets) if key.startswith(prefix)]
+
+    async def scan_iter(self, match, count):
+        for key in (await self.scan(0, match, count))[1]:
+            yield key
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.zsets.pop(key, None)
+            self.sets.pop(key, None)
+
+    async def sadd(self, name, *members):
+        self.sets.setdefault(name, set()).update(members)
+
+    async def smembers(self, name):
+        return set(self.sets.get(name, ()))
+
+    async def expire(self, name, time):
+        return name in self.sets
+
+    async def zadd(self, name, mapping, xx=False, incr=False):
+        zset = self.zsets.setdefault(name, {})
+        for member, score in mapping.items():
+            if xx and member not in zset:
+                continue
+            zset[member] = zset.get(member, 0) + score if incr else score
+
+    async def zrange(self, name, start, end):
+        members = sorted(self.zsets.get(name, {}).items(), key=lambda item: item[1])
+        return [member for member, _ in members][start : None if end == -1 else end + 1]
+
+    async def zcard(self, name):
+        return len(self.zsets.get(name, {}))
+
+    async def zrem(self, name, *members):
+        for member in members:
+            self.zsets.get(name, {}).pop(member, None)
+
+    async def zunionstore(self, dest, keys):
+        union = {}
+        for key, weight in keys.items():
+            for member, score in self.zsets.get(key, {}).items():
+                union[member] = union.get(member, 0) + score * weight
+        self.zsets[dest] = union
+
+
+@pytest.fixture
+def l1():
+    cache = SemanticCacheL1()
+    cache.set_active(True)
+    with patch.object(semantic_cache_l1, "_global_l1", cache):
+        yield cache
+
+
+@pytest.fixture
+def service():
+    redis = _FakeRedis()
+    vector_service = MagicMock()
+    vector_service.get_async_qdrant_client = AsyncMock()
+    with (
+        patch.object(SemanticCacheService, "_redis_pool", redis),
+        patch.object(SemanticCacheService, "_initialized_providers", {"ollama"}),
+    ):
+        yield SemanticCacheService(vector_service)
+
+
+@pytest.mark.asyncio
+async def test_repeated_exact_question_is_served_by_l1(service, l1):
+    key = service._generate_cache_key("What is Vectra?", "a1")
+    service.redis.values[key] = json.dumps({"response": "cached"})
+
+    assert await service.get_cached_response("What is Vectra?", "a1") == {"response": "cached"}
+    assert await service.get_cached_response("what is  vectra?", "a1") == {"response": "cached"}
+
+    assert service.redis.round_trips == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetched_exact_entry_needs_no_round_trip(service):
+    key = service._generate_cache_key("What is Vectra?", "a1")
+
+    hit = service.prepare_exact_lookup("What is Vectra?", "a1")
+    hit.resolve(json.dumps({"response": "cached"}).encode(), 60000)
+    miss = service.prepare_exact_lookup("Unknown", "a1")
+    miss.resolve(None, -2)
+
+    assert hit.cache_key == key
+    assert await service.get_cached_response("What is Vectra?", "a1", prefetched=hit) == {"response": "cached"}
+    assert await service.get_cached_response("Unknown", "a1", prefetched=miss) is None
+    assert service.redis.round_trips == 0
+
+    # Not resolved (e.g. history load timed out): regular lookup
+    service.redis.values[key] = json.dumps({"response": "cached"})
+    pending = service.prepare_exact_lookup("What is Vectra?", "a1")
+    assert await service.get_cached_response("What is Vectra?", "a1", prefetched=pending) == {"response": "cached"}
+    assert service.redis.round_trips == 1
+
+
+@pytest.mark.asyncio
+async def test_semantic_hit_is_remembered_under_the_asking_question(service, l1):
+    stored_key = service._generate_cache_key("What is Vectra?", "a1")
+    service.redis.values[stored_key] = json.dumps({"response": "cached"})
+
+    client = AsyncMock()
+    client.query_points.return_value = MagicMock(points=[MagicMock(payload={"cache_key": stored_key}, score=0.93)])
+    service.vector_service.get_async_qdrant_client.return_value = client
+
+    hit = await service.get_cached_response("Tell me about Vectra", "a1", embedding=[0.1], min_score=0.9)
+    assert hit == {"response": "cached"}
+
+    # Asked again: no embedding, no Qdrant, no Redis
+    round_trips = service.redis.round_trips
+    assert await service.get_cached_response("Tell me about Vectra", "a1", min_score=0.9) == hit
+    assert client.query_points.await_count == 1
+    assert service.redis.round_trips == round_trips
+
+
+@pytest.mark.asyncio
+async def test_writes_and_clears_publish_invalidations(service, l1):
+    key = service._generate_cache_key("q", "a1")
+    l1.put(key, json.dumps({"response": "old"}), l1.generation)
+
+    with patch.object(service, "_cache_in_qdrant", new_callable=AsyncMock):
+        await service.set_cached_response("q", "a1", [0.1], {"response": "new"})
+
+    assert l1.get(key) is None
+    service.redis.publish.assert_awaited_with(INVALIDATION_CHANNEL, json.dumps({"keys": [key]}))
+
+    l1.put(key, json.dumps({"response": "new"}), l1.generation)
+    with patch.object(service, "_purge_qdrant_points", new_callable=AsyncMock):
+        assert await service.clear_assistant_cache("a1") == 1
+
+    assert l1.get(key) is None
+    assert "cache_idx:a1" not in service.redis.zsets
+    service.redis.publish.assert_awaited_with(INVALIDATION_CHANNEL, json.dumps({"assistant_id": "a1"}))
+
+
+@pytest.mark.asyncio
+async def test_in_memory_index_answers_semantic_lookups_without_qdrant(service):
+    stored_key = service._generate_cache_key("What is Vectra?", "a1")
+    service.redis.values[stored_key] = json.dumps({"response": "cached"})
+
+    index = SemanticCacheIndex()
+    index.load("ollama", [("a1", stored_key, [1.0, 0.0])])
+    client = AsyncMock()
+    service.vector_service.get_async_qdrant_client.return_value = client
+
+    with (
+        patch.object(semantic_cache_index, "_global_index", index),
+        patch("app.services.semantic_cache_index.settings.SEMANTIC_CACHE_INDEX_ENABLED", True),
+    ):
+        hit = await service.get_cached_response("Tell me about Vectra", "a1", embedding=[0.9, 0.1], min_score=0.9)
+        miss = await service.get_cached_response("Unrelated", "a1", embedding=[0.0, 1.0], min_score=0.9)
+
+        # This process' writes are indexed immediately
+        with patch.object(service, "_cache_in_qdrant", new_callable=AsyncMock):
+            await service.set_cached_response("Unrelated", "a1", [0.0, 1.0], {"response": "new"})
+
+    assert hit == {"response": "cached"}
+    assert miss is None
+    client.query_points.assert_not_awaited()
+    assert index.search("a1", "ollama", [0.0, 1.0], 0.9)[1][0] == service._generate_cache_key("Unrelated", "a1")
+
+
+async def _write(service, question, assistant_id="a1"):
+    with patch.object(service, "_cache_in_qdrant", new_callable=AsyncMock):
+        await service.set_cached_response(question, assistant_id, [0.1], {"response": question})
+    return service._generate_cache_key(question, assistant_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+async def test_eviction_keeps_the_most_used_entries_per_assistant(service, policy):
+    repo = MagicMock()
+    repo.list_collections = AsyncMock(return_value=["semantic_cache_ollama", "documents"])
+    repo.delete_points = AsyncMock()
+
+    with (
+        patch("app.services.cache_service.settings.SEMANTIC_CACHE_EVICTION_POLICY", policy),
+        patch("app.repositories.vector_repository.VectorRepository", return_value=repo),
+    ):
+        keys = [await _write(service, f"q{i}") for i in range(3)]
+        other = await _write(service, "q0", assistant_id="a2")
+        if policy == "lru":
+            service.redis.zsets["cache_idx:a1"] = {keys[0]: 300.0, keys[1]: 100.0, keys[2]: 200.0}
+        await service.flush_hits({"a1": {keys[0]: 5, keys[2]: 1, "cache:a1:evicted": 1}})
+
+        assert await service.evict_over_capacity(capacity=2) == 1
+
+    assert keys[1] not in service.redis.values
+    assert set(service.redis.zsets["cache_idx:a1"]) == {keys[0], keys[2]}
+    assert other in service.redis.values
+    # Hits of untracked entries do not recreate them
+    assert "cache:a1:evicted" not in service.redis.zsets["cache_idx:a1"]
+    repo.delete_points.assert_awaited_once_with("semantic_cache_ollama", [service._point_id(keys[1])])
+    service.redis.publish.assert_awaited_with(INVALIDATION_CHANNEL, json.dumps({"deleted_keys": [keys[1]]}))
+
+
+@pytest.mark.asyncio
+async def test_lfu_ages_hit_counts_so_fresh_entries_outlive_stale_popular_ones(service):
+    repo = MagicMock()
+    repo.list_collections = AsyncMock(return_value=["semantic_cache_ollama"])
+    repo.delete_points = AsyncMock()
+
+    with (
+        patch("app.services.cache_service.settings.SEMANTIC_CACHE_EVICTION_POLICY", "lfu"),
+        patch("app.services.cache_service.settings.SEMANTIC_CACHE_LFU_DECAY", 0.5),
+        patch("app.repositories.vector_repository.VectorRepository", return_value=repo),
+    ):
+        stale = [await _write(service, f"old{i}") for i in range(2)]
+        await service.flush_hits({"a1": {key: 8 for key in stale}})
+        for _ in range(5):  # Popular once, not asked for five maintenance passes
+            assert await service.evict_over_capacity(capacity=10) == 0
+
+        fresh = await _write(service, "new")
+        assert await service.evict_over_capacity(capacity=2) == 1
+
+    assert fresh in service.redis.values
+    assert sum(key in service.redis.values for key in stale) == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_dropped_from_usage_sets(service):
+    key = await _write(service, "q")
+    del service.redis.values[key]  # Redis TTL expiry
+
+    assert await service.evict_over_capacity(capacity=10) == 0
+    assert service.redis.zsets["cache_idx:a1"] == {}
+
+
+@pytest.mark.asyncio
+async def test_reconcile_orphans_deletes_points_without_redis_entry(service):
+    alive = await _write(service, "alive")
+    points = [
+        MagicMock(id="p1", payload={"cache_key": alive}),
+        MagicMock(id="p2", payload={"cache_key": "cache:a1:expired"}),
+        MagicMock(id="p3", payload={}),
+    ]
+
+    async def scroll_points(collection_name, payload_fields, with_vectors):
+        yield points
+
+    repo = MagicMock()
+    repo.list_collections = AsyncMock(return_value=["semantic_cache_ollama"])
+    repo.scroll_points = scroll_points
+    repo.delete_points = AsyncMock()
+
+    with patch("app.repositories.vector_repository.VectorRepository", return_value=repo):
+        assert await service.reconcile_orphans() == 2
+
+    repo.delete_points.assert_awaited_once_with("semantic_cache_ollama", ["p2", "p3"])
+    service.redis.publish.assert_awaited_with(INVALIDATION_CHANNEL, json.dumps({"deleted_keys": ["cache:a1:expired"]}))
+
+
+@pytest.mark.asyncio
+async def test_document_invalidation_drops_only_entries_citing_the_document(service):
+    def _sources(*document_ids):
+        return [{"id": f"n{d}", "metadata": {"connector_document_id": d}} for d in document_ids]
+
+    async def _write_with_sources(question, assistant_id, *document_ids):
+        with patch.object(service, "_cache_in_qdrant", new_callable=AsyncMock):
+            response = {"response": question, "sources": _sources(*document_ids)}
+            await service.set_cached_response(question, assistant_id, [0.1], response)
+        return service._generate_cache_key(question, assistant_id)
+
+    repo = MagicMock()
+    repo.list_collections = AsyncMock(return_value=["semantic_cache_ollama"])
+    repo.delete_points = AsyncMock()
+
+    with patch("app.repositories.vector_repository.VectorRepository", return_value=repo):
+        cites_d1 = await _write_with_sources("q1", "a1", "d1", "d2")
+        other_assistant = await _write_with_sources("q1", "a2", "d1")
+        cites_d2 = await _write_with_sources("q2", "a1", "d2")
+        no_sources = await _write_with_sources("q3", "a1")
+
+        assert await service.invalidate_documents(["d1", "d1"]) == 2
+        assert await service.invalidate_documents(["unknown"]) == 0
+
+    assert cites_d1 not in service.redis.values and other_assistant not in service.redis.values
+    assert cites_d2 in service.redis.values and no_sources in service.redis.values
+    assert set(service.redis.zsets["cache_idx:a1"]) == {cites_d2, no_sources}
+    assert service.redis.zsets["cache_idx:a2"] == {}
+    assert "cache_doc:d1" not in service.redis.sets
+    deleted = sorted([cites_d1, other_assistant])
+    repo.delete_points.assert_awaited_once_with("semantic_cache_ollama", [service._point_id(key) for key in deleted])
+    service.redis.publish.assert_awaited_with(INVALIDATION_CHANNEL, json.dumps({"deleted_keys": deleted}))
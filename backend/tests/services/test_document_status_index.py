@@ -0,0 +1,98 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.websocket import manager
+from app.schemas.enums import DocStatus
+from app.services.document_status_index import DocumentStatusIndex
+
+
+def test_index_is_cold_until_first_rebuild_and_after_max_age():
+    index = DocumentStatusIndex(max_age_seconds=0)
+    assert not index.is_warm
+
+    index.load([])
+    index._built_at -= 1
+    assert not index.is_warm
+
+    index.max_age_seconds = 60
+    assert index.is_warm
+    index.invalidate()
+    assert not index.is_warm
+
+
+def test_document_frames_keep_the_index_current():
+    index = DocumentStatusIndex()
+    connector_id, doc_a, doc_b = uuid4(), uuid4(), uuid4()
+    index.load([(doc_a, connector_id)])
+
+    index.apply_event({"type": "DOC_UPDATE", "id": str(doc_b), "status": DocStatus.INDEXED})
+    assert index.is_indexed(doc_b)
+
+    index.apply_event({"type": "DOC_UPDATE", "id": str(doc_a), "status": DocStatus.PROCESSING})
+    assert not index.is_indexed(doc_a)
+    assert index.indexed_ids(connector_id) == set()
+
+    index.apply_event({"type": "DOC_DELETED", "id": str(doc_b), "connector_id": str(connector_id)})
+    assert not index.is_indexed(doc_b)
+
+    index.apply_event({"type": "DOC_PROGRESS", "doc_id": str(doc_a)})
+    assert index.get_stats()["indexed_documents"] == 0
+
+
+def test_connector_deletion_drops_its_documents():
+    index = DocumentStatusIndex()
+    kept, dropped = uuid4(), uuid4()
+    docs = [uuid4(), uuid4()]
+    other = uuid4()
+    index.load([(docs[0], dropped), (docs[1], dropped), (other, kept)])
+
+    index.apply_event({"type": "CONNECTOR_DELETED", "id": str(dropped)})
+
+    assert not any(index.is_indexed(d) for d in docs)
+    assert index.indexed_ids(kept) == {other}
+
+
+@pytest.mark.asyncio
+async def test_frames_received_during_rebuild_are_replayed_on_the_snapshot():
+    index = DocumentStatusIndex()
+    connector_id, doc_id = uuid4(), uuid4()
+
+    async def _snapshot():
+        # Document re-queued while the (now stale) snapshot is being read
+        index.apply_event({"type": "DOC_UPDATE", "id": str(doc_id), "status": "pending"})
+        return [(doc_id, connector_id)]
+
+    repo = AsyncMock()
+    repo.get_indexed_refs.side_effect = _snapshot
+    await index.rebuild(repo)
+
+    assert index.is_warm
+    assert not index.is_indexed(doc_id)
+
+
+@pytest.mark.asyncio
+async def test_failed_rebuild_keeps_the_index_cold():
+    index = DocumentStatusIndex()
+    repo = AsyncMock()
+    repo.get_indexed_refs.side_effect = RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        await index.rebuild(repo)
+
+    assert not index.is_warm
+    assert index._journal is None
+
+
+@pytest.mark.asyncio
+async def test_websocket_broadcast_notifies_observers():
+    index = DocumentStatusIndex()
+    doc_id = uuid4()
+    manager.add_observer(index.apply_event)
+    try:
+        await manager.emit_document_update(str(doc_id), DocStatus.INDEXED)
+    finally:
+        manager.remove_observer(index.apply_event)
+
+    assert index.is_indexed(doc_id)
@@ -0,0 +1,72 @@
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.services.query_engine_cache import QueryEngineCache
+
+
+@pytest.fixture
+def cache():
+    return QueryEngineCache(max_size=2, ttl_seconds=60)
+
+
+def _assistant(updated_at=datetime(2026, 1, 1), configuration=None):
+    connector = SimpleNamespace(
+        id=uuid4(),
+        connector_type="local_folder",
+        updated_at=None,
+        configuration=configuration or {"ai_provider": "ollama"},
+    )
+    return SimpleNamespace(id=uuid4(), updated_at=updated_at, linked_connectors=[connector])
+
+
+def test_version_changes_with_assistant_and_connectors():
+    assistant = _assistant()
+    version = QueryEngineCache.compute_version(assistant)
+
+    assert QueryEngineCache.compute_version(assistant) == version
+
+    assistant.linked_connectors[0].configuration = {"ai_provider": "gemini"}
+    assert QueryEngineCache.compute_version(assistant) != version
+
+    assistant.linked_connectors[0].configuration = {"ai_provider": "ollama"}
+    assistant.updated_at = datetime(2026, 2, 1)
+    assert QueryEngineCache.compute_version(assistant) != version
+
+
+def test_stale_version_is_never_served(cache):
+    a_id = uuid4()
+    cache.set_engine(a_id, "en", "v1", "engine")
+
+    assert cache.get_engine(a_id, "en", "v1") == "engine"
+    assert cache.get_engine(a_id, "fr", "v1") is None
+    assert cache.get_engine(a_id, "en", "v2") is None
+    assert cache.get_engine(a_id, "en", "v1") is None  # Stale entry dropped
+
+
+def test_invalidation_hooks(cache):
+    a_id, other_id, c_id = uuid4(), uuid4(), uuid4()
+    cache.set_engine(a_id, "en", "v1", "engine_en", [c_id])
+    cache.set_engine(other_id, "en", "v1", "engine_other", [c_id])
+
+    assert cache.invalidate_connector(c_id) == 2
+    assert cache.get_engine(a_id, "en", "v1") is None
+
+    cache.set_engine(a_id, "en", "v1", "engine_en")
+    cache.set_engine(a_id, "fr", "v1", "engine_fr")
+    assert cache.invalidate_assistant(a_id) == 2
+    assert cache.get_stats()["size"] == 0
+
+
+def test_lru_eviction(cache):
+    ids = [uuid4() for _ in range(3)]
+    cache.set_engine(ids[0], "en", "v", "e0")
+    cache.set_engine(ids[1], "en", "v", "e1")
+    cache.get_engine(ids[0], "en", "v")
+
+    cache.set_engine(ids[2], "en", "v", "e2")
+
+    assert cache.get_engine(ids[1], "en", "v") is None
+    assert cache.get_engine(ids[0], "en", "v") == "e0"
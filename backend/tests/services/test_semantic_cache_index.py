@@ -0,0 +1,117 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.semantic_cache_index import SemanticCacheIndex
+
+
+def test_index_is_cold_until_the_provider_is_rebuilt():
+    index = SemanticCacheIndex()
+    assert index.search("a1", "ollama", [1.0, 0.0], 0.9) == (False, None)
+
+    index.load("ollama", [])
+    # Scanned provider, assistant without entries: known miss
+    assert index.search("a1", "ollama", [1.0, 0.0], 0.9) == (True, None)
+    assert index.search("a1", "openai", [1.0, 0.0], 0.9) == (False, None)
+
+    index.invalidate()
+    assert index.search("a1", "ollama", [1.0, 0.0], 0.9) == (False, None)
+
+
+def test_search_returns_best_cosine_match_above_min_score():
+    index = SemanticCacheIndex()
+    index.load(
+        "ollama",
+        [("a1", "cache:a1:x", [1.0, 0.0]), ("a1", "cache:a1:y", [0.0, 2.0]), ("a2", "cache:a2:z", [1.0, 0.0])],
+    )
+
+    covered, match = index.search("a1", "ollama", [0.1, 1.0], 0.9)
+    assert covered
+    assert match[0] == "cache:a1:y"
+    assert match[1] == pytest.approx(0.995, abs=1e-3)
+
+    assert index.search("a1", "ollama", [1.0, 1.0], 0.9) == (True, None)
+
+
+def test_large_assistants_are_left_to_qdrant():
+    index = SemanticCacheIndex(max_vectors=2)
+    index.load("ollama", [("a1", f"cache:a1:{i}", [1.0, float(i)]) for i in range(3)])
+    assert index.search("a1", "ollama", [1.0, 0.0], 0.5) == (False, None)
+
+    index.load("ollama", [("a1", "cache:a1:0", [1.0, 0.0]), ("a1", "cache:a1:1", [0.0, 1.0])])
+    index.add("a1", "ollama", "cache:a1:1", [0.0, 1.0])  # Overwrite: still within the limit
+    assert index.search("a1", "ollama", [1.0, 0.0], 0.5)[0]
+    index.add("a1", "ollama", "cache:a1:2", [1.0, 1.0])
+    assert index.search("a1", "ollama", [1.0, 0.0], 0.5) == (False, None)
+
+
+def test_writes_and_purges_keep_the_index_current():
+    index = SemanticCacheIndex()
+    index.load("ollama", [])
+
+    index.add("a1", "ollama", "cache:a1:x", [0.0, 1.0])
+    assert index.search("a1", "ollama", [0.0, 1.0], 0.9)[1][0] == "cache:a1:x"
+
+    index.apply_message({"assistant_id": "a1"})
+    assert index.search("a1", "ollama", [0.0, 1.0], 0.9) == (True, None)
+
+
+def test_matrix_grows_and_fills_removed_rows():
+    index = SemanticCacheIndex()
+    index.load("ollama", [("a1", f"cache:a1:{i}", [1.0, float(i)]) for i in range(100)])
+    vectors = index._matrices["ollama"]["a1"]
+    assert vectors.matrix.shape[0] >= 100 and vectors.matrix.flags["C_CONTIGUOUS"]
+
+    assert vectors.remove("cache:a1:0")
+    assert len(vectors) == 99
+    assert vectors.keys[0] == "cache:a1:99" and vectors.rows["cache:a1:99"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rebuild_replays_writes_received_during_the_scan():
+    index = SemanticCacheIndex()
+
+    async def scroll_points(collection_name, payload_fields):
+        assert collection_name == "semantic_cache_ollama"
+        yield [MagicMock(payload={"assistant_id": "a1", "cache_key": "cache:a1:x"}, vector={"": [1.0, 0.0]})]
+        # Written by this process while the collection is being scanned
+        index.add("a1", "ollama", "cache:a1:y", [0.0, 1.0])
+
+    repo = MagicMock()
+    repo.scroll_points = scroll_points
+    await index.rebuild("ollama", repo)
+
+    assert index.search("a1", "ollama", [1.0, 0.0], 0.9)[1][0] == "cache:a1:x"
+    assert index.search("a1", "ollama", [0.0, 1.0], 0.9)[1][0] == "cache:a1:y"
+    assert index.get_stats()["ollama"]["vectors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_rebuild_keeps_current_content():
+    index = SemanticCacheIndex()
+    index.load("ollama", [("a1", "cache:a1:x", [1.0, 0.0])])
+
+    async def scroll_points(collection_name, payload_fields):
+        raise RuntimeError("qdrant down")
+        yield
+
+    repo = MagicMock()
+    repo.scroll_points = scroll_points
+    with pytest.raises(RuntimeError):
+        await index.rebuild("ollama", repo)
+
+    assert index.search("a1", "ollama", [1.0, 0.0], 0.9)[1][0] == "cache:a1:x"
+    assert "ollama" not in index._journals
+
+
+def test_deleted_keys_are_removed_including_during_a_rebuild():
+    index = SemanticCacheIndex()
+    index.load("ollama", [("a1", "cache:a1:x", [1.0, 0.0]), ("a1", "cache:a1:y", [0.0, 1.0])])
+
+    index.apply_message({"deleted_keys": ["cache:a1:x", "malformed"]})
+    assert index.search("a1", "ollama", [1.0, 0.0], 0.9) == (True, None)
+
+    index.begin_rebuild("ollama")
+    index.remove_keys(["cache:a1:y"])
+    index.load("ollama", [("a1", "cache:a1:y", [0.0, 1.0])])  # Snapshot read before the eviction
+    assert index.search("a1", "ollama", [0.0, 1.0], 0.9) == (True, None)
@@ -0,0 +1,90 @@
+import json
+import time
+
+from app.services.semantic_cache_l1 import SemanticCacheL1
+
+
+def _active_l1(**kwargs) -> SemanticCacheL1:
+    l1 = SemanticCacheL1(**kwargs)
+    l1.set_active(True)
+    return l1
+
+
+def test_l1_serves_only_while_active():
+    l1 = SemanticCacheL1()
+    l1.put("cache:a:1", json.dumps({"response": "x"}), l1.generation)
+    assert l1.get("cache:a:1") is None
+
+    l1.set_active(True)
+    l1.put("cache:a:1", json.dumps({"response": "x"}), l1.generation)
+    assert l1.get("cache:a:1") == {"response": "x"}
+
+    # Losing the subscription drops everything (invalidations may be missed)
+    l1.set_active(False)
+    assert l1.get("cache:a:1") is None
+    assert l1.get_stats()["size"] == 0
+
+
+def test_l1_returns_independent_copies():
+    l1 = _active_l1()
+    l1.put("cache:a:1", json.dumps({"sources": []}), l1.generation)
+
+    l1.get("cache:a:1")["sources"].append("mutated")
+    assert l1.get("cache:a:1") == {"sources": []}
+
+
+def test_l1_expiry_never_exceeds_redis_ttl():
+    l1 = _active_l1(ttl_seconds=300)
+    l1.put("cache:a:1", "{}", l1.generation, ttl_seconds=0.01)
+    time.sleep(0.02)
+    assert l1.get("cache:a:1") is None
+
+    # Already expired in Redis: not stored
+    l1.put("cache:a:2", "{}", l1.generation, ttl_seconds=0)
+    assert l1.get_stats()["size"] == 0
+
+
+def test_l1_lru_eviction():
+    l1 = _active_l1(max_entries=2)
+    for key in ("cache:a:1", "cache:a:2"):
+        l1.put(key, "{}", l1.generation)
+    l1.get("cache:a:1")
+    l1.put("cache:a:3", "{}", l1.generation)
+
+    assert l1.get("cache:a:1") == {}
+    assert l1.get("cache:a:2") is None
+
+
+def test_semantic_hits_respect_min_score_and_source_invalidation():
+    l1 = _active_l1()
+    l1.put("cache:a:asked", '{"response": "y"}', l1.generation, score=0.85, source_key="cache:a:stored")
+
+    assert l1.get("cache:a:asked", min_score=0.9) is None
+    assert l1.get("cache:a:asked", min_score=0.8) == {"response": "y"}
+
+    # Overwriting the stored question drops the semantic hits read from it
+    assert l1.invalidate_keys(["cache:a:stored"]) == 1
+    assert l1.get("cache:a:asked") is None
+
+
+def test_invalidation_messages():
+    l1 = _active_l1()
+    for key in ("cache:a:1", "cache:a:2", "cache:b:1"):
+        l1.put(key, "{}", l1.generation)
+
+    l1.apply_message({"assistant_id": "a"})
+    assert l1.get("cache:a:1") is None and l1.get("cache:a:2") is None
+    assert l1.get("cache:b:1") == {}
+
+    l1.apply_message({"keys": ["cache:b:1"]})
+    assert l1.get("cache:b:1") is None
+
+
+def test_reads_started_before_an_invalidation_are_not_stored():
+    l1 = _active_l1()
+    generation = l1.generation
+
+    l1.invalidate_keys(["cache:a:1"])
+    l1.put("cache:a:1", '{"response": "stale"}', generation)
+
+    assert l1.get("cache:a:1") is None
@@ -0,0 +1,49 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import semantic_cache_maintenance
+from app.services.semantic_cache_maintenance import drain_hits, record_cache_hit, run_maintenance
+
+
+@pytest.fixture(autouse=True)
+def empty_buffer():
+    drain_hits()
+    yield
+    drain_hits()
+
+
+def test_hits_are_buffered_until_drained():
+    record_cache_hit("a1", "cache:a1:x")
+    record_cache_hit("a1", "cache:a1:x")
+    record_cache_hit("a2", "cache:a2:y")
+
+    assert drain_hits() == {"a1": {"cache:a1:x": 2}, "a2": {"cache:a2:y": 1}}
+    assert drain_hits() == {}
+
+
+def test_hit_buffer_is_bounded():
+    with patch.object(semantic_cache_maintenance, "MAX_PENDING_HITS", 1):
+        record_cache_hit("a1", "cache:a1:x")
+        record_cache_hit("a1", "cache:a1:y")
+        record_cache_hit("a1", "cache:a1:x")
+
+    assert drain_hits() == {"a1": {"cache:a1:x": 2}}
+
+
+@pytest.mark.asyncio
+async def test_only_the_lock_holder_evicts_and_reconciles():
+    service = MagicMock()
+    service.flush_hits = AsyncMock()
+    service.evict_over_capacity = AsyncMock(return_value=3)
+    service.reconcile_orphans = AsyncMock(return_value=2)
+    service.redis.set = AsyncMock(side_effect=[True, None])
+
+    record_cache_hit("a1", "cache:a1:x")
+    assert await run_maintenance(service, 600) == {"evicted": 3, "orphans": 2}
+    service.flush_hits.assert_awaited_with({"a1": {"cache:a1:x": 1}})
+
+    # Another process already ran this interval: hits are still flushed
+    assert await run_maintenance(service, 600) == {"evicted": 0, "orphans": 0}
+    assert service.flush_hits.await_count == 2
+    assert service.evict_over_capacity.await_count == 1
@@ -84,7 +84,7 @@ async def test_vanna_engine_wrapper_aquery_success(mock_settings):
     # Mock LLM synthesis
     from llama_index.core.base.response.schema import Response
 
-    mock_vanna.llm.complete.return_value = "Synthesized answer"
+    mock_vanna.llm.acomplete = AsyncMock(return_value="Synthesized answer")
 
     import pandas as pd
 
@@ -99,6 +99,8 @@ async def test_vanna_engine_wrapper_aquery_success(mock_settings):
 
     # Assert
     assert any(x in response.response for x in ["Synthesized answer", "I found the"])
+    mock_vanna.llm.acomplete.assert_awaited_once()
+    mock_vanna.llm.complete.assert_not_called()
     assert ":::table" in response.response  # Structured data appended
     assert response.metadata["sql"] == "SELECT * FROM items"
     assert len(response.metadata["sql_query_result"]) == 1
@@ -121,3 +123,32 @@ async def test_vanna_engine_wrapper_aquery_no_results(mock_settings):
     # Assert
     assert "no results" in response.response.lower()
     assert response.metadata["sql_query_result"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_views_schema_markdown_shares_one_engine(service):
+    connector = MagicMock()
+    connector.configuration = {"host": "localhost", "port": 5432, "type": "postgresql", "schema": "public"}
+
+    engine = MagicMock()
+    inspector = MagicMock()
+
+    def _columns(view_name, schema):
+        if view_name == "broken":
+            raise RuntimeError("no such view")
+        return [{"name": "id", "type": "INTEGER", "comment": None}]
+
+    inspector.get_columns.side_effect = _columns
+
+    with (
+        patch("app.services.sql_discovery_service.create_engine", return_value=engine) as mock_create,
+        patch("app.services.sql_discovery_service.inspect", return_value=inspector),
+    ):
+        schemas = await service.get_views_schema_markdown(connector, ["v1", "v2", "broken"], concurrency=2)
+
+    mock_create.assert_called_once()
+    engine.dispose.assert_called_once()
+    assert list(schemas) == ["v1", "v2", "broken"]
+    assert schemas["v1"].startswith("# Table: v1")
+    assert "- **id** (INTEGER)" in schemas["v2"]
+    assert "Schema info unavailable" in schemas["broken"]
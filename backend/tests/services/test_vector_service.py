@@ -1,5 +1,6 @@
 import sys
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 # Pragmatic Mock for pyodbc and vanna to avoid collection errors in environments without native drivers
 sys.modules["pyodbc"] = MagicMock()
@@ -7,8 +8,12 @@ sys.modules["vanna"] = MagicMock()
 sys.modules["vanna.base"] = MagicMock()
 
 import pytest
+from qdrant_client.http.models import PayloadSchemaType
 
 from app.core.exceptions import ExternalDependencyError, TechnicalError
+from app.repositories.vector_repository import SYSTEM_PAYLOAD_INDEXES
+from app.schemas.ingestion import IndexingStrategy
+from app.services.ingestion.transformers.smart_row_transformer import SmartRowTransformer
 from app.services.vector_service import VectorService
 
 
@@ -44,6 +49,8 @@ class TestVectorService:
         VectorService._client_lock = None
         VectorService._aclient_lock = None
         VectorService._model_cache.clear()
+        VectorService._payload_indexed.clear()
+        VectorService._sparse_collections.clear()
 
     @pytest.mark.asyncio
     async def test_singleton_logic(self, mock_settings_service, mock_qdrant_module):
@@ -84,12 +91,15 @@ class TestVectorService:
         service = VectorService(mock_settings_service)
         mock_aclient = await service.get_async_qdrant_client()
         mock_aclient.collection_exists = AsyncMock(return_value=True)
+        mock_aclient.get_collection.return_value = MagicMock(payload_schema={})
         # Explicitly mock create_collection as AsyncMock to avoid 'function' object AttributeError
         mock_aclient.create_collection = AsyncMock()
 
         await service.ensure_collection_exists("test_col", "gemini")
 
         mock_aclient.create_collection.assert_not_called()
+        fields = [c.kwargs["field_name"] for c in mock_aclient.create_payload_index.await_args_list]
+        assert fields == list(SYSTEM_PAYLOAD_INDEXES)
 
     @pytest.mark.asyncio
     async def test_ensure_collection_exists_creates_if_missing(self, mock_settings_service, mock_qdrant_module):
@@ -97,6 +107,7 @@ class TestVectorService:
         service = VectorService(mock_settings_service)
         mock_aclient = await service.get_async_qdrant_client()
         mock_aclient.collection_exists = AsyncMock(return_value=False)
+        mock_aclient.get_collection.return_value = MagicMock(payload_schema={})
         mock_aclient.create_collection = AsyncMock()
 
         await service.ensure_collection_exists("test_col", "openai")
@@ -106,6 +117,171 @@ class TestVectorService:
         args = mock_aclient.create_collection.call_args[1]
         assert args["collection_name"] == "test_col"
         assert args["vectors_config"].size == 1536
+        indexed = {
+            c.kwargs["field_name"]: c.kwargs["field_schema"] for c in mock_aclient.create_payload_index.await_args_list
+        }
+        assert indexed == SYSTEM_PAYLOAD_INDEXES
+
+    @pytest.mark.asyncio
+    async def test_ensure_collection_exists_creates_system_payload_indexes_once(
+        self, mock_settings_service, mock_qdrant_module
+    ):
+        """System payload indexes are ensured once per collection, also on existing ones."""
+        service = VectorService(mock_settings_service)
+        mock_aclient = await service.get_async_qdrant_client()
+        mock_aclient.collection_exists = AsyncMock(return_value=True)
+        mock_aclient.get_collection.return_value = MagicMock(payload_schema={})
+
+        await service.ensure_collection_exists("test_col", "gemini")
+        await service.ensure_collection_exists("test_col", "gemini")
+
+        fields = [c.kwargs["field_name"] for c in mock_aclient.create_payload_index.await_args_list]
+        assert fields == list(SYSTEM_PAYLOAD_INDEXES)
+
+    @pytest.mark.asyncio
+    async def test_ensure_payload_indexes_creates_csv_filter_columns(self, mock_settings_service, mock_qdrant_module):
+        """CSV filter columns (SmartRowTransformer.payload_index_schema) get one typed index each."""
+        service = VectorService(mock_settings_service)
+        mock_aclient = await service.get_async_qdrant_client()
+        mock_aclient.get_collection.return_value = MagicMock(payload_schema={})
+        transformer = SmartRowTransformer(
+            IndexingStrategy(
+                renaming_map={}, semantic_cols=["title"], filter_exact_cols=["category"], filter_range_cols=["price"]
+            )
+        )
+        schema = transformer.payload_index_schema([{"category": "A", "price": 19.99}])
+
+        await service.ensure_payload_indexes("test_col", schema)
+
+        indexed = {
+            c.kwargs["field_name"]: c.kwargs["field_schema"] for c in mock_aclient.create_payload_index.await_args_list
+        }
+        assert indexed == schema == {"category": PayloadSchemaType.KEYWORD, "price": PayloadSchemaType.FLOAT}
+
+    @pytest.mark.asyncio
+    async def test_migrate_payload_indexes_backfills_every_collection(self, mock_settings_service, mock_qdrant_module):
+        """Existing collections get the indexes they miss, built in the background."""
+        service = VectorService(mock_settings_service)
+        mock_aclient = await service.get_async_qdrant_client()
+        collections = [MagicMock(), MagicMock()]
+        collections[0].name, collections[1].name = "col_a", "col_b"
+        mock_aclient.get_collections.return_value = MagicMock(collections=collections)
+        indexed = {
+            field: MagicMock(data_type=t) for field, t in SYSTEM_PAYLOAD_INDEXES.items() if field != "doc_status"
+        }
+        mock_aclient.get_collection.return_value = MagicMock(payload_schema=indexed)
+
+        assert await service.migrate_payload_indexes() == 2
+
+        calls = [
+            (c.kwargs["collection_name"], c.kwargs["field_name"], c.kwargs["wait"])
+            for c in mock_aclient.create_payload_index.await_args_list
+        ]
+        assert calls == [("col_a", "doc_status", False), ("col_b", "doc_status", False)]
+
+    @pytest.mark.asyncio
+    async def test_reconcile_document_status_unhides_indexed_documents(self, mock_settings_service, mock_qdrant_module):
+        """Points left non-indexed by a lost mirror are set back to indexed when the database says INDEXED."""
+        service = VectorService(mock_settings_service)
+        mock_aclient = await service.get_async_qdrant_client()
+        indexed, processing = uuid4(), uuid4()
+        mock_aclient.collection_exists.side_effect = lambda name: name == "documents_gemini"
+        mock_aclient.get_aliases.return_value = MagicMock(aliases=[])
+        mock_aclient.scroll.return_value = (
+            [
+                MagicMock(payload={"connector_document_id": str(indexed)}),
+                MagicMock(payload={"connector_document_id": str(processing)}),
+            ],
+            None,
+        )
+
+        assert await service.reconcile_document_status(lambda doc_id: doc_id == indexed) == 1
+
+        mock_aclient.set_payload.assert_awaited_once()
+        kwargs = mock_aclient.set_payload.call_args.kwargs
+        assert kwargs["collection_name"] == "documents_gemini"
+        assert kwargs["payload"] == {"doc_status": "indexed"}
+        assert kwargs["points"].must[0].match.any == [str(indexed)]
+
+    @pytest.mark.asyncio
+    async def test_migrate_collection_profile_rebuilds_and_swaps_alias(self, mock_settings_service, mock_qdrant_module):
+        """A collection not matching its profile is copied to a new collection served through an alias."""
+        service = VectorService(mock_settings_service)
+        mock_aclient = await service.get_async_qdrant_client()
+        info = MagicMock()
+        info.config.params.vectors.size = 768
+        info.payload_schema = {}
+        mock_aclient.get_collection.return_value = info
+        mock_aclient.get_aliases.return_value = MagicMock(aliases=[])
+        mock_aclient.scroll.return_value = ([], None)
+
+        with (
+            patch("app.services.vector_service.profile_matches", return_value=False),
+            patch("app.services.vector_service.get_collection_profile", return_value="int8"),
+        ):
+            assert await service.migrate_collection_profile("documents_gemini") is True
+
+        target = mock_aclient.create_collection.call_args.kwargs["collection_name"]
+        assert target.startswith("documents_gemini__int8_")
+        mock_aclient.delete_collection.assert_awaited_once_with("documents_gemini")
+        operations = mock_aclient.update_collection_aliases.call_args.kwargs["change_aliases_operations"]
+        assert operations[0].create_alias.alias_name == "documents_gemini"
+        assert operations[0].create_alias.collection_name == target
+
+    @pytest.mark.asyncio
+    async def test_migrate_collection_profile_drains_the_previous_alias_target(
+        self, mock_settings_service, mock_qdrant_module
+    ):
+        """An existing alias is swapped atomically; writes that raced the swap are drained before the drop."""
+        service = VectorService(mock_settings_service)
+        mock_aclient = await service.get_async_qdrant_client()
+        info = MagicMock()
+        info.config.params.vectors.size = 768
+        info.payload_schema = {}
+        mock_aclient.get_collection.return_value = info
+        alias = MagicMock(alias_name="documents_gemini", collection_name="documents_gemini__default_1")
+        mock_aclient.get_aliases.return_value = MagicMock(aliases=[alias])
+        mock_aclient.scroll.return_value = ([], None)
+
+        with (
+            patch("app.services.vector_service.profile_matches", return_value=False),
+            patch("app.services.vector_service.get_collection_profile", return_value="int8"),
+        ):
+            assert await service.migrate_collection_profile("documents_gemini") is True
+
+        # copy, one clean sync pass (2 scrolls), drain (2 scrolls)
+        assert mock_aclient.scroll.await_count == 5
+        operations = mock_aclient.update_collection_aliases.call_args.kwargs["change_aliases_operations"]
+        assert [type(op).__name__ for op in operations] == ["DeleteAliasOperation", "CreateAliasOperation"]
+        mock_aclient.delete_collection.assert_awaited_once_with("documents_gemini__default_1")
+
+    @pytest.mark.asyncio
+    async def test_migrate_collection_profile_skips_matching_collection(
+        self, mock_settings_service, mock_qdrant_module
+    ):
+        service = VectorService(mock_settings_service)
+        mock_aclient = await service.get_async_qdrant_client()
+
+        with patch("app.services.vector_service.profile_matches", return_value=True):
+            assert await service.migrate_collection_profile("documents_gemini") is False
+
+        mock_aclient.create_collection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_has_sparse_vectors_is_detected_once_per_collection(self, mock_settings_service, mock_qdrant_module):
+        service = VectorService(mock_settings_service)
+        mock_aclient = await service.get_async_qdrant_client()
+        info = MagicMock()
+        info.config.params.sparse_vectors = {"bm25": MagicMock()}
+        mock_aclient.get_collection.return_value = info
+
+        assert await service.has_sparse_vectors("documents_gemini") is True
+        assert await service.has_sparse_vectors("documents_gemini") is True
+        mock_aclient.get_collection.assert_awaited_once()
+
+        kwargs = await service.sparse_store_kwargs("documents_gemini")
+        assert kwargs["enable_hybrid"] is True
+        assert kwargs["sparse_vector_name"] == "bm25"
 
     @pytest.mark.asyncio
     async def test_get_embedding_model_gemini(self, mock_settings_service):
@@ -57,6 +57,11 @@ async def test_hybrid_search_happy_path():
     mock_vector_repo.search.assert_called_once()
     mock_doc_repo.get_by_ids.assert_called_once()
 
+    # Non-indexed documents are filtered by Qdrant: no candidate over-fetch
+    search_kwargs = mock_vector_repo.search.call_args.kwargs
+    assert search_kwargs["limit"] == 10
+    assert [c.key for c in search_kwargs["query_filter"].must_not] == ["doc_status", "is_active"]
+
 
 @pytest.mark.asyncio
 async def test_hybrid_search_sql_status_filtering():
@@ -138,3 +143,99 @@ async def test_hybrid_search_partial_failure():
 
     assert len(results) == 1  # coll1 results only
     assert results[0].document_id == doc1_id
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_warm_status_index_skips_sql():
+    """Warm status index: candidates are filtered in memory, PostgreSQL is not queried."""
+    from app.services.document_status_index import DocumentStatusIndex
+
+    mock_vector_repo = AsyncMock()
+    mock_doc_repo = AsyncMock()
+    mock_vector_service = AsyncMock()
+    mock_vector_service.get_collection_name.return_value = "test_collection"
+    mock_model = AsyncMock()
+    mock_model.aget_query_embedding.return_value = [0.1] * 768
+    mock_vector_service.get_embedding_model.return_value = mock_model
+
+    indexed_id, pending_id = uuid4(), uuid4()
+    hits = []
+    for doc_id, score in [(indexed_id, 0.9), (pending_id, 0.8)]:
+        hit = MagicMock()
+        hit.score = score
+        hit.payload = {"connector_document_id": str(doc_id)}
+        hits.append(hit)
+    mock_vector_repo.search.return_value = hits
+
+    index = DocumentStatusIndex()
+    index.load([(indexed_id, uuid4())])
+
+    strategy = HybridStrategy(mock_vector_repo, mock_doc_repo, AsyncMock(), mock_vector_service, status_index=index)
+
+    results = await strategy.search(query="test")
+    assert [r.document_id for r in results] == [indexed_id]
+    assert await strategy.search(query="test", filters=SearchFilters(status="PENDING")) == []
+    mock_doc_repo.get_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_cold_index_accepts_lowercase_db_status():
+    """Cold status index: SQL fallback matches DocStatus values (stored lowercase)."""
+    from app.schemas.enums import DocStatus
+    from app.services.document_status_index import DocumentStatusIndex
+
+    mock_vector_repo = AsyncMock()
+    mock_doc_repo = AsyncMock()
+    mock_vector_service = AsyncMock()
+    mock_vector_service.get_collection_name.return_value = "test_collection"
+    mock_model = AsyncMock()
+    mock_model.aget_query_embedding.return_value = [0.1] * 768
+    mock_vector_service.get_embedding_model.return_value = mock_model
+
+    doc_id = uuid4()
+    hit = MagicMock()
+    hit.score = 0.9
+    hit.payload = {"connector_document_id": str(doc_id)}
+    mock_vector_repo.search.return_value = [hit]
+    mock_doc = MagicMock()
+    mock_doc.id = doc_id
+    mock_doc.status = DocStatus.INDEXED
+    mock_doc_repo.get_by_ids.return_value = [mock_doc]
+
+    strategy = HybridStrategy(
+        mock_vector_repo, mock_doc_repo, AsyncMock(), mock_vector_service, status_index=DocumentStatusIndex()
+    )
+
+    results = await strategy.search(query="test", filters=SearchFilters(status="INDEXED"))
+    assert [r.document_id for r in results] == [doc_id]
+    mock_doc_repo.get_by_ids.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("has_sparse", [True, False])
+async def test_hybrid_search_sends_bm25_query_only_to_sparse_collections(has_sparse):
+    """Collections declaring the sparse vector get the lexical branch, older ones stay dense-only."""
+    mock_vector_repo = AsyncMock()
+    mock_vector_repo.search.return_value = []
+    mock_vector_service = AsyncMock()
+    mock_vector_service.get_collection_name.return_value = "test_collection"
+    mock_vector_service.has_sparse_vectors.return_value = has_sparse
+    mock_model = AsyncMock()
+    mock_model.aget_query_embedding.return_value = [0.1] * 768
+    mock_vector_service.get_embedding_model.return_value = mock_model
+
+    strategy = HybridStrategy(mock_vector_repo, AsyncMock(), AsyncMock(), mock_vector_service)
+    await strategy.search(query="error code E-4012", top_k=5)
+
+    kwargs = mock_vector_repo.search.call_args.kwargs
+    if has_sparse:
+        assert len(kwargs["sparse_vector"].indices) == 5  # error, code, e-4012, e, 4012
+        assert kwargs["prefetch_limit"] > kwargs["limit"] == 5
+    else:
+        assert kwargs["sparse_vector"] is None
+
+    # Hybrid results are flagged so the dense similarity cutoff skips their fused score
+    hit = MagicMock(score=0.5, payload={"connector_document_id": str(uuid4()), "content": "E-4012"})
+    mock_vector_repo.search.return_value = [hit]
+    results = await strategy._search_single_collection("test_collection", "ollama", "error code E-4012", 5, None)
+    assert results[0].fused is has_sparse